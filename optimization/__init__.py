@@ -11,8 +11,13 @@ Full package documentation: https://github.com/mdabrowski1990/optimization
 __author__ = "Maciej Dąbrowski (maciek_dabrowski@o2.pl)"
 
 from .problem import OptimizationProblem, OptimizationType, IntegerVariable, DiscreteVariable, FloatVariable, \
-    ChoiceVariable
+    ChoiceVariable, EvaluationCache, PersistentEvaluationCache, CachePolicy
 from .stop_conditions import StopConditions
-from .logging import AbstractLogger, Logger, LoggingFormat, LoggingVerbosity
-from .algorithms import RandomAlgorithm, EvolutionaryAlgorithm, SelectionType, CrossoverType, MutationType, \
-    AdaptationType, AdaptiveEvolutionaryAlgorithm, EvolutionaryAlgorithmAdaptationProblem
+from .evaluators import AbstractEvaluator, SerialEvaluator, ProcessPoolEvaluator, ThreadPoolEvaluator, \
+    AsyncEvaluator
+from .utilities import RandomSource, set_random_seed
+from .logging import AbstractLogger, Logger, LoggingFormat, LoggingVerbosity, AsyncLogger, BackpressurePolicy, \
+    ArchiveLogger, SolutionsArchive
+from .algorithms import InitializationType, RandomAlgorithm, EvolutionaryAlgorithm, SelectionType, CrossoverType, \
+    MutationType, AdaptationType, AdaptiveEvolutionaryAlgorithm, EvolutionaryAlgorithmAdaptationProblem, \
+    AbstractBudgetAllocator, EqualBudgetAllocator, SuccessiveHalvingBudgetAllocator
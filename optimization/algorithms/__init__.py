@@ -5,8 +5,13 @@ Available algorithms:
  - RandomAlgorithm - algorithm that creates totally random solutions
  - EvolutionaryAlgorithm - algorithm that uses biological evolution mechanisms such as reproduction, mutation,
     recombination and selection
+
+Available initialization strategies (of initial solutions):
+ - InitializationType - enum with all implemented initialization strategies
 """
 
+from .initialization import InitializationType
 from .random_algorithm import RandomAlgorithm
 from .evolutionary_algorithm import EvolutionaryAlgorithm, SelectionType, CrossoverType, MutationType, \
-    AdaptationType, EvolutionaryAlgorithmAdaptationProblem, AdaptiveEvolutionaryAlgorithm
+    AdaptationType, EvolutionaryAlgorithmAdaptationProblem, AdaptiveEvolutionaryAlgorithm, \
+    AbstractBudgetAllocator, EqualBudgetAllocator, SuccessiveHalvingBudgetAllocator
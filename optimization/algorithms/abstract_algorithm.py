@@ -1,15 +1,22 @@
 """Common implementation fo all optimization algorithms."""
 
-__all__ = ["AbstractOptimizationAlgorithm"]
+__all__ = ["IterationInterrupted", "AbstractOptimizationAlgorithm"]
 
 
-from typing import Optional, Iterable, List, Dict, Any
+from typing import Optional, Iterable, List, Dict, Any, Sequence
 from abc import ABC, abstractmethod
 from datetime import datetime
+from time import monotonic_ns
 
-from ..problem import OptimizationProblem, AbstractSolution
+from ..problem import OptimizationProblem, AbstractSolution, fitness_key
 from ..stop_conditions import StopConditions
 from ..logging import AbstractLogger
+from ..evaluators import AbstractEvaluator, SerialEvaluator
+from ..utilities import RandomSource, set_random_source
+
+
+class IterationInterrupted(Exception):
+    """Optimization process must be stopped before the current iteration is finished."""
 
 
 class AbstractOptimizationAlgorithm(ABC):
@@ -18,13 +25,19 @@ class AbstractOptimizationAlgorithm(ABC):
     @abstractmethod
     def __init__(self, problem: OptimizationProblem,
                  stop_conditions: StopConditions,
-                 logger: Optional[AbstractLogger] = None) -> None:
+                 logger: Optional[AbstractLogger] = None,
+                 evaluator: Optional[AbstractEvaluator] = None,
+                 random_source: Optional[RandomSource] = None) -> None:
         """
         Common initialization of all optimization algorithms.
 
         :param problem: Optimization problem to be solved by the algorithm.
         :param stop_conditions: Conditions when optimization algorithm shall be stopped.
         :param logger: Logger used for optimization process recording.
+        :param evaluator: Evaluator used for calculation of solutions objective values.
+            If None, then SerialEvaluator is used.
+        :param random_source: Source of random values used during optimization process.
+            If None, then new (not seeded) RandomSource is used.
         """
         if not isinstance(problem, OptimizationProblem):
             raise TypeError(f"Parameter 'problem' value is not OptimizationProblem type. Actual value: {problem}.")
@@ -33,16 +46,27 @@ class AbstractOptimizationAlgorithm(ABC):
                             f"Actual value: {stop_conditions}.")
         if logger is not None and not isinstance(logger, AbstractLogger):
             raise TypeError(f"Parameter 'logger' value is not AbstractLogger type. Actual value: {logger}.")
+        if evaluator is not None and not isinstance(evaluator, AbstractEvaluator):
+            raise TypeError(f"Parameter 'evaluator' value is not AbstractEvaluator type. Actual value: {evaluator}.")
+        if random_source is not None and not isinstance(random_source, RandomSource):
+            raise TypeError(f"Parameter 'random_source' value is not RandomSource type. "
+                            f"Actual value: {random_source}.")
         self.problem = problem
         self.stop_conditions = stop_conditions
         self.logger = logger
+        self.evaluator = SerialEvaluator() if evaluator is None else evaluator
+        self.random_source = RandomSource() if random_source is None else random_source
         self._start_time: Optional[datetime] = None
+        self._start_time_ns: Optional[int] = None
         self._end_time: Optional[datetime] = None
         self._best_solution: Optional[AbstractSolution] = None
+        self._iterations_number = 0
+        self._evaluations_number = 0
 
         class Solution(AbstractSolution):
             """Solution class for given optimization problem."""
 
+            __slots__ = ()
             optimization_problem = problem
 
         self.SolutionClass = Solution
@@ -62,6 +86,53 @@ class AbstractOptimizationAlgorithm(ABC):
         """
         ...
 
+    def _evaluate_solutions(self, solutions: Sequence[AbstractSolution]) -> None:
+        """
+        Evaluation stage of optimization algorithm iteration.
+
+        Calculates objective values (with penalty) of all provided solutions at once, so batch (vectorized) functions
+        of the optimization problem or many processes (depending on 'evaluator') could be used.
+
+        Number of performed evaluations is counted, so evaluations limit of stop conditions could be checked.
+        If 'checkpoint_interval' of stop conditions is set, then solutions are evaluated in parts of this size
+        and the optimization process might be interrupted between them (look '_checkpoint' method).
+
+        :param solutions: Solutions to be evaluated.
+        """
+        checkpoint_interval = self.stop_conditions.checkpoint_interval
+        if checkpoint_interval is None or len(solutions) <= checkpoint_interval:
+            self._evaluations_number += self.evaluator.evaluate(solutions)
+            return
+        for first_index in range(0, len(solutions), checkpoint_interval):
+            last_index = first_index + checkpoint_interval
+            evaluated_solutions = solutions[first_index:last_index]
+            self._evaluations_number += self.evaluator.evaluate(evaluated_solutions)
+            if last_index < len(solutions):
+                self._checkpoint(evaluated_solutions)
+
+    def _checkpoint(self, evaluated_solutions: Sequence[AbstractSolution]) -> None:
+        """
+        Checks in the middle of an iteration whether optimization process has to be stopped immediately.
+
+        The best solution is updated with just evaluated solutions, so they are not lost when the iteration
+        is interrupted.
+
+        :param evaluated_solutions: Solutions that were just evaluated.
+
+        :raise IterationInterrupted: Time or evaluations limit is exceeded or satisfying solution was found.
+        """
+        if evaluated_solutions:
+            best_evaluated = max(evaluated_solutions, key=fitness_key)
+            self._best_solution = best_evaluated if self._best_solution is None \
+                else max(best_evaluated, self._best_solution, key=fitness_key)
+        if self._best_solution is not None and self._is_interruption_needed():
+            raise IterationInterrupted
+
+    @property
+    def evaluations_number(self) -> int:
+        """Number of solutions evaluations (calculations of objective value) in the last optimization process."""
+        return self._evaluations_number
+
     @abstractmethod
     def get_log_data(self) -> Dict[str, Any]:
         """
@@ -79,8 +150,20 @@ class AbstractOptimizationAlgorithm(ABC):
 
         :return: True if stop conditions are achieved, False otherwise.
         """
-        return self.stop_conditions.is_achieved(start_time=self._start_time,  # type: ignore
-                                                best_solution=self._best_solution)  # type: ignore
+        return self.stop_conditions.is_achieved(start_time=self._start_time_ns,  # type: ignore
+                                                best_solution=self._best_solution,  # type: ignore
+                                                iterations_number=self._iterations_number,
+                                                evaluations_number=self._evaluations_number)
+
+    def _is_interruption_needed(self) -> bool:
+        """
+        Checks whether optimization process should be stopped before the current iteration is finished.
+
+        :return: True if time or evaluations limit is exceeded or satisfying solution was found, False otherwise.
+        """
+        return self.stop_conditions.is_interruption_needed(start_time=self._start_time_ns,  # type: ignore
+                                                           best_solution=self._best_solution,  # type: ignore
+                                                           evaluations_number=self._evaluations_number)
 
     @staticmethod
     def sorted_solutions(solutions: Iterable[AbstractSolution], descending: bool = True) -> List[AbstractSolution]:
@@ -94,7 +177,7 @@ class AbstractOptimizationAlgorithm(ABC):
 
         :return: Sorted list with optimization solution.
         """
-        return sorted(solutions, reverse=descending)
+        return sorted(solutions, key=fitness_key, reverse=descending)
 
     def perform_optimization(self) -> AbstractSolution:
         """
@@ -106,14 +189,31 @@ class AbstractOptimizationAlgorithm(ABC):
         if self.logger is not None:
             self.logger.log_at_start(algorithm=self, stop_conditions=self.stop_conditions, problem=self.problem)
         self._start_time = datetime.now()
+        self._start_time_ns = monotonic_ns()
+        self._iterations_number = 0
+        self._evaluations_number = 0
+        previous_random_source = set_random_source(self.random_source)
         # optimization process
-        iteration_index = 0
-        self._perform_iteration(iteration_index=iteration_index)
-        while not self._is_stop_achieved():
-            iteration_index += 1
+        try:
+            iteration_index = 0
             self._perform_iteration(iteration_index=iteration_index)
+            self._iterations_number += 1
+            while not self._is_stop_achieved():
+                iteration_index += 1
+                self._perform_iteration(iteration_index=iteration_index)
+                self._iterations_number += 1
+        except IterationInterrupted:
+            pass  # the last iteration was not finished, but the best solution found in it is already stored
+        except BaseException:
+            if self.logger is not None:
+                self.logger.close()  # so records logged before the failure are not lost
+            raise
+        finally:
+            self.evaluator.close()
+            set_random_source(previous_random_source)
         # after stop
         self._end_time = datetime.now()
         if self.logger is not None:
             self.logger.log_at_end(best_solution=self._best_solution, optimization_time=self._end_time-self._start_time)
+            self.logger.close()
         return self._best_solution  # type: ignore
@@ -8,6 +8,10 @@ Additionally, there enums with implemented and possible to choose selection, cro
 - SelectionType - enum with all implemented selection types supported by EvolutionaryAlgorithm
 - CrossoverType - enum with all implemented crossover types supported by EvolutionaryAlgorithm
 - MutationType - enum with all implemented mutation types supported by EvolutionaryAlgorithm
+
+Budget allocators (sharing time between Lower Evolutionary Algorithms of AdaptiveEvolutionaryAlgorithm):
+- EqualBudgetAllocator - gives the same time to each Lower Evolutionary Algorithm
+- SuccessiveHalvingBudgetAllocator - races Lower Evolutionary Algorithms and gives more time to the best ones
 """
 
 from .evolutionary_algorithm import EvolutionaryAlgorithm
@@ -16,3 +20,4 @@ from .crossover import CrossoverType
 from .mutation import MutationType
 from .adaptive_evolutionary_algorithm import AdaptationType, EvolutionaryAlgorithmAdaptationProblem, \
     AdaptiveEvolutionaryAlgorithm
+from .budget_allocation import AbstractBudgetAllocator, EqualBudgetAllocator, SuccessiveHalvingBudgetAllocator
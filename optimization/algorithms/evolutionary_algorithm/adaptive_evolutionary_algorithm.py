@@ -9,25 +9,32 @@ Evolutionary algorithms that performs two level optimization of:
 __all__ = ["AdaptationType", "EvolutionaryAlgorithmAdaptationProblem", "AdaptiveEvolutionaryAlgorithm"]
 
 
-from typing import Any, Union, Optional, Tuple, List, Iterable, Dict, Callable
+from typing import Any, Union, Optional, Tuple, List, Iterable, Dict, Callable, Sequence, NamedTuple, Type, \
+    Mapping
 from typing import OrderedDict as OrderedDictTyping
 from enum import Enum
 from abc import abstractmethod
 from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from copy import deepcopy
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import monotonic_ns
 
-from ...utilities import shuffled
+from ...utilities import shuffled, RandomSource, get_random_source
+from ..abstract_algorithm import IterationInterrupted
 from .evolutionary_algorithm import EvolutionaryAlgorithm
-from ...problem import OptimizationProblem, AbstractSolution, OptimizationType, \
+from ...problem import OptimizationProblem, AbstractSolution, OptimizationType, fitness_key, \
     DecisionVariable, IntegerVariable, DiscreteVariable, FloatVariable, ChoiceVariable
 from ...stop_conditions import StopConditions
 from ...logging import AbstractLogger
+from ...evaluators import AbstractEvaluator
 from .selection import SelectionType, SELECTION_ADDITIONAL_PARAMS_LIMITS, SELECTION_ADDITIONAL_PARAMS
-from .crossover import CrossoverType, CROSSOVER_ADDITIONAL_PARAMS, ChildrenValuesTyping
-from .mutation import MutationType, MUTATION_ADDITIONAL_PARAMS
+from .crossover import CrossoverType, CROSSOVER_ADDITIONAL_PARAMS, CROSSOVER_ADDITIONAL_PARAMS_LIMITS, \
+    ChildrenValuesTyping
+from .mutation import MutationType, MUTATION_ADDITIONAL_PARAMS, MUTATION_ADDITIONAL_PARAMS_LIMITS
 from .limits import MIN_EA_POPULATION_SIZE, MAX_EA_POPULATION_SIZE, MIN_EA_MUTATION_CHANCE, MAX_EA_MUTATION_CHANCE
 from .defaults import DEFAULT_SOLUTIONS_NUMBER, DEFAULT_SOLUTIONS_PERCENTILE
+from .budget_allocation import AbstractBudgetAllocator, EqualBudgetAllocator
 
 
 class AdaptationType(Enum):
@@ -324,14 +331,14 @@ class EvolutionaryAlgorithmAdaptationProblem(OptimizationProblem):
 
             def adaptation_objective_function(solutions: list, **_: Any) -> float:  # type: ignore
                 return sum([solution.get_objective_value_with_penalty()
-                            for solution in sorted(solutions, reverse=True)[:solutions_number]])
+                            for solution in sorted(solutions, key=fitness_key, reverse=True)[:solutions_number]])
         elif adaptation_type == AdaptationType.BestSolutionsPercentile:
 
             def adaptation_objective_function(solutions: list, population_size: int, **_: Any) -> float:  # type: ignore
                 considered_number = int(population_size*solutions_percentile // 100)  # type: ignore
                 considered_number = max(considered_number, 1)
                 return sum([solution.get_objective_value_with_penalty()
-                            for solution in sorted(solutions, reverse=True)[:considered_number]])
+                            for solution in sorted(solutions, key=fitness_key, reverse=True)[:considered_number]])
         else:
             raise NotImplementedError(f"This value of 'adaptation_type' parameter is not supported. "
                                       f"Actual value: {adaptation_type}")
@@ -475,8 +482,12 @@ class EvolutionaryAlgorithmAdaptationProblem(OptimizationProblem):
             "crossover_points_number":
                 IntegerVariable(min_value=_min_crossover_points, max_value=_max_crossover_points),
             "crossover_pattern": IntegerVariable(min_value=_min_crossover_pattern, max_value=_max_crossover_pattern),
+            **{param_name: FloatVariable(min_value=min_value, max_value=max_value)
+               for param_name, (min_value, max_value) in CROSSOVER_ADDITIONAL_PARAMS_LIMITS.items()},
             # mutation
             "mutation_points_number": IntegerVariable(min_value=_min_mutation_points, max_value=_max_mutation_points),
+            **{param_name: FloatVariable(min_value=min_value, max_value=max_value)
+               for param_name, (min_value, max_value) in MUTATION_ADDITIONAL_PARAMS_LIMITS.items()},
         }
 
     @staticmethod
@@ -498,6 +509,142 @@ class EvolutionaryAlgorithmAdaptationProblem(OptimizationProblem):
         return lambda **decision_variables_values: 0  # penalty function is not used here
 
 
+SolutionDataTyping = Tuple[tuple, Union[float, int, None]]
+"""Picklable data of a solution - decision variables values (ordered) and objective value with penalty."""
+
+
+def get_solutions_data(solutions: Iterable[AbstractSolution]) -> List[SolutionDataTyping]:
+    """
+    Converts solutions into picklable data (e.g. to transfer them between processes).
+
+    :param solutions: Solutions to convert.
+
+    :return: List with data of following solutions.
+    """
+    return [(solution.values, solution._objective_value_with_penalty)  # pylint: disable=protected-access
+            for solution in solutions]
+
+
+def get_solutions_from_data(solution_class: Type[AbstractSolution],
+                            solutions_data: Iterable[SolutionDataTyping]) -> List[AbstractSolution]:
+    """
+    Creates solutions from data returned by 'get_solutions_data' function.
+
+    :param solution_class: Class of solutions to create.
+    :param solutions_data: Data of following solutions.
+
+    :return: List with solutions (objects of 'solution_class').
+    """
+    names = list(solution_class.optimization_problem.decision_variables.keys())  # type: ignore
+    solutions = []
+    for values, objective_value_with_penalty in solutions_data:
+        solution = solution_class.from_trusted_values(OrderedDict(zip(names, values)))
+        solution._objective_value_with_penalty = objective_value_with_penalty  # pylint: disable=protected-access
+        solutions.append(solution)
+    return solutions
+
+
+class LowerAlgorithmOutcome(NamedTuple):
+    """Results of Lower Adaptive Evolutionary Algorithm optimization process executed by a worker process."""
+
+    population: List[SolutionDataTyping]
+    best_solution: SolutionDataTyping
+    start_time: datetime
+    end_time: datetime
+    iterations_number: int
+    evaluations_number: int
+    iterations: Optional[List[List[SolutionDataTyping]]]
+
+
+class _WorkerEvolutionaryAlgorithm(EvolutionaryAlgorithm):
+    """
+    Evolutionary Algorithm that performs optimization of Lower Adaptive Evolutionary Algorithm in a worker process.
+
+    Populations of following iterations are recorded (instead of logged), so they could be logged by the main process.
+    """
+
+    def __init__(self, record_iterations: bool, resumed: bool, **params: Any) -> None:
+        """
+        Configuration of Evolutionary Algorithm in a worker process.
+
+        :param record_iterations: Determines whether to record populations of following iterations.
+        :param resumed: Determines whether optimization process of Lower Evolutionary Algorithm is continued,
+            so the initial iteration (which does not change the initial population) is not counted.
+        :param params: Parameters of Evolutionary Algorithm.
+        """
+        super().__init__(**params)
+        self.resumed = resumed
+        self.performed_iterations_number = 0
+        self.recorded_iterations: Optional[List[List[SolutionDataTyping]]] = [] if record_iterations else None
+
+    def _log_iteration(self, iteration_index: int) -> None:
+        """
+        Records population data in given algorithm's iteration.
+
+        :param iteration_index: Index number (counted from 0) of optimization algorithm iteration.
+
+        :return: None
+        """
+        if self.resumed and iteration_index == 0:
+            return
+        self.performed_iterations_number += 1
+        if self.recorded_iterations is not None:
+            self.recorded_iterations.append(get_solutions_data(self._population))
+
+
+_worker_problem: Optional[OptimizationProblem] = None
+"""Optimization problem which is solved by Lower Adaptive Evolutionary Algorithms in the worker process."""
+
+
+def _initialize_worker(problem: OptimizationProblem) -> None:
+    """
+    Sets optimization problem in worker process, so it is transferred only once (not with every algorithm).
+
+    :param problem: Optimization problem to be solved by Lower Adaptive Evolutionary Algorithms.
+    """
+    global _worker_problem  # pylint: disable=global-statement
+    _worker_problem = problem
+
+
+def _run_lower_algorithm(stop_conditions: StopConditions,
+                         algorithm_params: Dict[str, Any],
+                         initial_population: List[SolutionDataTyping],
+                         best_solution: Optional[SolutionDataTyping],
+                         random_source: RandomSource,
+                         record_iterations: bool,
+                         resumed: bool) -> LowerAlgorithmOutcome:
+    """
+    Performs optimization process of Lower Adaptive Evolutionary Algorithm inside a worker process.
+
+    :param stop_conditions: Stop conditions of the Lower Adaptive Evolutionary Algorithm.
+    :param algorithm_params: Settings (decision variables values) of the Lower Adaptive Evolutionary Algorithm.
+    :param initial_population: Data of solutions in initial population.
+    :param best_solution: Data of the best solution found so far (None if optimization process was not started).
+    :param random_source: Source of random values used by the Lower Adaptive Evolutionary Algorithm.
+    :param record_iterations: Determines whether to return populations of following iterations.
+    :param resumed: Determines whether optimization process of Lower Adaptive Evolutionary Algorithm is continued.
+
+    :return: Results of the optimization process.
+    """
+    algorithm = _WorkerEvolutionaryAlgorithm(record_iterations=record_iterations, resumed=resumed,
+                                             problem=_worker_problem, stop_conditions=stop_conditions,
+                                             random_source=random_source, **algorithm_params)
+    algorithm._population = get_solutions_from_data(algorithm.SolutionClass,  # pylint: disable=protected-access
+                                                    initial_population)
+    if best_solution is not None:
+        algorithm._best_solution = get_solutions_from_data(  # pylint: disable=protected-access
+            algorithm.SolutionClass, [best_solution])[0]
+    best_solution_found = algorithm.perform_optimization()
+    # pylint: disable=protected-access
+    return LowerAlgorithmOutcome(population=get_solutions_data(algorithm._population),
+                                 best_solution=get_solutions_data([best_solution_found])[0],
+                                 start_time=algorithm._start_time,  # type: ignore # pylint: disable=protected-access
+                                 end_time=algorithm._end_time,  # type: ignore # pylint: disable=protected-access
+                                 iterations_number=algorithm.performed_iterations_number,
+                                 evaluations_number=algorithm.evaluations_number,
+                                 iterations=algorithm.recorded_iterations)
+
+
 class LowerAdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm, AbstractSolution):
     """
     Definition of Lower (Slave) Adaptive Evolutionary Algorithm.
@@ -525,6 +672,7 @@ class LowerAdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm, AbstractSolution
                  mutation_chance: float,
                  apply_elitism: bool,
                  logger: Optional[AbstractLogger] = None,
+                 evaluator: Optional[AbstractEvaluator] = None,
                  **other_params: Any) -> None:
         """
         Configuration of Lower Evolutionary Algorithm.
@@ -541,7 +689,12 @@ class LowerAdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm, AbstractSolution
                 in ranking selection
             - :param crossover_points_number: int - number of crossover points to use in multipoint crossover
             - :param crossover_pattern: int - pattern of crossover to be used in adaptive crossover
-            - :param mutation_points_number: int - number of mutation points to be used in multipoint mutation.
+            - :param crossover_distribution_index: float - distribution index of simulated binary crossover
+            - :param blend_alpha: float - extension of parents genes interval in blend (BLX-alpha) crossover
+            - :param mutation_points_number: int - number of mutation points to be used in multipoint mutation
+            - :param mutation_sigma: float - standard deviation (relative to decision variable range) of gene shift
+                in gaussian mutation
+            - :param mutation_distribution_index: float - distribution index of polynomial mutation.
         """
         self.upper_iteration = upper_iteration
         self.index = index
@@ -551,8 +704,10 @@ class LowerAdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm, AbstractSolution
                                        population_size=population_size, selection_type=selection_type,
                                        crossover_type=crossover_type, mutation_type=mutation_type,
                                        mutation_chance=mutation_chance, apply_elitism=apply_elitism, logger=logger,
-                                       **other_params)
+                                       evaluator=evaluator, **other_params)
         self._population = initial_population[:population_size]
+        self._next_iteration_index = 0
+        self._optimization_time = timedelta()
         # init as solution
         AbstractSolution.__init__(self_solution=self, population_size=population_size, selection_type=selection_type,
                                   crossover_type=crossover_type, mutation_type=mutation_type,
@@ -583,37 +738,107 @@ class LowerAdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm, AbstractSolution
                                                   lower_iteration=iteration_index,
                                                   solutions=self._population)
 
-    def _calculate_objective(self) -> Union[float, int]:
-        """:return: Value of solution objective without penalty."""
+    def _calculate_objective(self, decision_variables_values: Mapping[str, Any]) -> Union[float, int]:
+        """
+        :param decision_variables_values: Values of decision variables of this solution (not used, as the objective
+            depends on results of the optimization process).
+
+        :return: Value of solution objective without penalty.
+        """
         return self.optimization_problem.objective_function(
             best_solution=self._best_solution,
             solutions=self._population,
             population_size=self.population_size
         )
 
+    def _reset_evaluation(self) -> None:
+        """Forgets objective value of this algorithm (as a solution) after its optimization process was continued."""
+        self._objective_value_with_penalty = None
+        self._fitness = None
+
     def perform_optimization(self) -> AbstractSolution:
         """
         Executes optimization process.
 
+        If the optimization process was already performed, then it is continued (from the last population)
+        until stop conditions are achieved again.
+
+        Note: Random values are drawn from random source of the Upper Algorithm (which is currently used).
+
         :return: The best solution that was found by the optimization algorithm.
         """
         # pre start
         self._start_time = datetime.now()
+        self._start_time_ns = monotonic_ns()
+        self._iterations_number = 0
+        self._evaluations_number = 0
         # optimization process
-        iteration_index = 0
-        self._perform_iteration(iteration_index=iteration_index)
-        while not self._is_stop_achieved():
-            iteration_index += 1
+        iteration_index = self._next_iteration_index
+        try:
             self._perform_iteration(iteration_index=iteration_index)
+            self._iterations_number += 1
+            while not self._is_stop_achieved():
+                iteration_index += 1
+                self._perform_iteration(iteration_index=iteration_index)
+                self._iterations_number += 1
+        except IterationInterrupted:
+            iteration_index -= 1  # the last iteration was not finished
         # after stop
         self._end_time = datetime.now()
+        self._next_iteration_index = iteration_index + 1
+        self._optimization_time += self._end_time - self._start_time
+        self._reset_evaluation()
         if self.logger is not None:
             self.logger.log_lower_level_at_end(upper_iteration=self.upper_iteration,
                                                lower_algorithm_index=self.index,
                                                best_solution=self._best_solution,
-                                               optimization_time=self._end_time - self._start_time)
+                                               optimization_time=self._optimization_time)
         return self._best_solution  # type: ignore
 
+    def get_worker_task(self, random_source: RandomSource) -> Dict[str, Any]:
+        """
+        Gets picklable arguments for optimization process of this algorithm performed by a worker process.
+
+        :param random_source: Source of random values to be used by the worker process.
+
+        :return: Keyword arguments for '_run_lower_algorithm' function.
+        """
+        best_solution = None if self._best_solution is None else get_solutions_data([self._best_solution])[0]
+        return dict(stop_conditions=self.stop_conditions,
+                    algorithm_params=dict(self.decision_variables_values, **self.additional_decision_variables_values),
+                    initial_population=get_solutions_data(self._population),
+                    best_solution=best_solution,
+                    random_source=random_source,
+                    record_iterations=self.logger is not None,
+                    resumed=self._next_iteration_index > 0)
+
+    def set_worker_outcome(self, outcome: LowerAlgorithmOutcome) -> None:
+        """
+        Completes optimization process of this algorithm that was performed by a worker process.
+
+        :param outcome: Results of the optimization process returned by the worker process.
+        """
+        self._population = get_solutions_from_data(self.SolutionClass, outcome.population)
+        self._best_solution = get_solutions_from_data(self.SolutionClass, [outcome.best_solution])[0]
+        self._start_time = outcome.start_time
+        self._end_time = outcome.end_time
+        first_iteration_index = self._next_iteration_index
+        self._next_iteration_index += outcome.iterations_number
+        self._evaluations_number = outcome.evaluations_number
+        self._optimization_time += self._end_time - self._start_time
+        self._reset_evaluation()
+        if self.logger is not None:
+            for iteration_index, solutions_data in enumerate(outcome.iterations or [], start=first_iteration_index):
+                self.logger.log_lower_level_iteration(
+                    upper_iteration=self.upper_iteration,
+                    lower_algorithm_index=self.index,
+                    lower_iteration=iteration_index,
+                    solutions=get_solutions_from_data(self.SolutionClass, solutions_data))
+            self.logger.log_lower_level_at_end(upper_iteration=self.upper_iteration,
+                                               lower_algorithm_index=self.index,
+                                               best_solution=self._best_solution,
+                                               optimization_time=self._optimization_time)
+
     def get_log_data(self) -> Dict[str, Any]:
         """
         Gets data for logging purposes.
@@ -652,7 +877,11 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
                  mutation_type: Union[MutationType, str],
                  mutation_chance: float,
                  logger: Optional[AbstractLogger] = None,
+                 evaluator: Optional[AbstractEvaluator] = None,
                  iterations_number=10,
+                 random_source: Optional[RandomSource] = None,
+                 lower_algorithms_workers: int = 1,
+                 budget_allocator: Optional[AbstractBudgetAllocator] = None,
                  **other_params: Any) -> None:
         """
         Configuration of Self-adaptive Evolutionary Algorithm.
@@ -660,18 +889,47 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
         :param problem: Optimization problem to be solved by the algorithm.
         :param adaptation_problem: Evolutionary algorithm adaptation problem to be optimized by the algorithm.
         :param stop_conditions: Conditions when optimization algorithm shall be stopped.
+            Note: Time limit is mandatory, as it is shared between Lower Evolutionary Algorithms. Evaluations limit
+            is checked (against evaluations of all Lower Evolutionary Algorithms) after each iteration.
         :param population_size: Size of the algorithm's population (number of LowerAdaptiveEvolutionaryAlgorithm).
         :param selection_type: Type of selection function to use.
         :param crossover_type: Type of crossover function to use.
         :param mutation_type: Type of mutation function to use.
         :param mutation_chance: Probability of a single decision variable (gene) mutation.
         :param logger: Logger used for optimization process recording.
+        :param evaluator: Evaluator used by Lower Evolutionary Algorithms for calculation of solutions objective
+            values. If None, then SerialEvaluator is used.
         :param iterations_number: Desired number of iteration to be performed by AdaptiveEvolutionaryAlgorithm.
             WARNING! The actual number of iterations might be slightly different.
             Additionally, the lower the value of time_limit in StopConditions, the less accurate this value is.
+        :param random_source: Source of random values used during optimization process (also by Lower Evolutionary
+            Algorithms). If None, then new (not seeded) RandomSource is used.
+        :param lower_algorithms_workers: Number of worker processes that perform optimization processes of Lower
+            Evolutionary Algorithms (of a single iteration) in parallel. If 1, then Lower Evolutionary Algorithms
+            are executed one after another in the current process.
+            WARNING! If greater than 1, then optimization problem (including all its functions) must be picklable
+            (functions have to be defined at module level) and Lower Evolutionary Algorithms evaluate solutions
+            in worker processes without 'evaluator'.
+        :param budget_allocator: Budget allocator that shares time of a single iteration between Lower Evolutionary
+            Algorithms (e.g. SuccessiveHalvingBudgetAllocator gives more time to the most promising ones).
+            If None, then EqualBudgetAllocator is used.
         :param other_params: Parameter related to selected selection, crossover and mutation type further
             described in parent class.
         """
+        if not isinstance(lower_algorithms_workers, int):
+            raise TypeError(f"Value of 'lower_algorithms_workers' parameter is not int type. "
+                            f"Actual value: '{lower_algorithms_workers}'.")
+        if lower_algorithms_workers <= 0:
+            raise ValueError(f"Value of 'lower_algorithms_workers' parameter must be greater than 0. "
+                             f"Actual value: '{lower_algorithms_workers}'.")
+        if budget_allocator is None:
+            budget_allocator = EqualBudgetAllocator()
+        elif not isinstance(budget_allocator, AbstractBudgetAllocator):
+            raise TypeError(f"Value of 'budget_allocator' parameter is not AbstractBudgetAllocator type. "
+                            f"Actual value: '{budget_allocator}'.")
+        if isinstance(stop_conditions, StopConditions) and stop_conditions.time_limit is None:
+            raise ValueError("Parameter 'stop_conditions' must contain 'time_limit', as it is shared between "
+                             "Lower Evolutionary Algorithms.")
         if not isinstance(adaptation_problem, EvolutionaryAlgorithmAdaptationProblem):
             raise TypeError(f"Value of 'adaptation_problem' parameter is not EvolutionaryAlgorithmAdaptationProblem "
                             f"type. Actual value: '{adaptation_problem}'.")
@@ -684,9 +942,13 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
         dv_mutation_points_number.max_value = problem.variables_number - 1  # type: ignore
         self.adaptation_problem = adaptation_problem
         self.iterations_number = iterations_number
+        self.lower_algorithms_workers = lower_algorithms_workers
+        self.budget_allocator = budget_allocator
+        self._lower_algorithms_executor: Optional[Executor] = None
         super().__init__(problem=problem, stop_conditions=stop_conditions, population_size=population_size,
                          selection_type=selection_type, crossover_type=crossover_type, mutation_type=mutation_type,
-                         mutation_chance=mutation_chance, apply_elitism=False, logger=logger, **other_params)
+                         mutation_chance=mutation_chance, apply_elitism=False, logger=logger, evaluator=evaluator,
+                         random_source=random_source, **other_params)
 
         class AdaptiveAESolution(LowerAdaptiveEvolutionaryAlgorithm):
             """Solution class for given evolutionary algorithm adaptation problem."""
@@ -816,11 +1078,24 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
         individual_values.clear()  # type: ignore
         individual_values.update(final_values)  # type: ignore
 
-    def _generate_lower_algorithm_stop_conditions(self) -> StopConditions:
-        """Returns instance of StopConditions for LowerAdaptiveEvolutionaryAlgorithm."""
+    def _get_iteration_time_budget(self) -> timedelta:
+        """
+        Returns time that Lower Evolutionary Algorithms might use in a single iteration of this algorithm.
+
+        How this time is split between Lower Evolutionary Algorithms is decided by the budget allocator.
+        """
+        return self.stop_conditions.time_limit / self.iterations_number  # type: ignore
+
+    def _generate_lower_algorithm_stop_conditions(self, time_limit: timedelta) -> StopConditions:
+        """
+        Returns instance of StopConditions for LowerAdaptiveEvolutionaryAlgorithm.
+
+        :param time_limit: Time limit for a single run of Lower Evolutionary Algorithm.
+        """
         return StopConditions(
-            time_limit=self.stop_conditions.time_limit / (self.population_size * self.iterations_number),
-            satisfying_objective_value=self.stop_conditions.satisfying_objective_value
+            time_limit=time_limit,
+            satisfying_objective_value=self.stop_conditions.satisfying_objective_value,
+            checkpoint_interval=self.stop_conditions.checkpoint_interval
         )
 
     def _create_individual(self,
@@ -840,8 +1115,10 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
             upper_iteration=iteration,
             index=individual_number,
             problem=self.problem,
-            stop_conditions=self._generate_lower_algorithm_stop_conditions(),
+            stop_conditions=self._generate_lower_algorithm_stop_conditions(
+                time_limit=self._get_iteration_time_budget()),
             logger=self.logger,
+            evaluator=self.evaluator,
             **values)
 
     def _generate_random_individual(self, iteration: int, individual_number: int) -> LowerAdaptiveEvolutionaryAlgorithm:
@@ -890,6 +1167,64 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
                 self._generate_random_individual(iteration=0, individual_number=current_population_size))
             current_population_size = len(self._population)
 
+    def _perform_lower_algorithms_in_parallel(self, lower_algorithms: Sequence[AbstractSolution]) -> None:
+        """
+        Performs optimization processes of Lower Evolutionary Algorithms using worker processes.
+
+        Each Lower Evolutionary Algorithm uses its own random source (spawned from the currently used one),
+        therefore results are reproducible regardless of the order in which worker processes finish.
+
+        :param lower_algorithms: Lower Evolutionary Algorithms to execute.
+
+        :return: None
+        """
+        if self._lower_algorithms_executor is None:
+            self._lower_algorithms_executor = ProcessPoolExecutor(max_workers=self.lower_algorithms_workers,
+                                                                  initializer=_initialize_worker,
+                                                                  initargs=(self.problem,))
+        random_sources = get_random_source().spawn(len(lower_algorithms))
+        futures = [self._lower_algorithms_executor.submit(_run_lower_algorithm,
+                                                          **lower_ae.get_worker_task(random_source=random_source))
+                   for lower_ae, random_source in zip(lower_algorithms, random_sources)]
+        for lower_ae, future in zip(lower_algorithms, futures):
+            lower_ae.set_worker_outcome(future.result())  # type: ignore
+
+    def _run_lower_algorithms(self, lower_algorithms: Sequence[AbstractSolution], time_limit: timedelta) -> None:
+        """
+        Performs (or continues) optimization processes of Lower Evolutionary Algorithms.
+
+        :param lower_algorithms: Lower Evolutionary Algorithms to execute.
+        :param time_limit: Time limit for each of Lower Evolutionary Algorithms.
+
+        :return: None
+        """
+        for lower_ae in lower_algorithms:
+            lower_ae.stop_conditions = self._generate_lower_algorithm_stop_conditions(  # type: ignore
+                time_limit=time_limit)
+        if self.lower_algorithms_workers > 1:
+            self._perform_lower_algorithms_in_parallel(lower_algorithms)
+        else:
+            for lower_ae in lower_algorithms:
+                lower_ae.perform_optimization()  # type: ignore
+        self._evaluations_number += sum(lower_ae.evaluations_number for lower_ae in lower_algorithms)  # type: ignore
+
+    def _close_lower_algorithms_executor(self) -> None:
+        """Shuts down worker processes used by Lower Evolutionary Algorithms."""
+        if self._lower_algorithms_executor is not None:
+            self._lower_algorithms_executor.shutdown(wait=True)
+            self._lower_algorithms_executor = None
+
+    def perform_optimization(self) -> AbstractSolution:
+        """
+        Executes optimization process.
+
+        :return: The best solution that was found by the optimization algorithm.
+        """
+        try:
+            return super().perform_optimization()
+        finally:
+            self._close_lower_algorithms_executor()
+
     def _perform_iteration(self, iteration_index: int) -> None:
         """
         Executes following iteration of optimization algorithm.
@@ -902,10 +1237,14 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
             self._generate_random_population()
         else:
             self._evolution_iteration(iteration_index=iteration_index)
-        for lower_ae in self._population:
-            lower_ae.perform_optimization()
-        best_in_iter = max(lower_ae.best_solution for lower_ae in self._population)
-        self._best_solution = best_in_iter if self._best_solution is None else max(best_in_iter, self._best_solution)
+        self.budget_allocator.perform_lower_algorithms(
+            lower_algorithms=self._population,
+            time_budget=self._get_iteration_time_budget(),
+            workers=self.lower_algorithms_workers,
+            run_lower_algorithms=self._run_lower_algorithms)
+        best_in_iter = max((lower_ae.best_solution for lower_ae in self._population), key=fitness_key)
+        self._best_solution = best_in_iter if self._best_solution is None \
+            else max(best_in_iter, self._best_solution, key=fitness_key)
         self._log_iteration(iteration_index=iteration_index)
 
     def _evolution_iteration(self, **kwargs: Any) -> None:
@@ -944,3 +1283,15 @@ class AdaptiveEvolutionaryAlgorithm(EvolutionaryAlgorithm):
                 new_population.append(child1)
                 new_population.append(child2)
         self._population = new_population
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Adaptive Evolutionary Algorithm crucial data.
+        """
+        log_data = super().get_log_data()
+        log_data.update(iterations_number=self.iterations_number,
+                        lower_algorithms_workers=self.lower_algorithms_workers,
+                        budget_allocator=self.budget_allocator.get_log_data())
+        return log_data
@@ -0,0 +1,150 @@
+"""
+Budget allocators of Adaptive Evolutionary Algorithm.
+
+Budget allocator decides how the time (of a single Adaptive Evolutionary Algorithm iteration) is shared between
+Lower Evolutionary Algorithms, so configurations that are doing poorly might get less time than promising ones.
+"""
+
+__all__ = ["RunLowerAlgorithmsTyping", "AbstractBudgetAllocator", "EqualBudgetAllocator",
+           "SuccessiveHalvingBudgetAllocator"]
+
+
+from typing import Any, Callable, Dict, List, Sequence
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from math import ceil
+
+from ...problem import AbstractSolution, fitness_key
+
+
+RunLowerAlgorithmsTyping = Callable[[Sequence[AbstractSolution], timedelta], None]
+"""Function that performs (or continues) optimization processes of given Lower Evolutionary Algorithms
+with given time limit (for each algorithm)."""
+
+
+class AbstractBudgetAllocator(ABC):
+    """Abstract definition of budget allocator."""
+
+    @abstractmethod
+    def perform_lower_algorithms(self,
+                                 lower_algorithms: Sequence[AbstractSolution],
+                                 time_budget: timedelta,
+                                 workers: int,
+                                 run_lower_algorithms: RunLowerAlgorithmsTyping) -> None:
+        """
+        Performs optimization processes of Lower Evolutionary Algorithms within provided time budget.
+
+        :param lower_algorithms: Lower Evolutionary Algorithms (of a single Adaptive Evolutionary Algorithm iteration).
+        :param time_budget: Time that might be used by all Lower Evolutionary Algorithms.
+        :param workers: Number of Lower Evolutionary Algorithms that are executed at the same time.
+        :param run_lower_algorithms: Function that performs optimization processes of Lower Evolutionary Algorithms.
+            Note: Lower Evolutionary Algorithm that is run again, continues its optimization process.
+        """
+        ...
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Budget Allocator crucial data.
+        """
+        return {
+            "type": self.__class__.__name__,
+        }
+
+
+class EqualBudgetAllocator(AbstractBudgetAllocator):
+    """Budget allocator that gives the same time to each Lower Evolutionary Algorithm."""
+
+    def perform_lower_algorithms(self,
+                                 lower_algorithms: Sequence[AbstractSolution],
+                                 time_budget: timedelta,
+                                 workers: int,
+                                 run_lower_algorithms: RunLowerAlgorithmsTyping) -> None:
+        """
+        Performs optimization processes of Lower Evolutionary Algorithms within provided time budget.
+
+        :param lower_algorithms: Lower Evolutionary Algorithms (of a single Adaptive Evolutionary Algorithm iteration).
+        :param time_budget: Time that might be used by all Lower Evolutionary Algorithms.
+        :param workers: Number of Lower Evolutionary Algorithms that are executed at the same time.
+        :param run_lower_algorithms: Function that performs optimization processes of Lower Evolutionary Algorithms.
+        """
+        sequential_runs_number = ceil(len(lower_algorithms) / workers)
+        run_lower_algorithms(lower_algorithms, time_budget / sequential_runs_number)
+
+
+class SuccessiveHalvingBudgetAllocator(AbstractBudgetAllocator):
+    """
+    Budget allocator that races Lower Evolutionary Algorithms (successive halving).
+
+    Time budget is split equally between following rounds. In the first round, all Lower Evolutionary Algorithms
+    are executed. Only the best of them (the best adapted configurations) continue their optimization processes
+    in the next round, so the time freed by dropped algorithms is given to the survivors.
+    """
+
+    def __init__(self, reduction_factor: int = 2, min_survivors: int = 1) -> None:
+        """
+        Configuration of Successive Halving Budget Allocator.
+
+        :param reduction_factor: Number of algorithms in a round is divided by this value to get number of algorithms
+            that survive (continue in the next round).
+        :param min_survivors: Number of algorithms in the last round.
+
+        :raise TypeError: For some parameter a value has incorrect type.
+        :raise ValueError: For some parameter a value is incorrect.
+        """
+        if not isinstance(reduction_factor, int):
+            raise TypeError(f"Parameter 'reduction_factor' value is not int type. Actual value: {reduction_factor}.")
+        if reduction_factor < 2:
+            raise ValueError(f"Parameter 'reduction_factor' value must be greater than 1. "
+                             f"Actual value: {reduction_factor}.")
+        if not isinstance(min_survivors, int):
+            raise TypeError(f"Parameter 'min_survivors' value is not int type. Actual value: {min_survivors}.")
+        if min_survivors <= 0:
+            raise ValueError(f"Parameter 'min_survivors' value must be greater than 0. Actual value: {min_survivors}.")
+        self.reduction_factor = reduction_factor
+        self.min_survivors = min_survivors
+
+    def get_rounds_sizes(self, algorithms_number: int) -> List[int]:
+        """
+        Gets numbers of Lower Evolutionary Algorithms that are executed in following rounds.
+
+        :param algorithms_number: Number of all Lower Evolutionary Algorithms.
+
+        :return: List with numbers of algorithms in following rounds.
+        """
+        rounds_sizes = [algorithms_number]
+        while rounds_sizes[-1] > self.min_survivors:
+            rounds_sizes.append(max(self.min_survivors, ceil(rounds_sizes[-1] / self.reduction_factor)))
+        return rounds_sizes
+
+    def perform_lower_algorithms(self,
+                                 lower_algorithms: Sequence[AbstractSolution],
+                                 time_budget: timedelta,
+                                 workers: int,
+                                 run_lower_algorithms: RunLowerAlgorithmsTyping) -> None:
+        """
+        Performs optimization processes of Lower Evolutionary Algorithms within provided time budget.
+
+        :param lower_algorithms: Lower Evolutionary Algorithms (of a single Adaptive Evolutionary Algorithm iteration).
+        :param time_budget: Time that might be used by all Lower Evolutionary Algorithms.
+        :param workers: Number of Lower Evolutionary Algorithms that are executed at the same time.
+        :param run_lower_algorithms: Function that performs optimization processes of Lower Evolutionary Algorithms.
+        """
+        rounds_sizes = self.get_rounds_sizes(len(lower_algorithms))
+        round_time_budget = time_budget / len(rounds_sizes)
+        survivors = list(lower_algorithms)
+        for round_index, round_size in enumerate(rounds_sizes):
+            if round_index > 0:
+                survivors = sorted(survivors, key=fitness_key, reverse=True)[:round_size]
+            run_lower_algorithms(survivors, round_time_budget / ceil(round_size / workers))
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Budget Allocator crucial data.
+        """
+        log_data = super().get_log_data()
+        log_data.update(reduction_factor=self.reduction_factor, min_survivors=self.min_survivors)
+        return log_data
@@ -1,21 +1,28 @@
 """Crossover functions implementation that are used by Evolutionary Algorithms."""
 
-__all__ = ["CrossoverType", "CROSSOVER_FUNCTIONS", "CROSSOVER_ADDITIONAL_PARAMS", "check_crossover_parameters",
+__all__ = ["CrossoverType", "CROSSOVER_FUNCTIONS", "CROSSOVER_MASK_FUNCTIONS", "CROSSOVER_GENES_FUNCTIONS",
+           "CROSSOVER_ADDITIONAL_PARAMS", "CROSSOVER_ADDITIONAL_PARAMS_LIMITS", "check_crossover_parameters",
            "ChildrenValuesTyping"]
 
 
-from typing import Tuple, Dict, Callable, Any
+from typing import Tuple, Dict, Callable, Any, Union
 from enum import Enum
 from collections import OrderedDict
 
-from ...problem import AbstractSolution
-from ...utilities import generate_random_int, choose_random_values
+import numpy as np
+
+from ...problem import AbstractSolution, FloatVariable
+from ...utilities import generate_random_int, choose_random_values, generate_random_ints_array, \
+    generate_random_floats_array
+from .limits import MIN_CROSSOVER_DISTRIBUTION_INDEX, MAX_CROSSOVER_DISTRIBUTION_INDEX, MIN_BLEND_ALPHA, \
+    MAX_BLEND_ALPHA
 
 
 # crossover utilities
 
 
 ChildrenValuesTyping = Tuple[OrderedDict, OrderedDict]
+ChildrenGenesTyping = Tuple[np.ndarray, np.ndarray]
 
 
 def check_crossover_points_number(variables_number: int, crossover_points_number: int) -> None:
@@ -55,6 +62,95 @@ def check_crossover_pattern(variables_number: int, crossover_pattern: int) -> No
                          f"Expected value: 0 < crossover_pattern < {max_pattern_value}. "
                          f"Actual value: {crossover_pattern}.")
 
+
+def check_real_crossover_parameter(param_name: str, param_value: Union[float, int]) -> None:
+    """
+    Check if parameter of real-valued crossover has proper value.
+
+    :param param_name: Name of the parameter (one of CROSSOVER_ADDITIONAL_PARAMS_LIMITS keys).
+    :param param_value: Value of the parameter.
+
+    :raise TypeError: Value of parameter is not int nor float type.
+    :raise ValueError: Value of parameter is not in proper range.
+    """
+    if not isinstance(param_value, (int, float)):
+        raise TypeError(f"Parameter '{param_name}' is not int nor float type. Actual value: {param_value}.")
+    min_value, max_value = CROSSOVER_ADDITIONAL_PARAMS_LIMITS[param_name]
+    if not min_value <= param_value <= max_value:
+        raise ValueError(f"Parameter '{param_name}' has invalid value. "
+                         f"Expected value: {min_value} <= {param_name} <= {max_value}. "
+                         f"Actual value: {param_value}.")
+
+
+def get_pattern_mask(variables_number: int, crossover_pattern: int) -> np.ndarray:
+    """
+    Converts crossover pattern into crossover mask.
+
+    :param variables_number: Number of decision variables (genes).
+    :param crossover_pattern: Pattern of crossover (i-th bit of the pattern is related to i-th gene).
+
+    :return: Boolean array with crossover mask (True value for each set bit of the pattern).
+    """
+    pattern_bytes = crossover_pattern.to_bytes((variables_number + 7) // 8, byteorder="little")
+    return np.unpackbits(np.frombuffer(pattern_bytes, dtype=np.uint8), count=variables_number,
+                         bitorder="little").astype(bool)
+
+
+def crossover_with_mask(parents: Tuple[AbstractSolution, AbstractSolution],
+                        crossover_mask: np.ndarray) -> ChildrenValuesTyping:
+    """
+    Mixes parents genes (decision variables values) according to crossover mask.
+
+    :param parents: Pair of parent solution that provides genes for a new pair of children.
+    :param crossover_mask: Boolean array with crossover mask. True value means that the first child gets the gene
+        from the second parent (and the second child gets the gene from the first parent).
+
+    :return: Pair of children data sets.
+    """
+    names = parents[0].optimization_problem.decision_variables.keys()
+    genes_1 = np.empty(len(crossover_mask), dtype=object)
+    genes_1[:] = list(parents[0].values)
+    genes_2 = np.empty(len(crossover_mask), dtype=object)
+    genes_2[:] = list(parents[1].values)
+    child_1_values = OrderedDict(zip(names, np.where(crossover_mask, genes_2, genes_1).tolist()))
+    child_2_values = OrderedDict(zip(names, np.where(crossover_mask, genes_1, genes_2).tolist()))
+    return child_1_values, child_2_values
+
+
+def crossover_float_genes(parents: Tuple[AbstractSolution, AbstractSolution],
+                          genes_crossover_function: Callable[..., ChildrenGenesTyping],
+                          **crossover_params: Any) -> ChildrenValuesTyping:
+    """
+    Real-valued crossover of parents.
+
+    Values of float decision variables (genes) are created by real-valued crossover function,
+    values of other decision variables are picked from randomly chosen parent (as in uniform crossover).
+
+    :param parents: Pair of parent solution that provides genes for a new pair of children.
+    :param genes_crossover_function: Real-valued crossover function (one of CROSSOVER_GENES_FUNCTIONS values).
+    :param crossover_params: Additional parameters of real-valued crossover function.
+
+    :return: Pair of children data sets.
+    """
+    parent_1_values = parents[0].decision_variables_values
+    parent_2_values = parents[1].decision_variables_values
+    child_1_values, child_2_values = uniform_crossover(parents=parents, variables_number=len(parent_1_values))
+    decision_variables = parents[0].optimization_problem.decision_variables
+    float_variables = [(name, variable) for name, variable in decision_variables.items()  # type: ignore
+                       if isinstance(variable, FloatVariable)]
+    if float_variables:
+        names = [name for name, _ in float_variables]
+        children_1_genes, children_2_genes = genes_crossover_function(
+            np.array([parent_1_values[name] for name in names], dtype=float),
+            np.array([parent_2_values[name] for name in names], dtype=float),
+            lower_bounds=np.array([variable.min_value for _, variable in float_variables], dtype=float),
+            upper_bounds=np.array([variable.max_value for _, variable in float_variables], dtype=float),
+            **crossover_params)
+        child_1_values.update(zip(names, children_1_genes.tolist()))
+        child_2_values.update(zip(names, children_2_genes.tolist()))
+    return child_1_values, child_2_values
+
+
 # crossover functions
 
 
@@ -72,11 +168,7 @@ def single_point_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
     :return: Pair of children data sets.
     """
     crossover_point = generate_random_int(1, variables_number-1)
-    parent_1_values = list(parents[0].decision_variables_values.items())
-    parent_2_values = list(parents[1].decision_variables_values.items())
-    child_1_values = OrderedDict(parent_1_values[:crossover_point] + parent_2_values[crossover_point:])
-    child_2_values = OrderedDict(parent_2_values[:crossover_point] + parent_1_values[crossover_point:])
-    return child_1_values, child_2_values
+    return crossover_with_mask(parents=parents, crossover_mask=np.arange(variables_number) >= crossover_point)
 
 
 def multi_point_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
@@ -96,19 +188,8 @@ def multi_point_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
     """
     crossover_points = choose_random_values(values_pool=range(1, variables_number),
                                             values_number=crossover_points_number)
-    parent_1_values = list(parents[0].decision_variables_values.items())
-    parent_2_values = list(parents[1].decision_variables_values.items())
-    child_1_values = OrderedDict(parent_1_values[:crossover_points[0]])
-    child_2_values = OrderedDict(parent_2_values[:crossover_points[0]])
-    for i, current_point in enumerate(crossover_points[1:] + [variables_number]):
-        previous_point = crossover_points[i]
-        if i & 1:
-            child_1_values.update(parent_1_values[previous_point:current_point])
-            child_2_values.update(parent_2_values[previous_point:current_point])
-        else:
-            child_1_values.update(parent_2_values[previous_point:current_point])
-            child_2_values.update(parent_1_values[previous_point:current_point])
-    return child_1_values, child_2_values
+    passed_points = (np.array(crossover_points)[:, np.newaxis] <= np.arange(variables_number)).sum(axis=0)
+    return crossover_with_mask(parents=parents, crossover_mask=(passed_points & 1).astype(bool))
 
 
 def adaptive_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
@@ -126,15 +207,8 @@ def adaptive_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
 
     :return: Pair of children data sets.
     """
-    parents_values = list(parents[0].decision_variables_values.items()), \
-        list(parents[1].decision_variables_values.items())
-    child_1_values: OrderedDict = OrderedDict()
-    child_2_values: OrderedDict = OrderedDict()
-    for i in range(variables_number):
-        pattern_value = (crossover_pattern >> i) & 1
-        child_1_values.update([parents_values[pattern_value][i]])
-        child_2_values.update([parents_values[pattern_value ^ 1][i]])
-    return child_1_values, child_2_values
+    return crossover_with_mask(parents=parents, crossover_mask=get_pattern_mask(variables_number=variables_number,
+                                                                                crossover_pattern=crossover_pattern))
 
 
 def uniform_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
@@ -150,8 +224,214 @@ def uniform_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
 
     :return: Pair of children data sets.
     """
-    random_pattern = generate_random_int(0, (1 << variables_number) - 1)
-    return adaptive_crossover(parents=parents, variables_number=variables_number, crossover_pattern=random_pattern)
+    crossover_mask = generate_random_floats_array(size=variables_number) < 0.5
+    return crossover_with_mask(parents=parents, crossover_mask=crossover_mask)
+
+
+def simulated_binary_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
+                               variables_number: int,  # pylint: disable=unused-argument
+                               crossover_distribution_index: float) -> ChildrenValuesTyping:
+    """
+    Simulated binary crossover (SBX) function.
+
+    Float genes of children are spread around parents genes (the higher 'crossover_distribution_index',
+    the closer to parents), other genes are picked from randomly chosen parent.
+
+    :param parents: Pair of parent solution that provides genes for a new pair of children.
+    :param variables_number: Number of decision variables (genes).
+    :param crossover_distribution_index: Distribution index of simulated binary crossover.
+
+    :return: Pair of children data sets.
+    """
+    return crossover_float_genes(parents=parents, genes_crossover_function=simulated_binary_crossover_genes,
+                                 crossover_distribution_index=crossover_distribution_index)
+
+
+def blend_alpha_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
+                          variables_number: int,  # pylint: disable=unused-argument
+                          blend_alpha: float) -> ChildrenValuesTyping:
+    """
+    Blend crossover (BLX-alpha) function.
+
+    Float genes of children are drawn from interval spanned by parents genes extended on both sides
+    by [blend_alpha] of its length, other genes are picked from randomly chosen parent.
+
+    :param parents: Pair of parent solution that provides genes for a new pair of children.
+    :param variables_number: Number of decision variables (genes).
+    :param blend_alpha: Extension (relative to parents genes distance) of the interval.
+
+    :return: Pair of children data sets.
+    """
+    return crossover_float_genes(parents=parents, genes_crossover_function=blend_alpha_crossover_genes,
+                                 blend_alpha=blend_alpha)
+
+
+def arithmetic_crossover(parents: Tuple[AbstractSolution, AbstractSolution],
+                         variables_number: int) -> ChildrenValuesTyping:  # pylint: disable=unused-argument
+    """
+    Arithmetic crossover function.
+
+    Float genes of children are weighted averages of parents genes (with random weight), other genes are picked
+    from randomly chosen parent.
+
+    :param parents: Pair of parent solution that provides genes for a new pair of children.
+    :param variables_number: Number of decision variables (genes).
+
+    :return: Pair of children data sets.
+    """
+    return crossover_float_genes(parents=parents, genes_crossover_function=arithmetic_crossover_genes)
+
+
+# real-valued crossovers of float genes (used by both solution objects and array population)
+#   Parents genes are arrays with the same shape - the last axis is related to genes, other axes to pairs of parents.
+#   Children genes are clipped to bounds of decision variables.
+
+
+def simulated_binary_crossover_genes(parents_1_genes: np.ndarray,
+                                     parents_2_genes: np.ndarray,
+                                     lower_bounds: np.ndarray,
+                                     upper_bounds: np.ndarray,
+                                     crossover_distribution_index: float) -> ChildrenGenesTyping:
+    """
+    Simulated binary crossover of float genes.
+
+    :param parents_1_genes: Float genes of the first parents.
+    :param parents_2_genes: Float genes of the second parents.
+    :param lower_bounds: Minimal values of following genes.
+    :param upper_bounds: Maximal values of following genes.
+    :param crossover_distribution_index: Distribution index of simulated binary crossover.
+
+    :return: Float genes of the first and the second children.
+    """
+    random_values, swap_values = generate_random_floats_array(size=(2, *parents_1_genes.shape))
+    exponent = 1. / (crossover_distribution_index + 1.)
+    spread_factors = np.where(random_values <= 0.5,
+                              (2. * random_values) ** exponent,
+                              (0.5 / (1. - random_values)) ** exponent)
+    # children genes are swapped with 0.5 probability, so each child gets genes spread around both parents
+    spread_factors = np.where(swap_values < 0.5, -spread_factors, spread_factors)
+    genes_sum = parents_1_genes + parents_2_genes
+    genes_difference = spread_factors * (parents_2_genes - parents_1_genes)
+    return (np.clip(0.5 * (genes_sum - genes_difference), lower_bounds, upper_bounds),
+            np.clip(0.5 * (genes_sum + genes_difference), lower_bounds, upper_bounds))
+
+
+def blend_alpha_crossover_genes(parents_1_genes: np.ndarray,
+                                parents_2_genes: np.ndarray,
+                                lower_bounds: np.ndarray,
+                                upper_bounds: np.ndarray,
+                                blend_alpha: float) -> ChildrenGenesTyping:
+    """
+    Blend crossover (BLX-alpha) of float genes.
+
+    :param parents_1_genes: Float genes of the first parents.
+    :param parents_2_genes: Float genes of the second parents.
+    :param lower_bounds: Minimal values of following genes.
+    :param upper_bounds: Maximal values of following genes.
+    :param blend_alpha: Extension (relative to parents genes distance) of the interval.
+
+    :return: Float genes of the first and the second children.
+    """
+    min_genes = np.minimum(parents_1_genes, parents_2_genes)
+    max_genes = np.maximum(parents_1_genes, parents_2_genes)
+    extension = blend_alpha * (max_genes - min_genes)
+    interval_start = min_genes - extension
+    interval_length = max_genes - min_genes + 2. * extension
+    random_values = generate_random_floats_array(size=(2, *parents_1_genes.shape))
+    children_genes = np.clip(interval_start + random_values * interval_length, lower_bounds, upper_bounds)
+    return children_genes[0], children_genes[1]
+
+
+def arithmetic_crossover_genes(parents_1_genes: np.ndarray,
+                               parents_2_genes: np.ndarray,
+                               lower_bounds: np.ndarray,
+                               upper_bounds: np.ndarray) -> ChildrenGenesTyping:
+    """
+    Arithmetic crossover of float genes (one random weight per pair of parents).
+
+    :param parents_1_genes: Float genes of the first parents.
+    :param parents_2_genes: Float genes of the second parents.
+    :param lower_bounds: Minimal values of following genes.
+    :param upper_bounds: Maximal values of following genes.
+
+    :return: Float genes of the first and the second children.
+    """
+    weights = generate_random_floats_array(size=(*parents_1_genes.shape[:-1], 1))
+    genes_difference = weights * (parents_2_genes - parents_1_genes)
+    return (np.clip(parents_1_genes + genes_difference, lower_bounds, upper_bounds),
+            np.clip(parents_2_genes - genes_difference, lower_bounds, upper_bounds))
+
+
+# crossover masks (used by array population)
+#   Mask has shape (pairs_number, variables_number). True value means that the first child gets the gene from
+#   the second parent (and the second child gets the gene from the first parent).
+
+
+def single_point_crossover_mask(pairs_number: int, variables_number: int) -> np.ndarray:
+    """
+    Single point crossover masks of many pairs of parents.
+
+    :param pairs_number: Number of pairs of parents.
+    :param variables_number: Number of decision variables (genes).
+
+    :return: Boolean array with crossover masks (one row per pair of parents).
+    """
+    crossover_points = generate_random_ints_array(1, variables_number - 1, size=(pairs_number, 1))
+    return np.arange(variables_number) >= crossover_points
+
+
+def multi_point_crossover_mask(pairs_number: int, variables_number: int, crossover_points_number: int) -> np.ndarray:
+    """
+    Multi point crossover masks of many pairs of parents.
+
+    :param pairs_number: Number of pairs of parents.
+    :param variables_number: Number of decision variables (genes).
+    :param crossover_points_number: Number of crossover points to use.
+
+    :return: Boolean array with crossover masks (one row per pair of parents).
+    """
+    crossover_points = np.argsort(generate_random_floats_array(size=(pairs_number, variables_number - 1)),
+                                  axis=1)[:, :crossover_points_number] + 1
+    passed_points = (crossover_points[:, :, np.newaxis] <= np.arange(variables_number)).sum(axis=1)
+    return (passed_points & 1).astype(bool)
+
+
+def adaptive_crossover_mask(pairs_number: int, variables_number: int, crossover_pattern: int) -> np.ndarray:
+    """
+    Adaptive crossover masks of many pairs of parents.
+
+    :param pairs_number: Number of pairs of parents.
+    :param variables_number: Number of decision variables (genes).
+    :param crossover_pattern: Pattern of crossover to be used.
+
+    :return: Boolean array with crossover masks (one row per pair of parents).
+    """
+    pattern_mask = get_pattern_mask(variables_number=variables_number, crossover_pattern=crossover_pattern)
+    return np.tile(pattern_mask, (pairs_number, 1))
+
+
+def uniform_crossover_mask(pairs_number: int, variables_number: int) -> np.ndarray:
+    """
+    Uniform crossover masks of many pairs of parents.
+
+    :param pairs_number: Number of pairs of parents.
+    :param variables_number: Number of decision variables (genes).
+
+    :return: Boolean array with crossover masks (one row per pair of parents).
+    """
+    return generate_random_floats_array(size=(pairs_number, variables_number)) < 0.5
+
+
+def real_valued_crossover_mask(pairs_number: int, variables_number: int, **_: Any) -> np.ndarray:
+    """
+    Crossover masks of real-valued crossovers (used for genes that are not float).
+
+    :param pairs_number: Number of pairs of parents.
+    :param variables_number: Number of decision variables (genes).
+
+    :return: Boolean array with crossover masks (one row per pair of parents).
+    """
+    return uniform_crossover_mask(pairs_number=pairs_number, variables_number=variables_number)
 
 
 # outputs (visible outside)
@@ -166,12 +446,19 @@ class CrossoverType(Enum):
         - MultiPoint - Mixes genes of two parents with many points of crossover.
         - Uniform - Each gene is independently picked from randomly picked parent.
         - Adaptive - Genes are mixed according to crossover pattern.
+        - SimulatedBinary - Float genes are spread around parents genes (SBX), other genes as in Uniform.
+        - BlendAlpha - Float genes are drawn from extended interval between parents genes (BLX-alpha),
+            other genes as in Uniform.
+        - Arithmetic - Float genes are weighted averages of parents genes, other genes as in Uniform.
     """
 
     SinglePoint = "SinglePoint"
     MultiPoint = "MultiPoint"
     Adaptive = "Adaptive"
     Uniform = "Uniform"
+    SimulatedBinary = "SimulatedBinary"
+    BlendAlpha = "BlendAlpha"
+    Arithmetic = "Arithmetic"
 
 
 CROSSOVER_FUNCTIONS: Dict[str, Callable] = {
@@ -180,6 +467,29 @@ CROSSOVER_FUNCTIONS: Dict[str, Callable] = {
     CrossoverType.MultiPoint.value: multi_point_crossover,
     CrossoverType.Adaptive.value: adaptive_crossover,
     CrossoverType.Uniform.value: uniform_crossover,
+    CrossoverType.SimulatedBinary.value: simulated_binary_crossover,
+    CrossoverType.BlendAlpha.value: blend_alpha_crossover,
+    CrossoverType.Arithmetic.value: arithmetic_crossover,
+}
+
+
+CROSSOVER_MASK_FUNCTIONS: Dict[str, Callable] = {
+    # crossover type: crossover masks function
+    CrossoverType.SinglePoint.value: single_point_crossover_mask,
+    CrossoverType.MultiPoint.value: multi_point_crossover_mask,
+    CrossoverType.Adaptive.value: adaptive_crossover_mask,
+    CrossoverType.Uniform.value: uniform_crossover_mask,
+    CrossoverType.SimulatedBinary.value: real_valued_crossover_mask,
+    CrossoverType.BlendAlpha.value: real_valued_crossover_mask,
+    CrossoverType.Arithmetic.value: real_valued_crossover_mask,
+}
+
+
+CROSSOVER_GENES_FUNCTIONS: Dict[str, Callable[..., ChildrenGenesTyping]] = {
+    # crossover type: real-valued crossover function of float genes (only for real-valued crossover types)
+    CrossoverType.SimulatedBinary.value: simulated_binary_crossover_genes,
+    CrossoverType.BlendAlpha.value: blend_alpha_crossover_genes,
+    CrossoverType.Arithmetic.value: arithmetic_crossover_genes,
 }
 
 
@@ -189,6 +499,16 @@ CROSSOVER_ADDITIONAL_PARAMS: Dict[str, Tuple[str, ...]] = {
     CrossoverType.MultiPoint.value: ("crossover_points_number", ),
     CrossoverType.Adaptive.value: ("crossover_pattern", ),
     CrossoverType.Uniform.value: (),
+    CrossoverType.SimulatedBinary.value: ("crossover_distribution_index", ),
+    CrossoverType.BlendAlpha.value: ("blend_alpha", ),
+    CrossoverType.Arithmetic.value: (),
+}
+
+
+CROSSOVER_ADDITIONAL_PARAMS_LIMITS: Dict[str, Tuple[float, float]] = {
+    # parameter name: (min value, max value)
+    "crossover_distribution_index": (MIN_CROSSOVER_DISTRIBUTION_INDEX, MAX_CROSSOVER_DISTRIBUTION_INDEX),
+    "blend_alpha": (MIN_BLEND_ALPHA, MAX_BLEND_ALPHA),
 }
 
 
@@ -203,3 +523,6 @@ def check_crossover_parameters(variables_number: int, **crossover_params: Any) -
         check_crossover_points_number(variables_number, crossover_params["crossover_points_number"])
     if "crossover_pattern" in crossover_params:
         check_crossover_pattern(variables_number, crossover_params["crossover_pattern"])
+    for param_name in CROSSOVER_ADDITIONAL_PARAMS_LIMITS:
+        if param_name in crossover_params:
+            check_real_crossover_parameter(param_name, crossover_params[param_name])
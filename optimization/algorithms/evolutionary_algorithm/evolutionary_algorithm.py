@@ -3,17 +3,25 @@
 __all__ = ["EvolutionaryAlgorithm"]
 
 
-from typing import Optional, Union, Any, Dict, Tuple, OrderedDict
+from typing import Optional, Union, Any, Dict, List, Tuple, OrderedDict
+from functools import partial
+
+import numpy as np
 
 from ..abstract_algorithm import AbstractOptimizationAlgorithm
-from ...problem import OptimizationProblem, AbstractSolution
+from ..initialization import InitializationType, generate_initial_values
+from ...problem import OptimizationProblem, OptimizationType, AbstractSolution, FloatVariable, fitness_key
 from ...stop_conditions import StopConditions
 from ...logging import AbstractLogger
-from .selection import SelectionType, SELECTION_FUNCTIONS, SELECTION_ADDITIONAL_PARAMS, check_selection_parameters, \
-    SelectionOutput
-from .crossover import CrossoverType, CROSSOVER_FUNCTIONS, CROSSOVER_ADDITIONAL_PARAMS, check_crossover_parameters, \
-    ChildrenValuesTyping
-from .mutation import MutationType, MUTATION_FUNCTIONS, MUTATION_ADDITIONAL_PARAMS, check_mutation_parameters
+from ...evaluators import AbstractEvaluator
+from ...utilities import RandomSource
+from .selection import SelectionType, SELECTION_FUNCTIONS, BATCH_SELECTION_FUNCTIONS, SELECTION_ADDITIONAL_PARAMS, \
+    check_selection_parameters, SelectionOutput
+from .crossover import CrossoverType, CROSSOVER_FUNCTIONS, CROSSOVER_MASK_FUNCTIONS, CROSSOVER_GENES_FUNCTIONS, \
+    CROSSOVER_ADDITIONAL_PARAMS, check_crossover_parameters, ChildrenValuesTyping
+from .mutation import MutationType, MUTATION_FUNCTIONS, MUTATION_MASK_FUNCTIONS, MUTATION_GENES_FUNCTIONS, \
+    MUTATION_ADDITIONAL_PARAMS, check_mutation_parameters
+from .population import GenesEncoding, ArrayPopulation, MAX_EXACT_GENE_VALUE
 from .limits import MIN_EA_POPULATION_SIZE, MAX_EA_POPULATION_SIZE, MIN_EA_MUTATION_CHANCE, MAX_EA_MUTATION_CHANCE
 
 
@@ -40,6 +48,10 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
                  mutation_chance: float,
                  apply_elitism: bool,
                  logger: Optional[AbstractLogger] = None,
+                 evaluator: Optional[AbstractEvaluator] = None,
+                 array_population: bool = False,
+                 random_source: Optional[RandomSource] = None,
+                 initialization_type: Union[InitializationType, str] = InitializationType.Uniform,
                  **other_params: Any) -> None:
         """
         Configuration of Evolutionary Algorithm.
@@ -55,6 +67,15 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
             When True, then only better adopted children will replace their parents.
             When False, then children will always replace their parents.
         :param logger: Logger used for optimization process recording.
+        :param evaluator: Evaluator used for calculation of solutions objective values.
+            If None, then SerialEvaluator is used.
+        :param array_population: Information whether population should be stored in arrays.
+            When True, then genes of the whole population are stored in a single array and selection, crossover
+            and mutation are performed on whole arrays (faster for big populations and many decision variables).
+            When False, then each individual is processed separately as a solution object.
+        :param random_source: Source of random values used during optimization process.
+            If None, then new (not seeded) RandomSource is used.
+        :param initialization_type: Type of initialization strategy used for creating initial population.
         :param other_params: Parameter related to selected selection, crossover and mutation type such as:
             - :param tournament_group_size: int - determines group size used in tournament
                 and double tournament selections
@@ -63,17 +84,30 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
                 in ranking selection
             - :param crossover_points_number: int - number of crossover points to use in multipoint crossover
             - :param crossover_pattern: int - pattern of crossover to be used in adaptive crossover
-            - :param mutation_points_number: int - number of mutation points to be used in multipoint mutation.
+            - :param crossover_distribution_index: float - distribution index of simulated binary crossover
+                (the higher the value, the closer children genes are to parents genes)
+            - :param blend_alpha: float - extension of parents genes interval in blend (BLX-alpha) crossover
+            - :param mutation_points_number: int - number of mutation points to be used in multipoint mutation
+            - :param mutation_sigma: float - standard deviation (relative to decision variable range) of gene shift
+                in gaussian mutation
+            - :param mutation_distribution_index: float - distribution index of polynomial mutation.
 
         :raise ValueError: Unexpected value of 'other_params'.
         """
         self_ea._check_init_input(population_size=population_size, mutation_chance=mutation_chance,
-                                  apply_elitism=apply_elitism)
-        super().__init__(problem=problem, stop_conditions=stop_conditions, logger=logger)
+                                  apply_elitism=apply_elitism, array_population=array_population, problem=problem)
+        super().__init__(problem=problem, stop_conditions=stop_conditions, logger=logger, evaluator=evaluator,
+                         random_source=random_source)
         self_ea.population_size = population_size
         self_ea._population: list = []
         self_ea.mutation_chance = mutation_chance
         self_ea.apply_elitism = apply_elitism
+        self_ea.array_population = array_population
+        self_ea.initialization_type = initialization_type.value \
+            if isinstance(initialization_type, InitializationType) \
+            else getattr(InitializationType, initialization_type).value
+        self_ea._genes_encoding: Optional[GenesEncoding] = None
+        self_ea._array_population: Optional[ArrayPopulation] = None
         self_ea.selection_type = selection_type.value if isinstance(selection_type, SelectionType) \
             else getattr(SelectionType, selection_type).value
         self_ea.crossover_type = crossover_type.value if isinstance(crossover_type, CrossoverType) \
@@ -81,8 +115,13 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
         self_ea.mutation_type = mutation_type.value if isinstance(mutation_type, MutationType) \
             else getattr(MutationType, mutation_type).value
         self_ea.selection_function = SELECTION_FUNCTIONS[self_ea.selection_type]
+        self_ea.batch_selection_function = BATCH_SELECTION_FUNCTIONS[self_ea.selection_type]
         self_ea.crossover_function = CROSSOVER_FUNCTIONS[self_ea.crossover_type]
         self_ea.mutation_function = MUTATION_FUNCTIONS[self_ea.mutation_type]
+        self_ea.crossover_mask_function = CROSSOVER_MASK_FUNCTIONS[self_ea.crossover_type]
+        self_ea.mutation_mask_function = MUTATION_MASK_FUNCTIONS[self_ea.mutation_type]
+        self_ea.crossover_genes_function = CROSSOVER_GENES_FUNCTIONS.get(self_ea.crossover_type)
+        self_ea.mutation_genes_function = MUTATION_GENES_FUNCTIONS.get(self_ea.mutation_type)
         self_ea.selection_params: Dict[str, Any] = {}
         self_ea.crossover_params: Dict[str, Any] = {}
         self_ea.mutation_params: Dict[str, Any] = {}
@@ -96,13 +135,17 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
             raise ValueError(f"Unexpected 'other_params' received: {other_params}.")
         self_ea._check_additional_parameters()
 
-    def _check_init_input(self, population_size: int, mutation_chance: float, apply_elitism: bool) -> None:
+    def _check_init_input(self, population_size: int, mutation_chance: float, apply_elitism: bool,
+                          array_population: bool = False, problem: Optional[OptimizationProblem] = None) -> None:
         """
         Checks if input parameter provided to __init__ method have proper values.
 
         :param population_size: Size of the algorithm's solution population.
         :param mutation_chance: Probability of a single decision variable (gene) mutation.
         :param apply_elitism: Information whether elitism should be applied.
+        :param array_population: Information whether population should be stored in arrays.
+        :param problem: Optimization problem to solve (used to check whether its decision variables values
+            might be stored in arrays).
 
         :raise TypeError: One of parameters stores value of incorrect type.
         :raise ValueError: One of parameters stores incorrect value.
@@ -122,6 +165,15 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
                              f"Actual value: {mutation_chance}.")
         if not isinstance(apply_elitism, bool):
             raise TypeError(f"Parameter 'apply_elitism' value is not bool type. Actual value: {apply_elitism}.")
+        if not isinstance(array_population, bool):
+            raise TypeError(f"Parameter 'array_population' value is not bool type. "
+                            f"Actual value: {array_population}.")
+        if array_population and isinstance(problem, OptimizationProblem):
+            inexact_variables = GenesEncoding.get_inexact_variables(problem)
+            if inexact_variables:
+                raise ValueError(f"Parameter 'array_population' cannot be True, because values of some decision "
+                                 f"variables cannot be exactly stored in arrays (absolute value greater than "
+                                 f"{MAX_EXACT_GENE_VALUE}). Actual value: {inexact_variables}.")
 
     def _check_additional_parameters(self) -> None:
         """
@@ -142,7 +194,20 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
         :return: None
         """
         if self.logger is not None:
-            self.logger.log_iteration(iteration=iteration_index, solutions=self._population)
+            self.logger.log_iteration(iteration=iteration_index, solutions=self._get_population())
+
+    def _get_population(self) -> List[AbstractSolution]:
+        """
+        Gets solutions of the current population.
+
+        When array population is used, then solution objects are created only when this method is called
+        (e.g. for logging purposes).
+
+        :return: Solutions of the current population.
+        """
+        if self.array_population and self._array_population is not None and not self._population:
+            self._population = self._array_population.to_solutions(self.SolutionClass)
+        return self._population
 
     def _generate_random_population(self) -> None:
         """
@@ -150,8 +215,18 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
 
         :return: None
         """
-        while len(self._population) < self.population_size:
-            self._population.append(self.SolutionClass())
+        missing_solutions_number = self.population_size - len(self._get_population())
+        if missing_solutions_number > 0:
+            initial_values = generate_initial_values(decision_variables=self.problem.decision_variables,  # type: ignore
+                                                     values_number=missing_solutions_number,
+                                                     initialization_type=self.initialization_type)
+            self._population.extend(self.SolutionClass.from_trusted_values(values) for values in initial_values)
+        self._evaluate_solutions(self._population)
+        if self.array_population:
+            if self._genes_encoding is None:
+                self._genes_encoding = GenesEncoding(self.problem)
+            self._array_population = ArrayPopulation.from_solutions(encoding=self._genes_encoding,
+                                                                    solutions=self._population)
 
     def _perform_selection(self) -> SelectionOutput:
         """
@@ -163,6 +238,16 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
                                        population=self._population,
                                        **self.selection_params)
 
+    def _perform_batch_selection(self) -> np.ndarray:
+        """
+        Selects pairs of individuals (of array population) that will become parents for new population.
+
+        :return: Array with shape (population_size // 2, 2) with indices of parents in following pairs.
+        """
+        return self.batch_selection_function(population_size=self.population_size,
+                                             fitness=self._array_population.fitness,  # type: ignore
+                                             **self.selection_params)
+
     def _perform_crossover(self, parents: Tuple[AbstractSolution, AbstractSolution]) -> ChildrenValuesTyping:
         """
         Performs crossover of two parents.
@@ -184,11 +269,23 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
         :return: None
         """
         decision_variables_list = list(self.problem.decision_variables.items())  # type: ignore
+        float_variables = []
         for mutation_point in self.mutation_function(variables_number=self.problem.variables_number,
                                                      mutation_chance=self.mutation_chance,
                                                      **self.mutation_params):
             name, var = decision_variables_list[mutation_point]
-            individual_values[name] = var.generate_random_value()  # type: ignore
+            if self.mutation_genes_function is not None and isinstance(var, FloatVariable):
+                float_variables.append((name, var))
+            else:
+                individual_values[name] = var.generate_random_value()  # type: ignore
+        if float_variables:
+            names = [name for name, _ in float_variables]
+            genes = self.mutation_genes_function(  # type: ignore
+                np.array([individual_values[name] for name in names], dtype=float),
+                lower_bounds=np.array([var.min_value for _, var in float_variables], dtype=float),
+                upper_bounds=np.array([var.max_value for _, var in float_variables], dtype=float),
+                **self.mutation_params)
+            individual_values.update(zip(names, genes.tolist()))
 
     def _evolution_iteration(self, **_: Any) -> None:
         """
@@ -196,20 +293,91 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
 
         :return: None
         """
-        new_population = []
+        parents = []
+        children = []
         for parent1, parent2 in self._perform_selection():
             child1_values, child2_values = self._perform_crossover(parents=(parent1, parent2))
             self._perform_mutation(child1_values)
             self._perform_mutation(child2_values)
-            child1 = self.SolutionClass(**child1_values)
-            child2 = self.SolutionClass(**child2_values)
-            if self.apply_elitism:
-                new_population.append(child1 if child1 >= parent1 else parent1)
-                new_population.append(child2 if child2 >= parent2 else parent2)
-            else:
-                new_population.append(child1)
-                new_population.append(child2)
-        self._population = new_population
+            parents.extend((parent1, parent2))
+            children.extend((self.SolutionClass.from_trusted_values(child1_values),
+                             self.SolutionClass.from_trusted_values(child2_values)))
+        self._evaluate_solutions(children)
+        if self.apply_elitism:
+            self._population = [child if child.get_fitness() >= parent.get_fitness() else parent
+                                for child, parent in zip(children, parents)]
+        else:
+            self._population = children
+
+    def _array_evolution_iteration(self, **_: Any) -> None:
+        """
+        Perform iteration according to evolutionary algorithm using array population. To be called as following
+        iteration when 'array_population' is True.
+
+        :return: None
+        """
+        population = self._array_population
+        parents_indices = self._perform_batch_selection()
+        crossover_genes_function = None if self.crossover_genes_function is None \
+            else partial(self.crossover_genes_function, **self.crossover_params)
+        mutation_genes_function = None if self.mutation_genes_function is None \
+            else partial(self.mutation_genes_function, **self.mutation_params)
+        children = population.crossover(  # type: ignore
+            parents_indices=parents_indices,
+            masks=self.crossover_mask_function(pairs_number=len(parents_indices),
+                                               variables_number=self.problem.variables_number,
+                                               **self.crossover_params),
+            genes_function=crossover_genes_function)
+        children.mutate(self.mutation_mask_function(individuals_number=len(children),
+                                                    variables_number=self.problem.variables_number,
+                                                    mutation_chance=self.mutation_chance,
+                                                    **self.mutation_params),
+                        genes_function=mutation_genes_function)
+        self._evaluate_array_population(children)
+        if self.apply_elitism:
+            parents = population.take(parents_indices.ravel())  # type: ignore
+            children_kept = children.fitness >= parents.fitness
+            children.genes = np.where(children_kept[:, np.newaxis], children.genes, parents.genes)
+            children.fitness = np.where(children_kept, children.fitness, parents.fitness)
+        self._array_population = children
+        self._population = []  # solution objects are created only when needed (look '_get_population' method)
+
+    def _evaluate_array_population(self, population: ArrayPopulation) -> None:
+        """
+        Evaluation stage of optimization algorithm iteration when array population is used.
+
+        Genes are decoded column by column into the format accepted by batch functions and evaluated by 'evaluator'
+        without creating solution objects. Identical individuals are evaluated only once.
+        If 'checkpoint_interval' of stop conditions is set, then individuals are evaluated in parts of this size
+        and the optimization process might be interrupted between them (look '_checkpoint' method).
+
+        Solution objects are still used when evaluation cache is set for the optimization problem, as the cache
+        stores results of solutions.
+
+        :param population: Population which individuals are going to be evaluated (its fitness is set).
+        """
+        if self.problem.evaluation_cache is not None:
+            solutions = [self.SolutionClass.from_trusted_values(values) for values in population.to_values()]
+            self._evaluate_solutions(solutions)
+            population.fitness = ArrayPopulation.get_fitness(solutions)
+            return
+        unique_genes, inverse = np.unique(population.genes, axis=0, return_inverse=True)
+        unique_fitness = np.empty(len(unique_genes), dtype=float)
+        minimize = self.problem.optimization_type == OptimizationType.Minimize
+        checkpoint_interval = self.stop_conditions.checkpoint_interval or len(unique_genes)
+        for first_index in range(0, len(unique_genes), checkpoint_interval):
+            last_index = first_index + checkpoint_interval
+            objective_values = self.evaluator.evaluate_batch(
+                self.problem, population.encoding.decode_columns(unique_genes[first_index:last_index]))
+            unique_fitness[first_index:last_index] = -objective_values if minimize else objective_values
+            self._evaluations_number += len(objective_values)
+            if last_index < len(unique_genes):
+                evaluated = ArrayPopulation(encoding=population.encoding,
+                                            genes=unique_genes[first_index:last_index],
+                                            fitness=unique_fitness[first_index:last_index])
+                self._checkpoint(evaluated.to_solutions(self.SolutionClass,
+                                                        indices=np.array([np.argmax(evaluated.fitness)])))
+        population.fitness = unique_fitness[inverse.ravel()]
 
     def _perform_iteration(self, iteration_index: int) -> None:
         """
@@ -221,10 +389,17 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
         """
         if iteration_index == 0:
             self._generate_random_population()
+            best_in_iteration = max(self._population, key=fitness_key)
+        elif self.array_population:
+            self._array_evolution_iteration()
+            best_index = np.argmax(self._array_population.fitness)  # type: ignore
+            best_in_iteration = self._array_population.to_solutions(  # type: ignore
+                self.SolutionClass, indices=np.array([best_index]))[0]
         else:
             self._evolution_iteration()
-        self._best_solution = max(*self._population) if self._best_solution is None \
-            else max(*self._population, self._best_solution)
+            best_in_iteration = max(self._population, key=fitness_key)
+        self._best_solution = best_in_iteration if self._best_solution is None \
+            else max(best_in_iteration, self._best_solution, key=fitness_key)
         self._log_iteration(iteration_index=iteration_index)
 
     def get_log_data(self) -> Dict[str, Any]:
@@ -238,5 +413,6 @@ class EvolutionaryAlgorithm(AbstractOptimizationAlgorithm):
                         selection_type=self.selection_type, selection_params=self.selection_params,
                         crossover_type=self.crossover_type, crossover_params=self.crossover_params,
                         mutation_type=self.mutation_type, mutation_params=self.mutation_params,
-                        mutation_chance=self.mutation_chance)
+                        mutation_chance=self.mutation_chance, array_population=self.array_population,
+                        initialization_type=self.initialization_type)
         return log_data
@@ -13,3 +13,15 @@ MIN_ROULETTE_BIAS: float = 1.1
 MAX_ROULETTE_BIAS: float = 100.
 MIN_RANKING_BIAS: float = 1.
 MAX_RANKING_BIAS: float = 2.
+
+# crossover variables
+MIN_CROSSOVER_DISTRIBUTION_INDEX: float = 1.
+MAX_CROSSOVER_DISTRIBUTION_INDEX: float = 100.
+MIN_BLEND_ALPHA: float = 0.
+MAX_BLEND_ALPHA: float = 1.
+
+# mutation variables
+MIN_MUTATION_DISTRIBUTION_INDEX: float = 1.
+MAX_MUTATION_DISTRIBUTION_INDEX: float = 100.
+MIN_MUTATION_SIGMA: float = 0.001
+MAX_MUTATION_SIGMA: float = 1.
@@ -1,12 +1,19 @@
 """Mutation functions implementation that are used by Evolutionary Algorithms."""
 
-__all__ = ["MutationType", "MUTATION_FUNCTIONS", "MUTATION_ADDITIONAL_PARAMS", "check_mutation_parameters"]
+__all__ = ["MutationType", "MUTATION_FUNCTIONS", "MUTATION_MASK_FUNCTIONS", "MUTATION_GENES_FUNCTIONS",
+           "MUTATION_ADDITIONAL_PARAMS", "MUTATION_ADDITIONAL_PARAMS_LIMITS", "check_mutation_parameters"]
 
 
-from typing import List, Dict, Callable, Tuple, Any
+from typing import List, Dict, Callable, Tuple, Any, Union
 from enum import Enum
 
-from ...utilities import generate_random_float, choose_random_value, choose_random_values
+import numpy as np
+
+from ...utilities import generate_random_float, choose_random_value, choose_random_values, \
+    generate_random_ints_array, generate_random_floats_array, generate_random_normal_floats_array, \
+    generate_random_geometric_gap, choose_random_successes_indices
+from .limits import MIN_MUTATION_DISTRIBUTION_INDEX, MAX_MUTATION_DISTRIBUTION_INDEX, MIN_MUTATION_SIGMA, \
+    MAX_MUTATION_SIGMA
 
 
 # mutation utilities
@@ -32,6 +39,25 @@ def check_mutation_points_number(variables_number: int, mutation_points_number:
                          f"Expected value: 2 <= mutation_points_number < {variables_number}. "
                          f"Actual value: {mutation_points_number}.")
 
+
+def check_real_mutation_parameter(param_name: str, param_value: Union[float, int]) -> None:
+    """
+    Check if parameter of real-valued mutation has proper value.
+
+    :param param_name: Name of the parameter (one of MUTATION_ADDITIONAL_PARAMS_LIMITS keys).
+    :param param_value: Value of the parameter.
+
+    :raise TypeError: Value of parameter is not int nor float type.
+    :raise ValueError: Value of parameter is not in proper range.
+    """
+    if not isinstance(param_value, (int, float)):
+        raise TypeError(f"Parameter '{param_name}' is not int nor float type. Actual value: {param_value}.")
+    min_value, max_value = MUTATION_ADDITIONAL_PARAMS_LIMITS[param_name]
+    if not min_value <= param_value <= max_value:
+        raise ValueError(f"Parameter '{param_name}' has invalid value. "
+                         f"Expected value: {min_value} <= {param_name} <= {max_value}. "
+                         f"Actual value: {param_value}.")
+
 # mutation functions
 
 
@@ -80,6 +106,8 @@ def probabilistic_mutation(variables_number: int,
 
     Having in mind 'mutation_chance', selects decision variables to be mutated with the same probability.
     Number of selected decision variables can be any value between 0 and [variables_number].
+    Gaps between following mutation points are drawn, so the number of random draws depends on the number
+    of mutated genes (not on the number of all genes).
 
     :param variables_number: Number of decision variables (genes).
     :param mutation_chance: Probability of single decision variable (gene) mutation.
@@ -87,12 +115,176 @@ def probabilistic_mutation(variables_number: int,
     :return: List of decision variables (genes) positions to be mutated.
     """
     mutation_points = []
-    for var_index in range(variables_number):
-        if generate_random_float(0, 1) <= mutation_chance:
-            mutation_points.append(var_index)
+    if mutation_chance <= 0:
+        return mutation_points
+    var_index = generate_random_geometric_gap(mutation_chance)
+    while var_index < variables_number:
+        mutation_points.append(var_index)
+        var_index += generate_random_geometric_gap(mutation_chance) + 1
     return mutation_points
 
 
+def gaussian_mutation(variables_number: int,
+                      mutation_chance: float,
+                      mutation_sigma: float) -> MutationPointsTyping:  # pylint: disable=unused-argument
+    """
+    Gaussian mutation function.
+
+    Decision variables (genes) to be mutated are selected as in probabilistic mutation. Float genes are then shifted
+    by 'gaussian_mutation_genes' instead of being replaced with random values.
+
+    :param variables_number: Number of decision variables (genes).
+    :param mutation_chance: Probability of single decision variable (gene) mutation.
+    :param mutation_sigma: Standard deviation of gene shift (relative to decision variable range).
+
+    :return: List of decision variables (genes) positions to be mutated.
+    """
+    return probabilistic_mutation(variables_number=variables_number, mutation_chance=mutation_chance)
+
+
+def polynomial_mutation(variables_number: int,
+                        mutation_chance: float,
+                        mutation_distribution_index: float) -> MutationPointsTyping:  # pylint: disable=unused-argument
+    """
+    Polynomial mutation function.
+
+    Decision variables (genes) to be mutated are selected as in probabilistic mutation. Float genes are then shifted
+    by 'polynomial_mutation_genes' instead of being replaced with random values.
+
+    :param variables_number: Number of decision variables (genes).
+    :param mutation_chance: Probability of single decision variable (gene) mutation.
+    :param mutation_distribution_index: Distribution index of polynomial mutation.
+
+    :return: List of decision variables (genes) positions to be mutated.
+    """
+    return probabilistic_mutation(variables_number=variables_number, mutation_chance=mutation_chance)
+
+
+# real-valued mutations of float genes (used by both solution objects and array population)
+#   Mutated genes are clipped to bounds of decision variables.
+
+
+def gaussian_mutation_genes(genes: np.ndarray,
+                            lower_bounds: np.ndarray,
+                            upper_bounds: np.ndarray,
+                            mutation_sigma: float) -> np.ndarray:
+    """
+    Gaussian mutation of float genes.
+
+    :param genes: Float genes to mutate.
+    :param lower_bounds: Minimal values of following genes.
+    :param upper_bounds: Maximal values of following genes.
+    :param mutation_sigma: Standard deviation of gene shift (relative to decision variable range).
+
+    :return: Mutated float genes.
+    """
+    shifts = generate_random_normal_floats_array(size=genes.shape) * mutation_sigma * (upper_bounds - lower_bounds)
+    return np.clip(genes + shifts, lower_bounds, upper_bounds)
+
+
+def polynomial_mutation_genes(genes: np.ndarray,
+                              lower_bounds: np.ndarray,
+                              upper_bounds: np.ndarray,
+                              mutation_distribution_index: float) -> np.ndarray:
+    """
+    Polynomial mutation of float genes.
+
+    :param genes: Float genes to mutate.
+    :param lower_bounds: Minimal values of following genes.
+    :param upper_bounds: Maximal values of following genes.
+    :param mutation_distribution_index: Distribution index of polynomial mutation.
+
+    :return: Mutated float genes.
+    """
+    random_values = generate_random_floats_array(size=genes.shape)
+    exponent = 1. / (mutation_distribution_index + 1.)
+    relative_shifts = np.where(random_values < 0.5,
+                               (2. * random_values) ** exponent - 1.,
+                               1. - (2. * (1. - random_values)) ** exponent)
+    return np.clip(genes + relative_shifts * (upper_bounds - lower_bounds), lower_bounds, upper_bounds)
+
+
+# mutation masks (used by array population)
+#   Mask has shape (individuals_number, variables_number). True value means that the gene is mutated.
+
+
+def single_point_mutation_mask(individuals_number: int,
+                               variables_number: int,
+                               mutation_chance: float) -> np.ndarray:
+    """
+    Single point mutation masks of many individuals.
+
+    :param individuals_number: Number of individuals to mutate.
+    :param variables_number: Number of decision variables (genes).
+    :param mutation_chance: Probability of single decision variable (gene) mutation.
+
+    :return: Boolean array with mutation masks (one row per individual).
+    """
+    scaled_mutation_chance = variables_number * mutation_chance
+    mask = np.zeros((individuals_number, variables_number), dtype=bool)
+    mutated_rows = np.flatnonzero(generate_random_floats_array(size=individuals_number) <= scaled_mutation_chance)
+    mask[mutated_rows, generate_random_ints_array(0, variables_number - 1, size=mutated_rows.size)] = True
+    return mask
+
+
+def multi_point_mutation_mask(individuals_number: int,
+                              variables_number: int,
+                              mutation_chance: float,
+                              mutation_points_number: int) -> np.ndarray:
+    """
+    Multi point mutation masks of many individuals.
+
+    :param individuals_number: Number of individuals to mutate.
+    :param variables_number: Number of decision variables (genes).
+    :param mutation_chance: Probability of single decision variable (gene) mutation.
+    :param mutation_points_number: Number of mutation points to select.
+
+    :return: Boolean array with mutation masks (one row per individual).
+    """
+    scaled_mutation_chance = variables_number * mutation_chance / mutation_points_number
+    mask = np.zeros((individuals_number, variables_number), dtype=bool)
+    mutated_rows = np.flatnonzero(generate_random_floats_array(size=individuals_number) <= scaled_mutation_chance)
+    mutation_points = np.argsort(generate_random_floats_array(size=(mutated_rows.size, variables_number)),
+                                 axis=1)[:, :mutation_points_number]
+    mask[mutated_rows[:, np.newaxis], mutation_points] = True
+    return mask
+
+
+def probabilistic_mutation_mask(individuals_number: int,
+                                variables_number: int,
+                                mutation_chance: float) -> np.ndarray:
+    """
+    Probabilistic mutation masks of many individuals.
+
+    :param individuals_number: Number of individuals to mutate.
+    :param variables_number: Number of decision variables (genes).
+    :param mutation_chance: Probability of single decision variable (gene) mutation.
+
+    :return: Boolean array with mutation masks (one row per individual).
+    """
+    mask = np.zeros((individuals_number, variables_number), dtype=bool)
+    mask.reshape(-1)[choose_random_successes_indices(trials_number=mask.size, success_probability=mutation_chance)] \
+        = True
+    return mask
+
+
+def real_valued_mutation_mask(individuals_number: int,
+                              variables_number: int,
+                              mutation_chance: float,
+                              **_: Any) -> np.ndarray:
+    """
+    Mutation masks of real-valued mutations (as in probabilistic mutation).
+
+    :param individuals_number: Number of individuals to mutate.
+    :param variables_number: Number of decision variables (genes).
+    :param mutation_chance: Probability of single decision variable (gene) mutation.
+
+    :return: Boolean array with mutation masks (one row per individual).
+    """
+    return probabilistic_mutation_mask(individuals_number=individuals_number, variables_number=variables_number,
+                                       mutation_chance=mutation_chance)
+
+
 # outputs (visible outside)
 
 
@@ -104,11 +296,15 @@ class MutationType(Enum):
         - SinglePoint - Chooses a single position of decision variable (gene) for mutation.
         - MultiPoint - Chooses multiple positions of decision variables (genes) for mutation.
         - Probabilistic - Each decision variable (gene) for mutation is chosen independently with the same probability.
+        - Gaussian - Genes are chosen as in Probabilistic, float genes are shifted by normally distributed value.
+        - Polynomial - Genes are chosen as in Probabilistic, float genes are shifted by polynomially distributed value.
     """
 
     SinglePoint = "SinglePoint"
     MultiPoint = "MultiPoint"
     Probabilistic = "Probabilistic"
+    Gaussian = "Gaussian"
+    Polynomial = "Polynomial"
 
 
 MUTATION_FUNCTIONS: Dict[str, Callable] = {
@@ -116,6 +312,25 @@ MUTATION_FUNCTIONS: Dict[str, Callable] = {
     MutationType.SinglePoint.value: single_point_mutation,
     MutationType.MultiPoint.value: multi_point_mutation,
     MutationType.Probabilistic.value: probabilistic_mutation,
+    MutationType.Gaussian.value: gaussian_mutation,
+    MutationType.Polynomial.value: polynomial_mutation,
+}
+
+
+MUTATION_MASK_FUNCTIONS: Dict[str, Callable] = {
+    # mutation type: mutation masks function
+    MutationType.SinglePoint.value: single_point_mutation_mask,
+    MutationType.MultiPoint.value: multi_point_mutation_mask,
+    MutationType.Probabilistic.value: probabilistic_mutation_mask,
+    MutationType.Gaussian.value: real_valued_mutation_mask,
+    MutationType.Polynomial.value: real_valued_mutation_mask,
+}
+
+
+MUTATION_GENES_FUNCTIONS: Dict[str, Callable[..., np.ndarray]] = {
+    # mutation type: real-valued mutation function of float genes (only for real-valued mutation types)
+    MutationType.Gaussian.value: gaussian_mutation_genes,
+    MutationType.Polynomial.value: polynomial_mutation_genes,
 }
 
 
@@ -124,6 +339,15 @@ MUTATION_ADDITIONAL_PARAMS: Dict[str, Tuple[str, ...]] = {
     MutationType.SinglePoint.value: (),
     MutationType.MultiPoint.value: ("mutation_points_number", ),
     MutationType.Probabilistic.value: (),
+    MutationType.Gaussian.value: ("mutation_sigma", ),
+    MutationType.Polynomial.value: ("mutation_distribution_index", ),
+}
+
+
+MUTATION_ADDITIONAL_PARAMS_LIMITS: Dict[str, Tuple[float, float]] = {
+    # parameter name: (min value, max value)
+    "mutation_sigma": (MIN_MUTATION_SIGMA, MAX_MUTATION_SIGMA),
+    "mutation_distribution_index": (MIN_MUTATION_DISTRIBUTION_INDEX, MAX_MUTATION_DISTRIBUTION_INDEX),
 }
 
 
@@ -136,3 +360,6 @@ def check_mutation_parameters(variables_number: int, **mutation_params: Any) ->
     """
     if "mutation_points_number" in mutation_params:
         check_mutation_points_number(variables_number, mutation_params["mutation_points_number"])
+    for param_name in MUTATION_ADDITIONAL_PARAMS_LIMITS:
+        if param_name in mutation_params:
+            check_real_mutation_parameter(param_name, mutation_params[param_name])
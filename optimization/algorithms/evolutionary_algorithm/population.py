@@ -0,0 +1,343 @@
+"""
+Array representation of Evolutionary Algorithm population.
+
+Genes (decision variables values) of the whole population are stored in a single 2D array (one row per individual,
+one column per decision variable) and fitness of individuals in a single vector, therefore selection, crossover
+and mutation might operate on whole rows (and arrays of indices) instead of solution objects.
+"""
+
+__all__ = ["GenesEncoding", "ArrayPopulation", "MAX_EXACT_GENE_VALUE"]
+
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+from collections import OrderedDict
+
+import numpy as np
+
+from ...problem import OptimizationProblem, OptimizationType, AbstractSolution, \
+    IntegerVariable, DiscreteVariable, FloatVariable, ChoiceVariable
+from ...utilities import generate_random_floats_array
+
+
+MAX_EXACT_GENE_VALUE = 2 ** 53
+"""Greater absolute values of integers are not stored exactly as genes (float64 values)."""
+
+class GenesEncoding:
+    """
+    Numeric encoding of decision variables values (genes) of an optimization problem.
+
+    Encoding of decision variables values:
+        - IntegerVariable, DiscreteVariable, FloatVariable - value itself
+        - ChoiceVariable - index (code) of the value in the list of possible values
+    """
+
+    def __init__(self, problem: OptimizationProblem) -> None:
+        """
+        Creates encoding of decision variables values for given optimization problem.
+
+        :param problem: Optimization problem which decision variables values are going to be encoded.
+
+        :raise TypeError: Decision variable of unknown type is defined in the optimization problem.
+        """
+        self.problem = problem
+        self.names: List[str] = list(problem.decision_variables.keys())  # type: ignore
+        self.choices: Dict[int, List[Any]] = {}
+        self._codes: Dict[int, Dict[Any, int]] = {}
+        self._decoders: List[Callable[[np.ndarray], np.ndarray]] = []
+        # random gene value = min + floor(random * values_number) * step    (integer, discrete and choice variables)
+        # random gene value = min + random * (max - min)                     (float variables)
+        lower_bounds, spans, steps, continuous = [], [], [], []
+        for index, variable in enumerate(problem.decision_variables.values()):  # type: ignore
+            if isinstance(variable, IntegerVariable):
+                lower_bounds.append(variable.min_value)
+                spans.append(variable.max_value - variable.min_value + 1)
+                steps.append(1)
+                continuous.append(False)
+                self._decoders.append(self._decode_int)
+            elif isinstance(variable, DiscreteVariable):
+                lower_bounds.append(variable.min_value)
+                spans.append(int((variable.max_value - variable.min_value) // variable.step) + 1)
+                steps.append(variable.step)
+                continuous.append(False)
+                self._decoders.append(self._decode_int if isinstance(variable.min_value, int)
+                                      and isinstance(variable.step, int) else self._decode_float)
+            elif isinstance(variable, FloatVariable):
+                lower_bounds.append(variable.min_value)
+                spans.append(variable.max_value - variable.min_value)
+                steps.append(0)
+                continuous.append(True)
+                self._decoders.append(self._decode_float)
+            elif isinstance(variable, ChoiceVariable):
+                self.choices[index] = list(variable.possible_values)
+                self._codes[index] = {value: code for code, value in enumerate(self.choices[index])}
+                lower_bounds.append(0)
+                spans.append(len(self.choices[index]))
+                steps.append(1)
+                continuous.append(False)
+                self._decoders.append(self._get_choice_decoder(self.choices[index]))
+            else:
+                raise TypeError(f"Decision variable of unknown type cannot be encoded. Actual value: {variable}.")
+        self._lower_bounds = np.array(lower_bounds, dtype=float)
+        self._spans = np.array(spans, dtype=float)
+        self._steps = np.array(steps, dtype=float)
+        self.continuous = np.array(continuous, dtype=bool)
+
+    @staticmethod
+    def get_inexact_variables(problem: OptimizationProblem) -> List[str]:
+        """
+        Gets decision variables which integer values cannot be exactly stored as genes.
+
+        :param problem: Optimization problem which decision variables values are going to be encoded.
+
+        :return: Names of integer and discrete (with integer values) decision variables that might take values
+            with absolute value greater than MAX_EXACT_GENE_VALUE.
+        """
+        inexact_variables = []
+        for name, variable in problem.decision_variables.items():  # type: ignore
+            if isinstance(variable, (IntegerVariable, DiscreteVariable)) \
+                    and isinstance(variable.min_value, int) and isinstance(variable.max_value, int) \
+                    and max(abs(variable.min_value), abs(variable.max_value)) > MAX_EXACT_GENE_VALUE:
+                inexact_variables.append(name)
+        return inexact_variables
+
+    @property
+    def variables_number(self) -> int:
+        """Number of decision variables (genes), equal to number of columns of genes array."""
+        return len(self.names)
+
+    @staticmethod
+    def _decode_int(column: np.ndarray) -> np.ndarray:
+        """:return: Decoded values of integer decision variable."""
+        return np.rint(column).astype(int)
+
+    @staticmethod
+    def _decode_float(column: np.ndarray) -> np.ndarray:
+        """:return: Decoded values of float decision variable."""
+        return column.copy()
+
+    @staticmethod
+    def _get_choice_decoder(possible_values: List[Any]) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Creates decoder of choice decision variable values.
+
+        :param possible_values: List of possible values (value index is used as the code).
+
+        :return: Function that decodes values of the decision variable.
+        """
+        # possible values might be sequences, so they cannot be converted by 'np.array'
+        values_array = np.empty(len(possible_values), dtype=object)
+        values_array[:] = possible_values
+
+        def _decode_choice(column: np.ndarray) -> np.ndarray:
+            return values_array[column.astype(int)]
+        return _decode_choice
+
+    def encode(self, decision_variables_values: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """
+        Encodes decision variables values of many individuals.
+
+        :param decision_variables_values: Decision variables values of following individuals.
+
+        :return: Array of genes (one row per individual).
+        """
+        genes = np.empty((len(decision_variables_values), self.variables_number), dtype=float)
+        for column, name in enumerate(self.names):
+            codes = self._codes.get(column)
+            if codes is None:
+                genes[:, column] = [values[name] for values in decision_variables_values]
+            else:
+                genes[:, column] = [codes[values[name]] for values in decision_variables_values]
+        return genes
+
+    def decode_columns(self, genes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Decodes genes of many individuals column by column (without creating objects for individuals).
+
+        :param genes: Array of genes (one row per individual).
+
+        :return: Decision variables values of all individuals in the format accepted by batch functions
+            (as returned by 'get_batch_values' method of the optimization problem).
+        """
+        return {name: decoder(genes[:, column])
+                for column, (name, decoder) in enumerate(zip(self.names, self._decoders))}
+
+    def decode(self, genes: np.ndarray) -> List[OrderedDict]:
+        """
+        Decodes genes of many individuals.
+
+        :param genes: Array of genes (one row per individual).
+
+        :return: Decision variables values of following individuals.
+        """
+        columns = [values.tolist() for values in self.decode_columns(genes).values()]
+        return [OrderedDict(zip(self.names, row_values)) for row_values in zip(*columns)]
+
+    def get_bounds(self, columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets bounds of continuous (float) genes.
+
+        :param columns: Indices of columns with continuous genes.
+
+        :return: Minimal and maximal values of genes in following columns.
+        """
+        lower_bounds = self._lower_bounds[columns]
+        return lower_bounds, lower_bounds + self._spans[columns]
+
+    def generate_random_genes(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """
+        Generates random values of genes on given positions.
+
+        :param rows: Rows indices of positions.
+        :param columns: Columns indices of positions.
+
+        :return: Random genes values for following positions.
+        """
+        random_values = generate_random_floats_array(size=rows.size)
+        lower_bounds = self._lower_bounds[columns]
+        spans = self._spans[columns]
+        return np.where(self.continuous[columns],
+                        lower_bounds + random_values * spans,
+                        lower_bounds + np.floor(random_values * spans) * self._steps[columns])
+
+
+class ArrayPopulation:
+    """Population of Evolutionary Algorithm stored as array of genes and vector of fitness values."""
+
+    def __init__(self, encoding: GenesEncoding, genes: np.ndarray, fitness: Optional[np.ndarray] = None) -> None:
+        """
+        Creates population from array of genes.
+
+        :param encoding: Encoding of decision variables values that was used to create genes.
+        :param genes: Array of genes with shape (population size, variables number).
+        :param fitness: Fitness of following individuals (the higher the value, the better the individual)
+            or None if the individuals were not evaluated yet.
+        """
+        self.encoding = encoding
+        self.genes = genes
+        self.fitness = fitness
+
+    def __len__(self) -> int:
+        """:return: Number of individuals in the population."""
+        return self.genes.shape[0]
+
+    @staticmethod
+    def get_fitness(solutions: Sequence[AbstractSolution]) -> np.ndarray:
+        """
+        Gets fitness of evaluated solutions.
+
+        Fitness is objective value with penalty normalized by optimization direction, so for both optimization types
+        the higher the value the better the solution.
+
+        :param solutions: Evaluated solutions (of a single optimization problem).
+
+        :return: Fitness of following solutions.
+        """
+        return np.array([solution.get_fitness() for solution in solutions], dtype=float)
+
+    @classmethod
+    def from_solutions(cls, encoding: GenesEncoding, solutions: Sequence[AbstractSolution]) -> "ArrayPopulation":
+        """
+        Creates population from evaluated solutions.
+
+        :param encoding: Encoding of decision variables values to use.
+        :param solutions: Evaluated solutions (of a single optimization problem).
+
+        :return: Population with genes and fitness of provided solutions.
+        """
+        return cls(encoding=encoding,
+                   genes=encoding.encode([solution.decision_variables_values for solution in solutions]),
+                   fitness=cls.get_fitness(solutions))
+
+    def to_values(self) -> List[OrderedDict]:
+        """:return: Decision variables values of following individuals."""
+        return self.encoding.decode(self.genes)
+
+    def to_solutions(self, solution_class: Type[AbstractSolution],
+                     indices: Optional[np.ndarray] = None) -> List[AbstractSolution]:
+        """
+        Creates solution objects for evaluated individuals.
+
+        Objective values (with penalty) of the solutions are restored from fitness, so they are not evaluated again.
+
+        :param solution_class: Solution class (of the optimization problem) to use.
+        :param indices: Indices of individuals (rows) to create solutions for. If None, then solutions
+            are created for all individuals.
+
+        :return: Evaluated solutions with decision variables values of following individuals.
+        """
+        genes = self.genes if indices is None else self.genes[indices]
+        fitness = self.fitness if indices is None else self.fitness[indices]  # type: ignore
+        minimize = self.encoding.problem.optimization_type == OptimizationType.Minimize
+        solutions = []
+        for values, individual_fitness in zip(self.encoding.decode(genes), fitness.tolist()):
+            solution = solution_class.from_trusted_values(values)
+            solution._fitness = individual_fitness  # pylint: disable=protected-access
+            solution._objective_value_with_penalty = \
+                -individual_fitness if minimize else individual_fitness  # pylint: disable=protected-access
+            solutions.append(solution)
+        return solutions
+
+    def take(self, indices: np.ndarray) -> "ArrayPopulation":
+        """
+        Creates population with selected individuals.
+
+        :param indices: Indices of individuals (rows) to take (might be repeated).
+
+        :return: New population with selected individuals.
+        """
+        return ArrayPopulation(encoding=self.encoding,
+                               genes=self.genes[indices],
+                               fitness=None if self.fitness is None else self.fitness[indices])
+
+    def crossover(self, parents_indices: np.ndarray, masks: np.ndarray,
+                  genes_function: Optional[Callable[..., Tuple[np.ndarray, np.ndarray]]] = None) -> "ArrayPopulation":
+        """
+        Creates children population by crossing over pairs of parents.
+
+        :param parents_indices: Array with shape (pairs number, 2) with indices of parents in following pairs.
+        :param masks: Boolean array with shape (pairs number, variables number). True value means that the first child
+            gets the gene from the second parent (and the second child gets the gene from the first parent).
+        :param genes_function: Real-valued crossover function (called with parents genes and bounds) to be used
+            for continuous genes instead of masks. None if masks are used for all genes.
+
+        :return: Population of children (not evaluated) - children of the same pair are placed next to each other,
+            so their order is the same as order of parents in flattened 'parents_indices'.
+        """
+        parents_1_genes = self.genes[parents_indices[:, 0]]
+        parents_2_genes = self.genes[parents_indices[:, 1]]
+        children_genes = np.empty((2 * len(parents_indices), self.genes.shape[1]), dtype=self.genes.dtype)
+        children_genes[0::2] = np.where(masks, parents_2_genes, parents_1_genes)
+        children_genes[1::2] = np.where(masks, parents_1_genes, parents_2_genes)
+        if genes_function is not None:
+            columns = np.flatnonzero(self.encoding.continuous)
+            if columns.size:
+                lower_bounds, upper_bounds = self.encoding.get_bounds(columns)
+                children_genes[0::2, columns], children_genes[1::2, columns] = \
+                    genes_function(parents_1_genes[:, columns], parents_2_genes[:, columns],
+                                   lower_bounds=lower_bounds, upper_bounds=upper_bounds)
+        return ArrayPopulation(encoding=self.encoding, genes=children_genes)
+
+    def mutate(self, mask: np.ndarray, genes_function: Optional[Callable[..., np.ndarray]] = None) -> None:
+        """
+        Mutates selected genes (in place).
+
+        :param mask: Boolean array with the same shape as genes array. True value means that the gene is mutated.
+        :param genes_function: Real-valued mutation function (called with genes and bounds) to be used
+            for continuous genes. None if all selected genes are replaced with random values.
+        """
+        rows, columns = np.nonzero(mask)
+        if not rows.size:
+            return
+        if genes_function is None:
+            self.genes[rows, columns] = self.encoding.generate_random_genes(rows=rows, columns=columns)
+        else:
+            continuous = self.encoding.continuous[columns]
+            random_rows, random_columns = rows[~continuous], columns[~continuous]
+            shifted_rows, shifted_columns = rows[continuous], columns[continuous]
+            self.genes[random_rows, random_columns] = self.encoding.generate_random_genes(rows=random_rows,
+                                                                                          columns=random_columns)
+            lower_bounds, upper_bounds = self.encoding.get_bounds(shifted_columns)
+            self.genes[shifted_rows, shifted_columns] = genes_function(self.genes[shifted_rows, shifted_columns],
+                                                                       lower_bounds=lower_bounds,
+                                                                       upper_bounds=upper_bounds)
+        self.fitness = None
@@ -5,15 +5,22 @@ Code is basing on  information from:
 'Introduction to Evolutionary Computing. Second edition.' Eiben, A.E., Smith, James E.
 """
 
-__all__ = ["SelectionType", "SELECTION_FUNCTIONS", "SELECTION_ADDITIONAL_PARAMS", "SELECTION_ADDITIONAL_PARAMS_LIMITS",
-           "check_selection_parameters", "SelectionOutput"]
+__all__ = ["SelectionType", "SELECTION_FUNCTIONS", "BATCH_SELECTION_FUNCTIONS", "SELECTION_ADDITIONAL_PARAMS",
+           "SELECTION_ADDITIONAL_PARAMS_LIMITS", "check_selection_parameters", "SelectionOutput"]
 
 
 from typing import List, Iterator, Union, Tuple, Dict, Callable, Any
 from enum import Enum
+from itertools import accumulate
+from bisect import bisect_right
 
-from ...problem import AbstractSolution
-from ...utilities import choose_random_values, choose_random_value_with_weights
+import numpy as np
+
+from ...problem import AbstractSolution, fitness_key
+from ...utilities import generate_random_float, choose_random_values, \
+    choose_random_values_with_cumulative_weights, shuffle, generate_random_ints_array, \
+    generate_random_floats_array, generate_random_permutation, choose_random_indices_groups, \
+    choose_random_indices_with_weights
 from .limits import MIN_TOURNAMENT_GROUP_SIZE, MAX_TOURNAMENT_GROUP_SIZE, MIN_ROULETTE_BIAS, MAX_ROULETTE_BIAS, \
     MIN_RANKING_BIAS, MAX_RANKING_BIAS
 
@@ -79,6 +86,41 @@ def get_scaled_ranking(rank: int, population_size: int, ranking_bias: Union[floa
     return 2 - ranking_bias + (2 * rank * (ranking_bias - 1) / (population_size - 1))
 
 
+def get_roulette_weights(population: List[AbstractSolution],
+                         roulette_bias: Union[float, int]) -> List[Union[float, int]]:
+    """
+    Calculates weights (scaled objective values) of solutions for roulette like selections.
+
+    :param population: List with individuals (solutions) from which parents to be selected.
+    :param roulette_bias: Bias towards promoting better adopted individuals.
+
+    :return: List with weights of following solutions (all equal 1 if all solutions have the same objective value).
+    """
+    best_solution = max(population, key=fitness_key)
+    worst_solution = min(population, key=fitness_key)
+    if fitness_key(best_solution) == fitness_key(worst_solution):
+        return [1] * len(population)
+    factor, offset = calculate_roulette_scaling(best_solution=best_solution, worst_solution=worst_solution,
+                                                roulette_bias=roulette_bias)
+    return [get_scaled_objective(solution=solution, factor=factor, offset=offset) for solution in population]
+
+
+def get_stochastic_universal_sampling_indices(cumulative_weights: List[Union[float, int]],
+                                              values_number: int) -> List[int]:
+    """
+    Picks indices using stochastic universal sampling (equally spaced pointers with a single random offset).
+
+    :param cumulative_weights: List with cumulative sums of weights of following individuals.
+    :param values_number: Number of indices to pick.
+
+    :return: List with picked indices (in order of pointers).
+    """
+    last_index = len(cumulative_weights) - 1
+    step = cumulative_weights[-1] / values_number
+    offset = generate_random_float(0, step)
+    return [min(bisect_right(cumulative_weights, offset + i * step), last_index) for i in range(values_number)]
+
+
 def check_tournament_group_size(tournament_group_size: int) -> None:
     """
     Checks if 'tournament_group_size' has proper value.
@@ -160,9 +202,7 @@ def tournament_selection(population_size: int,
     """
     for _ in range(population_size // 2):
         random_group = choose_random_values(values_pool=population, values_number=tournament_group_size)
-        best = max(random_group)
-        random_group.remove(best)
-        second_best = max(random_group)
+        best, second_best = sorted(random_group, key=fitness_key, reverse=True)[:2]
         yield best, second_best
 
 
@@ -183,7 +223,7 @@ def double_tournament_selection(population_size: int,
     """
 
     def _get_individual():
-        return max(choose_random_values(values_pool=population, values_number=tournament_group_size))
+        return max(choose_random_values(values_pool=population, values_number=tournament_group_size), key=fitness_key)
 
     for _ in range(population_size // 2):
         yield _get_individual(), _get_individual()
@@ -210,23 +250,18 @@ def roulette_selection(population_size: int,
 
     :return: Generator producing individual pairs.
     """
-    best_solution = max(population)
-    worst_solution = min(population)
     # if all solution values are the same, then we can use uniform selection - there will be the same result
-    if best_solution == worst_solution:
+    if fitness_key(max(population, key=fitness_key)) == fitness_key(min(population, key=fitness_key)):
         for pair in uniform_selection(population_size=population_size, population=population):
             yield pair
-    else:
-        # determine scaling values
-        factor, offset = calculate_roulette_scaling(best_solution=best_solution, worst_solution=worst_solution,
-                                                    roulette_bias=roulette_bias)
-        weights = [get_scaled_objective(solution=solution, factor=factor, offset=offset) for solution in population]
-
-        def _get_individual():
-            return choose_random_value_with_weights(values_pool=population, weights=weights)
-
-        for _ in range(population_size // 2):
-            yield _get_individual(), _get_individual()
+        return
+    weights = get_roulette_weights(population=population, roulette_bias=roulette_bias)
+    # cumulative weights are calculated once, then all parents are picked at once
+    parents = choose_random_values_with_cumulative_weights(values_pool=population,
+                                                           cumulative_weights=list(accumulate(weights)),
+                                                           values_number=2 * (population_size // 2))
+    for i in range(0, len(parents), 2):
+        yield parents[i], parents[i + 1]
 
 
 def ranking_selection(population_size: int,
@@ -247,15 +282,182 @@ def ranking_selection(population_size: int,
 
     :return: Generator producing individual pairs.
     """
-    population.sort()
+    population.sort(key=fitness_key)
     weights = [get_scaled_ranking(rank=rank, population_size=population_size, ranking_bias=ranking_bias)
                for rank in range(population_size)]
+    # cumulative weights are calculated once, then all parents are picked at once
+    parents = choose_random_values_with_cumulative_weights(values_pool=population,
+                                                           cumulative_weights=list(accumulate(weights)),
+                                                           values_number=2 * (population_size // 2))
+    for i in range(0, len(parents), 2):
+        yield parents[i], parents[i + 1]
 
-    def _get_individual():
-        return choose_random_value_with_weights(values_pool=population, weights=weights)
 
-    for _ in range(population_size // 2):
-        yield _get_individual(), _get_individual()
+def stochastic_universal_sampling_selection(population_size: int,
+                                            population: List[AbstractSolution],
+                                            roulette_bias: Union[float, int]) -> SelectionOutput:
+    """
+    Stochastic universal sampling selection function.
+
+    Parents are picked with probability proportional to their scaled fitness (the same as in roulette selection),
+    but using equally spaced pointers on a single roulette wheel spin. Therefore, number of copies of each individual
+    is always close to its expected value (minimal spread).
+
+    Note: More information can be found in the book:
+    'Introduction to Evolutionary Computing. Second edition.' A.E. Eiben, J.E. Smith., page 84
+
+    :param population_size: Size of the population (number of parents to pick).
+    :param population: List with individuals (solutions) from which parents to be selected.
+    :param roulette_bias: Bias towards promoting better adopted individuals.
+        [probability of picking the best adopted individual] = \
+            roulette_bias * [probability of picking the worst adopted individual]
+
+    :return: Generator producing individual pairs.
+    """
+    weights = get_roulette_weights(population=population, roulette_bias=roulette_bias)
+    parents = [population[index] for index in get_stochastic_universal_sampling_indices(
+        cumulative_weights=list(accumulate(weights)), values_number=2 * (population_size // 2))]
+    shuffle(parents)  # pointers are ordered, so parents pairs have to be randomized
+    for i in range(0, len(parents), 2):
+        yield parents[i], parents[i + 1]
+
+
+# batch selection functions (used by array population)
+#   Individuals are represented by fitness vector (the higher the value, the better the individual).
+#   Output is an array with shape (population_size // 2, 2) with indices of parents in following pairs.
+
+
+def uniform_batch_selection(population_size: int,
+                            fitness: np.ndarray) -> np.ndarray:
+    """
+    Uniform selection of all parents pairs at once. Each individual is picked with the same probability.
+
+    :param population_size: Size of the population (number of parents to pick).
+    :param fitness: Fitness of individuals from which parents to be selected.
+
+    :return: Array with indices of parents in following pairs.
+    """
+    pairs_number = population_size // 2
+    first_parents = generate_random_ints_array(0, fitness.size - 1, size=pairs_number)
+    second_parents = generate_random_ints_array(0, fitness.size - 2, size=pairs_number)
+    second_parents += second_parents >= first_parents  # parents in a pair are always different individuals
+    return np.stack((first_parents, second_parents), axis=1)
+
+
+def tournament_batch_selection(population_size: int,
+                               fitness: np.ndarray,
+                               tournament_group_size: int) -> np.ndarray:
+    """
+    Tournament selection of all parents pairs at once. The two best individuals from a small random group
+    become a parents pair.
+
+    :param population_size: Size of the population (number of parents to pick).
+    :param fitness: Fitness of individuals from which parents to be selected.
+    :param tournament_group_size: Size of a random groups.
+
+    :return: Array with indices of parents in following pairs.
+    """
+    random_groups = choose_random_indices_groups(pool_size=fitness.size, groups_number=population_size // 2,
+                                                 group_size=tournament_group_size)
+    best_in_groups = np.argsort(-fitness[random_groups], axis=1, kind="stable")[:, :2]
+    return np.take_along_axis(random_groups, best_in_groups, axis=1)
+
+
+def double_tournament_batch_selection(population_size: int,
+                                      fitness: np.ndarray,
+                                      tournament_group_size: int) -> np.ndarray:
+    """
+    Double tournament selection of all parents pairs at once. The best individual from a small random group
+    becomes a parent (each parent is picked from a different group).
+
+    :param population_size: Size of the population (number of parents to pick).
+    :param fitness: Fitness of individuals from which parents to be selected.
+    :param tournament_group_size: Size of a random groups.
+
+    :return: Array with indices of parents in following pairs.
+    """
+    random_groups = choose_random_indices_groups(pool_size=fitness.size, groups_number=2 * (population_size // 2),
+                                                 group_size=tournament_group_size)
+    best_in_groups = np.argmax(fitness[random_groups], axis=1)
+    return random_groups[np.arange(random_groups.shape[0]), best_in_groups].reshape(-1, 2)
+
+
+def roulette_batch_selection(population_size: int,
+                             fitness: np.ndarray,
+                             roulette_bias: Union[float, int]) -> np.ndarray:
+    """
+    Roulette selection of all parents pairs at once. Each parent is picked with probability proportional to
+    its scaled fitness (the same scaling as in 'roulette_selection' is used).
+
+    :param population_size: Size of the population (number of parents to pick).
+    :param fitness: Fitness of individuals from which parents to be selected.
+    :param roulette_bias: Bias towards promoting better adopted individuals.
+        [probability of picking the best adopted individual] = \
+            roulette_bias * [probability of picking the worst adopted individual]
+
+    :return: Array with indices of parents in following pairs.
+    """
+    best_fitness = fitness.max()
+    worst_fitness = fitness.min()
+    # if all solution values are the same, then we can use uniform selection - there will be the same result
+    if best_fitness == worst_fitness:
+        return uniform_batch_selection(population_size=population_size, fitness=fitness)
+    factor = (roulette_bias - 1) / (best_fitness - worst_fitness)
+    weights = factor * (fitness - worst_fitness) + 1
+    return choose_random_indices_with_weights(weights=weights, size=(population_size // 2, 2))
+
+
+def ranking_batch_selection(population_size: int,
+                            fitness: np.ndarray,
+                            ranking_bias: float) -> np.ndarray:
+    """
+    Ranking selection of all parents pairs at once. Each parent is picked with probability proportional
+    to its position in the ranking.
+
+    :param population_size: Size of the population (number of parents to pick).
+    :param fitness: Fitness of individuals from which parents to be selected.
+    :param ranking_bias: Bias that represents selection pressure (the higher the value the higher the pressure).
+        When ranking_bias == 1, then the function acts the same effect as uniform selection.
+        When ranking_bias == 2, then the function acts like classic ranking selection.
+        Expected value: 1 < ranking_bias <= 2
+
+    :return: Array with indices of parents in following pairs.
+    """
+    weights = np.empty(fitness.size, dtype=float)
+    weights[np.argsort(fitness, kind="stable")] = get_scaled_ranking(rank=np.arange(fitness.size),  # type: ignore
+                                                                     population_size=fitness.size,
+                                                                     ranking_bias=ranking_bias)
+    return choose_random_indices_with_weights(weights=weights, size=(population_size // 2, 2))
+
+
+def stochastic_universal_sampling_batch_selection(population_size: int,
+                                                  fitness: np.ndarray,
+                                                  roulette_bias: Union[float, int]) -> np.ndarray:
+    """
+    Stochastic universal sampling selection of all parents pairs at once. Parents are picked with equally spaced
+    pointers on a single roulette wheel spin (the same weights as in 'roulette_batch_selection' are used).
+
+    :param population_size: Size of the population (number of parents to pick).
+    :param fitness: Fitness of individuals from which parents to be selected.
+    :param roulette_bias: Bias towards promoting better adopted individuals.
+        [probability of picking the best adopted individual] = \
+            roulette_bias * [probability of picking the worst adopted individual]
+
+    :return: Array with indices of parents in following pairs.
+    """
+    best_fitness = fitness.max()
+    worst_fitness = fitness.min()
+    if best_fitness == worst_fitness:
+        weights = np.ones(fitness.size, dtype=float)
+    else:
+        weights = (roulette_bias - 1) / (best_fitness - worst_fitness) * (fitness - worst_fitness) + 1
+    cumulative_weights = np.cumsum(weights)
+    parents_number = 2 * (population_size // 2)
+    step = cumulative_weights[-1] / parents_number
+    pointers = (generate_random_floats_array(size=1) + np.arange(parents_number)) * step
+    parents = np.minimum(np.searchsorted(cumulative_weights, pointers, side="right"), fitness.size - 1)
+    # pointers are ordered, so parents pairs have to be randomized
+    return parents[generate_random_permutation(parents_number)].reshape(-1, 2)
 
 
 # outputs (visible outside)
@@ -268,7 +470,11 @@ class SelectionType(Enum):
     Options:
         - Uniform - Each individual has the same chance to be selected as parent.
         - Tournament - Each parents pair is the best best adapted individuals from a small random group.
-        - Tournament - Each parent is the best best adapted individual from a small random group.
+        - DoubleTournament - Each parent is the best best adapted individual from a small random group.
+        - Roulette - Each parent is picked with probability proportional to its (scaled) fitness.
+        - Ranking - Each parent is picked with probability proportional to its position in the ranking.
+        - StochasticUniversalSampling - Parents are picked with probability proportional to their (scaled) fitness
+            using a single spin of roulette wheel with equally spaced pointers.
     """
 
     Uniform = "Uniform"
@@ -276,6 +482,7 @@ class SelectionType(Enum):
     DoubleTournament = "DoubleTournament"
     Roulette = "Roulette"
     Ranking = "Ranking"
+    StochasticUniversalSampling = "StochasticUniversalSampling"
 
 
 SELECTION_FUNCTIONS: Dict[str, Callable] = {
@@ -285,6 +492,18 @@ SELECTION_FUNCTIONS: Dict[str, Callable] = {
     SelectionType.DoubleTournament.value: double_tournament_selection,
     SelectionType.Roulette.value: roulette_selection,
     SelectionType.Ranking.value: ranking_selection,
+    SelectionType.StochasticUniversalSampling.value: stochastic_universal_sampling_selection,
+}
+
+
+BATCH_SELECTION_FUNCTIONS: Dict[str, Callable] = {
+    # selection type: batch selection function
+    SelectionType.Uniform.value: uniform_batch_selection,
+    SelectionType.Tournament.value: tournament_batch_selection,
+    SelectionType.DoubleTournament.value: double_tournament_batch_selection,
+    SelectionType.Roulette.value: roulette_batch_selection,
+    SelectionType.Ranking.value: ranking_batch_selection,
+    SelectionType.StochasticUniversalSampling.value: stochastic_universal_sampling_batch_selection,
 }
 
 
@@ -295,6 +514,7 @@ SELECTION_ADDITIONAL_PARAMS: Dict[str, Tuple[str, ...]] = {
     SelectionType.DoubleTournament.value: ("tournament_group_size", ),
     SelectionType.Roulette.value: ("roulette_bias", ),
     SelectionType.Ranking.value: ("ranking_bias", ),
+    SelectionType.StochasticUniversalSampling.value: ("roulette_bias", ),
 }
 
 SELECTION_ADDITIONAL_PARAMS_LIMITS: Dict[str, Tuple[Union[float, int], Union[float, int]]] = {
@@ -0,0 +1,157 @@
+"""
+Initialization (generation of initial solutions) strategies that are used by optimization algorithms.
+
+Each strategy creates samples from unit hypercube [0, 1)^d (one column per decision variable) that are then mapped
+onto decision variables values, so the whole population is created at once (instead of value by value).
+"""
+
+__all__ = ["InitializationType", "INITIALIZATION_FUNCTIONS", "generate_initial_values"]
+
+
+from typing import Callable, Dict, List, Mapping, Union
+from collections import OrderedDict
+from enum import Enum
+
+import numpy as np
+
+from ..problem import DecisionVariable
+from ..utilities import generate_random_floats_array
+
+
+# initialization utilities
+
+
+def get_primes(primes_number: int) -> List[int]:
+    """
+    Finds the smallest prime numbers.
+
+    :param primes_number: Number of primes to find.
+
+    :return: List with following prime numbers (starting from 2).
+    """
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < primes_number:
+        if all(candidate % prime for prime in primes if prime * prime <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def get_random_permutations(permutations_number: int, size: int) -> np.ndarray:
+    """
+    Generates many independent random permutations at once.
+
+    :param permutations_number: Number of permutations to generate.
+    :param size: Number of elements in each permutation.
+
+    :return: Array with shape (permutations_number, size) with one permutation of 0, 1, ..., size-1 per row.
+    """
+    return np.argsort(generate_random_floats_array(size=(permutations_number, size)), axis=1)
+
+
+# initialization functions
+
+
+def uniform_initialization(samples_number: int, dimensions_number: int) -> np.ndarray:
+    """
+    Uniform random sampling - each sample is drawn independently.
+
+    :param samples_number: Number of samples (solutions) to create.
+    :param dimensions_number: Number of dimensions (decision variables).
+
+    :return: Array with shape (samples_number, dimensions_number) with floats in range [0, 1).
+    """
+    return generate_random_floats_array(size=(samples_number, dimensions_number))
+
+
+def latin_hypercube_initialization(samples_number: int, dimensions_number: int) -> np.ndarray:
+    """
+    Latin Hypercube sampling - range of each dimension is divided into 'samples_number' equal intervals
+    and each interval contains exactly one sample.
+
+    :param samples_number: Number of samples (solutions) to create.
+    :param dimensions_number: Number of dimensions (decision variables).
+
+    :return: Array with shape (samples_number, dimensions_number) with floats in range [0, 1).
+    """
+    intervals = get_random_permutations(permutations_number=dimensions_number, size=samples_number).T
+    offsets = generate_random_floats_array(size=(samples_number, dimensions_number))
+    return (intervals + offsets) / samples_number
+
+
+def halton_initialization(samples_number: int, dimensions_number: int) -> np.ndarray:
+    """
+    Scrambled Halton sequence - low discrepancy (quasi-random) sequence that uses following prime bases
+    for following dimensions. Digits of each position (in each dimension) are scrambled with random permutation.
+
+    :param samples_number: Number of samples (solutions) to create.
+    :param dimensions_number: Number of dimensions (decision variables).
+
+    :return: Array with shape (samples_number, dimensions_number) with floats in range [0, 1).
+    """
+    samples = np.zeros((samples_number, dimensions_number), dtype=float)
+    indices = np.arange(1, samples_number + 1)
+    for dimension, base in enumerate(get_primes(dimensions_number)):
+        digits_number = 1
+        while base ** digits_number <= samples_number:
+            digits_number += 1
+        permutations = get_random_permutations(permutations_number=digits_number, size=base)
+        remaining_indices = indices.copy()
+        for position in range(digits_number):
+            remaining_indices, digits = np.divmod(remaining_indices, base)
+            samples[:, dimension] += permutations[position][digits] / float(base) ** (position + 1)
+    return np.minimum(samples, np.nextafter(1., 0.))
+
+
+def generate_initial_values(decision_variables: Mapping[str, DecisionVariable],
+                            values_number: int,
+                            initialization_type: Union["InitializationType", str]) -> List[OrderedDict]:
+    """
+    Generates decision variables values of many solutions at once.
+
+    :param decision_variables: Decision variables of the optimization problem.
+    :param values_number: Number of solutions to create values for.
+    :param initialization_type: Type of initialization strategy to use.
+
+    :return: Decision variables values of following solutions (ordered as 'decision_variables').
+    """
+    initialization_type = initialization_type.value if isinstance(initialization_type, InitializationType) \
+        else initialization_type
+    if initialization_type == InitializationType.Uniform.value:
+        columns = [variable.generate_random_values(values_number).tolist()
+                   for variable in decision_variables.values()]
+    else:
+        samples = INITIALIZATION_FUNCTIONS[initialization_type](samples_number=values_number,
+                                                                dimensions_number=len(decision_variables))
+        columns = [variable.scale_unit_values(samples[:, index]).tolist()
+                   for index, variable in enumerate(decision_variables.values())]
+    names = list(decision_variables.keys())
+    return [OrderedDict(zip(names, values)) for values in zip(*columns)]
+
+
+# outputs (visible outside)
+
+
+class InitializationType(Enum):
+    """
+    Enum with available initialization strategies.
+
+    Options:
+        - Uniform - Each value is drawn independently (uniform distribution).
+        - LatinHypercube - Values of each decision variable are spread evenly (one value in each of equal intervals).
+        - Halton - Values are created by scrambled Halton sequence (low discrepancy sequence), so the whole space
+            is filled evenly.
+    """
+
+    Uniform = "Uniform"
+    LatinHypercube = "LatinHypercube"
+    Halton = "Halton"
+
+
+INITIALIZATION_FUNCTIONS: Dict[str, Callable[..., np.ndarray]] = {
+    # initialization type: initialization function
+    InitializationType.Uniform.value: uniform_initialization,
+    InitializationType.LatinHypercube.value: latin_hypercube_initialization,
+    InitializationType.Halton.value: halton_initialization,
+}
@@ -3,12 +3,16 @@
 __all__ = ["RandomAlgorithm"]
 
 
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, List, Union
+from heapq import nlargest
 
 from .abstract_algorithm import AbstractOptimizationAlgorithm
-from ..problem import OptimizationProblem
+from .initialization import InitializationType, generate_initial_values
+from ..problem import OptimizationProblem, AbstractSolution, fitness_key
 from ..stop_conditions import StopConditions
 from ..logging import AbstractLogger
+from ..evaluators import AbstractEvaluator
+from ..utilities import RandomSource
 
 
 class RandomAlgorithm(AbstractOptimizationAlgorithm):
@@ -21,23 +25,82 @@ class RandomAlgorithm(AbstractOptimizationAlgorithm):
     def __init__(self, problem: OptimizationProblem,
                  stop_conditions: StopConditions,
                  population_size: int = 1000,
-                 logger: Optional[AbstractLogger] = None) -> None:
+                 logger: Optional[AbstractLogger] = None,
+                 evaluator: Optional[AbstractEvaluator] = None,
+                 random_source: Optional[RandomSource] = None,
+                 initialization_type: Union[InitializationType, str] = InitializationType.Uniform,
+                 chunk_size: Optional[int] = None,
+                 best_solutions_number: int = 1) -> None:
         """
         Configuration of Random Algorithm.
 
         :param problem: Optimization problem to be solved by the algorithm.
         :param stop_conditions: Conditions when optimization algorithm shall be stopped.
         :param population_size: Number of solutions generated in one iteration.
-            Note: Setting big value might cause big memory usage and delay in stopping the optimization process.
+            Note: Setting big value might cause big memory usage and delay in stopping the optimization process
+            (unless 'chunk_size' is set).
         :param logger: Logger used for optimization process recording.
+        :param evaluator: Evaluator used for calculation of solutions objective values.
+            If None, then SerialEvaluator is used.
+        :param random_source: Source of random values used during optimization process.
+            If None, then new (not seeded) RandomSource is used.
+        :param initialization_type: Type of initialization strategy used for creating solutions in each iteration.
+        :param chunk_size: Number of solutions that are generated and evaluated at once in streaming mode.
+            If None, then streaming mode is not used and all solutions of an iteration are created at once.
+            In streaming mode, only the best solutions are kept in memory and stop conditions (time limit and
+            satisfying objective value) are checked after each chunk, so 'population_size' might be huge.
+        :param best_solutions_number: Number of the best solutions (found in an iteration) that are kept
+            (and passed to logger) in streaming mode.
         """
         if not isinstance(population_size, int):
             raise TypeError(f"Parameter 'population_size' value is not int type. Actual value: {population_size}.")
         if population_size <= 0:
             raise ValueError(f"Parameter 'population_size' value must be greater than 0. "
                              f"Actual value: {population_size}.")
-        super().__init__(problem=problem, stop_conditions=stop_conditions, logger=logger)
+        if chunk_size is not None:
+            if not isinstance(chunk_size, int):
+                raise TypeError(f"Parameter 'chunk_size' value is not int nor None type. Actual value: {chunk_size}.")
+            if chunk_size <= 0:
+                raise ValueError(f"Parameter 'chunk_size' value must be greater than 0. Actual value: {chunk_size}.")
+        if not isinstance(best_solutions_number, int):
+            raise TypeError(f"Parameter 'best_solutions_number' value is not int type. "
+                            f"Actual value: {best_solutions_number}.")
+        if best_solutions_number <= 0:
+            raise ValueError(f"Parameter 'best_solutions_number' value must be greater than 0. "
+                             f"Actual value: {best_solutions_number}.")
+        super().__init__(problem=problem, stop_conditions=stop_conditions, logger=logger, evaluator=evaluator,
+                         random_source=random_source)
         self.population_size = population_size
+        self.initialization_type = initialization_type.value if isinstance(initialization_type, InitializationType) \
+            else getattr(InitializationType, initialization_type).value
+        self.chunk_size = chunk_size
+        self.best_solutions_number = best_solutions_number
+
+    def _perform_streaming_iteration(self, iteration_index: int) -> None:
+        """
+        Perform optimization of algorithm iteration in streaming mode.
+
+        Solutions are created and evaluated in chunks and only the best of them are kept in memory.
+
+        :param iteration_index: Index number (counted from 0) of random algorithm iteration.
+        """
+        best_solutions: List[AbstractSolution] = []
+        remaining_solutions_number = self.population_size
+        while remaining_solutions_number > 0:
+            solutions_number = min(self.chunk_size, remaining_solutions_number)  # type: ignore
+            remaining_solutions_number -= solutions_number
+            solutions = [self.SolutionClass.from_trusted_values(values) for values in
+                         generate_initial_values(decision_variables=self.problem.decision_variables,  # type: ignore
+                                                 values_number=solutions_number,
+                                                 initialization_type=self.initialization_type)]
+            self._evaluate_solutions(solutions)
+            best_solutions = nlargest(self.best_solutions_number, best_solutions + solutions, key=fitness_key)
+            self._best_solution = best_solutions[0] if self._best_solution is None \
+                else max(best_solutions[0], self._best_solution, key=fitness_key)
+            if remaining_solutions_number > 0 and self._is_interruption_needed():
+                break
+        if self.logger is not None:
+            self.logger.log_iteration(iteration=iteration_index, solutions=best_solutions)
 
     def _perform_iteration(self, iteration_index: int) -> None:
         """
@@ -45,18 +108,27 @@ class RandomAlgorithm(AbstractOptimizationAlgorithm):
 
         :param iteration_index: Index number (counted from 0) of random algorithm iteration.
         """
-        solutions = [self.SolutionClass() for _ in range(self.population_size)]
-        best_in_iter = max(solutions)
-        self._best_solution = best_in_iter if self._best_solution is None else max(best_in_iter, self._best_solution)
+        if self.chunk_size is not None:
+            self._perform_streaming_iteration(iteration_index=iteration_index)
+            return
+        solutions = [self.SolutionClass.from_trusted_values(values) for values in
+                     generate_initial_values(decision_variables=self.problem.decision_variables,  # type: ignore
+                                             values_number=self.population_size,
+                                             initialization_type=self.initialization_type)]
+        self._evaluate_solutions(solutions)
+        best_in_iter = max(solutions, key=fitness_key)
+        self._best_solution = best_in_iter if self._best_solution is None \
+            else max(best_in_iter, self._best_solution, key=fitness_key)
         if self.logger is not None:
             self.logger.log_iteration(iteration=iteration_index, solutions=solutions)
 
-    def get_log_data(self) -> Dict[str, Union[str, int]]:
+    def get_log_data(self) -> Dict[str, Union[str, int, None]]:
         """
         Gets data for logging purposes.
 
         :return: Dictionary with this Random Algorithm crucial data.
         """
         log_data = super().get_log_data()
-        log_data.update(population_size=self.population_size)
+        log_data.update(population_size=self.population_size, initialization_type=self.initialization_type,
+                        chunk_size=self.chunk_size, best_solutions_number=self.best_solutions_number)
         return log_data
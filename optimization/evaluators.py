@@ -0,0 +1,491 @@
+"""
+Evaluators of optimization problem solutions.
+
+Evaluator is responsible for the evaluation stage of optimization algorithm iteration - calculation of objective
+values (with penalty) of many solutions at once.
+"""
+
+__all__ = ["AbstractEvaluator", "SerialEvaluator", "ProcessPoolEvaluator", "ThreadPoolEvaluator", "AsyncEvaluator"]
+
+
+from typing import Optional, Sequence, List, Dict, Tuple, Any, Union, Mapping
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from inspect import isawaitable
+import asyncio
+
+import numpy
+
+from .problem import OptimizationProblem, OptimizationType, AbstractSolution
+
+
+class AbstractEvaluator(ABC):
+    """Abstract definition of solutions evaluator."""
+
+    @abstractmethod
+    def evaluate(self, solutions: Sequence[AbstractSolution]) -> int:
+        """
+        Calculates objective values (with penalty) of provided solutions that were not evaluated yet.
+
+        :param solutions: Solutions (of a single optimization problem) to be evaluated.
+
+        :return: Number of performed evaluations (calculations of objective value).
+        """
+        ...
+
+    def evaluate_batch(self, problem: OptimizationProblem, batch_values: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Calculates objective values (with penalty) of many individuals given without solution objects.
+
+        It is used by algorithms that store their populations in arrays. Evaluation cache is not used.
+
+        :param problem: Optimization problem which individuals are evaluated.
+        :param batch_values: Decision variables values of evaluated individuals (format as returned by
+            'get_batch_values' method of the optimization problem).
+
+        :return: Array with objective values (with penalty) of following individuals.
+        """
+        return problem.evaluate_batch(batch_values)
+
+    def close(self) -> None:
+        """Releases all resources (e.g. worker processes) that are used by the evaluator."""
+        ...
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Evaluator crucial data.
+        """
+        return {
+            "type": self.__class__.__name__,
+        }
+
+
+class SerialEvaluator(AbstractEvaluator):
+    """Evaluator that calculates objective values of solutions in the current process (one after another)."""
+
+    def evaluate(self, solutions: Sequence[AbstractSolution]) -> int:
+        """
+        Calculates objective values (with penalty) of provided solutions that were not evaluated yet.
+
+        Batch (vectorized) functions of the optimization problem are used if they are defined.
+
+        :param solutions: Solutions (of a single optimization problem) to be evaluated.
+
+        :return: Number of performed evaluations (calculations of objective value).
+        """
+        if not solutions:
+            return 0
+        return solutions[0].evaluate_solutions(solutions)
+
+
+_worker_problem: Optional[OptimizationProblem] = None
+"""Optimization problem which solutions are evaluated by the worker process."""
+
+
+def _initialize_worker(problem: OptimizationProblem) -> None:
+    """
+    Sets optimization problem in worker process, so it is transferred only once (not with every chunk).
+
+    :param problem: Optimization problem which solutions are going to be evaluated by the worker process.
+    """
+    global _worker_problem  # pylint: disable=global-statement
+    _worker_problem = problem
+
+
+def _evaluate_chunk(solutions_values: List[Tuple[Any, ...]]) -> Dict[str, Any]:
+    """
+    Calculates objective values (with penalty) of a chunk of solutions inside a worker process.
+
+    :param solutions_values: Decision variables values of following solutions.
+
+    :return: Evaluation results of following solutions (as returned by 'evaluate_batch_components' method
+        of the optimization problem).
+    """
+    return _worker_problem.evaluate_batch_components(  # type: ignore
+        _worker_problem.get_batch_values(solutions_values))  # type: ignore
+
+
+def _evaluate_batch_chunk(batch_values: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+    """
+    Calculates objective values (with penalty) of a chunk of individuals (given as batch values) inside a worker
+    process.
+
+    :param batch_values: Decision variables values of following individuals (format as returned by
+        'get_batch_values' method of the optimization problem).
+
+    :return: Objective values (with penalty) of following individuals.
+    """
+    return _worker_problem.evaluate_batch(batch_values)  # type: ignore
+
+
+def _split_batch_values(batch_values: Dict[str, numpy.ndarray], chunk_size: int) -> List[Dict[str, numpy.ndarray]]:
+    """
+    Splits decision variables values of many individuals into chunks.
+
+    :param batch_values: Decision variables values of individuals (format as returned by 'get_batch_values' method
+        of the optimization problem).
+    :param chunk_size: Maximal number of individuals in a single chunk.
+
+    :return: Decision variables values of following chunks of individuals (in the same format).
+    """
+    individuals_number = len(next(iter(batch_values.values()))) if batch_values else 0
+    return [{name: values[first_index:first_index + chunk_size] for name, values in batch_values.items()}
+            for first_index in range(0, individuals_number, chunk_size)]
+
+
+class ProcessPoolEvaluator(AbstractEvaluator):
+    """
+    Evaluator that distributes calculation of objective values of solutions to many worker processes.
+
+    It is advised to use it only when objective function (or constraints) is expensive to compute, otherwise
+    the cost of inter-process communication might be higher than the gain.
+
+    WARNING! Optimization problem (including all its functions) must be picklable, therefore functions
+    have to be defined at module level (lambdas and locally defined functions are not accepted).
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 1) -> None:
+        """
+        Configuration of Process Pool Evaluator.
+
+        :param workers: Number of worker processes to use. If None, then the number of processors on the machine
+            is used.
+        :param chunk_size: Number of solutions sent to a worker process at once.
+            Note: The higher the value, the lower the communication overhead, but the worse balance of workers load.
+
+        :raise TypeError: For some parameter a value has incorrect type.
+        :raise ValueError: For some parameter a value is incorrect.
+        """
+        if workers is not None:
+            if not isinstance(workers, int):
+                raise TypeError(f"Parameter 'workers' value is not int nor None type. Actual value: {workers}.")
+            if workers <= 0:
+                raise ValueError(f"Parameter 'workers' value must be greater than 0. Actual value: {workers}.")
+        if not isinstance(chunk_size, int):
+            raise TypeError(f"Parameter 'chunk_size' value is not int type. Actual value: {chunk_size}.")
+        if chunk_size <= 0:
+            raise ValueError(f"Parameter 'chunk_size' value must be greater than 0. Actual value: {chunk_size}.")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+        self._problem: Optional[OptimizationProblem] = None
+
+    def _get_executor(self, problem: OptimizationProblem) -> Executor:
+        """
+        Gets pool of worker processes that are able to evaluate solutions of given optimization problem.
+
+        Worker processes are started only once and reused as long as solutions of the same problem are evaluated.
+
+        :param problem: Optimization problem which solutions are going to be evaluated.
+
+        :return: Executor with worker processes.
+        """
+        if self._executor is None or self._problem is not problem:
+            self.close()
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_initialize_worker,
+                                                 initargs=(problem,))
+            self._problem = problem
+        return self._executor
+
+    def evaluate(self, solutions: Sequence[AbstractSolution]) -> int:
+        """
+        Calculates objective values (with penalty) of provided solutions that were not evaluated yet.
+
+        Solutions are split into chunks which are evaluated in parallel by worker processes.
+
+        :param solutions: Solutions (of a single optimization problem) to be evaluated.
+
+        :return: Number of performed evaluations (calculations of objective value).
+        """
+        if not solutions:
+            return 0
+        sample_solution = solutions[0]  # used to call class methods of the solutions class
+        groups = sample_solution.group_not_evaluated(solutions)
+        if not groups:
+            return 0
+        executor = self._get_executor(sample_solution.optimization_problem)
+        to_evaluate = [group[0] for group in groups]
+        solutions_chunks = [to_evaluate[i:i + self.chunk_size] for i in range(0, len(to_evaluate), self.chunk_size)]
+        chunks = [[solution.values for solution in solutions_chunk] for solutions_chunk in solutions_chunks]
+        for solutions_chunk, evaluation_results in zip(solutions_chunks, executor.map(_evaluate_chunk, chunks)):
+            sample_solution.assign_evaluation_results(solutions_chunk, evaluation_results)
+        sample_solution.store_evaluation_results(groups)
+        return len(groups)
+
+    def evaluate_batch(self, problem: OptimizationProblem, batch_values: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Calculates objective values (with penalty) of many individuals given without solution objects.
+
+        Individuals are split into chunks which are evaluated in parallel by worker processes.
+
+        :param problem: Optimization problem which individuals are evaluated.
+        :param batch_values: Decision variables values of evaluated individuals (format as returned by
+            'get_batch_values' method of the optimization problem).
+
+        :return: Array with objective values (with penalty) of following individuals.
+        """
+        chunks = _split_batch_values(batch_values, self.chunk_size)
+        if not chunks:
+            return numpy.empty(0)
+        executor = self._get_executor(problem)
+        return numpy.concatenate(list(executor.map(_evaluate_batch_chunk, chunks)))
+
+    def close(self) -> None:
+        """Shuts down worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._problem = None
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Evaluator crucial data.
+        """
+        log_data = super().get_log_data()
+        log_data.update(workers=self.workers, chunk_size=self.chunk_size)
+        return log_data
+
+
+class ThreadPoolEvaluator(AbstractEvaluator):
+    """
+    Evaluator that distributes calculation of objective values of solutions to many threads.
+
+    It is advised to use it when objective function (or constraints) spends most of its time on waiting
+    (e.g. for files or external services) or releases GIL, otherwise no gain is expected.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 1) -> None:
+        """
+        Configuration of Thread Pool Evaluator.
+
+        :param workers: Number of worker threads to use. If None, then default value of ThreadPoolExecutor is used.
+        :param chunk_size: Number of solutions evaluated by a worker thread at once.
+            Note: Batch (vectorized) functions of the optimization problem are called once for each chunk.
+
+        :raise TypeError: For some parameter a value has incorrect type.
+        :raise ValueError: For some parameter a value is incorrect.
+        """
+        if workers is not None:
+            if not isinstance(workers, int):
+                raise TypeError(f"Parameter 'workers' value is not int nor None type. Actual value: {workers}.")
+            if workers <= 0:
+                raise ValueError(f"Parameter 'workers' value must be greater than 0. Actual value: {workers}.")
+        if not isinstance(chunk_size, int):
+            raise TypeError(f"Parameter 'chunk_size' value is not int type. Actual value: {chunk_size}.")
+        if chunk_size <= 0:
+            raise ValueError(f"Parameter 'chunk_size' value must be greater than 0. Actual value: {chunk_size}.")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+
+    def evaluate(self, solutions: Sequence[AbstractSolution]) -> int:
+        """
+        Calculates objective values (with penalty) of provided solutions that were not evaluated yet.
+
+        Solutions are split into chunks which are evaluated concurrently by worker threads.
+
+        :param solutions: Solutions (of a single optimization problem) to be evaluated.
+
+        :return: Number of performed evaluations (calculations of objective value).
+        """
+        if not solutions:
+            return 0
+        sample_solution = solutions[0]  # used to call class methods of the solutions class
+        groups = sample_solution.group_not_evaluated(solutions)
+        if not groups:
+            return 0
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        to_evaluate = [group[0] for group in groups]
+        chunks = [to_evaluate[i:i + self.chunk_size] for i in range(0, len(to_evaluate), self.chunk_size)]
+        # list() is used to wait for all results and to re-raise exceptions of worker threads
+        list(self._executor.map(sample_solution.calculate_objective_values, chunks))
+        sample_solution.store_evaluation_results(groups)
+        return len(groups)
+
+    def evaluate_batch(self, problem: OptimizationProblem, batch_values: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Calculates objective values (with penalty) of many individuals given without solution objects.
+
+        Individuals are split into chunks which are evaluated concurrently by worker threads.
+
+        :param problem: Optimization problem which individuals are evaluated.
+        :param batch_values: Decision variables values of evaluated individuals (format as returned by
+            'get_batch_values' method of the optimization problem).
+
+        :return: Array with objective values (with penalty) of following individuals.
+        """
+        chunks = _split_batch_values(batch_values, self.chunk_size)
+        if not chunks:
+            return numpy.empty(0)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return numpy.concatenate(list(self._executor.map(problem.evaluate_batch, chunks)))
+
+    def close(self) -> None:
+        """Shuts down worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Evaluator crucial data.
+        """
+        log_data = super().get_log_data()
+        log_data.update(workers=self.workers, chunk_size=self.chunk_size)
+        return log_data
+
+
+async def _resolve(value: Any) -> Any:
+    """
+    Awaits the value if it is awaitable (e.g. returned by 'async def' function).
+
+    :param value: Value returned by objective, constraint or penalty function.
+
+    :return: Final (awaited if needed) value.
+    """
+    if isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncEvaluator(AbstractEvaluator):
+    """
+    Evaluator that calculates objective values of solutions concurrently using asyncio event loop.
+
+    Objective, constraints and penalty functions of the optimization problem might be either regular functions
+    or coroutine functions ('async def'). Evaluation of the whole population is executed in a new event loop,
+    therefore this evaluator cannot be used inside already running event loop.
+    """
+
+    def __init__(self, max_concurrency: int = 100) -> None:
+        """
+        Configuration of Async Evaluator.
+
+        :param max_concurrency: Maximal number of solutions that are evaluated at the same time.
+
+        :raise TypeError: Parameter 'max_concurrency' has incorrect type.
+        :raise ValueError: Parameter 'max_concurrency' has incorrect value.
+        """
+        if not isinstance(max_concurrency, int):
+            raise TypeError(f"Parameter 'max_concurrency' value is not int type. Actual value: {max_concurrency}.")
+        if max_concurrency <= 0:
+            raise ValueError(f"Parameter 'max_concurrency' value must be greater than 0. "
+                             f"Actual value: {max_concurrency}.")
+        self.max_concurrency = max_concurrency
+
+    @staticmethod
+    async def _evaluate_values(problem: OptimizationProblem, values: Mapping[str, Any],
+                               semaphore: asyncio.Semaphore) -> Tuple[Any, Any, Tuple[Any, ...]]:
+        """
+        Calculates objective value, constraints values and penalty of a single individual.
+
+        :param problem: Optimization problem which individual is evaluated.
+        :param values: Decision variables values of the individual.
+        :param semaphore: Semaphore that limits number of concurrent evaluations.
+
+        :return: Objective value, penalty value and (absolute) constraints values of the individual.
+        """
+        async with semaphore:
+            constraints_names = list(problem.constraints.keys())
+            objective_value, *constraints_values = await asyncio.gather(
+                _resolve(problem.objective_function(**values)),
+                *[_resolve(problem.constraints[name](**values)) for name in constraints_names])
+            constraints_values = [abs(value) for value in constraints_values]
+            penalty_value = await _resolve(problem.penalty_function(**dict(zip(constraints_names, constraints_values))))
+        return objective_value, penalty_value, tuple(constraints_values)
+
+    @classmethod
+    async def _evaluate_solution(cls, solution: AbstractSolution, semaphore: asyncio.Semaphore) -> None:
+        """
+        Calculates objective value (with penalty) of a single solution.
+
+        :param solution: Solution to be evaluated.
+        :param semaphore: Semaphore that limits number of concurrent evaluations.
+        """
+        problem = solution.optimization_problem
+        objective_value, penalty_value, constraints_values = \
+            await cls._evaluate_values(problem, solution.decision_variables_values, semaphore)
+        solution._objective_value = objective_value  # pylint: disable=protected-access
+        solution._penalty_value = penalty_value  # pylint: disable=protected-access
+        solution._constraints_values = constraints_values  # pylint: disable=protected-access
+        if problem.optimization_type == OptimizationType.Minimize:
+            solution._objective_value_with_penalty = objective_value + penalty_value  # pylint: disable=protected-access
+        else:  # only OptimizationType.Maximize value is possible here
+            solution._objective_value_with_penalty = objective_value - penalty_value  # pylint: disable=protected-access
+
+    async def _evaluate_all(self, solutions: Sequence[AbstractSolution]) -> None:
+        """
+        Calculates objective values (with penalty) of all provided solutions with bounded concurrency.
+
+        :param solutions: Solutions to be evaluated.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*[self._evaluate_solution(solution, semaphore) for solution in solutions])
+
+    async def _evaluate_all_values(self, problem: OptimizationProblem,
+                                   individuals_values: Sequence[Mapping[str, Any]]) -> List[Tuple[Any, Any, Any]]:
+        """
+        Calculates objective values, constraints values and penalties of many individuals with bounded concurrency.
+
+        :param problem: Optimization problem which individuals are evaluated.
+        :param individuals_values: Decision variables values of following individuals.
+
+        :return: Objective value, penalty value and constraints values of following individuals.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(*[self._evaluate_values(problem, values, semaphore)
+                                      for values in individuals_values])
+
+    def evaluate(self, solutions: Sequence[AbstractSolution]) -> int:
+        """
+        Calculates objective values (with penalty) of provided solutions that were not evaluated yet.
+
+        :param solutions: Solutions (of a single optimization problem) to be evaluated.
+
+        :return: Number of performed evaluations (calculations of objective value).
+        """
+        if not solutions:
+            return 0
+        sample_solution = solutions[0]  # used to call class methods of the solutions class
+        groups = sample_solution.group_not_evaluated(solutions)
+        if groups:
+            asyncio.run(self._evaluate_all([group[0] for group in groups]))
+            sample_solution.store_evaluation_results(groups)
+        return len(groups)
+
+    def evaluate_batch(self, problem: OptimizationProblem, batch_values: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Calculates objective values (with penalty) of many individuals given without solution objects.
+
+        :param problem: Optimization problem which individuals are evaluated.
+        :param batch_values: Decision variables values of evaluated individuals (format as returned by
+            'get_batch_values' method of the optimization problem).
+
+        :return: Array with objective values (with penalty) of following individuals.
+        """
+        individuals_values = [dict(zip(batch_values.keys(), row))
+                              for row in zip(*[values.tolist() for values in batch_values.values()])]
+        results = asyncio.run(self._evaluate_all_values(problem, individuals_values))
+        objective_values = numpy.array([objective_value for objective_value, _, _ in results])
+        penalty_values = numpy.array([penalty_value for _, penalty_value, _ in results])
+        if problem.optimization_type == OptimizationType.Minimize:
+            return objective_values + penalty_values
+        return objective_values - penalty_values
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Evaluator crucial data.
+        """
+        log_data = super().get_log_data()
+        log_data.update(max_concurrency=self.max_concurrency)
+        return log_data
@@ -2,3 +2,5 @@
 
 from .utilities import log_function_code
 from .logger import AbstractLogger, Logger, LoggingVerbosity, LoggingFormat
+from .async_logger import AsyncLogger, BackpressurePolicy
+from .archive import ArchiveLogger, SolutionsArchive
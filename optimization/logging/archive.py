@@ -0,0 +1,403 @@
+"""
+Columnar archive of all solutions found during optimization process.
+
+In this file you can find:
+- ArchiveLogger - logger that appends all logged solutions to binary ('.npy') columns
+- SolutionsArchive - reader of solutions archived by 'ArchiveLogger' (with memory-mapped columns)
+"""
+
+__all__ = ["ArchiveLogger", "SolutionsArchive"]
+
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from enum import Enum
+from os import path, mkdir, makedirs
+from datetime import datetime, timedelta
+from json import dump as json_dump, load as json_load
+
+import numpy as np
+
+from .logger import AbstractLogger, Logger
+from .writers import NpyColumnWriter
+
+
+ARCHIVE_FORMAT_VERSION = 1
+"""Version of archive files format."""
+
+METADATA_FILE_NAME = "metadata.json"
+"""Name of the file with archive metadata (header)."""
+
+VARIABLES_DIR_NAME = "variables"
+"""Name of the directory (in archive directory) with decision variables columns."""
+
+
+def _to_json_value(value: Any) -> Any:
+    """
+    Converts value that is not JSON serializable (e.g. possible value of choice variable).
+
+    :param value: Value to convert.
+
+    :return: Value of Enum member, string representation of other values.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class _ArchiveTable:
+    """Columns with solutions logged at one level (main or lower algorithms) of optimization process."""
+
+    def __init__(self, table_dir: str, optimization_problem: Any, index_columns: Sequence[str],
+                 chunk_size: int) -> None:
+        """
+        Creates directory with columns files and metadata of archived solutions.
+
+        Decision variables columns are kept in a separate directory, so names of decision variables never clash
+        with names of other columns (e.g. 'fitness').
+
+        :param table_dir: Directory where columns files to be created.
+        :param optimization_problem: Optimization problem of archived solutions.
+        :param index_columns: Names of columns with iteration indices (e.g. 'iteration').
+        :param chunk_size: Number of values in columns that are buffered before they are written to files.
+        """
+        from ..problem import IntegerVariable, ChoiceVariable  # pylint: disable=import-outside-toplevel
+        self.table_dir = table_dir
+        self.index_columns = tuple(index_columns)
+        columns_types = {name: np.dtype(np.int64) for name in self.index_columns + ("individual",)}
+        columns_types.update(objective_value_with_penalty=np.dtype(np.float64), fitness=np.dtype(np.float64),
+                             penalty_value=np.dtype(np.float64))
+        variables_metadata = []
+        variables_types = []
+        self._variables_codes: List[Optional[Dict[Any, int]]] = []
+        for name, variable in optimization_problem.decision_variables.items():
+            variable_metadata: Dict[str, Any] = {"name": name, "type": variable.__class__.__name__}
+            if isinstance(variable, ChoiceVariable):
+                possible_values = list(variable.possible_values)
+                variable_metadata["possible_values"] = possible_values
+                self._variables_codes.append({value: code for code, value in enumerate(possible_values)})
+                dtype = np.dtype(np.int64)
+            else:
+                self._variables_codes.append(None)
+                dtype = np.dtype(np.int64 if isinstance(variable, IntegerVariable) else np.float64)
+            variable_metadata["dtype"] = dtype.str
+            variables_metadata.append(variable_metadata)
+            variables_types.append(dtype)
+        mkdir(table_dir)
+        mkdir(path.join(table_dir, VARIABLES_DIR_NAME))
+        with open(path.join(table_dir, METADATA_FILE_NAME), "w") as json_file:
+            json_dump({"format_version": ARCHIVE_FORMAT_VERSION,
+                       "optimization_type": optimization_problem.optimization_type.value,
+                       "index_columns": list(self.index_columns),
+                       "decision_variables": variables_metadata,
+                       "columns": {name: dtype.str for name, dtype in columns_types.items()}},
+                      json_file, default=_to_json_value)
+        self.variables_names = list(optimization_problem.decision_variables)
+        self._writers = {name: NpyColumnWriter(file_path=path.join(table_dir, f"{name}.npy"), dtype=dtype,
+                                               chunk_size=chunk_size)
+                         for name, dtype in columns_types.items()}
+        self._variables_writers = [NpyColumnWriter(file_path=path.join(table_dir, VARIABLES_DIR_NAME, f"{name}.npy"),
+                                                   dtype=dtype, chunk_size=chunk_size)
+                                   for name, dtype in zip(self.variables_names, variables_types)]
+
+    def write(self, solutions: Sequence, **indices: int) -> None:
+        """
+        Appends solutions to the columns.
+
+        :param solutions: Solutions to archive.
+        :param indices: Values of index columns for these solutions.
+        """
+        solutions_number = len(solutions)
+        for name, value in indices.items():
+            self._writers[name].write(np.full(solutions_number, value, dtype=np.int64))
+        self._writers["individual"].write(np.arange(solutions_number, dtype=np.int64))
+        self._writers["objective_value_with_penalty"].write(
+            np.fromiter((solution.get_objective_value_with_penalty() for solution in solutions), dtype=np.float64,
+                        count=solutions_number))
+        self._writers["fitness"].write(np.fromiter((solution.get_fitness() for solution in solutions),
+                                                   dtype=np.float64, count=solutions_number))
+        self._writers["penalty_value"].write(np.array([solution.penalty_value for solution in solutions],
+                                                      dtype=np.float64))  # None (unknown penalty) becomes NaN
+        for writer, codes, values in zip(self._variables_writers, self._variables_codes,
+                                         zip(*(solution.values for solution in solutions))):
+            writer.write([codes[value] for value in values] if codes is not None else values)
+
+    def close(self) -> None:
+        """Writes all buffered values and closes columns files."""
+        for writer in list(self._writers.values()) + self._variables_writers:
+            writer.close()
+
+
+class ArchiveLogger(AbstractLogger):
+    """
+    Logger that archives all solutions found during optimization process in binary columns.
+
+    Each logged solution is a row of columns (separate '.npy' files) with: iteration indices, individual index
+    (position of the solution in the logged iteration), objective value with penalty, fitness, penalty value
+    (NaN if unknown) and decision variables values (index of the value in 'possible_values' for choice variables,
+    kept in 'variables' subdirectory).
+    Solutions of main algorithm are archived in 'solutions' directory, solutions of lower algorithms (adaptive
+    algorithm) in 'lower_level_solutions' directory. Each of these directories contains 'metadata.json' file with
+    archive metadata (header). Use 'SolutionsArchive' to read archived solutions.
+    """
+
+    LOG_DIRECTORY_PATTERN = Logger.LOG_DIRECTORY_PATTERN
+    SOLUTIONS_DIR_NAME = "solutions"
+    LOWER_LEVEL_SOLUTIONS_DIR_NAME = "lower_level_solutions"
+
+    def __init__(self, logs_dir: str, chunk_size: int = NpyColumnWriter.DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Creates archive logger.
+
+        :param logs_dir: Directory where optimization process archives to be created.
+        :param chunk_size: Number of archived solutions that are buffered before they are written to files.
+
+        :raise TypeError: For some parameter a value has incorrect type.
+        :raise ValueError: For some parameter a value is incorrect.
+        """
+        if not isinstance(logs_dir, str):
+            raise TypeError(f"Parameter 'logs_dir' is not str type. Actual value: {logs_dir}.")
+        if not isinstance(chunk_size, int):
+            raise TypeError(f"Parameter 'chunk_size' is not int type. Actual value: {chunk_size}.")
+        if chunk_size <= 0:
+            raise ValueError(f"Parameter 'chunk_size' must be greater than 0. Actual value: {chunk_size}.")
+        if not path.isdir(logs_dir):
+            makedirs(logs_dir)
+        self.main_dir = logs_dir
+        self.chunk_size = chunk_size
+        self.optimization_process_dir: Optional[str] = None
+        self._solutions_table: Optional[_ArchiveTable] = None
+        self._lower_level_solutions_table: Optional[_ArchiveTable] = None
+
+    def _create_table(self, dir_name: str, solution: Any, index_columns: Sequence[str]) -> _ArchiveTable:
+        """
+        Creates archive table for solutions.
+
+        :param dir_name: Name of the table directory (in optimization process directory).
+        :param solution: Example of archived solutions (its optimization problem defines the columns).
+        :param index_columns: Names of columns with iteration indices.
+
+        :return: Created archive table.
+        """
+        return _ArchiveTable(table_dir=path.join(self.optimization_process_dir, dir_name),  # type: ignore
+                             optimization_problem=solution.optimization_problem,
+                             index_columns=index_columns,
+                             chunk_size=self.chunk_size)
+
+    def log_at_start(self, algorithm, stop_conditions, problem) -> None:
+        """
+        Logging method that will be called before the start of the optimization process.
+
+        :param algorithm: Optimization algorithm configuration that will be used during the optimization process.
+        :param stop_conditions: Stop conditions of the optimization process.
+        :param problem: Optimization problem to solve.
+        """
+        self.close()
+        _top_level_dir_name = datetime.now().strftime(self.LOG_DIRECTORY_PATTERN.format(algorithm.__class__.__name__))
+        self.optimization_process_dir = path.join(self.main_dir, _top_level_dir_name)
+        mkdir(self.optimization_process_dir)
+
+    def log_iteration(self, iteration: int, solutions: Iterable) -> None:
+        """
+        Logging method that will be called at each iteration of main optimization algorithm.
+
+        :param iteration: Number of iteration of main optimization algorithm.
+        :param solutions: Solutions found in this iteration.
+        """
+        solutions = list(solutions)
+        if solutions:
+            if self._solutions_table is None:
+                self._solutions_table = self._create_table(dir_name=self.SOLUTIONS_DIR_NAME, solution=solutions[0],
+                                                           index_columns=("iteration",))
+            self._solutions_table.write(solutions, iteration=iteration)
+
+    def log_lower_level_iteration(self,
+                                  upper_iteration: int,
+                                  lower_algorithm_index: int,
+                                  lower_iteration: int,
+                                  solutions: Iterable) -> None:
+        """
+        Logging method that will be called at each iteration of lower level optimization algorithms.
+
+        :param upper_iteration: Upper algorithm iteration.
+        :param lower_algorithm_index: Lower algorithm index.
+        :param lower_iteration: Lower algorithm iteration.
+        :param solutions: Solutions found in this iteration of lower algorithm.
+        """
+        solutions = list(solutions)
+        if solutions:
+            if self._lower_level_solutions_table is None:
+                self._lower_level_solutions_table = self._create_table(
+                    dir_name=self.LOWER_LEVEL_SOLUTIONS_DIR_NAME, solution=solutions[0],
+                    index_columns=("upper_iteration", "lower_algorithm_index", "lower_iteration"))
+            self._lower_level_solutions_table.write(solutions, upper_iteration=upper_iteration,
+                                                    lower_algorithm_index=lower_algorithm_index,
+                                                    lower_iteration=lower_iteration)
+
+    def log_at_end(self, best_solution, optimization_time: timedelta) -> None:
+        """
+        Logging method that will be called at the end of optimization process.
+
+        The best solution and optimization time are saved to 'best_solution.json' file.
+
+        :param best_solution: The best solution found by the optimization algorithm.
+        :param optimization_time: Optimization process duration time.
+        """
+        file_path = path.join(self.optimization_process_dir, "best_solution.json")  # type: ignore
+        with open(file_path, "w") as json_file:
+            json_dump({"optimization_duration": str(optimization_time),
+                       "best_solution": best_solution.get_log_data()}, json_file, default=_to_json_value)
+
+    def log_lower_level_at_end(self,
+                               upper_iteration: int,
+                               lower_algorithm_index: int,
+                               best_solution,
+                               optimization_time: timedelta) -> None:
+        """
+        Logging method that will be called at the end of lower level optimization process.
+
+        Nothing is logged, as all solutions of lower algorithms are already archived.
+
+        :param upper_iteration: Upper algorithm iteration.
+        :param lower_algorithm_index: Lower algorithm index.
+        :param best_solution: The best solution found by the optimization algorithm.
+        :param optimization_time: Optimization process duration time.
+        """
+
+    def close(self) -> None:
+        """Writes all buffered solutions and closes archive files."""
+        for table in (self._solutions_table, self._lower_level_solutions_table):
+            if table is not None:
+                table.close()
+        self._solutions_table = None
+        self._lower_level_solutions_table = None
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Logger crucial data.
+        """
+        return {
+            "type": self.__class__.__name__,
+            "chunk_size": self.chunk_size,
+        }
+
+
+class SolutionsArchive:
+    """
+    Reader of solutions archived by 'ArchiveLogger'.
+
+    Columns are memory-mapped (read-only), so they are not loaded to memory until their values are used.
+    """
+
+    def __init__(self, archive_dir: str) -> None:
+        """
+        Opens solutions archive.
+
+        :param archive_dir: Directory with archived solutions (e.g. 'solutions' or 'lower_level_solutions'
+            directory in optimization process logs directory).
+
+        :raise TypeError: Provided value of 'archive_dir' is not str type.
+        :raise ValueError: Provided directory does not contain solutions archive.
+        """
+        if not isinstance(archive_dir, str):
+            raise TypeError(f"Parameter 'archive_dir' is not str type. Actual value: {archive_dir}.")
+        metadata_path = path.join(archive_dir, METADATA_FILE_NAME)
+        if not path.isfile(metadata_path):
+            raise ValueError(f"Provided directory does not contain solutions archive. Actual value: {archive_dir}.")
+        with open(metadata_path) as json_file:
+            self.metadata: Dict[str, Any] = json_load(json_file)
+        self.archive_dir = archive_dir
+        self._columns: Dict[str, np.ndarray] = {}
+
+    @property
+    def columns_names(self) -> List[str]:
+        """Names of archived columns (other than decision variables)."""
+        return list(self.metadata["columns"])
+
+    @property
+    def decision_variables_names(self) -> List[str]:
+        """Names of archived decision variables."""
+        return [variable["name"] for variable in self.metadata["decision_variables"]]
+
+    def _load_column(self, file_path: str) -> np.ndarray:
+        """
+        Memory-maps column file (once).
+
+        :param file_path: Path to '.npy' file with the column.
+
+        :return: Memory-mapped values of the column.
+        """
+        if file_path not in self._columns:
+            try:
+                self._columns[file_path] = np.load(file_path, mmap_mode="r")
+            except ValueError:  # empty column cannot be memory-mapped
+                self._columns[file_path] = np.load(file_path)
+        return self._columns[file_path]
+
+    def __getitem__(self, column_name: str) -> np.ndarray:
+        """
+        Gets archived column other than decision variable (e.g. 'fitness').
+
+        :param column_name: Name of the column.
+
+        :raise KeyError: There is no such column in the archive.
+
+        :return: Memory-mapped values of the column.
+        """
+        if column_name not in self.metadata["columns"]:
+            raise KeyError(f"There is no such column in the archive. Actual value: {column_name}.")
+        return self._load_column(path.join(self.archive_dir, f"{column_name}.npy"))
+
+    def __len__(self) -> int:
+        """:return: Number of archived solutions."""
+        return min([len(self[column_name]) for column_name in self.columns_names]
+                   + [len(self.get_decision_variable_column(name)) for name in self.decision_variables_names])
+
+    def _get_variable_metadata(self, variable_name: str) -> Dict[str, Any]:
+        """
+        Gets metadata of archived decision variable.
+
+        :param variable_name: Name of decision variable.
+
+        :raise KeyError: There is no such decision variable in the archive.
+
+        :return: Metadata of the decision variable.
+        """
+        for variable in self.metadata["decision_variables"]:
+            if variable["name"] == variable_name:
+                return variable
+        raise KeyError(f"There is no such decision variable in the archive. Actual value: {variable_name}.")
+
+    def get_decision_variable_column(self, variable_name: str) -> np.ndarray:
+        """
+        Gets archived column of decision variable.
+
+        :param variable_name: Name of decision variable.
+
+        :raise KeyError: There is no such decision variable in the archive.
+
+        :return: Memory-mapped values of the column (choice variables values are presented as codes).
+        """
+        self._get_variable_metadata(variable_name)
+        return self._load_column(path.join(self.archive_dir, VARIABLES_DIR_NAME, f"{variable_name}.npy"))
+
+    def get_decision_variable_values(self, variable_name: str) -> np.ndarray:
+        """
+        Gets archived values of decision variable.
+
+        :param variable_name: Name of decision variable.
+
+        :raise KeyError: There is no such decision variable in the archive.
+
+        :return: Values of decision variable (memory-mapped, except choice variables which values are decoded).
+            Possible values of choice variables that are not JSON serializable are presented as values of Enum
+            members or as strings.
+        """
+        variable = self._get_variable_metadata(variable_name)
+        column = self.get_decision_variable_column(variable_name)
+        if "possible_values" in variable:
+            possible_values = np.empty(len(variable["possible_values"]), dtype=object)
+            possible_values[:] = variable["possible_values"]
+            return possible_values[column]
+        return column
@@ -0,0 +1,382 @@
+"""
+Asynchronous optimization process logger.
+
+In this file you can find:
+- BackpressurePolicy - enum with policies of handling logged records when 'AsyncLogger' queue is full
+- AsyncLogger - logger that passes logged data to other logger in a background thread
+"""
+
+__all__ = ["BackpressurePolicy", "AsyncLogger"]
+
+
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple, Union
+from collections import deque, OrderedDict
+from enum import Enum
+from threading import Condition, Thread
+from datetime import timedelta
+
+from .logger import AbstractLogger
+
+
+class BackpressurePolicy(Enum):
+    """
+    Enum with policies of handling iteration records when queue of 'AsyncLogger' is full.
+
+    Options:
+        - Block: Optimization process waits until there is space in the queue (no record is lost).
+        - DropOldest: The oldest queued iteration record is dropped to make space for the new one.
+        - Sample: While the queue is full, only every 'sampling_step'-th iteration record is queued (optimization
+            process waits for space in the queue), other iteration records are dropped.
+
+    Note: Records logged at the start and at the end of optimization processes are never dropped.
+    """
+
+    Block = "Block"
+    DropOldest = "DropOldest"
+    Sample = "Sample"
+
+
+class _SolutionSnapshot:
+    """Data of a solution captured when it was logged."""
+
+    __slots__ = ("optimization_problem", "values", "objective_value_with_penalty", "fitness", "penalty_value",
+                 "log_data")
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 optimization_problem: Any,
+                 values: Tuple[Any, ...],
+                 objective_value_with_penalty: Union[float, int],
+                 fitness: Union[float, int],
+                 penalty_value: Optional[Union[float, int]],
+                 log_data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        :param optimization_problem: Optimization problem of the solution.
+        :param values: Decision variables values of the solution.
+        :param objective_value_with_penalty: Objective value (with penalty) of the solution.
+        :param fitness: Fitness of the solution.
+        :param penalty_value: Penalty value of the solution (None if unknown).
+        :param log_data: Data returned by 'get_log_data' method of the solution if it differs from the data
+            created basing on values and objective value.
+        """
+        self.optimization_problem = optimization_problem
+        self.values = values
+        self.objective_value_with_penalty = objective_value_with_penalty
+        self.fitness = fitness
+        self.penalty_value = penalty_value
+        self.log_data = log_data
+
+    def get_objective_value_with_penalty(self) -> Union[float, int]:
+        """:return: Objective value (with penalty) of the solution."""
+        return self.objective_value_with_penalty
+
+    def get_fitness(self) -> Union[float, int]:
+        """:return: Fitness of the solution."""
+        return self.fitness
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """:return: Data of the solution in the same format as 'get_log_data' method of the solution."""
+        if self.log_data is not None:
+            return self.log_data
+        return {
+            "decision_variables_values": OrderedDict(zip(self.optimization_problem.decision_variables, self.values)),
+            "objective_value_with_penalty": self.objective_value_with_penalty,
+        }
+
+
+class _LogDataSnapshot:
+    """Log data of an object (other than solution) captured when it was logged."""
+
+    __slots__ = ("log_data",)
+
+    def __init__(self, log_data: Dict[str, Any]) -> None:
+        """:param log_data: Data returned by 'get_log_data' method of the logged object."""
+        self.log_data = log_data
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """:return: Captured log data."""
+        return self.log_data
+
+
+def take_snapshot(solution: Any) -> Union[_SolutionSnapshot, _LogDataSnapshot]:
+    """
+    Captures data of a solution, so it could be logged later (even if the solution changes in the meantime).
+
+    Decision variables values and objective value of evaluated solutions never change, therefore only references
+    to them are captured. Log data of solutions that provide more data (e.g. lower algorithms of adaptive algorithm
+    that are continued in following iterations) is captured at once.
+
+    :param solution: Solution to be logged.
+
+    :return: Object which provides data of the solution at the moment of logging.
+    """
+    from ..problem import AbstractSolution  # pylint: disable=import-outside-toplevel  # circular import
+    if not isinstance(solution, AbstractSolution):
+        return _LogDataSnapshot(solution.get_log_data())
+    log_data = None if type(solution).get_log_data is AbstractSolution.get_log_data else solution.get_log_data()
+    return _SolutionSnapshot(optimization_problem=solution.optimization_problem,
+                             values=solution.values,
+                             objective_value_with_penalty=solution.get_objective_value_with_penalty(),
+                             fitness=solution.get_fitness(),
+                             penalty_value=solution.penalty_value,
+                             log_data=log_data)
+
+
+class AsyncLogger(AbstractLogger):
+    """
+    Logger that records optimization process in a background (writer) thread.
+
+    Logged data is captured as lightweight snapshots and put into a bounded queue. The writer thread takes records
+    from the queue and passes them to the wrapped logger (e.g. 'Logger'), so serialization of logged data and disk
+    writes do not stall optimization process.
+    """
+
+    def __init__(self,
+                 logger: AbstractLogger,
+                 queue_size: int = 64,
+                 backpressure_policy: Union[BackpressurePolicy, str] = BackpressurePolicy.Block,
+                 sampling_step: int = 10) -> None:
+        """
+        Creates asynchronous logger.
+
+        :param logger: Logger that records data in the writer thread.
+        :param queue_size: Maximal number of records waiting in the queue.
+        :param backpressure_policy: Policy of handling iteration records when the queue is full.
+        :param sampling_step: Every how many iteration records one is queued when the queue is full
+            (used only with BackpressurePolicy.Sample).
+
+        :raise TypeError: For some parameter a value has incorrect type.
+        :raise ValueError: For some parameter a value is incorrect.
+        """
+        if not isinstance(logger, AbstractLogger):
+            raise TypeError(f"Parameter 'logger' is not AbstractLogger type. Actual value: {logger}.")
+        if not isinstance(queue_size, int):
+            raise TypeError(f"Parameter 'queue_size' is not int type. Actual value: {queue_size}.")
+        if queue_size <= 0:
+            raise ValueError(f"Parameter 'queue_size' must be greater than 0. Actual value: {queue_size}.")
+        if isinstance(backpressure_policy, BackpressurePolicy):
+            pass
+        elif isinstance(backpressure_policy, str):
+            backpressure_policy = getattr(BackpressurePolicy, backpressure_policy)
+        else:
+            raise TypeError(f"Parameter 'backpressure_policy' is not BackpressurePolicy or str type. "
+                            f"Actual value: {backpressure_policy}.")
+        if not isinstance(sampling_step, int):
+            raise TypeError(f"Parameter 'sampling_step' is not int type. Actual value: {sampling_step}.")
+        if sampling_step <= 0:
+            raise ValueError(f"Parameter 'sampling_step' must be greater than 0. Actual value: {sampling_step}.")
+        self.logger = logger
+        self.queue_size = queue_size
+        self.backpressure_policy = backpressure_policy
+        self.sampling_step = sampling_step
+        self.dropped_records_number = 0
+        self._records: Deque[Tuple[bool, str, Dict[str, Any]]] = deque()
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._closing = False
+        self._writing = False
+        self._error: Optional[BaseException] = None
+        self._full_queue_records_number = 0
+
+    def _write_records(self) -> None:
+        """Passes queued records to the wrapped logger. To be executed by the writer thread."""
+        while True:
+            with self._condition:
+                while not self._records and not self._closing:
+                    self._condition.wait()
+                if not self._records:
+                    return
+                _, method_name, params = self._records.popleft()
+                self._writing = True
+                self._condition.notify_all()
+            try:
+                if self._error is None:
+                    getattr(self.logger, method_name)(**params)
+            except BaseException as exception:  # pylint: disable=broad-except
+                self._error = exception  # re-raised in the optimization thread
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _raise_error(self) -> None:
+        """
+        Re-raises exception that occurred in the writer thread.
+
+        :raise BaseException: Exception raised by the wrapped logger in the writer thread.
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _is_dropped(self) -> bool:
+        """
+        Decides whether new iteration record is dropped (according to backpressure policy).
+
+        Note: To be called while holding the lock.
+
+        :return: True if the record should be dropped, False otherwise.
+        """
+        if len(self._records) < self.queue_size:
+            return False
+        if self.backpressure_policy == BackpressurePolicy.Sample:
+            self._full_queue_records_number += 1
+            return self._full_queue_records_number % self.sampling_step != 0
+        return False
+
+    def _put(self, method_name: str, droppable: bool, **params: Any) -> None:
+        """
+        Puts a record into the queue, so it is passed to the wrapped logger by the writer thread.
+
+        :param method_name: Name of the wrapped logger method to call.
+        :param droppable: Information whether the record might be dropped when the queue is full.
+        :param params: Parameters of the method call (solutions have to be already captured).
+        """
+        with self._condition:
+            if self._thread is None:
+                self._thread = Thread(target=self._write_records, name="AsyncLoggerWriter", daemon=True)
+                self._thread.start()
+            if droppable and len(self._records) >= self.queue_size \
+                    and self.backpressure_policy == BackpressurePolicy.DropOldest:
+                for index, (record_droppable, _, _) in enumerate(self._records):
+                    if record_droppable:
+                        del self._records[index]
+                        self.dropped_records_number += 1
+                        break
+            while len(self._records) >= self.queue_size:
+                self._condition.wait()
+            self._records.append((droppable, method_name, params))
+            self._condition.notify_all()
+
+    def _put_solutions(self, method_name: str, solutions: Iterable, **params: Any) -> None:
+        """
+        Captures logged solutions and puts iteration record into the queue (according to backpressure policy).
+
+        :param method_name: Name of the wrapped logger method to call.
+        :param solutions: Solutions to be logged.
+        :param params: Other parameters of the method call.
+        """
+        self._raise_error()
+        with self._condition:
+            if self._is_dropped():
+                self.dropped_records_number += 1
+                return
+        self._put(method_name, droppable=True, solutions=[take_snapshot(solution) for solution in solutions],
+                  **params)
+
+    def wait_until_written(self) -> None:
+        """
+        Waits until all queued records are passed to the wrapped logger.
+
+        :raise BaseException: Exception raised by the wrapped logger in the writer thread.
+        """
+        with self._condition:
+            while self._thread is not None and (self._records or self._writing):
+                self._condition.wait()
+        self._raise_error()
+
+    def log_at_start(self, algorithm, stop_conditions, problem) -> None:
+        """
+        Logging method that will be called before the start of the optimization process.
+
+        It is executed immediately (in the calling thread) after all queued records are written, as configuration
+        of the algorithm changes during the optimization process. Counters of dropped records are reset.
+
+        :param algorithm: Optimization algorithm configuration that will be used during the optimization process.
+        :param stop_conditions: Stop conditions of the optimization process.
+        :param problem: Optimization problem to solve.
+        """
+        self.wait_until_written()
+        with self._condition:
+            self.dropped_records_number = 0
+            self._full_queue_records_number = 0
+        self.logger.log_at_start(algorithm=algorithm, stop_conditions=stop_conditions, problem=problem)
+
+    def log_iteration(self, iteration: int, solutions: Iterable) -> None:
+        """
+        Logging method that will be called at each iteration of main optimization algorithm.
+
+        :param iteration: Number of iteration of main optimization algorithm.
+        :param solutions: Solutions found in this iteration.
+        """
+        self._put_solutions("log_iteration", solutions=solutions, iteration=iteration)
+
+    def log_lower_level_iteration(self,
+                                  upper_iteration: int,
+                                  lower_algorithm_index: int,
+                                  lower_iteration: int,
+                                  solutions: Iterable) -> None:
+        """
+        Logging method that will be called at each iteration of lower level optimization algorithms.
+
+        :param upper_iteration: Upper algorithm iteration.
+        :param lower_algorithm_index: Lower algorithm index.
+        :param lower_iteration: Lower algorithm iteration.
+        :param solutions: Solutions found in this iteration of lower algorithm.
+        """
+        self._put_solutions("log_lower_level_iteration", solutions=solutions, upper_iteration=upper_iteration,
+                            lower_algorithm_index=lower_algorithm_index, lower_iteration=lower_iteration)
+
+    def log_at_end(self, best_solution, optimization_time: timedelta) -> None:
+        """
+        Logging method that will be called at the end of optimization process.
+
+        :param best_solution: The best solution found by the optimization algorithm.
+        :param optimization_time: Optimization process duration time.
+        """
+        self._raise_error()
+        self._put("log_at_end", droppable=False, best_solution=take_snapshot(best_solution),
+                  optimization_time=optimization_time)
+
+    def log_lower_level_at_end(self,
+                               upper_iteration: int,
+                               lower_algorithm_index: int,
+                               best_solution,
+                               optimization_time: timedelta) -> None:
+        """
+        Logging method that will be called at the end of lower level optimization process.
+
+        :param upper_iteration: Upper algorithm iteration.
+        :param lower_algorithm_index: Lower algorithm index.
+        :param best_solution: The best solution found by the optimization algorithm.
+        :param optimization_time: Optimization process duration time.
+        """
+        self._raise_error()
+        self._put("log_lower_level_at_end", droppable=False, upper_iteration=upper_iteration,
+                  lower_algorithm_index=lower_algorithm_index, best_solution=take_snapshot(best_solution),
+                  optimization_time=optimization_time)
+
+    def close(self) -> None:
+        """
+        Waits until all queued records are written, stops the writer thread and closes the wrapped logger.
+
+        :raise BaseException: Exception raised by the wrapped logger in the writer thread.
+        """
+        with self._condition:
+            thread = self._thread
+            self._closing = True
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            self._thread = None
+            self._closing = False
+        self.logger.close()
+        self._raise_error()
+
+    def get_queued_records_number(self) -> int:
+        """:return: Number of records that are waiting in the queue."""
+        with self._condition:
+            return len(self._records)
+
+    def get_log_data(self) -> Dict[str, Any]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Logger crucial data.
+        """
+        return {
+            "type": self.__class__.__name__,
+            "queue_size": self.queue_size,
+            "backpressure_policy": self.backpressure_policy.value,
+            "sampling_step": self.sampling_step,
+        }
@@ -11,7 +11,7 @@ In this file you can find:
 __all__ = ["AbstractLogger", "LoggingVerbosity", "LoggingFormat", "Logger"]
 
 
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from abc import ABC, abstractmethod
 from enum import IntEnum, Enum
 from os import path, mkdir, makedirs
@@ -19,7 +19,9 @@ from datetime import datetime, timedelta
 
 from yaml import dump as yaml_dump
 from yamlordereddictloader import Dumper as YamlDumper
-from json import dump as json_dump
+from json import dump as json_dump, dumps as json_dumps, loads as json_loads
+
+from .writers import BufferedRecordWriter, CompressedRecordWriter, read_compressed_records
 
 
 class LoggingVerbosity(IntEnum):
@@ -100,10 +102,19 @@ class LoggingVerbosity(IntEnum):
 
 
 class LoggingFormat(Enum):
-    """Enum with currently supported log formats."""
+    """
+    Enum with currently supported log formats.
+
+    Options:
+        - YAML: All log files are YAML documents.
+        - JSON: All log files are JSON documents.
+        - JSONL: Solutions are logged as JSON Lines (one JSON object per line for each iteration),
+            other log files are JSON documents.
+    """
 
     YAML = "YAML"
     JSON = "JSON"
+    JSONL = "JSONL"
 
 
 class AbstractLogger(ABC):
@@ -178,22 +189,40 @@ class AbstractLogger(ABC):
         :param optimization_time: Optimization process duration time.
         """
 
+    def close(self) -> None:
+        """Releases all resources (e.g. opened files) that are used by the logger."""
+        ...
+
 
 class Logger(AbstractLogger):
     """Build-in logger for reporting optimization data."""
 
     LOG_DIRECTORY_PATTERN = "{}_%Y-%m-%d_%H-%M-%S"
+    LOWER_LEVEL_STREAM_FILE_NAME_PATTERN = "lower_level_{}.jsonl.gz"
+    LOWER_LEVEL_STREAM_INDEX_FILE_NAME = "lower_level_index.jsonl"
 
-    def __init__(self,
+    def __init__(self,  # pylint: disable=too-many-arguments
                  logs_dir: str,
                  verbosity: LoggingVerbosity = LoggingVerbosity.BestSolution,
-                 log_format: LoggingFormat = LoggingFormat.YAML) -> None:
+                 log_format: LoggingFormat = LoggingFormat.YAML,
+                 buffer_size: int = BufferedRecordWriter.DEFAULT_BUFFER_SIZE,
+                 flush_interval: Optional[timedelta] = None,
+                 compress_lower_level: bool = False,
+                 max_lower_level_file_size: Optional[int] = None) -> None:
         """
         Creates optimization process logger.
 
         :param logs_dir: Directory where optimization process logs to be created.
         :param verbosity: Level of logger verbosity (how much information to be provided).
         :param log_format: Format in which log files to be presented.
+        :param buffer_size: Number of characters of logged solutions that are buffered before they are written
+            to a file.
+        :param flush_interval: Maximal time that logged solutions might stay in the buffer.
+            If None, then solutions are written to files only when the buffer is full or the logger is closed.
+        :param compress_lower_level: Whether to log all data of lower algorithms (adaptive algorithm) into
+            a compressed stream (gzip files with JSON Lines records and the index) instead of separate files.
+        :param max_lower_level_file_size: Maximal size (in bytes) of compressed lower level stream file, when exceeded
+            the next file is started. If None, then the whole stream is written to a single file.
         """
         if not isinstance(logs_dir, str):
             raise TypeError(f"Parameter 'logs_dir' is not str type. Actual value: {logs_dir}.")
@@ -211,10 +240,106 @@ class Logger(AbstractLogger):
             log_format = getattr(LoggingFormat, log_format)
         else:
             raise TypeError(f"Parameter 'log_format' is not LoggingFormat or str type. Actual value: {log_format}.")
+        if not isinstance(buffer_size, int):
+            raise TypeError(f"Parameter 'buffer_size' is not int type. Actual value: {buffer_size}.")
+        if buffer_size < 0:
+            raise ValueError(f"Parameter 'buffer_size' must not be negative. Actual value: {buffer_size}.")
+        if flush_interval is not None:
+            if not isinstance(flush_interval, timedelta):
+                raise TypeError(f"Parameter 'flush_interval' is not timedelta nor None type. "
+                                f"Actual value: {flush_interval}.")
+            if flush_interval <= timedelta():
+                raise ValueError(f"Parameter 'flush_interval' must be positive time. Actual value: {flush_interval}.")
+        if not isinstance(compress_lower_level, bool):
+            raise TypeError(f"Parameter 'compress_lower_level' is not bool type. Actual value: {compress_lower_level}.")
+        if max_lower_level_file_size is not None:
+            if not isinstance(max_lower_level_file_size, int):
+                raise TypeError(f"Parameter 'max_lower_level_file_size' is not int nor None type. "
+                                f"Actual value: {max_lower_level_file_size}.")
+            if max_lower_level_file_size <= 0:
+                raise ValueError(f"Parameter 'max_lower_level_file_size' must be greater than 0. "
+                                 f"Actual value: {max_lower_level_file_size}.")
         self.main_dir = logs_dir
         self.verbosity = verbosity
         self.log_format = log_format
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.compress_lower_level = compress_lower_level
+        self.max_lower_level_file_size = max_lower_level_file_size
         self.optimization_process_dir: Optional[str] = None
+        self._solutions_writer: Optional[BufferedRecordWriter] = None
+        self._lower_level_writer: Optional[BufferedRecordWriter] = None
+        self._lower_level_stream: Optional[CompressedRecordWriter] = None
+
+    def _open_writer(self, file_name: str) -> BufferedRecordWriter:
+        """
+        Opens writer of records for a file in optimization process directory.
+
+        :param file_name: Name of the file.
+
+        :return: Buffered writer of records to the file.
+        """
+        return BufferedRecordWriter(file_path=path.join(self.optimization_process_dir, file_name),  # type: ignore
+                                    buffer_size=self.buffer_size,
+                                    flush_interval=self.flush_interval)
+
+    def _serialize_record(self, data_to_log: dict) -> str:
+        """
+        Serializes logged data into a record (according to 'log_format' attribute).
+
+        :param data_to_log: Data to be logged.
+
+        :return: Text of the record.
+        """
+        if self.log_format == LoggingFormat.YAML:
+            return yaml_dump(data_to_log, Dumper=YamlDumper)
+        if self.log_format == LoggingFormat.JSON:
+            return json_dumps(data_to_log)
+        return json_dumps(data_to_log) + "\n"  # only LoggingFormat.JSONL value is possible here
+
+    def _write_lower_level_stream_record(self, upper_iteration: int, lower_algorithm_index: int,
+                                         data_to_log: dict) -> None:
+        """
+        Writes record of lower algorithm to compressed lower level stream.
+
+        :param upper_iteration: Upper algorithm iteration.
+        :param lower_algorithm_index: Lower algorithm index.
+        :param data_to_log: Data to be logged (without upper iteration and lower algorithm index).
+        """
+        if self._lower_level_stream is None:
+            self._lower_level_stream = CompressedRecordWriter(
+                dir_path=self.optimization_process_dir,  # type: ignore
+                file_name_pattern=self.LOWER_LEVEL_STREAM_FILE_NAME_PATTERN,
+                index_file_name=self.LOWER_LEVEL_STREAM_INDEX_FILE_NAME,
+                buffer_size=self.buffer_size,
+                max_file_size=self.max_lower_level_file_size)
+        record = json_dumps({"upper_iteration": upper_iteration, "lower_algorithm_index": lower_algorithm_index,
+                             **data_to_log}) + "\n"
+        self._lower_level_stream.write(key=(upper_iteration, lower_algorithm_index), record=record)
+
+    @classmethod
+    def read_lower_level_records(cls, optimization_process_dir: str, upper_iteration: int,
+                                 lower_algorithm_index: int) -> List[Dict[str, Any]]:
+        """
+        Reads records of a single lower algorithm from compressed lower level stream.
+
+        Only parts of the stream with records of this lower algorithm are decompressed.
+
+        :param optimization_process_dir: Directory with logs of optimization process.
+        :param upper_iteration: Upper algorithm iteration.
+        :param lower_algorithm_index: Lower algorithm index.
+
+        :return: Records of the lower algorithm (iterations and the best solution) in order in which they were logged.
+        """
+        return [json_loads(record) for record in read_compressed_records(
+            dir_path=optimization_process_dir,
+            index_file_name=cls.LOWER_LEVEL_STREAM_INDEX_FILE_NAME,
+            key=(upper_iteration, lower_algorithm_index))]
+
+    @property
+    def _solutions_file_extension(self) -> str:
+        """Extension of files with logged solutions."""
+        return self.log_format.value.lower()
 
     def _dump_algorithm_data(self, algorithm_data: dict, stop_conditions_data: dict) -> None:
         """
@@ -230,7 +355,7 @@ class Logger(AbstractLogger):
                 yaml_dump(algorithm_data, yaml_file, YamlDumper)
             with open(stop_conditions_file_path, "w") as yaml_file:
                 yaml_dump(stop_conditions_data, yaml_file, YamlDumper)
-        elif self.log_format == LoggingFormat.JSON:
+        elif self.log_format in (LoggingFormat.JSON, LoggingFormat.JSONL):
             algorithm_file_path = path.join(self.optimization_process_dir, "algorithm.json")  # type: ignore
             stop_conditions_file_path = path.join(self.optimization_process_dir, "stop_conditions.json")  # type: ignore
             with open(algorithm_file_path, "w") as json_file:
@@ -248,7 +373,7 @@ class Logger(AbstractLogger):
             file_path = path.join(self.optimization_process_dir, "problem.yaml")  # type: ignore
             with open(file_path, "w") as yaml_file:
                 yaml_dump(problem_data, yaml_file, YamlDumper)
-        elif self.log_format == LoggingFormat.JSON:
+        elif self.log_format in (LoggingFormat.JSON, LoggingFormat.JSONL):
             file_path = path.join(self.optimization_process_dir, "problem.json")  # type: ignore
             with open(file_path, "w") as json_file:
                 json_dump(problem_data, json_file)
@@ -264,6 +389,7 @@ class Logger(AbstractLogger):
         :param stop_conditions: Stop conditions of the optimization process.
         :param problem: Optimization problem to solve.
         """
+        self.close()
         # prepare separate directory for this optimization process logging
         _top_level_dir_name = datetime.now().strftime(self.LOG_DIRECTORY_PATTERN.format(algorithm.__class__.__name__))
         self.optimization_process_dir = path.join(self.main_dir, _top_level_dir_name)
@@ -279,23 +405,33 @@ class Logger(AbstractLogger):
         """
         Logging method that will be called at each iteration of main optimization algorithm.
 
+        Solutions are appended to 'solutions' file which is kept open until the logger is closed.
+
         :param iteration: Number of iteration of main optimization algorithm.
         :param solutions: Solutions found in this iteration.
         """
         if self.verbosity >= LoggingVerbosity.AllSolutions:
-            if iteration > 0:
-                mode = "a"
+            solutions_data = [solution.get_log_data() for solution in solutions]
+            if self.log_format == LoggingFormat.JSONL:
+                data_to_log = {"iteration": iteration, "solutions": solutions_data}
             else:
-                mode = "w"
-            data_to_log = {f"Iteration {iteration}": [solution.get_log_data() for solution in solutions]}
-            if self.log_format == LoggingFormat.YAML:
-                file_path = path.join(self.optimization_process_dir, "solutions.yaml")  # type: ignore
-                with open(file_path, mode) as yaml_file:
-                    yaml_dump(data_to_log, yaml_file, YamlDumper)
-            elif self.log_format == LoggingFormat.JSON:
-                file_path = path.join(self.optimization_process_dir, "solutions.json")  # type: ignore
-                with open(file_path, mode) as json_file:
-                    json_dump(data_to_log, json_file)
+                data_to_log = {f"Iteration {iteration}": solutions_data}
+            if self._solutions_writer is None:
+                self._solutions_writer = self._open_writer(f"solutions.{self._solutions_file_extension}")
+            self._solutions_writer.write(self._serialize_record(data_to_log))
+
+    def _get_lower_level_file_name(self, upper_iteration: int, lower_algorithm_index: int) -> str:
+        """
+        Gets name of the file with solutions of lower algorithm.
+
+        :param upper_iteration: Upper algorithm iteration.
+        :param lower_algorithm_index: Lower algorithm index.
+
+        :return: Name of the file.
+        """
+        if self.log_format == LoggingFormat.JSONL:
+            return "lower_level_solutions.jsonl"
+        return f"iter_{upper_iteration}_alg_{lower_algorithm_index}_solutions.{self._solutions_file_extension}"
 
     def log_lower_level_iteration(self,
                                   upper_iteration: int,
@@ -305,12 +441,16 @@ class Logger(AbstractLogger):
         """
         Logging method that will be called at each iteration of lower level optimization algorithms.
 
-        Log files naming convention: solution_iter_X_alg_Y.E,
+        Log files naming convention: iter_X_alg_Y_solutions.E,
         where:
         - X - iteration of main algorithm
         - Y - index (order number) of lower algorithm in main algorithm
         - E - extension (according to log_format attribute)
 
+        For LoggingFormat.JSONL all lower algorithms are logged to a single file 'lower_level_solutions.jsonl'
+        (each line contains 'upper_iteration', 'lower_algorithm_index' and 'lower_iteration' keys).
+        If 'compress_lower_level' is set, then such records are written to compressed lower level stream instead.
+
         Note: This method will only be called by adaptive algorithm!
 
         :param upper_iteration: Upper algorithm iteration.
@@ -319,21 +459,25 @@ class Logger(AbstractLogger):
         :param solutions: Solutions found in this iteration of lower algorithm.
         """
         if self.verbosity >= LoggingVerbosity.AllSolutions:
-            if lower_iteration > 0:
-                mode = "a"
+            solutions_data = [solution.get_log_data() for solution in solutions]
+            if self.compress_lower_level:
+                self._write_lower_level_stream_record(upper_iteration=upper_iteration,
+                                                      lower_algorithm_index=lower_algorithm_index,
+                                                      data_to_log={"lower_iteration": lower_iteration,
+                                                                   "solutions": solutions_data})
+                return
+            if self.log_format == LoggingFormat.JSONL:
+                data_to_log = {"upper_iteration": upper_iteration, "lower_algorithm_index": lower_algorithm_index,
+                               "lower_iteration": lower_iteration, "solutions": solutions_data}
             else:
-                mode = "w"
-            data_to_log = {f"Iteration {lower_iteration}": [solution.get_log_data() for solution in solutions]}
-            if self.log_format == LoggingFormat.YAML:
-                file_path = path.join(self.optimization_process_dir,  # type: ignore
-                                      f"iter_{upper_iteration}_alg_{lower_algorithm_index}_solutions.yaml")
-                with open(file_path, mode) as yaml_file:
-                    yaml_dump(data_to_log, yaml_file, YamlDumper)
-            elif self.log_format == LoggingFormat.JSON:
-                file_path = path.join(self.optimization_process_dir,  # type: ignore
-                                      f"iter_{upper_iteration}_alg_{lower_algorithm_index}_solutions.json")
-                with open(file_path, mode) as json_file:
-                    json_dump(data_to_log, json_file)
+                data_to_log = {f"Iteration {lower_iteration}": solutions_data}
+            file_name = self._get_lower_level_file_name(upper_iteration=upper_iteration,
+                                                        lower_algorithm_index=lower_algorithm_index)
+            if self._lower_level_writer is None or path.basename(self._lower_level_writer.file_path) != file_name:
+                if self._lower_level_writer is not None:
+                    self._lower_level_writer.close()
+                self._lower_level_writer = self._open_writer(file_name)
+            self._lower_level_writer.write(self._serialize_record(data_to_log))
 
     def log_at_end(self, best_solution, optimization_time: timedelta) -> None:
         """
@@ -354,7 +498,7 @@ class Logger(AbstractLogger):
                 file_path = path.join(self.optimization_process_dir, "best_solution.yaml")  # type: ignore
                 with open(file_path, "w") as yaml_file:
                     yaml_dump(log_data, yaml_file, YamlDumper)
-            elif self.log_format == LoggingFormat.JSON:
+            elif self.log_format in (LoggingFormat.JSON, LoggingFormat.JSONL):
                 file_path = path.join(self.optimization_process_dir, "best_solution.json")  # type: ignore
                 with open(file_path, "w") as json_file:
                     json_dump(log_data, json_file)
@@ -367,6 +511,9 @@ class Logger(AbstractLogger):
         """
         Logging method that will be called at the end of optimization process.
 
+        If 'compress_lower_level' is set, then the data is written to compressed lower level stream
+        (instead of 'iter_X_alg_Y_best_solution' file).
+
         :param upper_iteration: Upper algorithm iteration.
         :param lower_algorithm_index: Lower algorithm index.
         :param best_solution: The best solution found by the optimization algorithm.
@@ -379,14 +526,27 @@ class Logger(AbstractLogger):
         if self.verbosity >= LoggingVerbosity.BestSolution:
             log_data["best_solution"] = best_solution.get_log_data()
         # log to file
-        if log_data:
+        if log_data and self.compress_lower_level:
+            self._write_lower_level_stream_record(upper_iteration=upper_iteration,
+                                                  lower_algorithm_index=lower_algorithm_index,
+                                                  data_to_log=log_data)
+        elif log_data:
             if self.log_format == LoggingFormat.YAML:
                 file_path = path.join(self.optimization_process_dir,  # type: ignore
                                       f"iter_{upper_iteration}_alg_{lower_algorithm_index}_best_solution.yaml")
                 with open(file_path, "w") as yaml_file:
                     yaml_dump(log_data, yaml_file, YamlDumper)
-            elif self.log_format == LoggingFormat.JSON:
+            elif self.log_format in (LoggingFormat.JSON, LoggingFormat.JSONL):
                 file_path = path.join(self.optimization_process_dir,  # type: ignore
                                       f"iter_{upper_iteration}_alg_{lower_algorithm_index}_best_solution.json")
                 with open(file_path, "w") as json_file:
                     json_dump(log_data, json_file)
+
+    def close(self) -> None:
+        """Writes all buffered solutions and closes opened log files."""
+        for writer in (self._solutions_writer, self._lower_level_writer, self._lower_level_stream):
+            if writer is not None:
+                writer.close()
+        self._solutions_writer = None
+        self._lower_level_writer = None
+        self._lower_level_stream = None
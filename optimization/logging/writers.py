@@ -0,0 +1,309 @@
+"""
+Writers of log files that are updated during optimization process.
+
+In this file you can find:
+- BufferedRecordWriter - append-only writer of text records that keeps the file open and buffers records in memory
+- NpyColumnWriter - append-only writer of values column to '.npy' file
+- CompressedRecordWriter - append-only writer of text records to gzip compressed (and size-rotated) files with index
+- read_compressed_records - reads records of a single key written by 'CompressedRecordWriter'
+"""
+
+__all__ = ["BufferedRecordWriter", "NpyColumnWriter", "CompressedRecordWriter", "read_compressed_records"]
+
+
+from typing import Hashable, List, Optional, Sequence, Tuple
+from datetime import timedelta
+from time import monotonic_ns
+from os import path, SEEK_END
+from gzip import compress as gzip_compress, decompress as gzip_decompress
+from json import dumps as json_dumps, loads as json_loads
+
+import numpy as np
+from numpy.lib.format import write_array_header_1_0, dtype_to_descr
+
+
+class BufferedRecordWriter:
+    """
+    Append-only writer of text records (e.g. solutions logged in following iterations).
+
+    The file is opened once and kept open until the writer is closed. Records are collected in a memory buffer
+    which is written to the file when its size reaches 'buffer_size' or when 'flush_interval' has passed since
+    the last write to the file.
+    """
+
+    DEFAULT_BUFFER_SIZE: int = 1024 * 1024
+    """Default size (number of characters) of records buffer."""
+
+    def __init__(self, file_path: str, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 flush_interval: Optional[timedelta] = None) -> None:
+        """
+        Opens file (in append mode) for writing records.
+
+        :param file_path: Path to the file where records are going to be written.
+        :param buffer_size: Number of characters of buffered records which causes writing them to the file.
+        :param flush_interval: Maximal time that records might stay in the buffer (checked when a record is written).
+            If None, then records are written to the file only when the buffer is full or the writer is flushed.
+        """
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._flush_interval_ns = None if flush_interval is None \
+            else flush_interval // timedelta(microseconds=1) * 1000
+        self._buffer: List[str] = []
+        self._buffered_size = 0
+        self._file = open(file_path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        self._last_flush_ns = monotonic_ns()
+
+    @property
+    def closed(self) -> bool:
+        """Information whether the writer (and its file) is already closed."""
+        return self._file.closed
+
+    def write(self, record: str) -> None:
+        """
+        Appends record to the file (through the buffer).
+
+        :param record: Text of the record (including separator, e.g. new line character).
+        """
+        self._buffer.append(record)
+        self._buffered_size += len(record)
+        if self._buffered_size >= self.buffer_size or (self._flush_interval_ns is not None
+                                                       and monotonic_ns() - self._last_flush_ns
+                                                       >= self._flush_interval_ns):
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all buffered records to the file."""
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered_size = 0
+        self._file.flush()
+        self._last_flush_ns = monotonic_ns()
+
+    def close(self) -> None:
+        """Writes all buffered records to the file and closes it."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class NpyColumnWriter:
+    """
+    Append-only writer of values column (one dimensional array) to '.npy' file.
+
+    Values are collected in a preallocated memory buffer of 'chunk_size' elements. When the buffer is full (or the
+    writer is flushed), its content is appended to the file and the shape in the file header is updated, so the file
+    is always a valid '.npy' file that might be loaded (or memory-mapped) with 'numpy.load'.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 64 * 1024
+    """Default number of values in the buffer."""
+
+    def __init__(self, file_path: str, dtype: np.dtype, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Creates '.npy' file (with empty column) for writing values.
+
+        :param file_path: Path to the file where values are going to be written.
+        :param dtype: Data type of values.
+        :param chunk_size: Number of values that are buffered before they are written to the file.
+        """
+        self.file_path = file_path
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = chunk_size
+        self.length = 0
+        self._buffer = np.empty(chunk_size, dtype=self.dtype)
+        self._buffered_number = 0
+        self._file = open(file_path, "wb")  # pylint: disable=consider-using-with
+        self._write_header()
+        self._data_offset = self._file.tell()
+
+    @property
+    def closed(self) -> bool:
+        """Information whether the writer (and its file) is already closed."""
+        return self._file.closed
+
+    def _write_header(self) -> None:
+        """
+        Writes header of '.npy' file with the current length of the column.
+
+        :raise RuntimeError: Header size has changed (data would be overwritten).
+        """
+        self._file.seek(0)
+        write_array_header_1_0(self._file, {"descr": dtype_to_descr(self.dtype),
+                                            "fortran_order": False,
+                                            "shape": (self.length,)})
+        if self.length and self._file.tell() != self._data_offset:
+            raise RuntimeError(f"Header of '{self.file_path}' file cannot be updated in place.")
+        self._file.flush()
+
+    def _write_values(self, values: np.ndarray) -> None:
+        """
+        Appends values to the file and updates its header.
+
+        :param values: Values to write.
+        """
+        self._file.seek(0, SEEK_END)
+        self._file.write(values.tobytes())
+        self.length += len(values)
+        self._write_header()
+
+    def write(self, values: np.ndarray) -> None:
+        """
+        Appends values to the column (through the buffer).
+
+        :param values: Values to append.
+        """
+        values = np.asarray(values, dtype=self.dtype)
+        if self._buffered_number + len(values) > self.chunk_size:
+            self.flush()
+        if len(values) >= self.chunk_size:
+            self._write_values(values)
+        else:
+            self._buffer[self._buffered_number:self._buffered_number + len(values)] = values
+            self._buffered_number += len(values)
+
+    def flush(self) -> None:
+        """Writes all buffered values to the file."""
+        if self._buffered_number:
+            self._write_values(self._buffer[:self._buffered_number])
+            self._buffered_number = 0
+
+    def close(self) -> None:
+        """Writes all buffered values to the file and closes it."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class CompressedRecordWriter:
+    """
+    Append-only writer of keyed text records (e.g. solutions of lower algorithms) to gzip compressed files.
+
+    Records of the same key that are written one after another are collected in a memory buffer and compressed
+    together as a separate gzip member. Files are therefore valid gzip files (that might be decompressed as a whole),
+    while each member might be decompressed on its own - offset and size of each member (with its key) are written
+    to the index file, so records of a single key might be read without decompressing the whole stream.
+    When 'max_file_size' is set, the stream is rotated (records are written to the next file) when the file would
+    exceed this size.
+    """
+
+    DEFAULT_COMPRESSION_LEVEL: int = 6
+    """Default gzip compression level."""
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 dir_path: str,
+                 file_name_pattern: str,
+                 index_file_name: str,
+                 buffer_size: int = BufferedRecordWriter.DEFAULT_BUFFER_SIZE,
+                 max_file_size: Optional[int] = None,
+                 compression_level: int = DEFAULT_COMPRESSION_LEVEL) -> None:
+        """
+        Opens the first file of compressed stream and the index file.
+
+        :param dir_path: Directory where files to be created.
+        :param file_name_pattern: Pattern of compressed files names with a placeholder for the file number
+            (e.g. 'records_{}.jsonl.gz').
+        :param index_file_name: Name of the index file.
+        :param buffer_size: Number of characters of buffered records which causes compressing and writing them.
+        :param max_file_size: Maximal size (in bytes) of compressed file. If None, then all records are written
+            to a single file.
+        :param compression_level: Level of gzip compression (from 0 to 9).
+        """
+        self.dir_path = dir_path
+        self.file_name_pattern = file_name_pattern
+        self.buffer_size = buffer_size
+        self.max_file_size = max_file_size
+        self.compression_level = compression_level
+        self._file_number = 0
+        self._file = open(path.join(dir_path, self.file_name), "ab")  # pylint: disable=consider-using-with
+        self._offset = self._file.seek(0, SEEK_END)
+        self._index_writer = BufferedRecordWriter(file_path=path.join(dir_path, index_file_name),
+                                                  buffer_size=buffer_size)
+        self._key: Optional[Tuple[Hashable, ...]] = None
+        self._buffer: List[str] = []
+        self._buffered_size = 0
+
+    @property
+    def file_name(self) -> str:
+        """Name of the file that records are currently written to."""
+        return self.file_name_pattern.format(self._file_number)
+
+    @property
+    def closed(self) -> bool:
+        """Information whether the writer (and its files) is already closed."""
+        return self._file.closed
+
+    def _rotate(self) -> None:
+        """Closes the current file and opens the next one."""
+        self._file.close()
+        self._file_number += 1
+        self._file = open(path.join(self.dir_path, self.file_name), "ab")  # pylint: disable=consider-using-with
+        self._offset = self._file.seek(0, SEEK_END)
+
+    def _write_member(self) -> None:
+        """Compresses buffered records as gzip member, writes it to the file and its location to the index."""
+        if self._buffer:
+            data = gzip_compress("".join(self._buffer).encode("utf-8"), compresslevel=self.compression_level)
+            if self.max_file_size is not None and self._offset > 0 and self._offset + len(data) > self.max_file_size:
+                self._rotate()
+            self._file.write(data)
+            self._index_writer.write(json_dumps({"key": self._key, "file": self.file_name, "offset": self._offset,
+                                                 "size": len(data), "records": len(self._buffer)}) + "\n")
+            self._offset += len(data)
+            self._buffer.clear()
+            self._buffered_size = 0
+
+    def write(self, key: Tuple[Hashable, ...], record: str) -> None:
+        """
+        Appends record to the compressed stream (through the buffer).
+
+        :param key: Key of the record (JSON serializable values), e.g. (upper_iteration, lower_algorithm_index).
+        :param record: Text of the record (including separator, e.g. new line character).
+        """
+        key = tuple(key)
+        if key != self._key:
+            self._write_member()
+            self._key = key
+        self._buffer.append(record)
+        self._buffered_size += len(record)
+        if self._buffered_size >= self.buffer_size:
+            self._write_member()
+
+    def flush(self) -> None:
+        """Writes all buffered records to the compressed file and the index."""
+        self._write_member()
+        self._file.flush()
+        self._index_writer.flush()
+
+    def close(self) -> None:
+        """Writes all buffered records and closes the files."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            self._index_writer.close()
+
+
+def read_compressed_records(dir_path: str, index_file_name: str, key: Sequence[Hashable]) -> List[str]:
+    """
+    Reads records of a single key that were written by 'CompressedRecordWriter'.
+
+    Only gzip members with records of this key are read and decompressed.
+
+    :param dir_path: Directory with compressed files and the index file.
+    :param index_file_name: Name of the index file.
+    :param key: Key of the records to read.
+
+    :return: Records (including separators) in order in which they were written.
+    """
+    key = list(key)
+    records: List[str] = []
+    with open(path.join(dir_path, index_file_name), encoding="utf-8") as index_file:
+        for line in index_file:
+            member = json_loads(line)
+            if member["key"] == key:
+                with open(path.join(dir_path, member["file"]), "rb") as compressed_file:
+                    compressed_file.seek(member["offset"])
+                    data = compressed_file.read(member["size"])
+                records.extend(gzip_decompress(data).decode("utf-8").splitlines(keepends=True))
+    return records
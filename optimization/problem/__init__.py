@@ -4,8 +4,12 @@ Module with optimization problem and solution definition.
 Provides:
     - OptimizationProblem - class for defining optimization problem using mathematical model
     - OptimizationType - enum storing available optimization types
+    - EvaluationCache - bounded cache with objective values of already evaluated decision variables values
+    - PersistentEvaluationCache - evaluation cache that additionally stores values in SQLite database file
+    - CachePolicy - enum storing available eviction policies of evaluation cache
     - AbstractSolution - Abstract class (used internally) for defining types (child classes) that creates certain
         optimization problem solutions (objects of child classes).
+    - fitness_key - key function that orders solutions from the worst to the best (for sorting, max, min etc.)
     - DiscreteVariable - Abstract class (used internally) for typing and definition of children classes:
         - IntegerVariable - definition of Decision Variable that stores integer value (any int in range)
         - DiscreteVariable - definition of Decision Variable that stores discrete value (with certain step)
@@ -16,4 +20,5 @@ Provides:
 
 from .problem import OptimizationType, OptimizationProblem
 from .decision_variables import IntegerVariable, DiscreteVariable, FloatVariable, ChoiceVariable, DecisionVariable
-from .solution import AbstractSolution
+from .solution import AbstractSolution, fitness_key
+from .cache import EvaluationCache, PersistentEvaluationCache, CachePolicy
@@ -0,0 +1,417 @@
+"""Cache of optimization problem solutions evaluation results."""
+
+__all__ = ["CachePolicy", "EvaluationCache", "PersistentEvaluationCache"]
+
+
+from typing import Any, Optional, Union, Dict, Hashable
+from collections import OrderedDict, defaultdict
+from enum import Enum
+from hashlib import sha256
+import sqlite3
+import json
+import os
+
+import numpy
+
+
+class CachePolicy(Enum):
+    """
+    Policies of entries eviction (when the cache is full).
+
+    Possible options:
+     - LRU - Least Recently Used entry is removed
+     - LFU - Least Frequently Used entry is removed (the least recently used one if many are used the same number
+        of times)
+    """
+
+    LRU = "LRU"
+    LFU = "LFU"
+
+
+class EvaluationCache:
+    """Bounded in-memory cache with objective values (with penalty) of already evaluated decision variables values."""
+
+    def __init__(self, max_size: int = 10000, policy: Union[CachePolicy, str] = CachePolicy.LRU) -> None:
+        """
+        Configuration of Evaluation Cache.
+
+        :param max_size: Maximal number of entries stored in the cache.
+        :param policy: Policy of entries eviction that is used when the cache is full.
+
+        :raise TypeError: For some parameter a value has incorrect type.
+        :raise ValueError: For some parameter a value is incorrect.
+        """
+        if not isinstance(max_size, int):
+            raise TypeError(f"Parameter 'max_size' value is not int type. Actual value: {max_size}.")
+        if max_size <= 0:
+            raise ValueError(f"Parameter 'max_size' value must be greater than 0. Actual value: {max_size}.")
+        if isinstance(policy, CachePolicy):
+            self.policy = policy
+        elif isinstance(policy, str):
+            self.policy = CachePolicy[policy]
+        else:
+            raise TypeError(f"Parameter 'policy' is not str or CachePolicy type. Actual value: {policy}.")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # LRU: order of keys from the least to the most recently used
+        # LFU: keys grouped by number of uses (each group ordered from the least to the most recently used)
+        self._values: Dict[Hashable, Any] = {}
+        self._recently_used: OrderedDict = OrderedDict()
+        self._frequencies: Dict[Hashable, int] = {}
+        self._frequency_groups: Dict[int, OrderedDict] = defaultdict(OrderedDict)
+        self._min_frequency = 0
+
+    def __len__(self) -> int:
+        """:return: Number of entries stored in the cache."""
+        return len(self._values)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Checks whether value for given key is stored (without updating entry usage and counters).
+
+        :param key: Key to check.
+
+        :return: True if the key is stored in the cache, False otherwise.
+        """
+        return key in self._values
+
+    @staticmethod
+    def make_key(decision_variables_values: Dict[str, Any]) -> Hashable:
+        """
+        Creates hashable form of decision variables values.
+
+        :param decision_variables_values: Decision variables values of a solution.
+            Note: Values must be ordered the same way for all solutions (as in OptimizationProblem.decision_variables).
+
+        :return: Key that identifies decision variables values in the cache.
+        """
+        return tuple(decision_variables_values.values())
+
+    def bind_problem(self, problem: Any) -> None:
+        """
+        Informs the cache about optimization problem which evaluation results are going to be stored.
+
+        It is called by OptimizationProblem when the cache is assigned to it.
+
+        :param problem: Optimization problem that uses this cache.
+        """
+        ...
+
+    def _touch(self, key: Hashable) -> None:
+        """
+        Updates information about entry usage.
+
+        :param key: Key of used entry.
+        """
+        if self.policy == CachePolicy.LRU:
+            self._recently_used.move_to_end(key)
+        else:
+            frequency = self._frequencies[key]
+            del self._frequency_groups[frequency][key]
+            if not self._frequency_groups[frequency]:
+                del self._frequency_groups[frequency]
+                if self._min_frequency == frequency:
+                    self._min_frequency = frequency + 1
+            self._frequencies[key] = frequency + 1
+            self._frequency_groups[frequency + 1][key] = None
+
+    def _evict(self) -> None:
+        """Removes one entry according to eviction policy."""
+        if self.policy == CachePolicy.LRU:
+            key, _ = self._recently_used.popitem(last=False)
+        else:
+            group = self._frequency_groups[self._min_frequency]
+            key, _ = group.popitem(last=False)
+            if not group:
+                del self._frequency_groups[self._min_frequency]
+            del self._frequencies[key]
+        del self._values[key]
+
+    def _get_stored(self, key: Hashable) -> Optional[Any]:
+        """
+        Gets value stored for given key (without updating hit/miss counters).
+
+        :param key: Key created by 'make_key' method.
+
+        :return: Stored value or None if the key is not in the cache.
+        """
+        if key not in self._values:
+            return None
+        self._touch(key)
+        return self._values[key]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Gets value stored for given key and updates hit/miss counters.
+
+        :param key: Key created by 'make_key' method.
+
+        :return: Stored value or None if the key is not in the cache.
+        """
+        value = self._get_stored(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any,
+            objective_value: Optional[Union[float, int]] = None,
+            penalty_value: Optional[Union[float, int]] = None,
+            constraints_values: Optional[Dict[str, Union[float, int]]] = None) -> None:
+        """
+        Stores value for given key (removes other entry if the cache is full).
+
+        :param key: Key created by 'make_key' method.
+        :param value: Value to store.
+        :param objective_value: Value of objective (without penalty) - not stored in the memory.
+        :param penalty_value: Value of penalty - not stored in the memory.
+        :param constraints_values: Values of constraints - not stored in the memory.
+        """
+        if key in self._values:
+            self._values[key] = value
+            self._touch(key)
+            return
+        if len(self._values) >= self.max_size:
+            self._evict()
+        self._values[key] = value
+        if self.policy == CachePolicy.LRU:
+            self._recently_used[key] = None
+        else:
+            self._frequencies[key] = 1
+            self._frequency_groups[1][key] = None
+            self._min_frequency = 1
+
+    def clear(self) -> None:
+        """Removes all entries and resets counters."""
+        self.hits = 0
+        self.misses = 0
+        self._values.clear()
+        self._recently_used.clear()
+        self._frequencies.clear()
+        self._frequency_groups.clear()
+        self._min_frequency = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of cache hits to all cache lookups."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.
+
+    def get_log_data(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Evaluation Cache crucial data.
+        """
+        return {
+            "type": self.__class__.__name__,
+            "policy": self.policy.value,
+            "max_size": self.max_size,
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class PersistentEvaluationCache(EvaluationCache):
+    """
+    Evaluation cache that additionally stores evaluation results in SQLite database file.
+
+    Values stored in the database file are available for following optimization processes (of the same optimization
+    problem) and for other processes that use the same file at the same time (database is used in WAL mode, so many
+    processes might read it concurrently).
+    Besides objective values (with penalty), values of objective, penalty and constraints are stored in the database
+    file if they are known (they are not calculated when solutions are evaluated by batch functions
+    or in other processes).
+    Entries of different optimization problems are distinguished by problem fingerprint.
+    """
+
+    DETAILS_COLUMNS = {"objective_value": "REAL", "penalty_value": "REAL", "constraints_values": "TEXT"}
+    """Columns (with types) of the database table that store evaluation results other than objective value
+    (with penalty)."""
+
+    def __init__(self, path: str, problem_fingerprint: Optional[str] = None, max_size: int = 10000,
+                 policy: Union[CachePolicy, str] = CachePolicy.LRU, timeout: float = 30.) -> None:
+        """
+        Configuration of Persistent Evaluation Cache.
+
+        :param path: Path to SQLite database file (created if it does not exist).
+        :param problem_fingerprint: Identifier of optimization problem. If None, then it is calculated from
+            the optimization problem definition (including functions code) when the cache is assigned to the problem.
+        :param max_size: Maximal number of entries stored in the memory (number of entries in database file is not
+            limited).
+        :param policy: Policy of entries eviction (from the memory) that is used when the cache is full.
+        :param timeout: Number of seconds to wait for database file when it is locked by other process.
+
+        :raise TypeError: For some parameter a value has incorrect type.
+        :raise ValueError: For some parameter a value is incorrect.
+        """
+        if not isinstance(path, (str, os.PathLike)):
+            raise TypeError(f"Parameter 'path' value is not str nor PathLike type. Actual value: {path}.")
+        if problem_fingerprint is not None and not isinstance(problem_fingerprint, str):
+            raise TypeError(f"Parameter 'problem_fingerprint' value is not str nor None type. "
+                            f"Actual value: {problem_fingerprint}.")
+        if not isinstance(timeout, (int, float)):
+            raise TypeError(f"Parameter 'timeout' value is not int nor float type. Actual value: {timeout}.")
+        if timeout < 0:
+            raise ValueError(f"Parameter 'timeout' value must not be negative. Actual value: {timeout}.")
+        super().__init__(max_size=max_size, policy=policy)
+        self.path = os.fspath(path)
+        self.problem_fingerprint = problem_fingerprint
+        self.timeout = timeout
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """:return: State of the object to pickle (database connection is not transferred to other processes)."""
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the database file (opened at the first use)."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                               check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS evaluations ("
+                                     "problem TEXT NOT NULL, "
+                                     "genome TEXT NOT NULL, "
+                                     "objective_value_with_penalty REAL NOT NULL, "
+                                     "objective_value REAL, "
+                                     "penalty_value REAL, "
+                                     "constraints_values TEXT, "
+                                     "PRIMARY KEY (problem, genome))")
+            # database files created by older versions store objective values (with penalty) only
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(evaluations)")}
+            for column, column_type in self.DETAILS_COLUMNS.items():
+                if column not in columns:
+                    self._connection.execute(f"ALTER TABLE evaluations ADD COLUMN {column} {column_type}")
+        return self._connection
+
+    @staticmethod
+    def _normalize_value(value: Any) -> Any:
+        """
+        Converts decision variable value, so equal values of NumPy and Python types are hashed the same way.
+
+        :param value: Decision variable value (or element of a choice value).
+
+        :return: Value of Python type (tuples and lists are converted to lists of normalized elements).
+        """
+        if isinstance(value, numpy.generic):
+            return value.item()
+        if isinstance(value, (tuple, list)):
+            return [PersistentEvaluationCache._normalize_value(element) for element in value]
+        return value
+
+    @staticmethod
+    def hash_key(key: Hashable) -> str:
+        """
+        Creates hash of decision variables values that is stored in the database file.
+
+        Values are normalized to Python types before hashing, therefore the same hash is created for values
+        given as NumPy scalars (e.g. decoded from arrays) and as Python scalars. Values that cannot be serialized
+        to JSON (e.g. some choice values) are represented by 'repr'.
+
+        :param key: Key created by 'make_key' method.
+
+        :return: Hash of the key.
+        """
+        normalized_key = PersistentEvaluationCache._normalize_value(key)
+        return sha256(json.dumps(normalized_key, default=repr).encode("utf-8")).hexdigest()
+
+    def bind_problem(self, problem: Any) -> None:
+        """
+        Calculates problem fingerprint (if it was not provided) of optimization problem that uses this cache.
+
+        :param problem: Optimization problem that uses this cache.
+
+        :raise ValueError: Fingerprint of the problem cannot be calculated.
+        """
+        if self.problem_fingerprint is None:
+            self.problem_fingerprint = problem.get_fingerprint()
+
+    def _get_stored(self, key: Hashable) -> Optional[Any]:
+        """
+        Gets value stored (in the memory or in the database file) for given key.
+
+        :param key: Key created by 'make_key' method.
+
+        :return: Stored value or None if the key is not in the cache.
+        """
+        value = super()._get_stored(key)
+        if value is not None or self.problem_fingerprint is None:
+            return value
+        row = self.connection.execute("SELECT objective_value_with_penalty FROM evaluations "
+                                      "WHERE problem = ? AND genome = ?",
+                                      (self.problem_fingerprint, self.hash_key(key))).fetchone()
+        if row is None:
+            return None
+        super().set(key, row[0])
+        return row[0]
+
+    def set(self, key: Hashable, value: Any,
+            objective_value: Optional[Union[float, int]] = None,
+            penalty_value: Optional[Union[float, int]] = None,
+            constraints_values: Optional[Dict[str, Union[float, int]]] = None) -> None:
+        """
+        Stores value for given key in the memory and (together with other evaluation results) in the database file.
+
+        :param key: Key created by 'make_key' method.
+        :param value: Value to store.
+        :param objective_value: Value of objective (without penalty) - stored in the database file only.
+        :param penalty_value: Value of penalty - stored in the database file only.
+        :param constraints_values: Values of constraints - stored in the database file only.
+
+        :raise ValueError: Problem fingerprint is unknown.
+        """
+        if self.problem_fingerprint is None:
+            raise ValueError("Problem fingerprint is unknown. Assign the cache to an optimization problem "
+                             "or provide 'problem_fingerprint' parameter.")
+        super().set(key, value)
+        self.connection.execute("INSERT OR REPLACE INTO evaluations (problem, genome, objective_value_with_penalty, "
+                                "objective_value, penalty_value, constraints_values) VALUES (?, ?, ?, ?, ?, ?)",
+                                (self.problem_fingerprint, self.hash_key(key), value, objective_value, penalty_value,
+                                 None if constraints_values is None else json.dumps(constraints_values)))
+
+    def get_evaluation_results(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Gets all evaluation results stored in the database file for given key (hit/miss counters are not updated).
+
+        :param key: Key created by 'make_key' method.
+
+        :return: Dictionary with evaluation results ('objective_value_with_penalty', 'objective_value',
+            'penalty_value' and 'constraints_values' - None if unknown) or None if the key is not in the database file.
+        """
+        if self.problem_fingerprint is None:
+            return None
+        row = self.connection.execute("SELECT objective_value_with_penalty, objective_value, penalty_value, "
+                                      "constraints_values FROM evaluations WHERE problem = ? AND genome = ?",
+                                      (self.problem_fingerprint, self.hash_key(key))).fetchone()
+        if row is None:
+            return None
+        return {
+            "objective_value_with_penalty": row[0],
+            "objective_value": row[1],
+            "penalty_value": row[2],
+            "constraints_values": None if row[3] is None else json.loads(row[3]),
+        }
+
+    def close(self) -> None:
+        """Closes connection to the database file."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_log_data(self) -> Dict[str, Union[str, int, float]]:
+        """
+        Gets data for logging purposes.
+
+        :return: Dictionary with this Persistent Evaluation Cache crucial data.
+        """
+        log_data = super().get_log_data()
+        log_data.update(path=self.path, problem_fingerprint=self.problem_fingerprint)  # type: ignore
+        return log_data
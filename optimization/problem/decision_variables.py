@@ -11,7 +11,14 @@ __all__ = ["DecisionVariable", "IntegerVariable", "DiscreteVariable", "FloatVari
 from typing import Any, Union, Dict, Iterable
 from abc import ABC, abstractmethod
 
-from optimization.utilities.random_values import generate_random_int, generate_random_float, choose_random_value
+import numpy as np
+
+from optimization.utilities.random_values import generate_random_int, generate_random_float, choose_random_value, \
+    generate_random_floats_array
+
+
+MAX_INT64_ABS_VALUE = 2 ** 62
+"""Greater absolute values of integers are not stored in int64 arrays (to avoid overflow)."""
 
 
 class DecisionVariable(ABC):
@@ -22,6 +29,28 @@ class DecisionVariable(ABC):
         """:return: Random value according to this Decision Variable definition."""
         ...
 
+    @abstractmethod
+    def scale_unit_values(self, unit_values: np.ndarray) -> np.ndarray:
+        """
+        Maps floats from range [0, 1) onto values of this Decision Variable.
+
+        :param unit_values: Vector with floats in range [0, 1) (e.g. random or quasi-random samples).
+
+        :return: Vector with values (compatible with this Decision Variable definition) that correspond to provided
+            floats. Use 'tolist' method to get values of Python types.
+        """
+        ...
+
+    def generate_random_values(self, values_number: int) -> np.ndarray:
+        """
+        Generates many random values at once.
+
+        :param values_number: Number of values to generate.
+
+        :return: Vector with random values according to this Decision Variable definition.
+        """
+        return self.scale_unit_values(generate_random_floats_array(size=values_number))
+
     @abstractmethod
     def is_proper_value(self, value: Any) -> bool:
         """:return: True if value is compatible with this Decision Variable definition, False otherwise."""
@@ -68,6 +97,20 @@ class IntegerVariable(DecisionVariable):
         """:return: Random value according to this Integer Variable definition."""
         return generate_random_int(self.min_value, self.max_value)
 
+    def scale_unit_values(self, unit_values: np.ndarray) -> np.ndarray:
+        """
+        Maps floats from range [0, 1) onto values of this Integer Variable.
+
+        :param unit_values: Vector with floats in range [0, 1).
+
+        :return: Vector with integers in range [min_value, max_value].
+        """
+        values_number = self.max_value - self.min_value + 1
+        offsets = np.minimum(np.floor(unit_values * values_number), values_number - 1)
+        if max(abs(self.min_value), abs(self.max_value)) < MAX_INT64_ABS_VALUE:
+            return self.min_value + offsets.astype(np.int64)
+        return np.array([self.min_value + int(offset) for offset in offsets.tolist()], dtype=object)
+
     def is_proper_value(self, value: Any) -> bool:
         """:return: True if value is compatible with this Integer Variable definition, False otherwise."""
         return isinstance(value, int) and self.min_value <= value <= self.max_value
@@ -138,6 +181,17 @@ class DiscreteVariable(DecisionVariable):
         """:return: Random value according to this Discrete Variable definition."""
         return self.min_value + generate_random_int(0, self._max_rand)*self.step
 
+    def scale_unit_values(self, unit_values: np.ndarray) -> np.ndarray:
+        """
+        Maps floats from range [0, 1) onto values of this Discrete Variable.
+
+        :param unit_values: Vector with floats in range [0, 1).
+
+        :return: Vector with possible values of this Discrete Variable.
+        """
+        steps_numbers = np.minimum(np.floor(unit_values * (self._max_rand + 1)), self._max_rand).astype(np.int64)
+        return self.min_value + steps_numbers * self.step
+
     def is_proper_value(self, value: Any) -> bool:
         """:return: True if value is compatible with this Discrete Variable definition, False otherwise."""
         if isinstance(value, (int, float)) and self.min_value <= value <= self.max_value:
@@ -190,6 +244,16 @@ class FloatVariable(DecisionVariable):
         """:return: Random value according to this Float Variable definition."""
         return generate_random_float(self.min_value, self.max_value)
 
+    def scale_unit_values(self, unit_values: np.ndarray) -> np.ndarray:
+        """
+        Maps floats from range [0, 1) onto values of this Float Variable.
+
+        :param unit_values: Vector with floats in range [0, 1).
+
+        :return: Vector with floats in range [min_value, max_value].
+        """
+        return np.minimum(self.min_value + unit_values * (self.max_value - self.min_value), self.max_value)
+
     def is_proper_value(self, value: Any) -> bool:
         """:return: True if value is compatible with this Float Variable definition, False otherwise."""
         return isinstance(value, float) and self.min_value <= value <= self.max_value
@@ -226,6 +290,20 @@ class ChoiceVariable(DecisionVariable):
         """:return: Random value according to this Choice Variable definition."""
         return choose_random_value(self.possible_values)
 
+    def scale_unit_values(self, unit_values: np.ndarray) -> np.ndarray:
+        """
+        Maps floats from range [0, 1) onto values of this Choice Variable.
+
+        :param unit_values: Vector with floats in range [0, 1).
+
+        :return: Vector (of object type) with possible values of this Choice Variable.
+        """
+        possible_values = np.empty(len(self.possible_values), dtype=object)
+        for index, value in enumerate(self.possible_values):
+            possible_values[index] = value
+        indices = np.minimum(np.floor(unit_values * len(possible_values)), len(possible_values) - 1).astype(np.int64)
+        return possible_values[indices]
+
     def is_proper_value(self, value: Any) -> bool:
         """:return: True if value is compatible with this Choice Variable definition, False otherwise."""
         return value in self.possible_values
@@ -3,12 +3,17 @@
 __all__ = ["OptimizationType", "OptimizationProblem"]
 
 
-from typing import Union, Callable, Dict
+from typing import Union, Callable, Dict, Optional, Sequence, Any
 from typing import OrderedDict as OrderedDictTyping
 from collections import OrderedDict
 from enum import Enum
+from hashlib import sha256
+import json
 
-from .decision_variables import DecisionVariable
+import numpy
+
+from .decision_variables import DecisionVariable, ChoiceVariable
+from .cache import EvaluationCache
 from optimization.logging import log_function_code
 
 
@@ -27,7 +32,11 @@ class OptimizationProblem:
                  constraints: Dict[str, Callable],
                  penalty_function: Callable,
                  objective_function: Callable,
-                 optimization_type: Union[OptimizationType, str]) -> None:
+                 optimization_type: Union[OptimizationType, str],
+                 batch_objective_function: Optional[Callable] = None,
+                 batch_constraints: Optional[Dict[str, Callable]] = None,
+                 batch_penalty_function: Optional[Callable] = None,
+                 evaluation_cache: Optional[EvaluationCache] = None) -> None:
         """
         Definition of optimization problem.
 
@@ -38,6 +47,18 @@ class OptimizationProblem:
             (used if constrains are not meet).
         :param objective_function: Function that calculates objective value of the solution (does not include penalty).
         :param optimization_type: Type of optimization problem (either searching for minimal or maximal value).
+        :param batch_objective_function: (optional) Vectorized version of 'objective_function' that calculates
+            objective values of many solutions at once. It receives NumPy arrays (one array with values of all
+            solutions per decision variable) as keyword arguments and returns sequence of objective values.
+        :param batch_constraints: (optional) Vectorized versions of constraints (keys must be the same as in
+            'constraints'). Each function receives the same arguments as 'batch_objective_function' and returns
+            sequence of the constraint values.
+        :param batch_penalty_function: (optional) Vectorized version of 'penalty_function'. It receives NumPy arrays
+            (one array with values of all solutions per constraint) as keyword arguments and returns sequence of
+            penalty values.
+        :param evaluation_cache: (optional) Cache with objective values (with penalty) of already evaluated decision
+            variables values. If provided, then solutions with the same decision variables values are evaluated
+            only once.
 
         :raise TypeError: For some parameter a value has incorrect type.
         :raise ValueError: For some parameter a value is incorrect.
@@ -65,6 +86,26 @@ class OptimizationProblem:
         # check: objective_function
         if not callable(objective_function):
             raise TypeError(f"Parameter 'objective_function' is not callable. Actual value: {objective_function}.")
+        # check: batch functions
+        if batch_objective_function is not None and not callable(batch_objective_function):
+            raise TypeError(f"Parameter 'batch_objective_function' is not callable nor None. "
+                            f"Actual value: {batch_objective_function}.")
+        if batch_constraints is not None:
+            if not isinstance(batch_constraints, dict):
+                raise TypeError(f"Parameter 'batch_constraints' is not dict nor None type. "
+                                f"Actual value: {batch_constraints}.")
+            if set(batch_constraints.keys()) != set(constraints.keys()):
+                raise ValueError(f"Keys of 'batch_constraints' are not the same as keys of 'constraints'. "
+                                 f"Keys: {list(batch_constraints.keys())}. Expected: {list(constraints.keys())}.")
+            if any([not callable(value) for value in batch_constraints.values()]):
+                raise ValueError(f"Some values of 'batch_constraints' are not callable. "
+                                 f"Values: {list(batch_constraints.values())}.")
+        if batch_penalty_function is not None and not callable(batch_penalty_function):
+            raise TypeError(f"Parameter 'batch_penalty_function' is not callable nor None. "
+                            f"Actual value: {batch_penalty_function}.")
+        if evaluation_cache is not None and not isinstance(evaluation_cache, EvaluationCache):
+            raise TypeError(f"Parameter 'evaluation_cache' is not EvaluationCache nor None type. "
+                            f"Actual value: {evaluation_cache}.")
         # check and set value: optimization_type
         if isinstance(optimization_type, OptimizationType):
             self.optimization_type = optimization_type
@@ -78,7 +119,124 @@ class OptimizationProblem:
         self.constraints = constraints
         self.penalty_function = penalty_function
         self.objective_function = objective_function
+        self.batch_objective_function = batch_objective_function
+        self.batch_constraints = batch_constraints
+        self.batch_penalty_function = batch_penalty_function
+        self.evaluation_cache = evaluation_cache
         self.variables_number = len(self.decision_variables)
+        if evaluation_cache is not None:
+            evaluation_cache.bind_problem(self)
+
+    @property
+    def supports_batch_evaluation(self) -> bool:
+        """Information whether any vectorized (batch) function is defined for this problem."""
+        return self.batch_objective_function is not None or self.batch_constraints is not None \
+            or self.batch_penalty_function is not None
+
+    def get_batch_values(self, solutions_values: Sequence[Sequence[Any]]) -> Dict[str, numpy.ndarray]:
+        """
+        Converts values of many solutions into format accepted by batch functions.
+
+        :param solutions_values: Decision variables values of following solutions (each ordered as decision
+            variables of this problem, e.g. 'values' attribute of a solution).
+
+        :return: Dictionary with decision variables values of all solutions.
+            Keys: Names of decision variables.
+            Values: Arrays with values of the decision variable (following values for following solutions).
+        """
+        columns = list(zip(*solutions_values)) if solutions_values else [()] * self.variables_number
+        batch_values = {}
+        for (name, variable), column in zip(self.decision_variables.items(), columns):  # type: ignore
+            if isinstance(variable, ChoiceVariable):
+                # possible values might be sequences, so they cannot be converted by 'numpy.array'
+                batch_values[name] = numpy.empty(len(column), dtype=object)
+                batch_values[name][:] = column
+            else:
+                batch_values[name] = numpy.array(column)
+        return batch_values
+
+    def evaluate_batch(self, batch_values: Dict[str, numpy.ndarray]) -> numpy.ndarray:
+        """
+        Calculates objective values (with penalty) of many solutions at once.
+
+        :param batch_values: Decision variables values of evaluated solutions (format as returned by
+            'get_batch_values' method).
+
+        :return: Array with objective values (with penalty) of following solutions.
+        """
+        return self.evaluate_batch_components(batch_values)["objective_value_with_penalty"]
+
+    def evaluate_batch_components(self, batch_values: Dict[str, numpy.ndarray]) -> Dict[str, Any]:
+        """
+        Calculates objective values (with penalty) of many solutions at once together with all their components.
+
+        Vectorized (batch) functions are called once for all solutions, while functions without batch version
+        are called separately for each solution.
+
+        :param batch_values: Decision variables values of evaluated solutions (format as returned by
+            'get_batch_values' method).
+
+        :return: Dictionary with evaluation results of following solutions:
+            - "objective_value_with_penalty" - array with objective values (with penalty)
+            - "objective_value" - array with objective values (without penalty)
+            - "penalty_value" - array with penalty values
+            - "constraints_values" - dictionary with arrays of constraints values (absolute values) ordered as
+                'constraints' (keys: names of constraints)
+        """
+        solutions_number = len(next(iter(batch_values.values()))) if batch_values else 0
+        if self.batch_objective_function is not None and self.batch_constraints is not None:
+            rows = None
+        else:
+            rows = [dict(zip(batch_values.keys(), row))
+                    for row in zip(*[values.tolist() for values in batch_values.values()])]
+        # objective
+        if self.batch_objective_function is not None:
+            objective_values = numpy.asarray(self.batch_objective_function(**batch_values))
+        else:
+            objective_values = numpy.array([self.objective_function(**row) for row in rows])  # type: ignore
+        # constraints
+        if self.batch_constraints is not None:
+            constraints_values = {name: numpy.abs(numpy.asarray(self.batch_constraints[name](**batch_values)))
+                                  for name in self.constraints}
+        else:
+            constraints_values = {
+                name: numpy.abs(numpy.array([constraint_function(**row) for row in rows]))  # type: ignore
+                for name, constraint_function in self.constraints.items()}
+        # penalty
+        if self.batch_penalty_function is not None:
+            penalty_values = numpy.asarray(self.batch_penalty_function(**constraints_values))
+        else:
+            penalty_values = numpy.array([
+                self.penalty_function(**{name: values[i] for name, values in constraints_values.items()})
+                for i in range(solutions_number)])
+        if self.optimization_type == OptimizationType.Minimize:
+            objective_values_with_penalty = objective_values + penalty_values
+        else:
+            objective_values_with_penalty = objective_values - penalty_values
+        return {
+            "objective_value_with_penalty": objective_values_with_penalty,
+            "objective_value": objective_values,
+            "penalty_value": penalty_values,
+            "constraints_values": constraints_values,
+        }
+
+    def get_fingerprint(self) -> str:
+        """
+        Calculates fingerprint of this optimization problem.
+
+        Fingerprint is calculated from problem definition (including functions code), so it stays the same for
+        the same problem defined in following runs.
+
+        :raise ValueError: Code of some function cannot be extracted (e.g. function defined in interactive session).
+
+        :return: Fingerprint (SHA-256 hash) of the optimization problem.
+        """
+        try:
+            log_data = self.get_log_data()
+        except (OSError, TypeError) as exception:
+            raise ValueError("Fingerprint of the optimization problem cannot be calculated, "
+                             "as code of some function cannot be extracted.") from exception
+        return sha256(json.dumps(log_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
 
     def get_log_data(self) -> Dict[str, Union[str, dict, list]]:
         """
@@ -1,17 +1,30 @@
 """Optimization problem solution implementation."""
 
-__all__ = ["AbstractSolution"]
+__all__ = ["AbstractSolution", "fitness_key"]
 
 
-from typing import Any, Union, Dict
+from typing import Any, Union, Dict, Mapping, Sequence, List, Hashable, Optional
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 
 from .problem import OptimizationProblem, OptimizationType
+from .cache import EvaluationCache
 
 
 class AbstractSolution(ABC):
-    """Abstract definition of optimization problem solution."""
+    """
+    Abstract definition of optimization problem solution.
+
+    Decision variables values are stored in a tuple (ordered as decision variables in 'optimization_problem'),
+    dictionary with values is created only on demand (e.g. for objective function call or logging).
+    Subclasses are expected to define empty '__slots__', so solutions do not carry per-instance '__dict__'.
+    """
+
+    __slots__ = ("values", "_objective_value_with_penalty", "_fitness", "_objective_value", "_penalty_value",
+                 "_constraints_values")
+
+    validate_trusted_values: bool = False
+    """Debug flag - set to True to validate values passed to 'from_trusted_values' method as well."""
 
     @property
     @abstractmethod
@@ -32,7 +45,7 @@ class AbstractSolution(ABC):
             incorrect value of decision variable was provided.
         """
         # find values for all variables
-        values_to_set = OrderedDict()
+        values_to_set = []
         for variable_name, variable_definition in self_solution.optimization_problem.decision_variables.items():  # noqa
             if variable_name in decision_variables_values:
                 value = decision_variables_values.pop(variable_name)
@@ -41,14 +54,79 @@ class AbstractSolution(ABC):
                                      f"with variable definition. Actual value: {value}.")
             else:
                 value = variable_definition.generate_random_value()
-            values_to_set[variable_name] = value
+            values_to_set.append(value)
         # check if assignment of decision variables values was executed successfully
         if decision_variables_values:
             raise ValueError(f"Values for unknown decision variables were provided: "
                              f"{list(decision_variables_values.keys())}.")
         # set attributes
-        self_solution.decision_variables_values = values_to_set
+        self_solution.values = tuple(values_to_set)
         self_solution._objective_value_with_penalty = None
+        self_solution._fitness = None
+        self_solution._objective_value = None
+        self_solution._penalty_value = None
+        self_solution._constraints_values = None
+
+    @classmethod
+    def from_trusted_values(cls, decision_variables_values: Mapping[str, Any]) -> "AbstractSolution":
+        """
+        Creates solution from decision variables values that are correct by construction (e.g. values of children
+        created by crossover and mutation), therefore values are not validated.
+
+        :param decision_variables_values: Values of all decision variables defined for the 'optimization_problem'
+            (ordered the same way as decision variables in the 'optimization_problem').
+
+        :return: Solution with provided decision variables values.
+        """
+        if cls.validate_trusted_values:
+            return cls(**decision_variables_values)
+        solution = cls.__new__(cls)
+        solution.values = tuple(decision_variables_values.values())
+        solution._objective_value_with_penalty = None
+        solution._fitness = None
+        solution._objective_value = None
+        solution._penalty_value = None
+        solution._constraints_values = None
+        return solution
+
+    @property
+    def decision_variables_values(self) -> OrderedDict:
+        """
+        Values of decision variables (created on demand).
+
+        Keys: Names of decision variables.
+        Values: Values assigned to the decision variables.
+        """
+        return OrderedDict(zip(self.optimization_problem.decision_variables, self.values))
+
+    @property
+    def objective_value(self) -> Optional[Union[float, int]]:
+        """
+        Value of objective (without penalty) calculated during evaluation of this solution.
+
+        None if it was not calculated (e.g. the objective value with penalty was found in evaluation cache).
+        """
+        return self._objective_value
+
+    @property
+    def penalty_value(self) -> Optional[Union[float, int]]:
+        """
+        Value of penalty calculated during evaluation of this solution.
+
+        None if it was not calculated (e.g. the objective value with penalty was found in evaluation cache).
+        """
+        return self._penalty_value
+
+    @property
+    def constraints_values(self) -> Optional[Dict[str, Union[float, int]]]:
+        """
+        Values of constraints (absolute values) calculated during evaluation of this solution.
+
+        None if constraints were not calculated (e.g. the objective value with penalty was found in evaluation cache).
+        """
+        if self._constraints_values is None:
+            return None
+        return dict(zip(self.optimization_problem.constraints, self._constraints_values))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -132,39 +210,209 @@ class AbstractSolution(ABC):
         """
         return not self.__le__(other)
 
-    def _calculate_objective(self) -> Union[float, int]:
-        """:return: Value of solution objective without penalty."""
-        return self.optimization_problem.objective_function(**self.decision_variables_values)
+    def _calculate_objective(self, decision_variables_values: Mapping[str, Any]) -> Union[float, int]:
+        """
+        :param decision_variables_values: Values of decision variables of this solution.
 
-    def _calculate_constraints(self) -> Dict[str, Union[float, int]]:
+        :return: Value of solution objective without penalty.
+        """
+        return self.optimization_problem.objective_function(**decision_variables_values)
+
+    def _calculate_constraints(self, decision_variables_values: Mapping[str, Any]) -> Dict[str, Union[float, int]]:
         """
         Calculates constraints values.
 
         Each constraint function should return 0 if constraint is fulfilled (solution meets restrictions).
         If constraint is not fulfilled, then function should return value other than 0.
 
+        :param decision_variables_values: Values of decision variables of this solution.
+
         :return: Dictionary with constraints values.
             Keys: Names of constraint functions.
             Values: Calculated value of the corresponding constraint.
         """
         constraints_values = {
-            constraint_name: abs(constraint_function(**self.decision_variables_values))
+            constraint_name: abs(constraint_function(**decision_variables_values))
             for constraint_name, constraint_function in self.optimization_problem.constraints.items()
         }
         return constraints_values
 
-    def _calculate_penalty(self) -> Union[float, int]:
-        """:return: Value of solution penalty."""
-        return self.optimization_problem.penalty_function(**self._calculate_constraints())
+    def _calculate_penalty(self, decision_variables_values: Mapping[str, Any]) -> Union[float, int]:
+        """
+        :param decision_variables_values: Values of decision variables of this solution.
+
+        :return: Value of solution penalty.
+        """
+        constraints_values = self._calculate_constraints(decision_variables_values)
+        self._constraints_values = tuple(constraints_values.values())
+        return self.optimization_problem.penalty_function(**constraints_values)
+
+    @property
+    def is_evaluated(self) -> bool:
+        """Information whether objective value (with penalty) of this solution was already calculated."""
+        return self._objective_value_with_penalty is not None
+
+    def _calculate_objective_value_with_penalty(self) -> Union[float, int]:
+        """:return: Value of solution objective with penalty (always calculated, evaluation cache is not used)."""
+        decision_variables_values = self.decision_variables_values  # created once for all functions
+        self._objective_value = self._calculate_objective(decision_variables_values)
+        self._penalty_value = self._calculate_penalty(decision_variables_values)
+        if self.optimization_problem.optimization_type == OptimizationType.Minimize:
+            return self._objective_value + self._penalty_value
+        # only OptimizationType.Maximize value is possible here
+        return self._objective_value - self._penalty_value
+
+    def _store_in_cache(self, evaluation_cache: EvaluationCache) -> None:
+        """
+        Stores results of this solution evaluation in evaluation cache.
+
+        :param evaluation_cache: Evaluation cache of 'optimization_problem'.
+        """
+        evaluation_cache.set(self.values, self._objective_value_with_penalty,  # the same key as created by 'make_key'
+                             objective_value=self._objective_value,
+                             penalty_value=self._penalty_value,
+                             constraints_values=self.constraints_values)
 
     def get_objective_value_with_penalty(self):
         """:return: Value of solution objective with penalty."""
         if self._objective_value_with_penalty is None:
+            evaluation_cache = self.optimization_problem.evaluation_cache
+            if evaluation_cache is None:
+                self._objective_value_with_penalty = self._calculate_objective_value_with_penalty()
+            else:
+                key = self.values  # the same key as created by 'make_key' method
+                objective_value_with_penalty = evaluation_cache.get(key)
+                if objective_value_with_penalty is None:
+                    self._objective_value_with_penalty = self._calculate_objective_value_with_penalty()
+                    self._store_in_cache(evaluation_cache)
+                else:
+                    self._objective_value_with_penalty = objective_value_with_penalty
+        return self._objective_value_with_penalty
+
+    def get_fitness(self) -> Union[float, int]:
+        """
+        Gets fitness of the solution - objective value with penalty normalized by optimization type, so the higher
+        the value, the better the solution (for both minimization and maximization).
+
+        The value is cached, therefore it is cheap key for sorting and comparing solutions (use 'fitness_key').
+
+        :return: Fitness of the solution.
+        """
+        if self._fitness is None:
             if self.optimization_problem.optimization_type == OptimizationType.Minimize:
-                self._objective_value_with_penalty = self._calculate_objective() + self._calculate_penalty()
+                self._fitness = -self.get_objective_value_with_penalty()
             else:  # only OptimizationType.Maximize value is possible here
-                self._objective_value_with_penalty = self._calculate_objective() - self._calculate_penalty()
-        return self._objective_value_with_penalty
+                self._fitness = self.get_objective_value_with_penalty()
+        return self._fitness
+
+    @classmethod
+    def group_not_evaluated(cls, solutions: Sequence["AbstractSolution"]) -> List[List["AbstractSolution"]]:
+        """
+        Prepares evaluation of many solutions.
+
+        Objective values (with penalty) found in evaluation cache of 'optimization_problem' (if defined) are assigned
+        to the solutions. Other solutions that were not evaluated yet are grouped by decision variables values,
+        so each group could be evaluated only once (duplicates are counted as cache hits).
+
+        :param solutions: Solutions (objects of this class) to be evaluated.
+
+        :return: Groups of solutions (with the same decision variables values) that require evaluation.
+        """
+        not_evaluated = [solution for solution in solutions if not solution.is_evaluated]
+        evaluation_cache = cls.optimization_problem.evaluation_cache
+        if evaluation_cache is None:
+            return [[solution] for solution in not_evaluated]
+        groups: Dict[Hashable, List[AbstractSolution]] = {}
+        for solution in not_evaluated:
+            key = solution.values  # the same key as created by 'make_key' method
+            if key in groups:
+                evaluation_cache.hits += 1
+                groups[key].append(solution)
+                continue
+            objective_value_with_penalty = evaluation_cache.get(key)
+            if objective_value_with_penalty is None:
+                groups[key] = [solution]
+            else:
+                solution._objective_value_with_penalty = objective_value_with_penalty
+        return list(groups.values())
+
+    @classmethod
+    def calculate_objective_values(cls, solutions: Sequence["AbstractSolution"]) -> None:
+        """
+        Calculates objective values (with penalty) of many solutions at once (evaluation cache is not used).
+
+        If 'optimization_problem' defines batch (vectorized) functions, then they are called once for all solutions.
+        Otherwise, each solution is evaluated separately.
+
+        :param solutions: Solutions (objects of this class) to be evaluated.
+        """
+        if not solutions:
+            return
+        if not cls.optimization_problem.supports_batch_evaluation:
+            for solution in solutions:
+                solution._objective_value_with_penalty = solution._calculate_objective_value_with_penalty()
+            return
+        batch_values = cls.optimization_problem.get_batch_values([solution.values for solution in solutions])
+        cls.assign_evaluation_results(solutions, cls.optimization_problem.evaluate_batch_components(batch_values))
+
+    @classmethod
+    def assign_evaluation_results(cls, solutions: Sequence["AbstractSolution"],
+                                  evaluation_results: Mapping[str, Any]) -> None:
+        """
+        Assigns results of batch evaluation to many solutions.
+
+        :param solutions: Solutions (objects of this class) that were evaluated.
+        :param evaluation_results: Evaluation results of following solutions (as returned by
+            'evaluate_batch_components' method of 'optimization_problem').
+        """
+        constraints_values = [evaluation_results["constraints_values"][name].tolist()
+                              for name in cls.optimization_problem.constraints]
+        for solution, objective_value_with_penalty, objective_value, penalty_value, *solution_constraints_values \
+                in zip(solutions, evaluation_results["objective_value_with_penalty"].tolist(),
+                       evaluation_results["objective_value"].tolist(), evaluation_results["penalty_value"].tolist(),
+                       *constraints_values):
+            solution._objective_value_with_penalty = objective_value_with_penalty
+            solution._objective_value = objective_value
+            solution._penalty_value = penalty_value
+            solution._constraints_values = tuple(solution_constraints_values)
+
+    @classmethod
+    def store_evaluation_results(cls, groups: Sequence[Sequence["AbstractSolution"]]) -> None:
+        """
+        Completes evaluation of many solutions.
+
+        Objective value (with penalty) of the first solution in each group is assigned to other solutions in this
+        group and stored (together with other evaluation results) in evaluation cache of 'optimization_problem'
+        (if defined).
+
+        :param groups: Groups of solutions (as returned by 'group_not_evaluated' method) with the first solution
+            in each group already evaluated.
+        """
+        evaluation_cache = cls.optimization_problem.evaluation_cache
+        for evaluated_solution, *other_solutions in groups:
+            objective_value_with_penalty = evaluated_solution._objective_value_with_penalty
+            for solution in other_solutions:
+                solution._objective_value_with_penalty = objective_value_with_penalty
+            if evaluation_cache is not None:
+                evaluated_solution._store_in_cache(evaluation_cache)
+
+    @classmethod
+    def evaluate_solutions(cls, solutions: Sequence["AbstractSolution"]) -> int:
+        """
+        Calculates objective values (with penalty) of many solutions at once.
+
+        Only solutions that were not evaluated yet and which values are not found in evaluation cache
+        are evaluated (once for each unique decision variables values). If 'optimization_problem' defines batch
+        (vectorized) functions, then they are called once for all these solutions.
+
+        :param solutions: Solutions (objects of this class) to be evaluated.
+
+        :return: Number of performed evaluations (calculations of objective value).
+        """
+        groups = cls.group_not_evaluated(solutions)
+        cls.calculate_objective_values([group[0] for group in groups])
+        cls.store_evaluation_results(groups)
+        return len(groups)
 
     def get_log_data(self) -> Dict[str, Union[dict, int, float]]:
         """
@@ -176,3 +424,16 @@ class AbstractSolution(ABC):
             "decision_variables_values": self.decision_variables_values,
             "objective_value_with_penalty": self.get_objective_value_with_penalty(),
         }
+
+
+def fitness_key(solution: AbstractSolution) -> Union[float, int]:
+    """
+    Key function (for 'sorted', 'max', 'min' etc.) that orders solutions from the worst to the best.
+
+    It is much faster than rich comparison of solutions as fitness is cached by each solution.
+
+    :param solution: Solution to get key for.
+
+    :return: Fitness of the solution.
+    """
+    return solution.get_fitness()
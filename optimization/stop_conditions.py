@@ -5,24 +5,48 @@ __all__ = ["StopConditions"]
 
 from typing import Optional, Union, Dict
 from datetime import timedelta, datetime
+from time import monotonic_ns
 
 from .problem import AbstractSolution, OptimizationType
 
 
+StartTimeTyping = Union[datetime, int]
+"""Time when optimization process was started - either value of monotonic clock (in nanoseconds, as returned by
+'time.monotonic_ns') or (wall clock) datetime."""
+
+
+def to_nanoseconds(time_delta: timedelta) -> int:
+    """
+    Converts time difference to nanoseconds.
+
+    :param time_delta: Time difference to convert.
+
+    :return: Number of nanoseconds.
+    """
+    return time_delta // timedelta(microseconds=1) * 1000
+
+
 class StopConditions:
     """Definition of stop condition which causes the end of optimization process."""
 
-    def __init__(self,
-                 time_limit: timedelta,
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 time_limit: Optional[timedelta] = None,
                  satisfying_objective_value: Optional[Union[float, int]] = None,
                  max_iter_without_progress: Optional[int] = None,
-                 max_time_without_progress: Optional[timedelta] = None) -> None:
+                 max_time_without_progress: Optional[timedelta] = None,
+                 max_iterations: Optional[int] = None,
+                 max_evaluations: Optional[int] = None,
+                 checkpoint_interval: Optional[int] = None) -> None:
         """
         Create definition of certain stop conditions.
 
+        Note: At least one of hard limits ('time_limit', 'max_iterations', 'max_evaluations') is mandatory
+        to avoid infinity loop! Optimization process with only 'max_iterations' and/or 'max_evaluations' limits
+        is deterministic (for seeded random source), so its results do not depend on the machine speed.
+
         :param time_limit: Time that optimization process might last.
             After this time it will be stopped (sooner than later).
-            Note: Passing time restriction is mandatory to avoid infinity loop!
+            Note: It is not taken into account if equal None.
         :param satisfying_objective_value: Boundary value of the objective.
             When solution with better or equal objective value is found, then optimization process is stopped.
             Note: It is not taken into account if equal None.
@@ -33,11 +57,22 @@ class StopConditions:
         :param max_time_without_progress: Maximal time that optimization process might last without progress
             (finding a better solution). After this time is exceeded, then optimization process is stopped.
             Note: It is not taken into account if equal None.
+        :param max_iterations: Maximal number of optimization algorithm iterations.
+            Note: It is not taken into account if equal None.
+        :param max_evaluations: Maximal number of solutions evaluations (calculations of objective value).
+            It is checked after each iteration, so it might be exceeded by evaluations of the last iteration.
+            Note: It is not taken into account if equal None.
+        :param checkpoint_interval: Number of solutions evaluations after which time limit, evaluations limit and
+            satisfying objective value are checked inside an iteration, so the iteration might be interrupted.
+            It bounds overshoot of these limits when a single iteration takes long.
+            Note: Stop conditions are checked only between iterations if equal None.
         """
-        if not isinstance(time_limit, timedelta):
-            raise TypeError(f"Parameter 'time_limit' value is not timedelta type. Actual value: '{time_limit}'.")
-        if time_limit <= timedelta():
-            raise ValueError(f"Parameter 'time_limit' value less or equal 0s. Actual value: '{time_limit}'.")
+        if time_limit is not None:
+            if not isinstance(time_limit, timedelta):
+                raise TypeError(f"Parameter 'time_limit' value is not timedelta nor None type. "
+                                f"Actual value: '{time_limit}'.")
+            if time_limit <= timedelta():
+                raise ValueError(f"Parameter 'time_limit' value less or equal 0s. Actual value: '{time_limit}'.")
         if satisfying_objective_value is not None and not isinstance(satisfying_objective_value, (float, int)):
             raise TypeError(f"Parameter 'satisfying_objective_value' value is not float, int nor None type. "
                             f"Actual value: '{satisfying_objective_value}'.")
@@ -51,24 +86,63 @@ class StopConditions:
         if max_time_without_progress is not None and not isinstance(max_time_without_progress, timedelta):
             raise TypeError(f"Parameter 'max_time_without_progress' value is not timedelta nor None type. "
                             f"Actual value: '{max_time_without_progress}'.")
+        for param_name, param_value in (("max_iterations", max_iterations), ("max_evaluations", max_evaluations),
+                                        ("checkpoint_interval", checkpoint_interval)):
+            if param_value is not None:
+                if not isinstance(param_value, int):
+                    raise TypeError(f"Parameter '{param_name}' value is not int nor None type. "
+                                    f"Actual value: '{param_value}'.")
+                if param_value <= 0:
+                    raise ValueError(f"Parameter '{param_name}' must be positive integer. Actual value: {param_value}.")
+        if time_limit is None and max_iterations is None and max_evaluations is None:
+            raise ValueError("At least one of parameters 'time_limit', 'max_iterations' and 'max_evaluations' "
+                             "must be provided to avoid infinity loop.")
         self.time_limit = time_limit
         self.satisfying_objective_value = satisfying_objective_value
         self.max_iter_without_progress = max_iter_without_progress
         self.max_time_without_progress = max_time_without_progress
+        self.max_iterations = max_iterations
+        self.max_evaluations = max_evaluations
+        self.checkpoint_interval = checkpoint_interval
         # internal variables for assessing if test condition were achieved
         self._best_objective_found: Optional[float] = None
-        self._last_objective_progress_datetime: Optional[datetime] = None
+        self._last_objective_progress_time: Optional[int] = None
         self._iter_without_progress: Optional[int] = None
 
-    def _is_time_exceeded(self, start_time: datetime) -> bool:
+    def _is_time_exceeded(self, start_time: StartTimeTyping) -> bool:
         """
         Check if optimization process lasts at least time limit.
 
-        :param start_time: Time when optimization process was started.
+        :param start_time: Time when optimization process was started - value of monotonic clock (in nanoseconds)
+            or datetime (then wall clock is used, so the check is affected by system clock changes).
 
         :return: True if time limit exceeded, otherwise False.
         """
-        return datetime.now() - start_time >= self.time_limit
+        if self.time_limit is None:
+            return False
+        if isinstance(start_time, datetime):
+            return datetime.now() - start_time >= self.time_limit
+        return monotonic_ns() - start_time >= to_nanoseconds(self.time_limit)
+
+    def _is_iterations_limit_exceeded(self, iterations_number: int) -> bool:
+        """
+        Check if optimization process performed at least maximal number of iterations.
+
+        :param iterations_number: Number of iterations performed by optimization algorithm.
+
+        :return: True if iterations limit exceeded, otherwise False.
+        """
+        return self.max_iterations is not None and iterations_number >= self.max_iterations
+
+    def _is_evaluations_limit_exceeded(self, evaluations_number: int) -> bool:
+        """
+        Check if optimization process performed at least maximal number of solutions evaluations.
+
+        :param evaluations_number: Number of solutions evaluations performed by optimization algorithm.
+
+        :return: True if evaluations limit exceeded, otherwise False.
+        """
+        return self.max_evaluations is not None and evaluations_number >= self.max_evaluations
 
     def _is_satisfying_solution_found(self, best_solution: AbstractSolution) -> bool:
         """
@@ -98,11 +172,11 @@ class StopConditions:
         if self.max_iter_without_progress is None and self.max_time_without_progress is None:
             return False
         # update helping variables
-        if self._best_objective_found is None or \
-                self._best_objective_found < best_solution.get_objective_value_with_penalty():
+        objective_value = best_solution.get_objective_value_with_penalty()
+        if self._best_objective_found is None or self._best_objective_found < objective_value:
             self._iter_without_progress = 0
-            self._last_objective_progress_datetime = datetime.now()
-            self._best_objective_found = best_solution.get_objective_value_with_penalty()
+            self._last_objective_progress_time = monotonic_ns()
+            self._best_objective_found = objective_value
         else:
             self._iter_without_progress += 1  # type: ignore
         # assess status
@@ -124,21 +198,55 @@ class StopConditions:
         :return: True if maximal time without progress exceeded, otherwise False.
         """
         return self.max_time_without_progress is not None \
-            and datetime.now() - self._last_objective_progress_datetime > self.max_time_without_progress  # type: ignore
+            and monotonic_ns() - self._last_objective_progress_time \
+            > to_nanoseconds(self.max_time_without_progress)  # type: ignore
 
-    def is_achieved(self, start_time: datetime, best_solution: AbstractSolution) -> bool:
+    def is_achieved(self,
+                    start_time: StartTimeTyping,
+                    best_solution: AbstractSolution,
+                    iterations_number: int = 0,
+                    evaluations_number: int = 0) -> bool:
         """
         Checks whether stop condition was achieved and optimization process should be stopped.
 
-        :param start_time: Time when optimization process was started.
+        Conditions are checked from the cheapest one and checking stops at the first achieved condition.
+        Progress related conditions are checked (and updated) only if optimization process is going to be continued.
+
+        :param start_time: Time when optimization process was started - value of monotonic clock (in nanoseconds,
+            as returned by 'time.monotonic_ns') or datetime (then wall clock is used for time limit).
         :param best_solution: Instance of AbstractSolution class with the best solution found in this optimization
             algorithm iteration.
+        :param iterations_number: Number of iterations performed by optimization algorithm.
+        :param evaluations_number: Number of solutions evaluations performed by optimization algorithm.
 
         :return: True if stop conditions were achieved, False otherwise.
         """
-        return any([self._is_time_exceeded(start_time=start_time),
-                    self._is_satisfying_solution_found(best_solution=best_solution),
-                    self._is_limit_without_progress_exceeded(best_solution=best_solution)])
+        return self._is_iterations_limit_exceeded(iterations_number=iterations_number) \
+            or self._is_evaluations_limit_exceeded(evaluations_number=evaluations_number) \
+            or self._is_satisfying_solution_found(best_solution=best_solution) \
+            or self._is_time_exceeded(start_time=start_time) \
+            or self._is_limit_without_progress_exceeded(best_solution=best_solution)
+
+    def is_interruption_needed(self,
+                               start_time: StartTimeTyping,
+                               best_solution: AbstractSolution,
+                               evaluations_number: int = 0) -> bool:
+        """
+        Checks whether optimization process should be stopped in the middle of an iteration.
+
+        Only time limit, evaluations limit and satisfying objective value are checked, so conditions related
+        to iterations (that are updated once per iteration) are not affected.
+
+        :param start_time: Time when optimization process was started - value of monotonic clock (in nanoseconds,
+            as returned by 'time.monotonic_ns') or datetime (then wall clock is used for time limit).
+        :param best_solution: Instance of AbstractSolution class with the best solution found so far.
+        :param evaluations_number: Number of solutions evaluations performed by optimization algorithm.
+
+        :return: True if optimization process should be stopped immediately, False otherwise.
+        """
+        return self._is_evaluations_limit_exceeded(evaluations_number=evaluations_number) \
+            or self._is_satisfying_solution_found(best_solution=best_solution) \
+            or self._is_time_exceeded(start_time=start_time)
 
     def get_log_data(self) -> Dict[str, Union[str, int, float, None]]:
         """
@@ -148,8 +256,11 @@ class StopConditions:
         """
         max_time = None if self.max_iter_without_progress is None else str(self.max_time_without_progress)
         return {
-            "time_limit": str(self.time_limit),
+            "time_limit": None if self.time_limit is None else str(self.time_limit),
             "satisfying_objective_value": self.satisfying_objective_value,
             "max_iter_without_progress": self.max_iter_without_progress,
-            "max_time_without_progress": max_time
+            "max_time_without_progress": max_time,
+            "max_iterations": self.max_iterations,
+            "max_evaluations": self.max_evaluations,
+            "checkpoint_interval": self.checkpoint_interval
         }
@@ -6,7 +6,11 @@ It contains:
     - binary search algorithm
 """
 
-from .random_values import generate_random_int, generate_random_float, \
+from .random_values import RandomSource, get_random_source, set_random_source, set_random_seed, \
+    generate_random_int, generate_random_float, \
     choose_random_value, choose_random_values, choose_random_value_with_weights, \
-    shuffle, shuffled
+    choose_random_values_with_cumulative_weights, generate_random_permutation, \
+    shuffle, shuffled, generate_random_ints_array, generate_random_floats_array, generate_random_normal_floats_array, \
+    choose_random_indices_groups, choose_random_indices_with_weights, \
+    generate_random_geometric_gap, choose_random_successes_indices
 from .other import binary_search
@@ -1,21 +1,210 @@
 """
 Module with (pseudo) random values generation and random shuffling.
 
-Note: It uses built-in random package (it could have been used directly), but this module is meant to be
-abstraction layer that enables to easily change this implementation.
+Note: Random values are drawn from the current RandomSource (NumPy Generator with PCG64 bit generator for arrays
+and built-in random.Random, seeded from the same seed, for single values). This module is meant to be abstraction
+layer that enables to easily change this implementation.
 """
 
-__all__ = ["generate_random_int", "generate_random_float",
+__all__ = ["RandomSource", "get_random_source", "set_random_source", "set_random_seed",
+           "generate_random_int", "generate_random_float",
            "choose_random_value", "choose_random_values", "choose_random_value_with_weights",
-           "shuffle", "shuffled"]
+           "choose_random_values_with_cumulative_weights", "generate_random_permutation",
+           "shuffle", "shuffled",
+           "generate_random_ints_array", "generate_random_floats_array", "generate_random_normal_floats_array",
+           "choose_random_indices_groups", "choose_random_indices_with_weights",
+           "generate_random_geometric_gap", "choose_random_successes_indices"]
 
 
-from typing import Any, List, Iterable, Sequence, Set, Union
-from random import randint as generate_random_int
-from random import uniform as generate_random_float
-from random import sample, shuffle, choices
+from typing import Any, List, Iterable, Optional, Sequence, Set, Union, Tuple
+from random import Random
+from math import log, sqrt
 from copy import deepcopy
 
+import numpy as np
+
+
+SizeTyping = Union[int, Tuple[int, ...]]
+
+
+class RandomSource:
+    """
+    Source of (pseudo) random values.
+
+    Arrays of random values are drawn from NumPy Generator (PCG64 bit generator), single values are drawn from
+    built-in random.Random (which is much faster for single values) seeded by the Generator, so the whole stream
+    is reproducible when the seed is provided.
+    """
+
+    def __init__(self, seed: Optional[Union[int, np.random.SeedSequence]] = None) -> None:
+        """
+        Creates source of random values.
+
+        :param seed: Seed (non-negative int) or seed sequence that initializes the source.
+            If None, then fresh entropy from the operating system is used.
+
+        :raise TypeError: Parameter 'seed' has incorrect type.
+        :raise ValueError: Parameter 'seed' has incorrect value.
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        elif seed is None or isinstance(seed, int) and not isinstance(seed, bool):
+            if seed is not None and seed < 0:
+                raise ValueError(f"Parameter 'seed' value must not be negative. Actual value: {seed}.")
+            self.seed_sequence = np.random.SeedSequence(seed)
+        else:
+            raise TypeError(f"Parameter 'seed' value is not int, SeedSequence nor None type. Actual value: {seed}.")
+        self.seed = seed
+        self.generator = np.random.Generator(np.random.PCG64(self.seed_sequence))
+        self.python_random = Random(int(self.generator.integers(1 << 63)))
+
+    def spawn(self, sources_number: int) -> List["RandomSource"]:
+        """
+        Creates independent sources of random values (e.g. for worker processes).
+
+        Spawned sources are reproducible - the same seed and the same order of calls give the same sources.
+
+        :param sources_number: Number of sources to create.
+
+        :return: List with new random sources.
+        """
+        return [RandomSource(seed=seed_sequence) for seed_sequence in self.seed_sequence.spawn(sources_number)]
+
+    def ints(self, min_value: int, max_value: int, size: Optional[SizeTyping] = None) -> Union[int, np.ndarray]:
+        """
+        Draws random integers.
+
+        :param min_value: Minimal possible value (inclusive).
+        :param max_value: Maximal possible value (inclusive).
+        :param size: Shape of the array. If None, then a single value is drawn.
+
+        :return: Random integer or array with random integers in range [min_value, max_value].
+        """
+        if size is None:
+            return self.python_random.randint(min_value, max_value)
+        return self.generator.integers(min_value, max_value, size=size, endpoint=True)
+
+    def floats(self, size: Optional[SizeTyping] = None) -> Union[float, np.ndarray]:
+        """
+        Draws random floats.
+
+        :param size: Shape of the array. If None, then a single value is drawn.
+
+        :return: Random float or array with random floats in range [0, 1).
+        """
+        if size is None:
+            return self.python_random.random()
+        return self.generator.random(size=size)
+
+    def normal_floats(self, size: SizeTyping) -> np.ndarray:
+        """
+        Draws random floats with standard normal distribution.
+
+        :param size: Shape of the array.
+
+        :return: Array with random floats (mean 0, standard deviation 1).
+        """
+        return self.generator.standard_normal(size=size)
+
+    def choices(self, pool_size: int, size: SizeTyping, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Picks indices randomly (with replacement).
+
+        :param pool_size: Number of indices to pick from (indices 0, 1, ..., pool_size-1).
+        :param size: Shape of the output array.
+        :param weights: Array with non-negative weights of following indices. If None, then all indices are
+            equally probable.
+
+        :return: Array with randomly picked indices.
+        """
+        if weights is None:
+            return self.generator.integers(0, pool_size, size=size)
+        return self.generator.choice(pool_size, size=size, p=weights / weights.sum())
+
+    def permutation(self, size: int, k: Optional[int] = None) -> np.ndarray:
+        """
+        Generates random permutation of indices (or its first k elements).
+
+        :param size: Number of indices to permute.
+        :param k: Number of indices to return. If None, then all indices are returned.
+
+        :return: Array with randomly ordered (unique) indices from range 0, 1, ..., size-1.
+        """
+        if k is None:
+            return self.generator.permutation(size)
+        return self.generator.choice(size, size=k, replace=False)
+
+    def geometric(self, success_probability: float, size: SizeTyping) -> np.ndarray:
+        """
+        Draws numbers of trials up to (and including) the first success (geometric distribution).
+
+        :param success_probability: Probability of success in a single trial.
+        :param size: Shape of the array.
+
+        :return: Array with random positive integers.
+        """
+        return self.generator.geometric(success_probability, size=size)
+
+
+_random_source = RandomSource()
+"""Random source that is currently used by functions of this module."""
+
+
+def get_random_source() -> RandomSource:
+    """:return: Random source that is currently used."""
+    return _random_source
+
+
+def set_random_source(random_source: RandomSource) -> RandomSource:
+    """
+    Sets random source to be used by functions of this module.
+
+    :param random_source: Random source to use.
+
+    :raise TypeError: Parameter 'random_source' is not RandomSource type.
+
+    :return: Random source that was used before.
+    """
+    global _random_source  # pylint: disable=global-statement
+    if not isinstance(random_source, RandomSource):
+        raise TypeError(f"Parameter 'random_source' value is not RandomSource type. Actual value: {random_source}.")
+    previous_random_source = _random_source
+    _random_source = random_source
+    return previous_random_source
+
+
+def set_random_seed(seed: Optional[int]) -> None:
+    """
+    Sets new random source with given seed.
+
+    :param seed: Seed of the new random source.
+    """
+    set_random_source(RandomSource(seed=seed))
+
+
+def generate_random_int(min_value: int, max_value: int) -> int:
+    """
+    Generates random integer.
+
+    :param min_value: Minimal possible value (inclusive).
+    :param max_value: Maximal possible value (inclusive).
+
+    :return: Random integer in range [min_value, max_value].
+    """
+    return _random_source.python_random.randint(min_value, max_value)
+
+
+def generate_random_float(min_value: float, max_value: float) -> float:
+    """
+    Generates random float.
+
+    :param min_value: Minimal possible value.
+    :param max_value: Maximal possible value.
+
+    :return: Random float in range [min_value, max_value].
+    """
+    return _random_source.python_random.uniform(min_value, max_value)
+
 
 def choose_random_value(values_pool: Union[Sequence[Any], Set[Any]]) -> Any:
     """
@@ -25,7 +214,9 @@ def choose_random_value(values_pool: Union[Sequence[Any], Set[Any]]) -> Any:
 
     :return: Randomly chosen value.
     """
-    return sample(population=values_pool, k=1)[0]
+    if isinstance(values_pool, (set, frozenset)):
+        values_pool = list(values_pool)
+    return _random_source.python_random.choice(values_pool)
 
 
 def choose_random_value_with_weights(values_pool: Sequence[Any], weights: Sequence[Union[float, int]]) -> Any:
@@ -37,7 +228,25 @@ def choose_random_value_with_weights(values_pool: Sequence[Any], weights: Sequen
 
     :return: Randomly chosen value with given weights.
     """
-    return choices(population=values_pool, weights=weights, k=1)[0]
+    return _random_source.python_random.choices(population=values_pool, weights=weights, k=1)[0]
+
+
+def choose_random_values_with_cumulative_weights(values_pool: Sequence[Any],
+                                                 cumulative_weights: Sequence[Union[float, int]],
+                                                 values_number: int) -> List[Any]:
+    """
+    Picks randomly (with replacement) many values from 'values_pool' according to cumulative weights.
+
+    Cumulative weights are meant to be calculated once and reused, so each pick costs only a binary search.
+
+    :param values_pool: Sequence with possible values to pick.
+    :param cumulative_weights: Sequence with cumulative sums of weights of following values.
+    :param values_number: Number of values to be picked.
+
+    :return: List with randomly picked values.
+    """
+    return _random_source.python_random.choices(population=values_pool, cum_weights=cumulative_weights,
+                                                k=values_number)
 
 
 def choose_random_values(values_pool: Union[Sequence[Any], Set[Any]], values_number: int) -> List[Any]:
@@ -49,7 +258,18 @@ def choose_random_values(values_pool: Union[Sequence[Any], Set[Any]], values_num
 
     :return: List with two randomly picked values.
     """
-    return sample(population=values_pool, k=values_number)
+    if isinstance(values_pool, (set, frozenset)):
+        values_pool = list(values_pool)
+    return _random_source.python_random.sample(population=values_pool, k=values_number)
+
+
+def shuffle(values: List[Any]) -> None:
+    """
+    Randomly shuffles values (in place).
+
+    :param values: List with values to shuffle.
+    """
+    _random_source.python_random.shuffle(values)
 
 
 def shuffled(values: Iterable[Any]) -> List[Any]:
@@ -63,3 +283,120 @@ def shuffled(values: Iterable[Any]) -> List[Any]:
     values = list(deepcopy(values))
     shuffle(values)
     return values
+
+
+def generate_random_ints_array(min_value: int, max_value: int, size: SizeTyping) -> np.ndarray:
+    """
+    Generates array of random integers.
+
+    :param min_value: Minimal possible value (inclusive).
+    :param max_value: Maximal possible value (inclusive).
+    :param size: Shape of the array.
+
+    :return: Array with random integers in range [min_value, max_value].
+    """
+    return _random_source.ints(min_value, max_value, size=size)  # type: ignore
+
+
+def generate_random_floats_array(size: SizeTyping) -> np.ndarray:
+    """
+    Generates array of random floats.
+
+    :param size: Shape of the array.
+
+    :return: Array with random floats in range [0, 1).
+    """
+    return _random_source.floats(size=size)  # type: ignore
+
+
+def generate_random_normal_floats_array(size: SizeTyping) -> np.ndarray:
+    """
+    Generates array of random floats with standard normal distribution.
+
+    :param size: Shape of the array.
+
+    :return: Array with random floats (mean 0, standard deviation 1).
+    """
+    return _random_source.normal_floats(size=size)
+
+
+def choose_random_indices_groups(pool_size: int, groups_number: int, group_size: int) -> np.ndarray:
+    """
+    Picks many groups of different indices (indices in a group are unique, but groups are independent).
+
+    Robert Floyd's sampling algorithm is performed for all groups at once, so the number of random draws is equal
+    to the number of picked indices regardless of 'pool_size'.
+
+    :param pool_size: Number of indices to pick from (indices 0, 1, ..., pool_size-1).
+    :param groups_number: Number of groups to pick.
+    :param group_size: Number of indices in each group.
+
+    :return: Array with shape (groups_number, group_size) with randomly picked indices.
+    """
+    groups = np.empty((groups_number, group_size), dtype=int)
+    for i, max_index in enumerate(range(pool_size - group_size, pool_size)):
+        candidates = _random_source.ints(0, max_index, size=groups_number)
+        already_picked = (groups[:, :i] == candidates[:, np.newaxis]).any(axis=1)
+        groups[:, i] = np.where(already_picked, max_index, candidates)
+    return groups
+
+
+def choose_random_indices_with_weights(weights: np.ndarray, size: SizeTyping) -> np.ndarray:
+    """
+    Picks indices randomly (with replacement) with probability proportional to weights values.
+
+    :param weights: Array with non-negative weights of following indices.
+    :param size: Shape of the output array.
+
+    :return: Array with randomly picked indices.
+    """
+    return _random_source.choices(weights.size, size=size, weights=weights)
+
+
+def generate_random_permutation(size: int) -> np.ndarray:
+    """
+    Generates random permutation of indices.
+
+    :param size: Number of indices to permute.
+
+    :return: Array with randomly ordered indices 0, 1, ..., size-1.
+    """
+    return _random_source.permutation(size)
+
+
+def generate_random_geometric_gap(success_probability: float) -> int:
+    """
+    Generates number of failures before the first success in a series of independent trials (geometric distribution).
+
+    :param success_probability: Probability of success in a single trial (0 < success_probability <= 1).
+
+    :return: Randomly generated number of failures.
+    """
+    if success_probability >= 1:
+        return 0
+    return int(log(1. - _random_source.python_random.random()) / log(1. - success_probability))
+
+
+def choose_random_successes_indices(trials_number: int, success_probability: float) -> np.ndarray:
+    """
+    Picks indices of successful trials in a series of independent trials with the same probability of success.
+
+    Gaps between following successes are drawn (geometric distribution) instead of results of all trials,
+    so the number of random draws is proportional to the number of successes, not to the number of trials.
+
+    :param trials_number: Number of trials.
+    :param success_probability: Probability of success in a single trial.
+
+    :return: Sorted array with indices of successful trials.
+    """
+    if trials_number <= 0 or success_probability <= 0:
+        return np.empty(0, dtype=int)
+    if success_probability >= 1:
+        return np.arange(trials_number)
+    expected_successes = trials_number * success_probability
+    batch_size = int(expected_successes + 4 * sqrt(expected_successes)) + 8
+    indices = np.cumsum(_random_source.geometric(success_probability, size=batch_size)) - 1
+    while indices[-1] < trials_number:
+        following_indices = np.cumsum(_random_source.geometric(success_probability, size=batch_size)) + indices[-1]
+        indices = np.concatenate((indices, following_indices))
+    return indices[:np.searchsorted(indices, trials_number)]
@@ -1,10 +1,97 @@
 import pytest
 from mock import Mock, patch, call
 from collections import OrderedDict
+from datetime import datetime, timedelta
 
 from optimization.algorithms.evolutionary_algorithm.adaptive_evolutionary_algorithm import \
     EvolutionaryAlgorithmAdaptationProblem, AdaptiveEvolutionaryAlgorithm, LowerAdaptiveEvolutionaryAlgorithm, \
-    OptimizationType, AdaptationType, SelectionType, CrossoverType, MutationType
+    OptimizationType, AdaptationType, SelectionType, CrossoverType, MutationType, LowerAlgorithmOutcome, \
+    get_solutions_data, get_solutions_from_data, _initialize_worker, _run_lower_algorithm
+from optimization.algorithms.abstract_algorithm import IterationInterrupted
+from optimization import OptimizationProblem, IntegerVariable, StopConditions, RandomSource
+from optimization.problem import AbstractSolution
+
+
+def sum_objective_function(**values):
+    return sum(values.values())
+
+
+def zero_penalty_function(**_):
+    return 0
+
+
+EXAMPLE_PROBLEM = OptimizationProblem(decision_variables=OrderedDict(a=IntegerVariable(0, 10),
+                                                                     b=IntegerVariable(-5, 5)),
+                                      constraints={}, penalty_function=zero_penalty_function,
+                                      objective_function=sum_objective_function,
+                                      optimization_type=OptimizationType.Maximize)
+
+
+class ExampleSolution(AbstractSolution):
+    __slots__ = ()
+    optimization_problem = EXAMPLE_PROBLEM
+
+
+class TestUtilities:
+    """Tests for functions that transfer Lower Adaptive Evolutionary Algorithms between processes."""
+
+    @pytest.mark.parametrize("solutions_values", [[], [(0, 0)], [(1, 2), (10, -5), (1, 2)]])
+    @pytest.mark.parametrize("evaluated", [True, False])
+    def test_solutions_data(self, solutions_values, evaluated):
+        solutions = [ExampleSolution(a=a, b=b) for a, b in solutions_values]
+        if evaluated:
+            ExampleSolution.evaluate_solutions(solutions)
+        solutions_data = get_solutions_data(solutions)
+        assert solutions_data == [(values, sum(values) if evaluated else None) for values in solutions_values]
+        new_solutions = get_solutions_from_data(ExampleSolution, solutions_data)
+        assert all(isinstance(solution, ExampleSolution) for solution in new_solutions)
+        assert [solution.values for solution in new_solutions] == solutions_values
+        assert all(solution.is_evaluated is evaluated for solution in new_solutions)
+
+    @pytest.mark.parametrize("record_iterations", [True, False])
+    @pytest.mark.parametrize("initial_population", [[], [((10, 5), 15), ((0, 0), 0)]])
+    def test_run_lower_algorithm(self, record_iterations, initial_population):
+        _initialize_worker(EXAMPLE_PROBLEM)
+        outcome = _run_lower_algorithm(stop_conditions=StopConditions(time_limit=timedelta(seconds=0.01)),
+                                       algorithm_params=dict(population_size=10, selection_type=SelectionType.Uniform,
+                                                             crossover_type=CrossoverType.SinglePoint,
+                                                             mutation_type=MutationType.SinglePoint,
+                                                             mutation_chance=0.1, apply_elitism=True),
+                                       initial_population=initial_population,
+                                       best_solution=None,
+                                       random_source=RandomSource(1),
+                                       record_iterations=record_iterations,
+                                       resumed=False)
+        assert isinstance(outcome, LowerAlgorithmOutcome)
+        assert len(outcome.population) == 10
+        assert outcome.best_solution[1] >= max(objective for _, objective in outcome.population)
+        if initial_population:
+            assert outcome.best_solution == ((10, 5), 15)
+        assert outcome.start_time <= outcome.end_time
+        assert outcome.iterations_number >= 1
+        if record_iterations:
+            assert len(outcome.iterations) == outcome.iterations_number
+            assert outcome.iterations[-1] == outcome.population
+        else:
+            assert outcome.iterations is None
+
+    @pytest.mark.parametrize("record_iterations", [True, False])
+    def test_run_lower_algorithm__resumed(self, record_iterations):
+        _initialize_worker(EXAMPLE_PROBLEM)
+        outcome = _run_lower_algorithm(stop_conditions=StopConditions(time_limit=timedelta(seconds=0.01)),
+                                       algorithm_params=dict(population_size=10, selection_type=SelectionType.Uniform,
+                                                             crossover_type=CrossoverType.SinglePoint,
+                                                             mutation_type=MutationType.SinglePoint,
+                                                             mutation_chance=0.1, apply_elitism=True),
+                                       initial_population=[((0, 0), 0)] * 10,
+                                       best_solution=((10, 5), 15),
+                                       random_source=RandomSource(1),
+                                       record_iterations=record_iterations,
+                                       resumed=True)
+        assert outcome.best_solution == ((10, 5), 15)
+        if record_iterations:
+            assert len(outcome.iterations) == outcome.iterations_number
+            assert outcome.iterations[-1] == outcome.population
 
 
 class TestEvolutionaryAlgorithmAdaptationProblem:
@@ -545,7 +632,8 @@ class TestLowerAdaptiveEvolutionaryAlgorithm:
         {},
         {"param1": 1, "param2": 2, "param3": 3},
         {"logger": None, "initial_population": []},
-        {"logger": "Some logger", "initial_population": list(range(10)), "p1": "v1", "p2": "v2"}
+        {"logger": "Some logger", "initial_population": list(range(10)), "p1": "v1", "p2": "v2"},
+        {"logger": "Some logger", "evaluator": "Some evaluator"}
     ])
     def test_init(self, upper_iteration, index, problem, stop_conditions, population_size, selection_type,
                   crossover_type, mutation_type, mutation_chance, apply_elitism, optional_params):
@@ -555,9 +643,10 @@ class TestLowerAdaptiveEvolutionaryAlgorithm:
             population_size=population_size, selection_type=selection_type, crossover_type=crossover_type,
             mutation_type=mutation_type, mutation_chance=mutation_chance, apply_elitism=apply_elitism, **optional_params
         )
-        # pop 'logger' and 'initial_population' values from optional_params
+        # pop 'logger', 'evaluator' and 'initial_population' values from optional_params
         # only additional values related to selection, crossover and mutation are left in the dictionary
         logger = optional_params.pop("logger", None)
+        evaluator = optional_params.pop("evaluator", None)
         initial_population = optional_params.pop("initial_population", [])
         # assertions
         assert self.mock_lower_adaptive_evolutionary_algorithm_object.upper_iteration == upper_iteration
@@ -568,7 +657,8 @@ class TestLowerAdaptiveEvolutionaryAlgorithm:
             self_ea=self.mock_lower_adaptive_evolutionary_algorithm_object,
             problem=problem, stop_conditions=stop_conditions, population_size=population_size,
             selection_type=selection_type, crossover_type=crossover_type, mutation_type=mutation_type,
-            mutation_chance=mutation_chance, apply_elitism=apply_elitism, logger=logger, **optional_params)
+            mutation_chance=mutation_chance, apply_elitism=apply_elitism, logger=logger, evaluator=evaluator,
+            **optional_params)
         self.mock_abstract_solution_init.assert_called_once_with(
             self_solution=self.mock_lower_adaptive_evolutionary_algorithm_object,
             population_size=population_size,
@@ -597,6 +687,104 @@ class TestLowerAdaptiveEvolutionaryAlgorithm:
                                                                       lower_iteration=iteration_index,
                                                                       solutions=solutions)
 
+    @pytest.mark.parametrize("logger", [None, Mock()])
+    @pytest.mark.parametrize("decision_variables, additional_variables", [
+        ({"population_size": 10, "apply_elitism": True}, {}),
+        ({"population_size": 10, "selection_type": SelectionType.Tournament}, {"tournament_group_size": 3}),
+    ])
+    def test_get_worker_task(self, logger, decision_variables, additional_variables):
+        self.mock_lower_adaptive_evolutionary_algorithm_object.logger = logger
+        self.mock_lower_adaptive_evolutionary_algorithm_object.stop_conditions = Mock()
+        self.mock_lower_adaptive_evolutionary_algorithm_object.decision_variables_values = decision_variables
+        self.mock_lower_adaptive_evolutionary_algorithm_object.additional_decision_variables_values = additional_variables
+        self.mock_lower_adaptive_evolutionary_algorithm_object._population = \
+            get_solutions_from_data(ExampleSolution, [((1, 1), None)])
+        self.mock_lower_adaptive_evolutionary_algorithm_object._best_solution = None
+        self.mock_lower_adaptive_evolutionary_algorithm_object._next_iteration_index = 0
+        mock_random_source = Mock()
+        task = LowerAdaptiveEvolutionaryAlgorithm.get_worker_task(
+            self=self.mock_lower_adaptive_evolutionary_algorithm_object, random_source=mock_random_source)
+        assert task == dict(stop_conditions=self.mock_lower_adaptive_evolutionary_algorithm_object.stop_conditions,
+                            algorithm_params=dict(decision_variables, **additional_variables),
+                            initial_population=[((1, 1), None)],
+                            best_solution=None,
+                            random_source=mock_random_source,
+                            record_iterations=logger is not None,
+                            resumed=False)
+
+    @pytest.mark.parametrize("next_iteration_index", [1, 17])
+    def test_get_worker_task__resumed(self, next_iteration_index):
+        self.mock_lower_adaptive_evolutionary_algorithm_object.logger = None
+        self.mock_lower_adaptive_evolutionary_algorithm_object.stop_conditions = Mock()
+        self.mock_lower_adaptive_evolutionary_algorithm_object.decision_variables_values = {}
+        self.mock_lower_adaptive_evolutionary_algorithm_object.additional_decision_variables_values = {}
+        self.mock_lower_adaptive_evolutionary_algorithm_object._population = \
+            get_solutions_from_data(ExampleSolution, [((1, 1), 2)])
+        self.mock_lower_adaptive_evolutionary_algorithm_object._best_solution = \
+            get_solutions_from_data(ExampleSolution, [((3, 3), 6)])[0]
+        self.mock_lower_adaptive_evolutionary_algorithm_object._next_iteration_index = next_iteration_index
+        task = LowerAdaptiveEvolutionaryAlgorithm.get_worker_task(
+            self=self.mock_lower_adaptive_evolutionary_algorithm_object, random_source=Mock())
+        assert task["best_solution"] == ((3, 3), 6)
+        assert task["resumed"] is True
+
+    @pytest.mark.parametrize("upper_iteration, index", [(0, 0), (3, 7)])
+    @pytest.mark.parametrize("iterations", [None, [], [[((1, 1), 2)], [((2, 2), 4), ((0, 0), 0)]]])
+    @pytest.mark.parametrize("next_iteration_index, optimization_time", [(0, timedelta()), (5, timedelta(seconds=3))])
+    def test_set_worker_outcome__with_logger(self, upper_iteration, index, iterations, next_iteration_index,
+                                             optimization_time):
+        mock_logger = Mock()
+        start_time = datetime(2020, 1, 1, 12)
+        self.mock_lower_adaptive_evolutionary_algorithm_object.logger = mock_logger
+        self.mock_lower_adaptive_evolutionary_algorithm_object.upper_iteration = upper_iteration
+        self.mock_lower_adaptive_evolutionary_algorithm_object.index = index
+        self.mock_lower_adaptive_evolutionary_algorithm_object.SolutionClass = ExampleSolution
+        self.mock_lower_adaptive_evolutionary_algorithm_object._next_iteration_index = next_iteration_index
+        self.mock_lower_adaptive_evolutionary_algorithm_object._optimization_time = optimization_time
+        outcome = LowerAlgorithmOutcome(population=[((2, 2), 4), ((0, 0), 0)], best_solution=((3, 3), 6),
+                                        start_time=start_time, end_time=start_time + timedelta(seconds=2),
+                                        iterations_number=len(iterations or []) + 1, evaluations_number=25,
+                                        iterations=iterations)
+        LowerAdaptiveEvolutionaryAlgorithm.set_worker_outcome(
+            self=self.mock_lower_adaptive_evolutionary_algorithm_object, outcome=outcome)
+        assert get_solutions_data(self.mock_lower_adaptive_evolutionary_algorithm_object._population) \
+            == outcome.population
+        best_solution = self.mock_lower_adaptive_evolutionary_algorithm_object._best_solution
+        assert get_solutions_data([best_solution]) == [outcome.best_solution]
+        assert self.mock_lower_adaptive_evolutionary_algorithm_object._start_time == outcome.start_time
+        assert self.mock_lower_adaptive_evolutionary_algorithm_object._end_time == outcome.end_time
+        assert mock_logger.log_lower_level_iteration.call_count == len(iterations or [])
+        assert [logged_call[1]["lower_iteration"] for logged_call in mock_logger.log_lower_level_iteration.call_args_list] \
+            == list(range(next_iteration_index, next_iteration_index + len(iterations or [])))
+        assert self.mock_lower_adaptive_evolutionary_algorithm_object._next_iteration_index \
+            == next_iteration_index + outcome.iterations_number
+        assert self.mock_lower_adaptive_evolutionary_algorithm_object._evaluations_number == 25
+        self.mock_lower_adaptive_evolutionary_algorithm_object._reset_evaluation.assert_called_once_with()
+        mock_logger.log_lower_level_at_end.assert_called_once_with(upper_iteration=upper_iteration,
+                                                                   lower_algorithm_index=index,
+                                                                   best_solution=best_solution,
+                                                                   optimization_time=optimization_time
+                                                                   + timedelta(seconds=2))
+
+    @pytest.mark.parametrize("next_iteration_index", [0, 4])
+    @pytest.mark.parametrize("finished_iterations", [0, 1, 3])
+    def test_perform_optimization__interrupted(self, next_iteration_index, finished_iterations):
+        mock_perform_iteration = Mock(side_effect=[None] * finished_iterations + [IterationInterrupted])
+        self.mock_lower_adaptive_evolutionary_algorithm_object.logger = None
+        self.mock_lower_adaptive_evolutionary_algorithm_object._next_iteration_index = next_iteration_index
+        self.mock_lower_adaptive_evolutionary_algorithm_object._optimization_time = timedelta()
+        self.mock_lower_adaptive_evolutionary_algorithm_object._perform_iteration = mock_perform_iteration
+        self.mock_lower_adaptive_evolutionary_algorithm_object._is_stop_achieved.return_value = False
+        self.mock_lower_adaptive_evolutionary_algorithm_object._best_solution = "best solution"
+        assert LowerAdaptiveEvolutionaryAlgorithm.perform_optimization(
+            self=self.mock_lower_adaptive_evolutionary_algorithm_object) == "best solution"
+        mock_perform_iteration.assert_has_calls([call(iteration_index=next_iteration_index + i)
+                                                 for i in range(finished_iterations + 1)])
+        assert self.mock_lower_adaptive_evolutionary_algorithm_object._iterations_number == finished_iterations
+        assert self.mock_lower_adaptive_evolutionary_algorithm_object._next_iteration_index \
+            == next_iteration_index + finished_iterations
+        self.mock_lower_adaptive_evolutionary_algorithm_object._reset_evaluation.assert_called_once_with()
+
     @pytest.mark.parametrize("evolutionary_algorithm_data", [{}, {"value1": "a", "value2": "b"}])
     @pytest.mark.parametrize("decision_variables", [{"selection_type": Mock(), "crossover_type": Mock(), "mutation_type": Mock()}])
     @pytest.mark.parametrize("additional_variables", [{}, {"p1": 1, "p2": 2}, {"a": "xyz", "b": "tuv", "c": "hij"}])
@@ -688,3 +876,125 @@ class TestAdaptiveEvolutionaryAlgorithm:
         assert individual_values == final_values
         self.mock_evolutionary_algorithm__perform_mutation.assert_called_once()
         self.mock_adaptive_evolutionary_algorithm_object._update_additional_params.assert_called_once()
+
+    # _get_iteration_time_budget
+
+    @pytest.mark.parametrize("iterations_number, expected_time_budget", [
+        (1, timedelta(seconds=100)),
+        (10, timedelta(seconds=10)),
+        (3, timedelta(seconds=100 / 3)),
+    ])
+    def test_get_iteration_time_budget(self, iterations_number, expected_time_budget):
+        self.mock_adaptive_evolutionary_algorithm_object.stop_conditions = \
+            StopConditions(time_limit=timedelta(seconds=100))
+        self.mock_adaptive_evolutionary_algorithm_object.iterations_number = iterations_number
+        time_budget = AdaptiveEvolutionaryAlgorithm._get_iteration_time_budget(
+            self=self.mock_adaptive_evolutionary_algorithm_object)
+        assert abs(time_budget - expected_time_budget) < timedelta(milliseconds=1)
+
+    # _generate_lower_algorithm_stop_conditions
+
+    @pytest.mark.parametrize("time_limit", [timedelta(seconds=1), timedelta(minutes=5)])
+    @pytest.mark.parametrize("satisfying_objective_value", [None, 5])
+    @pytest.mark.parametrize("checkpoint_interval", [None, 50])
+    def test_generate_lower_algorithm_stop_conditions(self, time_limit, satisfying_objective_value,
+                                                      checkpoint_interval):
+        self.mock_adaptive_evolutionary_algorithm_object.stop_conditions = \
+            StopConditions(time_limit=timedelta(seconds=100), satisfying_objective_value=satisfying_objective_value,
+                           checkpoint_interval=checkpoint_interval)
+        stop_conditions = AdaptiveEvolutionaryAlgorithm._generate_lower_algorithm_stop_conditions(
+            self=self.mock_adaptive_evolutionary_algorithm_object, time_limit=time_limit)
+        assert isinstance(stop_conditions, StopConditions)
+        assert stop_conditions.time_limit == time_limit
+        assert stop_conditions.satisfying_objective_value == satisfying_objective_value
+        assert stop_conditions.checkpoint_interval == checkpoint_interval
+
+    # _perform_iteration
+
+    @pytest.mark.parametrize("lower_algorithms_workers", [1, 2, 16])
+    @pytest.mark.parametrize("iterations_number", [1, 10])
+    def test_perform_iteration(self, lower_algorithms_workers, iterations_number):
+        lower_algorithms = [Mock(best_solution=Mock(get_fitness=Mock(return_value=fitness))) for fitness in range(4)]
+        self.mock_adaptive_evolutionary_algorithm_object._population = lower_algorithms
+        self.mock_adaptive_evolutionary_algorithm_object._best_solution = None
+        self.mock_adaptive_evolutionary_algorithm_object.lower_algorithms_workers = lower_algorithms_workers
+        self.mock_adaptive_evolutionary_algorithm_object._get_iteration_time_budget.return_value = \
+            timedelta(seconds=100) / iterations_number
+        self.mock_adaptive_evolutionary_algorithm_object.budget_allocator = Mock()
+        AdaptiveEvolutionaryAlgorithm._perform_iteration(self=self.mock_adaptive_evolutionary_algorithm_object,
+                                                         iteration_index=0)
+        self.mock_adaptive_evolutionary_algorithm_object._generate_random_population.assert_called_once_with()
+        self.mock_adaptive_evolutionary_algorithm_object.budget_allocator.perform_lower_algorithms\
+            .assert_called_once_with(lower_algorithms=lower_algorithms,
+                                     time_budget=timedelta(seconds=100) / iterations_number,
+                                     workers=lower_algorithms_workers,
+                                     run_lower_algorithms=self.mock_adaptive_evolutionary_algorithm_object
+                                     ._run_lower_algorithms)
+        assert self.mock_adaptive_evolutionary_algorithm_object._best_solution == lower_algorithms[-1].best_solution
+
+    # _run_lower_algorithms
+
+    @pytest.mark.parametrize("lower_algorithms_workers", [1, 2, 16])
+    @pytest.mark.parametrize("time_limit", [timedelta(seconds=1), timedelta(milliseconds=20)])
+    def test_run_lower_algorithms(self, lower_algorithms_workers, time_limit):
+        lower_algorithms = [Mock(evaluations_number=evaluations_number) for evaluations_number in (10, 20, 30)]
+        self.mock_adaptive_evolutionary_algorithm_object._evaluations_number = 100
+        self.mock_adaptive_evolutionary_algorithm_object.lower_algorithms_workers = lower_algorithms_workers
+        AdaptiveEvolutionaryAlgorithm._run_lower_algorithms(self=self.mock_adaptive_evolutionary_algorithm_object,
+                                                            lower_algorithms=lower_algorithms, time_limit=time_limit)
+        self.mock_adaptive_evolutionary_algorithm_object._generate_lower_algorithm_stop_conditions.assert_has_calls(
+            [call(time_limit=time_limit)] * len(lower_algorithms))
+        for lower_ae in lower_algorithms:
+            assert lower_ae.stop_conditions \
+                == self.mock_adaptive_evolutionary_algorithm_object._generate_lower_algorithm_stop_conditions.return_value
+        if lower_algorithms_workers > 1:
+            self.mock_adaptive_evolutionary_algorithm_object._perform_lower_algorithms_in_parallel \
+                .assert_called_once_with(lower_algorithms)
+            assert all(lower_ae.perform_optimization.call_count == 0 for lower_ae in lower_algorithms)
+        else:
+            self.mock_adaptive_evolutionary_algorithm_object._perform_lower_algorithms_in_parallel.assert_not_called()
+            assert all(lower_ae.perform_optimization.call_count == 1 for lower_ae in lower_algorithms)
+        assert self.mock_adaptive_evolutionary_algorithm_object._evaluations_number == 160
+
+    # _perform_lower_algorithms_in_parallel
+
+    @pytest.mark.parametrize("executor_started", [False, True])
+    @pytest.mark.parametrize("population_size", [1, 4])
+    @patch(f"{SCRIPT_LOCATION}.get_random_source")
+    @patch(f"{SCRIPT_LOCATION}.ProcessPoolExecutor")
+    def test_perform_lower_algorithms_in_parallel(self, mock_process_pool_executor_class, mock_get_random_source,
+                                                  executor_started, population_size):
+        executor = Mock() if executor_started else None
+        lower_algorithms = [Mock(get_worker_task=Mock(return_value={})) for _ in range(population_size)]
+        random_sources = [Mock() for _ in range(population_size)]
+        mock_get_random_source.return_value.spawn.return_value = random_sources
+        self.mock_adaptive_evolutionary_algorithm_object._lower_algorithms_executor = executor
+        self.mock_adaptive_evolutionary_algorithm_object.lower_algorithms_workers = 3
+        self.mock_adaptive_evolutionary_algorithm_object.problem = Mock()
+        AdaptiveEvolutionaryAlgorithm._perform_lower_algorithms_in_parallel(
+            self=self.mock_adaptive_evolutionary_algorithm_object, lower_algorithms=lower_algorithms)
+        if executor is None:
+            mock_process_pool_executor_class.assert_called_once()
+            executor = mock_process_pool_executor_class.return_value
+        else:
+            mock_process_pool_executor_class.assert_not_called()
+        assert self.mock_adaptive_evolutionary_algorithm_object._lower_algorithms_executor is executor
+        mock_get_random_source.return_value.spawn.assert_called_once_with(population_size)
+        assert executor.submit.call_count == population_size
+        for lower_ae, random_source in zip(lower_algorithms, random_sources):
+            lower_ae.get_worker_task.assert_called_once_with(random_source=random_source)
+            lower_ae.set_worker_outcome.assert_called_once_with(executor.submit.return_value.result.return_value)
+
+    # perform_optimization
+
+    @pytest.mark.parametrize("exception", [None, RuntimeError])
+    @patch(f"{SCRIPT_LOCATION}.EvolutionaryAlgorithm.perform_optimization")
+    def test_perform_optimization(self, mock_perform_optimization, exception):
+        mock_perform_optimization.side_effect = exception
+        if exception is None:
+            assert AdaptiveEvolutionaryAlgorithm.perform_optimization(
+                self=self.mock_adaptive_evolutionary_algorithm_object) is mock_perform_optimization.return_value
+        else:
+            with pytest.raises(exception):
+                AdaptiveEvolutionaryAlgorithm.perform_optimization(self=self.mock_adaptive_evolutionary_algorithm_object)
+        self.mock_adaptive_evolutionary_algorithm_object._close_lower_algorithms_executor.assert_called_once_with()
@@ -0,0 +1,95 @@
+import pytest
+from mock import Mock
+from datetime import timedelta
+
+from optimization.algorithms.evolutionary_algorithm.budget_allocation import AbstractBudgetAllocator, \
+    EqualBudgetAllocator, SuccessiveHalvingBudgetAllocator
+
+
+def create_lower_algorithms(fitness_values):
+    return [Mock(get_fitness=Mock(return_value=fitness)) for fitness in fitness_values]
+
+
+class TestEqualBudgetAllocator:
+
+    @pytest.mark.parametrize("algorithms_number, workers, expected_time_limit", [
+        (10, 1, timedelta(seconds=1)),
+        (10, 4, timedelta(seconds=10 / 3)),
+        (10, 10, timedelta(seconds=10)),
+        (10, 32, timedelta(seconds=10)),
+    ])
+    def test_perform_lower_algorithms(self, algorithms_number, workers, expected_time_limit):
+        lower_algorithms = create_lower_algorithms(range(algorithms_number))
+        mock_run_lower_algorithms = Mock()
+        EqualBudgetAllocator().perform_lower_algorithms(lower_algorithms=lower_algorithms,
+                                                        time_budget=timedelta(seconds=10),
+                                                        workers=workers,
+                                                        run_lower_algorithms=mock_run_lower_algorithms)
+        mock_run_lower_algorithms.assert_called_once()
+        (algorithms, time_limit), _ = mock_run_lower_algorithms.call_args
+        assert list(algorithms) == lower_algorithms
+        assert abs(time_limit - expected_time_limit) < timedelta(milliseconds=1)
+
+    def test_get_log_data(self):
+        assert EqualBudgetAllocator().get_log_data() == {"type": "EqualBudgetAllocator"}
+
+
+class TestSuccessiveHalvingBudgetAllocator:
+
+    @pytest.mark.parametrize("reduction_factor, min_survivors", [(2, 1), (3, 2), (10, 7)])
+    def test_init__valid(self, reduction_factor, min_survivors):
+        budget_allocator = SuccessiveHalvingBudgetAllocator(reduction_factor=reduction_factor,
+                                                            min_survivors=min_survivors)
+        assert isinstance(budget_allocator, AbstractBudgetAllocator)
+        assert budget_allocator.reduction_factor == reduction_factor
+        assert budget_allocator.min_survivors == min_survivors
+
+    @pytest.mark.parametrize("params", [{"reduction_factor": 2.}, {"reduction_factor": "2"},
+                                        {"min_survivors": 1.}, {"min_survivors": None}])
+    def test_init__invalid_type(self, params):
+        with pytest.raises(TypeError):
+            SuccessiveHalvingBudgetAllocator(**params)
+
+    @pytest.mark.parametrize("params", [{"reduction_factor": 1}, {"reduction_factor": -2},
+                                        {"min_survivors": 0}, {"min_survivors": -1}])
+    def test_init__invalid_value(self, params):
+        with pytest.raises(ValueError):
+            SuccessiveHalvingBudgetAllocator(**params)
+
+    @pytest.mark.parametrize("reduction_factor, min_survivors, algorithms_number, expected_rounds_sizes", [
+        (2, 1, 1, [1]),
+        (2, 1, 10, [10, 5, 3, 2, 1]),
+        (2, 2, 16, [16, 8, 4, 2]),
+        (3, 1, 20, [20, 7, 3, 1]),
+        (3, 4, 20, [20, 7, 4]),
+        (2, 12, 10, [10]),
+    ])
+    def test_get_rounds_sizes(self, reduction_factor, min_survivors, algorithms_number, expected_rounds_sizes):
+        budget_allocator = SuccessiveHalvingBudgetAllocator(reduction_factor=reduction_factor,
+                                                            min_survivors=min_survivors)
+        assert budget_allocator.get_rounds_sizes(algorithms_number) == expected_rounds_sizes
+
+    @pytest.mark.parametrize("workers", [1, 2, 8])
+    @pytest.mark.parametrize("fitness_values", [range(8), [3, 7, 1, 0, 5, 2, 6, 4]])
+    def test_perform_lower_algorithms(self, workers, fitness_values):
+        lower_algorithms = create_lower_algorithms(fitness_values)
+        mock_run_lower_algorithms = Mock()
+        budget_allocator = SuccessiveHalvingBudgetAllocator(reduction_factor=2, min_survivors=1)
+        budget_allocator.perform_lower_algorithms(lower_algorithms=lower_algorithms,
+                                                  time_budget=timedelta(seconds=8),
+                                                  workers=workers,
+                                                  run_lower_algorithms=mock_run_lower_algorithms)
+        assert mock_run_lower_algorithms.call_count == 4
+        for (algorithms, time_limit), _ in mock_run_lower_algorithms.call_args_list:
+            assert abs(time_limit - timedelta(seconds=2) / -(-len(algorithms) // workers)) < timedelta(milliseconds=1)
+        rounds_fitness = [sorted(lower_ae.get_fitness() for lower_ae in algorithms)
+                          for (algorithms, _), _ in mock_run_lower_algorithms.call_args_list]
+        assert rounds_fitness == [list(range(8)), [4, 5, 6, 7], [6, 7], [7]]
+
+    @pytest.mark.parametrize("reduction_factor, min_survivors", [(2, 1), (4, 3)])
+    def test_get_log_data(self, reduction_factor, min_survivors):
+        budget_allocator = SuccessiveHalvingBudgetAllocator(reduction_factor=reduction_factor,
+                                                            min_survivors=min_survivors)
+        assert budget_allocator.get_log_data() == {"type": "SuccessiveHalvingBudgetAllocator",
+                                                   "reduction_factor": reduction_factor,
+                                                   "min_survivors": min_survivors}
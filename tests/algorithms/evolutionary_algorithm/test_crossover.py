@@ -1,13 +1,75 @@
 import pytest
-from mock import Mock, patch, call
+from mock import Mock, patch
+from collections import OrderedDict
+
+import numpy as np
 
 from optimization.algorithms.evolutionary_algorithm.crossover import single_point_crossover, multi_point_crossover, \
-    adaptive_crossover, uniform_crossover, check_crossover_parameters
+    adaptive_crossover, uniform_crossover, check_crossover_parameters, single_point_crossover_mask, \
+    multi_point_crossover_mask, adaptive_crossover_mask, uniform_crossover_mask, get_pattern_mask, crossover_with_mask, \
+    crossover_float_genes, simulated_binary_crossover, blend_alpha_crossover, arithmetic_crossover, \
+    simulated_binary_crossover_genes, blend_alpha_crossover_genes, arithmetic_crossover_genes, \
+    real_valued_crossover_mask
+from optimization.problem import FloatVariable, IntegerVariable
 
 
 class TestUtilities:
     """Tests for utilities functions"""
 
+    # get_pattern_mask
+
+    @pytest.mark.parametrize("variables_number, crossover_pattern, expected_mask", [
+        (5, 0b00000, [False] * 5),
+        (5, 0b11111, [True] * 5),
+        (5, 0b01101, [True, False, True, True, False]),
+        (3, 0b010, [False, True, False]),
+        (70, 1 << 69 | 1, [True] + [False] * 68 + [True]),
+    ])
+    def test_get_pattern_mask(self, variables_number, crossover_pattern, expected_mask):
+        """
+        Test that 'get_pattern_mask' converts crossover pattern into crossover mask.
+
+        :param variables_number: Example value of 'variables_number'.
+        :param crossover_pattern: Example value of 'crossover_pattern'.
+        :param expected_mask: Expected crossover mask.
+        """
+        mask = get_pattern_mask(variables_number=variables_number, crossover_pattern=crossover_pattern)
+        assert mask.dtype == bool
+        assert mask.tolist() == expected_mask
+
+    # crossover_with_mask
+
+    @pytest.mark.parametrize("crossover_mask, child_1_output, child_2_output", [
+        ([False, False, False], ["a", "b", "c"], [(1, 2), None, 3.5]),
+        ([True, False, True], [(1, 2), "b", 3.5], ["a", None, "c"]),
+    ])
+    def test_crossover_with_mask(self, crossover_mask, child_1_output, child_2_output):
+        """
+        Test that 'crossover_with_mask' mixes parents genes according to crossover mask.
+
+        :param crossover_mask: Example crossover mask.
+        :param child_1_output: Expected decision variables values of the first child.
+        :param child_2_output: Expected decision variables values of the second child.
+        """
+        mock_problem = Mock(decision_variables=OrderedDict(x=Mock(), y=Mock(), z=Mock()))
+        parent_1 = Mock(values=("a", "b", "c"), optimization_problem=mock_problem)
+        parent_2 = Mock(values=((1, 2), None, 3.5), optimization_problem=mock_problem)
+        child_1_values, child_2_values = crossover_with_mask(parents=(parent_1, parent_2),
+                                                             crossover_mask=np.array(crossover_mask))
+        assert isinstance(child_1_values, OrderedDict) and isinstance(child_2_values, OrderedDict)
+        assert list(child_1_values.items()) == list(zip("xyz", child_1_output))
+        assert list(child_2_values.items()) == list(zip("xyz", child_2_output))
+
+    def test_crossover_with_mask__sequence_genes(self):
+        """Test that 'crossover_with_mask' keeps genes which are sequences (of equal length) untouched."""
+        mock_problem = Mock(decision_variables=OrderedDict(x=Mock(), y=Mock()))
+        parent_1 = Mock(values=((1, 2), (3, 4)), optimization_problem=mock_problem)
+        parent_2 = Mock(values=((5, 6), (7, 8)), optimization_problem=mock_problem)
+        child_1_values, child_2_values = crossover_with_mask(parents=(parent_1, parent_2),
+                                                             crossover_mask=np.array([True, False]))
+        assert list(child_1_values.items()) == [("x", (5, 6)), ("y", (3, 4))]
+        assert list(child_2_values.items()) == [("x", (1, 2)), ("y", (7, 8))]
+
     # check_crossover_parameters
 
     @pytest.mark.parametrize("variables_number, crossover_params", [
@@ -21,6 +83,10 @@ class TestUtilities:
         (3, {"crossover_pattern": 6}),
         (8, {"crossover_pattern": 1}),
         (8, {"crossover_pattern": 254}),
+        (3, {"crossover_distribution_index": 1}),
+        (3, {"crossover_distribution_index": 15.5}),
+        (3, {"blend_alpha": 0.}),
+        (3, {"blend_alpha": 0.5}),
     ])
     def test_check_crossover_parameters__valid(self, variables_number, crossover_params):
         """
@@ -38,6 +104,8 @@ class TestUtilities:
         (3, {"crossover_pattern": 4.3}),
         (3, {"crossover_pattern": None}),
         (100, {"crossover_points_number": [], "crossover_pattern": ()}),
+        (3, {"crossover_distribution_index": "20"}),
+        (3, {"blend_alpha": None}),
     ])
     def test_check_crossover_parameters__invalid_type(self, variables_number, crossover_params):
         """
@@ -59,6 +127,10 @@ class TestUtilities:
         (8, {"crossover_pattern": 0}),
         (8, {"crossover_pattern": 255}),
         (10, {"crossover_points_number": -1, "crossover_pattern": -1}),
+        (3, {"crossover_distribution_index": 0.5}),
+        (3, {"crossover_distribution_index": 1000}),
+        (3, {"blend_alpha": -0.1}),
+        (3, {"blend_alpha": 1.5}),
     ])
     def test_check_crossover_parameters__invalid_value(self, variables_number, crossover_params):
         """
@@ -77,132 +149,370 @@ class TestCrossoverFunctions:
     SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.crossover"
 
     def setup(self):
-        self.mock_parent_1_decision_variables_values_items = Mock()
-        self.mock_parent_2_decision_variables_values_items = Mock()
-        self.mock_parent_1_decision_variables_values = Mock(items=self.mock_parent_1_decision_variables_values_items)
-        self.mock_parent_2_decision_variables_values = Mock(items=self.mock_parent_2_decision_variables_values_items)
-        self.mock_parent_1 = Mock(decision_variables_values=self.mock_parent_1_decision_variables_values)
-        self.mock_parent_2 = Mock(decision_variables_values=self.mock_parent_2_decision_variables_values)
-        self.mock_parents = [self.mock_parent_1, self.mock_parent_2]
+        self.mock_parents = [Mock(), Mock()]
         # patching
-        self._patcher_OrderedDict = patch(f"{self.SCRIPT_LOCATION}.OrderedDict")
-        self.mock_OrderedDict = self._patcher_OrderedDict.start()
+        self._patcher_crossover_with_mask = patch(f"{self.SCRIPT_LOCATION}.crossover_with_mask")
+        self.mock_crossover_with_mask = self._patcher_crossover_with_mask.start()
         self._patcher_generate_random_int = patch(f"{self.SCRIPT_LOCATION}.generate_random_int")
         self.mock_generate_random_int = self._patcher_generate_random_int.start()
         self._patcher_choose_random_values = patch(f"{self.SCRIPT_LOCATION}.choose_random_values")
         self.mock_choose_random_values = self._patcher_choose_random_values.start()
-        self._patcher_adaptive_crossover = patch(f"{self.SCRIPT_LOCATION}.adaptive_crossover")
-        self.mock_adaptive_crossover = self._patcher_adaptive_crossover.start()
+        self._patcher_generate_random_floats_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_floats_array")
+        self.mock_generate_random_floats_array = self._patcher_generate_random_floats_array.start()
 
     def teardown(self):
+        self._patcher_crossover_with_mask.stop()
         self._patcher_generate_random_int.stop()
-        self._patcher_OrderedDict.stop()
         self._patcher_choose_random_values.stop()
-        self._patcher_adaptive_crossover.stop()
+        self._patcher_generate_random_floats_array.stop()
+
+    def assert_crossover_mask(self, expected_mask):
+        """
+        Checks that 'crossover_with_mask' was called once with parents and expected crossover mask.
+
+        :param expected_mask: Expected crossover mask.
+        """
+        self.mock_crossover_with_mask.assert_called_once()
+        call_kwargs = self.mock_crossover_with_mask.call_args[1]
+        assert call_kwargs["parents"] == self.mock_parents
+        assert call_kwargs["crossover_mask"].tolist() == expected_mask
+
+    # crossover_float_genes
+
+    def test_crossover_float_genes(self):
+        """Test that 'crossover_float_genes' uses real-valued crossover function only for float genes."""
+        decision_variables = OrderedDict(x=IntegerVariable(min_value=0, max_value=10),
+                                         y=FloatVariable(min_value=-1., max_value=1.),
+                                         z=FloatVariable(min_value=0., max_value=5.))
+        for parent, values in zip(self.mock_parents, [(1, 0.5, 2.), (2, -0.5, 4.)]):
+            parent.decision_variables_values = OrderedDict(zip("xyz", values))
+            parent.optimization_problem.decision_variables = decision_variables
+        self.mock_crossover_with_mask.return_value = OrderedDict(x=2, y=0.5, z=2.), OrderedDict(x=1, y=-0.5, z=4.)
+        self.mock_generate_random_floats_array.return_value = np.array([0.1, 0.9, 0.2])
+        mock_genes_function = Mock(return_value=(np.array([0.1, 3.]), np.array([-0.1, 3.5])))
+        child_1_values, child_2_values = crossover_float_genes(parents=self.mock_parents,
+                                                               genes_crossover_function=mock_genes_function,
+                                                               some_param=1.5)
+        assert child_1_values == OrderedDict(x=2, y=0.1, z=3.)
+        assert child_2_values == OrderedDict(x=1, y=-0.1, z=3.5)
+        self.assert_crossover_mask([True, False, True])
+        call_args, call_kwargs = mock_genes_function.call_args
+        assert call_args[0].tolist() == [0.5, 2.]
+        assert call_args[1].tolist() == [-0.5, 4.]
+        assert call_kwargs["lower_bounds"].tolist() == [-1., 0.]
+        assert call_kwargs["upper_bounds"].tolist() == [1., 5.]
+        assert call_kwargs["some_param"] == 1.5
+
+    def test_crossover_float_genes__no_float_variables(self):
+        """Test that 'crossover_float_genes' works as uniform crossover when there are no float genes."""
+        for parent in self.mock_parents:
+            parent.decision_variables_values = OrderedDict(x=1, y="a")
+            parent.optimization_problem.decision_variables = OrderedDict(x=Mock(), y=Mock())
+        self.mock_generate_random_floats_array.return_value = np.array([0.7, 0.3])
+        self.mock_crossover_with_mask.return_value = OrderedDict(x=1, y="a"), OrderedDict(x=1, y="a")
+        mock_genes_function = Mock()
+        assert crossover_float_genes(parents=self.mock_parents, genes_crossover_function=mock_genes_function) \
+            == self.mock_crossover_with_mask.return_value
+        self.assert_crossover_mask([False, True])
+        mock_genes_function.assert_not_called()
+
+    # simulated_binary_crossover, blend_alpha_crossover, arithmetic_crossover
+
+    @pytest.mark.parametrize("crossover_function, genes_function_name, crossover_params", [
+        (simulated_binary_crossover, "simulated_binary_crossover_genes", {"crossover_distribution_index": 20}),
+        (blend_alpha_crossover, "blend_alpha_crossover_genes", {"blend_alpha": 0.5}),
+        (arithmetic_crossover, "arithmetic_crossover_genes", {}),
+    ])
+    @patch(f"{SCRIPT_LOCATION}.crossover_float_genes")
+    def test_real_valued_crossover(self, mock_crossover_float_genes, crossover_function, genes_function_name,
+                                   crossover_params):
+        """
+        Test that real-valued crossover functions use 'crossover_float_genes' with proper genes function.
+
+        :param crossover_function: Real-valued crossover function to test.
+        :param genes_function_name: Name of the expected real-valued crossover function of float genes.
+        :param crossover_params: Example additional parameters of the crossover.
+        """
+        assert crossover_function(parents=self.mock_parents, variables_number=5, **crossover_params) \
+            == mock_crossover_float_genes.return_value
+        mock_crossover_float_genes.assert_called_once_with(
+            parents=self.mock_parents, genes_crossover_function=globals()[genes_function_name], **crossover_params)
 
     # single_point_crossover
 
-    @pytest.mark.parametrize("output", [("child 1 data set", "child 2 data set"), ("12345", "54321")])
-    @pytest.mark.parametrize("variables_number, crossover_point, parent_1_data_list, parent_2_data_list", [
-        (5, 1, [1, 2, 3, 4, 5], [6, 7, 8, 9, 10]),
-        (5, 2, [1, 2, 3, 4, 5], [6, 7, 8, 9, 10]),
-        (5, 4, [1, 2, 3, 4, 5], [6, 7, 8, 9, 10]),
-        (3, 1, ["a", "b", "c"], ["x", "y", "z"]),
-        (3, 2, ["a", "b", "c"], ["x", "y", "z"]),
+    @pytest.mark.parametrize("variables_number, crossover_point, expected_mask", [
+        (5, 1, [False, True, True, True, True]),
+        (5, 2, [False, False, True, True, True]),
+        (5, 4, [False, False, False, False, True]),
+        (3, 1, [False, True, True]),
+        (2, 1, [False, True]),
     ])
-    def test_single_point_crossover(self, variables_number, crossover_point, parent_1_data_list, parent_2_data_list,
-                                    output):
+    def test_single_point_crossover(self, variables_number, crossover_point, expected_mask):
         """
         Test for 'single_point_crossover' function.
 
         :param variables_number: Example value of 'variables_number'.
         :param crossover_point: Simulated value of crossover point.
-        :param parent_1_data_list: Simulated value of parents decision variables values.
-        :param parent_2_data_list: Simulated value of parents decision variables values.
-        :param output: Simulated output.
+        :param expected_mask: Expected crossover mask.
         """
         self.mock_generate_random_int.return_value = crossover_point
-        self.mock_parent_1_decision_variables_values_items.return_value = parent_1_data_list
-        self.mock_parent_2_decision_variables_values_items.return_value = parent_2_data_list
-        self.mock_OrderedDict.side_effect = output
-        assert output == single_point_crossover(parents=self.mock_parents, variables_number=variables_number)
+        assert single_point_crossover(parents=self.mock_parents, variables_number=variables_number) \
+            == self.mock_crossover_with_mask.return_value
         self.mock_generate_random_int.assert_called_once_with(1, variables_number-1)
-        self.mock_OrderedDict.assert_has_calls([
-            call(parent_1_data_list[:crossover_point] + parent_2_data_list[crossover_point:]),
-            call(parent_2_data_list[:crossover_point] + parent_1_data_list[crossover_point:])
-        ])
+        self.assert_crossover_mask(expected_mask)
 
     # multi_point_crossover
 
-    @pytest.mark.parametrize("variables_number, crossover_points, parent_1_data_list, parent_2_data_list, child1_snips, child2_snips", [
-        (5, [1], [1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [[1], [7, 8, 9, 10]], [[6], [2, 3, 4, 5]]),
-        (5, [1, 4], [1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [[1], [7, 8, 9], [5]], [[6], [2, 3, 4], [10]]),
-        (5, [2, 3], [1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [[1, 2], [8], [4, 5]], [[6, 7], [3], [9, 10]]),
-        (3, [1], ["a", "b", "c"], ["x", "y", "z"], [["a"], ["y", "z"]], [["x"], ["b", "c"]]),
-        (3, [1, 2], ["a", "b", "c"], ["x", "y", "z"], [["a"], ["y"], ["c"]], [["x"], ["b"], ["z"]]),
+    @pytest.mark.parametrize("variables_number, crossover_points, expected_mask", [
+        (5, [1, 4], [False, True, True, True, False]),
+        (5, [2, 3], [False, False, True, False, False]),
+        (5, [3, 2], [False, False, True, False, False]),
+        (5, [1, 2, 3], [False, True, False, True, True]),
+        (3, [1, 2], [False, True, False]),
     ])
-    def test_multi_point_crossover(self, variables_number, crossover_points, parent_1_data_list, parent_2_data_list,
-                                   child1_snips, child2_snips):
+    def test_multi_point_crossover(self, variables_number, crossover_points, expected_mask):
         """
         Test for 'multi_point_crossover' function.
 
         :param variables_number: Example value of 'variables_number'.
         :param crossover_points: Simulated values of returned crossover points.
-        :param parent_1_data_list: Simulated value of parents decision variables values.
-        :param parent_2_data_list: Simulated value of parents decision variables values.
+        :param expected_mask: Expected crossover mask.
         """
         crossover_points_number = len(crossover_points)
         self.mock_choose_random_values.return_value = crossover_points
-        self.mock_parent_1_decision_variables_values_items.return_value = parent_1_data_list
-        self.mock_parent_2_decision_variables_values_items.return_value = parent_2_data_list
-        mock_child1 = Mock()
-        mock_child2 = Mock()
-        self.mock_OrderedDict.side_effect = [mock_child1, mock_child2]
-        assert (mock_child1, mock_child2) == multi_point_crossover(parents=self.mock_parents,
-                                                                   variables_number=variables_number,
-                                                                   crossover_points_number=crossover_points_number)
+        assert multi_point_crossover(parents=self.mock_parents, variables_number=variables_number,
+                                     crossover_points_number=crossover_points_number) \
+            == self.mock_crossover_with_mask.return_value
         self.mock_choose_random_values.assert_called_once_with(values_pool=range(1, variables_number),
                                                                values_number=crossover_points_number)
-        self.mock_OrderedDict.assert_has_calls([call(child1_snips[0]), call(child2_snips[0])])
-        mock_child1.update.assert_has_calls([call(snip) for snip in child1_snips[1:]])
-        mock_child2.update.assert_has_calls([call(snip) for snip in child2_snips[1:]])
+        self.assert_crossover_mask(expected_mask)
 
     # adaptive_crossover
 
-    @pytest.mark.parametrize("variables_number, crossover_pattern, parent_1_data_list, parent_2_data_list, child_1_output, child_2_output", [
-        (5, 0b00000, [1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [1, 2, 3, 4, 5], [6, 7, 8, 9, 10]),
-        (5, 0b11111, [1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [6, 7, 8, 9, 10], [1, 2, 3, 4, 5]),
-        (5, 0b01101, [1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [6, 2, 8, 9, 5], [1, 7, 3, 4, 10]),
-        (3, 0b101, ["a", "b", "c"], ["x", "y", "z"], "xbz", "ayc"),
-        (3, 0b010, ["a", "b", "c"], ["x", "y", "z"], "ayc", "xbz"),
+    @pytest.mark.parametrize("variables_number, crossover_pattern, expected_mask", [
+        (5, 0b00001, [True, False, False, False, False]),
+        (5, 0b01101, [True, False, True, True, False]),
+        (3, 0b101, [True, False, True]),
+        (3, 0b010, [False, True, False]),
     ])
-    def test_adaptive_crossover(self, variables_number, crossover_pattern, parent_1_data_list,
-                                parent_2_data_list, child_1_output, child_2_output):
-        self.mock_parent_1_decision_variables_values_items.return_value = parent_1_data_list
-        self.mock_parent_2_decision_variables_values_items.return_value = parent_2_data_list
-        mock_child1 = Mock()
-        mock_child2 = Mock()
-        self.mock_OrderedDict.side_effect = [mock_child1, mock_child2]
-        assert (mock_child1, mock_child2) == adaptive_crossover(parents=self.mock_parents,
-                                                                variables_number=variables_number,
-                                                                crossover_pattern=crossover_pattern)
-        self.mock_OrderedDict.assert_has_calls([call(), call()])
-        mock_child1.update.assert_has_calls([call([snip]) for snip in child_1_output])
-        mock_child2.update.assert_has_calls([call([snip]) for snip in child_2_output])
+    def test_adaptive_crossover(self, variables_number, crossover_pattern, expected_mask):
+        """
+        Test for 'adaptive_crossover' function.
+
+        :param variables_number: Example value of 'variables_number'.
+        :param crossover_pattern: Example value of 'crossover_pattern'.
+        :param expected_mask: Expected crossover mask.
+        """
+        assert adaptive_crossover(parents=self.mock_parents, variables_number=variables_number,
+                                  crossover_pattern=crossover_pattern) == self.mock_crossover_with_mask.return_value
+        self.assert_crossover_mask(expected_mask)
 
     # uniform_crossover
 
-    @pytest.mark.parametrize("variables_number, max_pattern_value", [(1, 1), (2, 3), (3, 7), (8, 255)])
-    def test_uniform_crossover(self, variables_number, max_pattern_value):
+    @pytest.mark.parametrize("random_values, expected_mask", [
+        ([0.5], [False]),
+        ([0.1, 0.9, 0.4999], [True, False, True]),
+    ])
+    def test_uniform_crossover(self, random_values, expected_mask):
         """
         Test for 'uniform_crossover' function.
 
+        :param random_values: Values to simulate random floats.
+        :param expected_mask: Expected crossover mask.
+        """
+        self.mock_generate_random_floats_array.return_value = np.array(random_values)
+        assert uniform_crossover(parents=self.mock_parents, variables_number=len(random_values)) \
+            == self.mock_crossover_with_mask.return_value
+        self.mock_generate_random_floats_array.assert_called_once_with(size=len(random_values))
+        self.assert_crossover_mask(expected_mask)
+
+
+class TestCrossoverMaskFunctions:
+    """Tests for crossover masks functions."""
+
+    SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.crossover"
+
+    def setup(self):
+        self._patcher_generate_random_ints_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_ints_array")
+        self.mock_generate_random_ints_array = self._patcher_generate_random_ints_array.start()
+        self._patcher_generate_random_floats_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_floats_array")
+        self.mock_generate_random_floats_array = self._patcher_generate_random_floats_array.start()
+
+    def teardown(self):
+        self._patcher_generate_random_ints_array.stop()
+        self._patcher_generate_random_floats_array.stop()
+
+    # single_point_crossover_mask
+
+    @pytest.mark.parametrize("variables_number, crossover_points, expected_mask", [
+        (3, [[1], [2]], [[False, True, True], [False, False, True]]),
+        (5, [[4]], [[False, False, False, False, True]]),
+    ])
+    def test_single_point_crossover_mask(self, variables_number, crossover_points, expected_mask):
+        """
+        Test for 'single_point_crossover_mask' function.
+
+        :param variables_number: Example value of 'variables_number'.
+        :param crossover_points: Values to simulate randomly chosen crossover points.
+        :param expected_mask: Expected crossover masks.
+        """
+        self.mock_generate_random_ints_array.return_value = np.array(crossover_points)
+        mask = single_point_crossover_mask(pairs_number=len(crossover_points), variables_number=variables_number)
+        assert mask.tolist() == expected_mask
+        self.mock_generate_random_ints_array.assert_called_once_with(1, variables_number - 1,
+                                                                     size=(len(crossover_points), 1))
+
+    # multi_point_crossover_mask
+
+    @pytest.mark.parametrize("random_values, crossover_points_number, expected_mask", [
+        ([[0.9, 0.1, 0.5, 0.7]], 2, [[False, False, True, False, False]]),
+        ([[0.1, 0.2, 0.3, 0.4]], 3, [[False, True, False, True, True]]),
+        ([[0.4, 0.3, 0.2, 0.1], [0.1, 0.9, 0.2, 0.8]], 2,
+         [[False, False, False, True, False], [False, True, True, False, False]]),
+    ])
+    def test_multi_point_crossover_mask(self, random_values, crossover_points_number, expected_mask):
+        """
+        Test for 'multi_point_crossover_mask' function.
+
+        :param random_values: Values to simulate random floats (used to choose crossover points).
+        :param crossover_points_number: Example value of 'crossover_points_number'.
+        :param expected_mask: Expected crossover masks.
+        """
+        self.mock_generate_random_floats_array.return_value = np.array(random_values)
+        mask = multi_point_crossover_mask(pairs_number=len(random_values), variables_number=5,
+                                          crossover_points_number=crossover_points_number)
+        assert mask.tolist() == expected_mask
+        self.mock_generate_random_floats_array.assert_called_once_with(size=(len(random_values), 4))
+
+    # adaptive_crossover_mask
+
+    @pytest.mark.parametrize("pairs_number", [1, 3])
+    @pytest.mark.parametrize("variables_number, crossover_pattern, expected_row", [
+        (3, 1, [True, False, False]),
+        (4, 6, [False, True, True, False]),
+        (70, 1 << 69, [False] * 69 + [True]),
+    ])
+    def test_adaptive_crossover_mask(self, pairs_number, variables_number, crossover_pattern, expected_row):
+        """
+        Test for 'adaptive_crossover_mask' function.
+
+        :param pairs_number: Example value of 'pairs_number'.
         :param variables_number: Example value of 'variables_number'.
-        :param max_pattern_value: Maximal number of pattern for given number of decision variables.
-        """
-        assert uniform_crossover(parents=self.mock_parents, variables_number=variables_number) \
-            == self.mock_adaptive_crossover.return_value
-        self.mock_generate_random_int.assert_called_once_with(0, max_pattern_value)
-        self.mock_adaptive_crossover.aasert_called_once_with(parents=self.mock_parents,
-                                                             variables_number=variables_number,
-                                                             crossover_pattern=self.mock_generate_random_int.return_value)
+        :param crossover_pattern: Example value of 'crossover_pattern'.
+        :param expected_row: Expected crossover mask of each pair.
+        """
+        mask = adaptive_crossover_mask(pairs_number=pairs_number, variables_number=variables_number,
+                                       crossover_pattern=crossover_pattern)
+        assert mask.tolist() == [expected_row] * pairs_number
+
+    # uniform_crossover_mask
+
+    def test_uniform_crossover_mask(self):
+        """Test for 'uniform_crossover_mask' function."""
+        self.mock_generate_random_floats_array.return_value = np.array([[0.1, 0.5, 0.7], [0.4999, 0.9, 0.]])
+        mask = uniform_crossover_mask(pairs_number=2, variables_number=3)
+        assert mask.tolist() == [[True, False, False], [True, False, True]]
+        self.mock_generate_random_floats_array.assert_called_once_with(size=(2, 3))
+
+    # real_valued_crossover_mask
+
+    def test_real_valued_crossover_mask(self):
+        """Test that 'real_valued_crossover_mask' creates uniform crossover masks."""
+        self.mock_generate_random_floats_array.return_value = np.array([[0.1, 0.5, 0.7]])
+        mask = real_valued_crossover_mask(pairs_number=1, variables_number=3, blend_alpha=0.3)
+        assert mask.tolist() == [[True, False, False]]
+        self.mock_generate_random_floats_array.assert_called_once_with(size=(1, 3))
+
+
+class TestRealValuedCrossoverGenesFunctions:
+    """Tests for real-valued crossover functions of float genes."""
+
+    SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.crossover"
+
+    def setup(self):
+        self.parents_1_genes = np.array([[0., 1.], [2., -1.]])
+        self.parents_2_genes = np.array([[1., 1.], [-2., 3.]])
+        self.lower_bounds = np.array([-3., -1.])
+        self.upper_bounds = np.array([3., 2.])
+        # patching
+        self._patcher_generate_random_floats_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_floats_array")
+        self.mock_generate_random_floats_array = self._patcher_generate_random_floats_array.start()
+
+    def teardown(self):
+        self._patcher_generate_random_floats_array.stop()
+
+    # simulated_binary_crossover_genes
+
+    @pytest.mark.parametrize("crossover_distribution_index", [1, 2., 20])
+    def test_simulated_binary_crossover_genes__no_spread(self, crossover_distribution_index):
+        """
+        Test that 'simulated_binary_crossover_genes' returns copies of parents genes when spread factor equals 1.
+
+        :param crossover_distribution_index: Example value of 'crossover_distribution_index'.
+        """
+        self.mock_generate_random_floats_array.return_value = np.array([np.full((2, 2), 0.5),
+                                                                        [[0.5, 0.9], [0.1, 0.7]]])
+        children_1_genes, children_2_genes = simulated_binary_crossover_genes(
+            self.parents_1_genes, self.parents_2_genes, lower_bounds=self.lower_bounds,
+            upper_bounds=self.upper_bounds, crossover_distribution_index=crossover_distribution_index)
+        assert children_1_genes.tolist() == [[0., 1.], [-2., -1.]]
+        assert children_2_genes.tolist() == [[1., 1.], [2., 2.]]
+        self.mock_generate_random_floats_array.assert_called_once_with(size=(2, 2, 2))
+
+    def test_simulated_binary_crossover_genes__spread(self):
+        """Test that 'simulated_binary_crossover_genes' spreads children genes around parents genes."""
+        self.mock_generate_random_floats_array.return_value = np.array([[[0.125, 0.], [0.75, 0.875]],
+                                                                        [[0.5, 0.5], [0.5, 0.5]]])
+        children_1_genes, children_2_genes = simulated_binary_crossover_genes(
+            self.parents_1_genes, self.parents_2_genes, lower_bounds=self.lower_bounds,
+            upper_bounds=self.upper_bounds, crossover_distribution_index=1)
+        # spread factors: 0.5, 0, sqrt(2), 2
+        assert np.allclose(children_1_genes, [[0.25, 1.], [2 * 2 ** 0.5, -1.]])
+        assert np.allclose(children_2_genes, [[0.75, 1.], [-2 * 2 ** 0.5, 2.]])
+
+    # blend_alpha_crossover_genes
+
+    def test_blend_alpha_crossover_genes(self):
+        """Test that 'blend_alpha_crossover_genes' draws children genes from extended parents genes interval."""
+        self.mock_generate_random_floats_array.return_value = np.array([[[0., 1.], [0.5, 0.25]],
+                                                                        [[1., 0.5], [0., 0.]]])
+        children_1_genes, children_2_genes = blend_alpha_crossover_genes(
+            self.parents_1_genes, self.parents_2_genes, lower_bounds=self.lower_bounds,
+            upper_bounds=self.upper_bounds, blend_alpha=0.5)
+        # intervals: [-0.5, 1.5], [1, 1], [-4, 4], [-3, 5]
+        assert children_1_genes.tolist() == [[-0.5, 1.], [0., -1.]]
+        assert children_2_genes.tolist() == [[1.5, 1.], [-3., -1.]]
+        self.mock_generate_random_floats_array.assert_called_once_with(size=(2, 2, 2))
+
+    # arithmetic_crossover_genes
+
+    def test_arithmetic_crossover_genes(self):
+        """Test that 'arithmetic_crossover_genes' creates weighted averages of parents genes."""
+        self.mock_generate_random_floats_array.return_value = np.array([[0.25], [0.5]])
+        children_1_genes, children_2_genes = arithmetic_crossover_genes(
+            self.parents_1_genes, self.parents_2_genes, lower_bounds=self.lower_bounds,
+            upper_bounds=self.upper_bounds)
+        assert children_1_genes.tolist() == [[0.25, 1.], [0., 1.]]
+        assert children_2_genes.tolist() == [[0.75, 1.], [0., 1.]]
+        self.mock_generate_random_floats_array.assert_called_once_with(size=(2, 1))
+
+    @pytest.mark.parametrize("crossover_function, crossover_params", [
+        (simulated_binary_crossover_genes, {"crossover_distribution_index": 1}),
+        (blend_alpha_crossover_genes, {"blend_alpha": 1.}),
+        (arithmetic_crossover_genes, {}),
+    ])
+    def test_genes_within_bounds(self, crossover_function, crossover_params):
+        """
+        Test that children genes created by real-valued crossover functions are within bounds.
+
+        :param crossover_function: Real-valued crossover function of float genes to test.
+        :param crossover_params: Example additional parameters of the crossover.
+        """
+        self._patcher_generate_random_floats_array.stop()
+        parents_1_genes = np.random.uniform(self.lower_bounds, self.upper_bounds, size=(100, 2))
+        parents_2_genes = np.random.uniform(self.lower_bounds, self.upper_bounds, size=(100, 2))
+        for children_genes in crossover_function(parents_1_genes, parents_2_genes, lower_bounds=self.lower_bounds,
+                                                 upper_bounds=self.upper_bounds, **crossover_params):
+            assert children_genes.shape == (100, 2)
+            assert (children_genes >= self.lower_bounds).all() and (children_genes <= self.upper_bounds).all()
+        self._patcher_generate_random_floats_array.start()
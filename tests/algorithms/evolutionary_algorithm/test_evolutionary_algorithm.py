@@ -4,8 +4,12 @@ from mock import Mock, patch, call
 from collections import OrderedDict
 from copy import deepcopy
 
+import numpy as np
+
 from optimization.algorithms.evolutionary_algorithm.evolutionary_algorithm import EvolutionaryAlgorithm, \
-    SelectionType, CrossoverType, MutationType, AbstractLogger, StopConditions, OptimizationProblem
+    SelectionType, CrossoverType, MutationType, AbstractLogger, StopConditions, OptimizationProblem, FloatVariable, \
+    InitializationType, OptimizationType
+from optimization.problem import IntegerVariable
 
 
 class TestEvolutionaryAlgorithm:
@@ -27,20 +31,30 @@ class TestEvolutionaryAlgorithm:
         self.mock_check_init_input = Mock()
         self.mock_check_additional_parameters = Mock()
         self.mock_perform_selection = Mock()
+        self.mock_perform_batch_selection = Mock()
         self.mock_perform_crossover = Mock()
         self.mock_perform_mutation = Mock()
         self.mock_generate_random_population = Mock()
         self.mock_evolution_iteration = Mock()
+        self.mock_array_evolution_iteration = Mock()
         self.mock_log_iteration = Mock()
+        self.mock_get_population = Mock(side_effect=lambda: self.mock_evolutionary_algorithm_object._population)
         self.mock_evolutionary_algorithm_object = Mock(spec=EvolutionaryAlgorithm,
                                                        _check_init_input=self.mock_check_init_input,
                                                        _check_additional_parameters=self.mock_check_additional_parameters,
                                                        _perform_selection=self.mock_perform_selection,
+                                                       _perform_batch_selection=self.mock_perform_batch_selection,
                                                        _perform_crossover=self.mock_perform_crossover,
                                                        _perform_mutation=self.mock_perform_mutation,
                                                        _generate_random_population=self.mock_generate_random_population,
                                                        _evolution_iteration=self.mock_evolution_iteration,
-                                                       _log_iteration=self.mock_log_iteration)
+                                                       _array_evolution_iteration=self.mock_array_evolution_iteration,
+                                                       _log_iteration=self.mock_log_iteration,
+                                                       _get_population=self.mock_get_population,
+                                                       array_population=False,
+                                                       initialization_type=InitializationType.Uniform.value,
+                                                       crossover_genes_function=None,
+                                                       mutation_genes_function=None)
         # patching
         self._patcher_abstract_algorithm_init = patch(f"{self.SCRIPT_LOCATION}.AbstractOptimizationAlgorithm.__init__")
         self.mock_abstract_algorithm_class_init = self._patcher_abstract_algorithm_init.start()
@@ -99,10 +113,11 @@ class TestEvolutionaryAlgorithm:
                                        crossover_type=crossover_type, mutation_type=mutation_type,
                                        **selection_args, **crossover_args, **mutation_args)
         self.mock_check_init_input.assert_called_once_with(population_size=population_size,
-                                                           mutation_chance=mutation_chance, apply_elitism=apply_elitism)
+                                                           mutation_chance=mutation_chance, apply_elitism=apply_elitism,
+                                                           array_population=False, problem=self.mock_problem)
         self.mock_abstract_algorithm_class_init.assert_called_once_with(problem=self.mock_problem,
                                                                         stop_conditions=self.mock_stop_conditions,
-                                                                        logger=logger)
+                                                                        logger=logger, evaluator=None, random_source=None)
         self.mock_check_additional_parameters.assert_called_once_with()
         assert self.mock_evolutionary_algorithm_object.population_size == population_size
         assert self.mock_evolutionary_algorithm_object.mutation_chance == mutation_chance
@@ -116,6 +131,27 @@ class TestEvolutionaryAlgorithm:
         assert callable(self.mock_evolutionary_algorithm_object.selection_function)
         assert callable(self.mock_evolutionary_algorithm_object.crossover_function)
         assert callable(self.mock_evolutionary_algorithm_object.mutation_function)
+        assert callable(self.mock_evolutionary_algorithm_object.batch_selection_function)
+        assert callable(self.mock_evolutionary_algorithm_object.crossover_mask_function)
+        assert callable(self.mock_evolutionary_algorithm_object.mutation_mask_function)
+        assert self.mock_evolutionary_algorithm_object.array_population is False
+        assert self.mock_evolutionary_algorithm_object._array_population is None
+        assert self.mock_evolutionary_algorithm_object.initialization_type == InitializationType.Uniform.value
+
+    @pytest.mark.parametrize("initialization_type", [InitializationType.LatinHypercube, "Halton"])
+    def test_init__initialization_type(self, initialization_type):
+        """
+        Test initialization of 'EvolutionaryAlgorithm' class with 'initialization_type' parameter.
+
+        :param initialization_type: Example value of 'initialization_type' parameter.
+        """
+        EvolutionaryAlgorithm.__init__(self_ea=self.mock_evolutionary_algorithm_object,
+                                       problem=self.mock_problem, stop_conditions=self.mock_stop_conditions,
+                                       population_size=10, apply_elitism=True, mutation_chance=0.1,
+                                       selection_type=SelectionType.Uniform, crossover_type=CrossoverType.SinglePoint,
+                                       mutation_type=MutationType.SinglePoint, initialization_type=initialization_type)
+        assert self.mock_evolutionary_algorithm_object.initialization_type \
+            == InitializationType(initialization_type).value
 
     @pytest.mark.parametrize("selection_type, selection_args", [
         (SelectionType.Uniform, {}),
@@ -289,6 +325,49 @@ class TestEvolutionaryAlgorithm:
                                                     population_size=population_size, mutation_chance=mutation_chance,
                                                     apply_elitism=apply_elitism)
 
+    @pytest.mark.parametrize("array_population", [None, 1, "True"])
+    def test_check_init_input__invalid_type_array_population(self, array_population):
+        """
+        Test that '_check_init_input' raises TypeError when 'array_population' is not bool type.
+
+        :param array_population: Example value of 'array_population' parameter.
+        """
+        self.mock_evolutionary_algorithm_object.MIN_POPULATION_SIZE = 10
+        self.mock_evolutionary_algorithm_object.MAX_POPULATION_SIZE = 1000
+        self.mock_evolutionary_algorithm_object.MIN_MUTATION_CHANCE = 0.
+        self.mock_evolutionary_algorithm_object.MAX_MUTATION_CHANCE = 1.
+        with pytest.raises(TypeError):
+            EvolutionaryAlgorithm._check_init_input(self=self.mock_evolutionary_algorithm_object,
+                                                    population_size=100, mutation_chance=0.1, apply_elitism=True,
+                                                    array_population=array_population)
+
+    @pytest.mark.parametrize("min_value, max_value", [
+        (10 ** 18, 10 ** 18 + 10),
+        (-2 ** 70, 0),
+    ])
+    def test_check_init_input__inexact_array_population(self, min_value, max_value):
+        """
+        Test that '_check_init_input' raises ValueError when 'array_population' is True and values of some integer
+        decision variable cannot be exactly stored in arrays.
+
+        :param min_value: Example minimal value of integer decision variable.
+        :param max_value: Example maximal value of integer decision variable.
+        """
+        self.mock_evolutionary_algorithm_object.MIN_POPULATION_SIZE = 10
+        self.mock_evolutionary_algorithm_object.MAX_POPULATION_SIZE = 1000
+        self.mock_evolutionary_algorithm_object.MIN_MUTATION_CHANCE = 0.
+        self.mock_evolutionary_algorithm_object.MAX_MUTATION_CHANCE = 1.
+        problem = OptimizationProblem(decision_variables=OrderedDict(x=IntegerVariable(min_value, max_value)),
+                                      constraints={}, penalty_function=lambda: 0,
+                                      objective_function=lambda x: x, optimization_type=OptimizationType.Maximize)
+        EvolutionaryAlgorithm._check_init_input(self=self.mock_evolutionary_algorithm_object,
+                                                population_size=100, mutation_chance=0.1, apply_elitism=True,
+                                                array_population=False, problem=problem)
+        with pytest.raises(ValueError):
+            EvolutionaryAlgorithm._check_init_input(self=self.mock_evolutionary_algorithm_object,
+                                                    population_size=100, mutation_chance=0.1, apply_elitism=True,
+                                                    array_population=True, problem=problem)
+
     # _check_additional_parameters
 
     @pytest.mark.parametrize("variables_number", [5, 9])
@@ -349,6 +428,45 @@ class TestEvolutionaryAlgorithm:
         self.mock_evolutionary_algorithm_object._population = population
         EvolutionaryAlgorithm._log_iteration(self=self.mock_evolutionary_algorithm_object, iteration_index=index)
         logger_mock.log_iteration.assert_called_once_with(iteration=index, solutions=population)
+        self.mock_get_population.assert_called_once_with()
+
+    # _get_population
+
+    @pytest.mark.parametrize("array_population", [True, False])
+    def test_get_population(self, array_population):
+        """
+        Test '_get_population' returns current solutions if they exist.
+
+        :param array_population: Example value of 'array_population' attribute.
+        """
+        population = [Mock(), Mock()]
+        mock_array_population = Mock()
+        self.mock_evolutionary_algorithm_object.array_population = array_population
+        self.mock_evolutionary_algorithm_object._array_population = mock_array_population
+        self.mock_evolutionary_algorithm_object._population = population
+        assert EvolutionaryAlgorithm._get_population(self=self.mock_evolutionary_algorithm_object) is population
+        mock_array_population.to_solutions.assert_not_called()
+
+    def test_get_population__array_population(self):
+        """Test '_get_population' creates solutions of array population only when they do not exist."""
+        mock_array_population = Mock()
+        mock_array_population.to_solutions.return_value = [Mock(), Mock()]
+        self.mock_evolutionary_algorithm_object.array_population = True
+        self.mock_evolutionary_algorithm_object._array_population = mock_array_population
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock()
+        self.mock_evolutionary_algorithm_object._population = []
+        assert EvolutionaryAlgorithm._get_population(self=self.mock_evolutionary_algorithm_object) \
+            == mock_array_population.to_solutions.return_value
+        mock_array_population.to_solutions.assert_called_once_with(
+            self.mock_evolutionary_algorithm_object.SolutionClass)
+        assert self.mock_evolutionary_algorithm_object._population == mock_array_population.to_solutions.return_value
+
+    def test_get_population__no_array_population(self):
+        """Test '_get_population' returns empty population when array population was not created yet."""
+        self.mock_evolutionary_algorithm_object.array_population = True
+        self.mock_evolutionary_algorithm_object._array_population = None
+        self.mock_evolutionary_algorithm_object._population = []
+        assert EvolutionaryAlgorithm._get_population(self=self.mock_evolutionary_algorithm_object) == []
 
     # _generate_random_population
 
@@ -363,13 +481,64 @@ class TestEvolutionaryAlgorithm:
         :param population_size:
         :param solutions:
         """
+        values = [Mock() for _ in solutions]
         self.mock_evolutionary_algorithm_object._population = []
         self.mock_evolutionary_algorithm_object.population_size = population_size
-        self.mock_evolutionary_algorithm_object.SolutionClass = Mock(side_effect=solutions)
-        EvolutionaryAlgorithm._generate_random_population(self=self.mock_evolutionary_algorithm_object)
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock(from_trusted_values=Mock(side_effect=solutions))
+        with patch(f"{self.SCRIPT_LOCATION}.generate_initial_values", return_value=values) \
+                as mock_generate_initial_values:
+            EvolutionaryAlgorithm._generate_random_population(self=self.mock_evolutionary_algorithm_object)
+        mock_generate_initial_values.assert_called_once_with(
+            decision_variables=self.decision_variables, values_number=population_size,
+            initialization_type=self.mock_evolutionary_algorithm_object.initialization_type)
         assert len(self.mock_evolutionary_algorithm_object._population) == population_size
         assert self.mock_evolutionary_algorithm_object._population == solutions
-        self.mock_evolutionary_algorithm_object.SolutionClass.assert_has_calls([call() for _ in solutions])
+        self.mock_evolutionary_algorithm_object.SolutionClass.from_trusted_values.assert_has_calls(
+            [call(individual_values) for individual_values in values])
+        self.mock_evolutionary_algorithm_object._evaluate_solutions.assert_called_once_with(solutions)
+
+    def test_generate_random_population__initial_population(self):
+        """Test '_generate_random_population' creates only missing solutions when initial population is provided."""
+        initial_population = [Mock(), Mock()]
+        solutions = [Mock(), Mock()]
+        self.mock_evolutionary_algorithm_object._population = list(initial_population)
+        self.mock_evolutionary_algorithm_object.population_size = 4
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock(from_trusted_values=Mock(side_effect=solutions))
+        with patch(f"{self.SCRIPT_LOCATION}.generate_initial_values", return_value=[Mock(), Mock()]) \
+                as mock_generate_initial_values:
+            EvolutionaryAlgorithm._generate_random_population(self=self.mock_evolutionary_algorithm_object)
+        assert mock_generate_initial_values.call_args[1]["values_number"] == 2
+        assert self.mock_evolutionary_algorithm_object._population == initial_population + solutions
+
+    @pytest.mark.parametrize("genes_encoding", [None, Mock()])
+    def test_generate_random_population__array_population(self, genes_encoding):
+        """
+        Test '_generate_random_population' creates array population when 'array_population' is set.
+
+        :param genes_encoding: Example value of '_genes_encoding' attribute.
+        """
+        solutions = [Mock(), Mock()]
+        self.mock_evolutionary_algorithm_object._population = []
+        self.mock_evolutionary_algorithm_object.population_size = 2
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock(from_trusted_values=Mock(side_effect=solutions))
+        self.mock_evolutionary_algorithm_object.array_population = True
+        self.mock_evolutionary_algorithm_object._genes_encoding = genes_encoding
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        with patch(f"{self.SCRIPT_LOCATION}.GenesEncoding") as mock_genes_encoding_class, \
+                patch(f"{self.SCRIPT_LOCATION}.ArrayPopulation") as mock_array_population_class, \
+                patch(f"{self.SCRIPT_LOCATION}.generate_initial_values", return_value=[Mock(), Mock()]):
+            EvolutionaryAlgorithm._generate_random_population(self=self.mock_evolutionary_algorithm_object)
+        if genes_encoding is None:
+            mock_genes_encoding_class.assert_called_once_with(self.mock_problem)
+            genes_encoding = mock_genes_encoding_class.return_value
+        else:
+            mock_genes_encoding_class.assert_not_called()
+        mock_array_population_class.from_solutions.assert_called_once_with(encoding=genes_encoding,
+                                                                           solutions=solutions)
+        assert self.mock_evolutionary_algorithm_object._array_population \
+            == mock_array_population_class.from_solutions.return_value
 
     # perform_selection
 
@@ -395,6 +564,29 @@ class TestEvolutionaryAlgorithm:
         mock_selection_function.assert_called_once_with(population_size=population_size, population=population,
                                                         **selection_params)
 
+    # _perform_batch_selection
+
+    @pytest.mark.parametrize("population_size", [2, 100])
+    @pytest.mark.parametrize("selection_params", [{}, {"tournament_group_size": 3}])
+    def test_perform_batch_selection(self, population_size, selection_params):
+        """
+        Test '_perform_batch_selection' uses 'batch_selection_function' and fitness of array population.
+
+        :param population_size: Example value of 'population_size' attribute.
+        :param selection_params: Example value of 'selection_params' attribute.
+        """
+        mock_batch_selection_function = Mock()
+        mock_array_population = Mock()
+        self.mock_evolutionary_algorithm_object.batch_selection_function = mock_batch_selection_function
+        self.mock_evolutionary_algorithm_object.population_size = population_size
+        self.mock_evolutionary_algorithm_object._array_population = mock_array_population
+        self.mock_evolutionary_algorithm_object.selection_params = selection_params
+        assert EvolutionaryAlgorithm._perform_batch_selection(self=self.mock_evolutionary_algorithm_object) \
+            == mock_batch_selection_function.return_value
+        mock_batch_selection_function.assert_called_once_with(population_size=population_size,
+                                                              fitness=mock_array_population.fitness,
+                                                              **selection_params)
+
     # _perform_crossover
 
     @pytest.mark.parametrize("parents", ["abc", (1, 2)])
@@ -464,6 +656,27 @@ class TestEvolutionaryAlgorithm:
         # reset value as it mutate during test
         individual_values.update(individual_values_before_mutation)
 
+    def test_perform_mutation__genes_function(self):
+        """Test '_perform_mutation' uses 'mutation_genes_function' for float decision variables."""
+        self.decision_variables["var2"] = FloatVariable(min_value=-1., max_value=1.)
+        self.decision_variables["var3"] = FloatVariable(min_value=0., max_value=5.)
+        mock_mutation_genes_function = Mock(return_value=np.array([0.5, 4.5]))
+        individual_values = OrderedDict(var1=1, var2=0., var3=2.)
+        self.mock_evolutionary_algorithm_object.mutation_function = Mock(return_value=[0, 1, 2])
+        self.mock_evolutionary_algorithm_object.mutation_genes_function = mock_mutation_genes_function
+        self.mock_evolutionary_algorithm_object.mutation_chance = 0.1
+        self.mock_evolutionary_algorithm_object.mutation_params = {"mutation_sigma": 0.2}
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        EvolutionaryAlgorithm._perform_mutation(self=self.mock_evolutionary_algorithm_object,
+                                                individual_values=individual_values)
+        assert individual_values == OrderedDict(var1=self.mock_decision_variable_1_generate_random_value.return_value,
+                                                var2=0.5, var3=4.5)
+        call_args, call_kwargs = mock_mutation_genes_function.call_args
+        assert call_args[0].tolist() == [0., 2.]
+        assert call_kwargs["lower_bounds"].tolist() == [-1., 0.]
+        assert call_kwargs["upper_bounds"].tolist() == [1., 5.]
+        assert call_kwargs["mutation_sigma"] == 0.2
+
     # _evolution_iteration
 
     @pytest.mark.parametrize("selected_parents, children_after_crossover, children", [
@@ -478,7 +691,7 @@ class TestEvolutionaryAlgorithm:
         :param children_after_crossover: Values to simulate children values after crossover.
         :param children: Values to simulate children in new population.
         """
-        mock_solution_class = Mock(side_effect=children)
+        mock_solution_class = Mock(from_trusted_values=Mock(side_effect=children))
         self.mock_perform_selection.return_value = selected_parents
         self.mock_perform_crossover.side_effect = children_after_crossover
         self.mock_evolutionary_algorithm_object.SolutionClass = mock_solution_class
@@ -488,8 +701,11 @@ class TestEvolutionaryAlgorithm:
         self.mock_perform_crossover.assert_has_calls([call(parents=(p1, p2)) for p1, p2 in selected_parents])
         self.mock_perform_mutation.assert_has_calls([call(child_values) for children_values in children_after_crossover
                                                      for child_values in children_values])
-        mock_solution_class.assert_has_calls([call(**child_values) for children_values in children_after_crossover
-                                              for child_values in children_values])
+        mock_solution_class.from_trusted_values.assert_has_calls([call(child_values)
+                                                                  for children_values in children_after_crossover
+                                                                  for child_values in children_values])
+        mock_solution_class.assert_not_called()
+        self.mock_evolutionary_algorithm_object._evaluate_solutions.assert_called_once_with(children)
         assert self.mock_evolutionary_algorithm_object._population == children
 
     @pytest.mark.parametrize("selected_parents, children_after_crossover, children", [
@@ -504,7 +720,10 @@ class TestEvolutionaryAlgorithm:
         :param children_after_crossover: Values to simulate children values after crossover.
         :param children: Values to simulate children in new population.
         """
-        mock_solution_class = Mock(side_effect=children)
+        children = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in children]
+        selected_parents = [tuple(Mock(get_fitness=Mock(return_value=fitness)) for fitness in parents)
+                            for parents in selected_parents]
+        mock_solution_class = Mock(from_trusted_values=Mock(side_effect=children))
         self.mock_perform_selection.return_value = selected_parents
         self.mock_perform_crossover.side_effect = children_after_crossover
         self.mock_evolutionary_algorithm_object.SolutionClass = mock_solution_class
@@ -514,16 +733,147 @@ class TestEvolutionaryAlgorithm:
         self.mock_perform_crossover.assert_has_calls([call(parents=(p1, p2)) for p1, p2 in selected_parents])
         self.mock_perform_mutation.assert_has_calls([call(child_values) for children_values in children_after_crossover
                                                      for child_values in children_values])
-        mock_solution_class.assert_has_calls([call(**child_values) for children_values in children_after_crossover
-                                              for child_values in children_values])
+        mock_solution_class.from_trusted_values.assert_has_calls([call(child_values)
+                                                                  for children_values in children_after_crossover
+                                                                  for child_values in children_values])
+        mock_solution_class.assert_not_called()
+        self.mock_evolutionary_algorithm_object._evaluate_solutions.assert_called_once_with(children)
         expected_population = []
         i = 0
         for parents in selected_parents:
-            expected_population.append(max(children[i], parents[0]))
-            expected_population.append(max(children[i+1], parents[1]))
+            expected_population.append(max(children[i], parents[0], key=lambda solution: solution.get_fitness()))
+            expected_population.append(max(children[i+1], parents[1], key=lambda solution: solution.get_fitness()))
             i += 2
         assert self.mock_evolutionary_algorithm_object._population == expected_population
 
+    # _array_evolution_iteration
+
+    @pytest.mark.parametrize("apply_elitism", [True, False])
+    def test_array_evolution_iteration(self, apply_elitism):
+        """
+        Test '_array_evolution_iteration' function.
+
+        :param apply_elitism: Example value of 'apply_elitism' attribute.
+        """
+        mock_children = Mock(genes=np.zeros((4, 3)), __len__=Mock(return_value=4))
+        mock_parents = Mock(genes=np.ones((4, 3)), fitness=np.array([0., 0., 0., 0.]))
+        mock_array_population = Mock(crossover=Mock(return_value=mock_children), take=Mock(return_value=mock_parents))
+        self.mock_perform_batch_selection.return_value = np.array([[2, 0], [1, 1]])
+        self.mock_evolutionary_algorithm_object._population = [Mock(), Mock(), Mock(), Mock()]
+        self.mock_evolutionary_algorithm_object._array_population = mock_array_population
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock()
+        self.mock_evolutionary_algorithm_object.apply_elitism = apply_elitism
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        self.mock_evolutionary_algorithm_object.crossover_mask_function = Mock()
+        self.mock_evolutionary_algorithm_object.crossover_params = {"crossover_points_number": 2}
+        self.mock_evolutionary_algorithm_object.mutation_mask_function = Mock()
+        self.mock_evolutionary_algorithm_object.mutation_params = {}
+        self.mock_evolutionary_algorithm_object.mutation_chance = 0.1
+
+        def _evaluate_array_population(population):
+            population.fitness = np.array([1., -1., 0., -2.])
+
+        self.mock_evolutionary_algorithm_object._evaluate_array_population.side_effect = _evaluate_array_population
+        EvolutionaryAlgorithm._array_evolution_iteration(self=self.mock_evolutionary_algorithm_object)
+        self.mock_perform_batch_selection.assert_called_once_with()
+        self.mock_perform_selection.assert_not_called()
+        parents_indices = mock_array_population.crossover.call_args[1]["parents_indices"]
+        assert parents_indices.tolist() == [[2, 0], [1, 1]]
+        self.mock_evolutionary_algorithm_object.crossover_mask_function.assert_called_once_with(
+            pairs_number=2, variables_number=3, crossover_points_number=2)
+        self.mock_evolutionary_algorithm_object.mutation_mask_function.assert_called_once_with(
+            individuals_number=4, variables_number=3, mutation_chance=0.1)
+        assert mock_array_population.crossover.call_args[1]["genes_function"] is None
+        mock_children.mutate.assert_called_once_with(
+            self.mock_evolutionary_algorithm_object.mutation_mask_function.return_value, genes_function=None)
+        self.mock_evolutionary_algorithm_object._evaluate_array_population.assert_called_once_with(mock_children)
+        self.mock_evolutionary_algorithm_object._evaluate_solutions.assert_not_called()
+        self.mock_evolutionary_algorithm_object.SolutionClass.from_trusted_values.assert_not_called()
+        mock_children.to_solutions.assert_not_called()
+        assert self.mock_evolutionary_algorithm_object._array_population is mock_children
+        assert self.mock_evolutionary_algorithm_object._population == []
+        if apply_elitism:
+            assert mock_array_population.take.call_args[0][0].tolist() == [2, 0, 1, 1]
+            assert mock_children.genes.tolist() == [[0., 0., 0.], [1., 1., 1.], [0., 0., 0.], [1., 1., 1.]]
+            assert mock_children.fitness.tolist() == [1., 0., 0., 0.]
+        else:
+            mock_array_population.take.assert_not_called()
+            assert mock_children.genes.tolist() == np.zeros((4, 3)).tolist()
+            assert mock_children.fitness.tolist() == [1., -1., 0., -2.]
+
+    # _evaluate_array_population
+
+    @pytest.mark.parametrize("optimization_type, expected_fitness", [
+        (OptimizationType.Minimize, [-5., -5., -1., -2.]),
+        (OptimizationType.Maximize, [5., 5., 1., 2.]),
+    ])
+    def test_evaluate_array_population(self, optimization_type, expected_fitness):
+        """
+        Test '_evaluate_array_population' evaluates decoded columns of unique genes with the evaluator.
+
+        :param optimization_type: Optimization type of the problem.
+        :param expected_fitness: Expected fitness of following individuals.
+        """
+        genes = np.array([[3., 1.], [3., 1.], [0., 2.], [1., 0.]])
+        mock_encoding = Mock()
+        population = Mock(genes=genes, encoding=mock_encoding, fitness=None)
+        self.mock_problem.evaluation_cache = None
+        self.mock_problem.optimization_type = optimization_type
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        self.mock_evolutionary_algorithm_object.stop_conditions = Mock(checkpoint_interval=None)
+        self.mock_evolutionary_algorithm_object.evaluator = Mock(
+            evaluate_batch=Mock(return_value=np.array([1., 2., 5.])))
+        self.mock_evolutionary_algorithm_object._evaluations_number = 7
+        EvolutionaryAlgorithm._evaluate_array_population(self=self.mock_evolutionary_algorithm_object,
+                                                         population=population)
+        assert mock_encoding.decode_columns.call_args[0][0].tolist() == [[0., 2.], [1., 0.], [3., 1.]]
+        self.mock_evolutionary_algorithm_object.evaluator.evaluate_batch.assert_called_once_with(
+            self.mock_problem, mock_encoding.decode_columns.return_value)
+        assert population.fitness.tolist() == expected_fitness
+        assert self.mock_evolutionary_algorithm_object._evaluations_number == 10
+        self.mock_evolutionary_algorithm_object._checkpoint.assert_not_called()
+        self.mock_evolutionary_algorithm_object._evaluate_solutions.assert_not_called()
+
+    def test_evaluate_array_population__checkpoints(self):
+        """Test '_evaluate_array_population' evaluates individuals in parts and calls checkpoint between them."""
+        genes = np.array([[float(index)] for index in range(5)])
+        population = Mock(genes=genes, encoding=Mock(), fitness=None)
+        self.mock_problem.evaluation_cache = None
+        self.mock_problem.optimization_type = OptimizationType.Maximize
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        self.mock_evolutionary_algorithm_object.stop_conditions = Mock(checkpoint_interval=2)
+        self.mock_evolutionary_algorithm_object.evaluator = Mock(
+            evaluate_batch=Mock(side_effect=[np.array([4., 3.]), np.array([1., 9.]), np.array([0.])]))
+        self.mock_evolutionary_algorithm_object._evaluations_number = 0
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock()
+        with patch(f"{self.SCRIPT_LOCATION}.ArrayPopulation.to_solutions") as mock_to_solutions:
+            EvolutionaryAlgorithm._evaluate_array_population(self=self.mock_evolutionary_algorithm_object,
+                                                             population=population)
+        assert self.mock_evolutionary_algorithm_object.evaluator.evaluate_batch.call_count == 3
+        assert self.mock_evolutionary_algorithm_object._evaluations_number == 5
+        assert [call_args[1]["indices"].tolist() for call_args in mock_to_solutions.call_args_list] == [[0], [1]]
+        self.mock_evolutionary_algorithm_object._checkpoint.assert_has_calls(
+            [call(mock_to_solutions.return_value), call(mock_to_solutions.return_value)])
+        assert self.mock_evolutionary_algorithm_object._checkpoint.call_count == 2
+        assert population.fitness.tolist() == [4., 3., 1., 9., 0.]
+
+    def test_evaluate_array_population__evaluation_cache(self):
+        """Test '_evaluate_array_population' evaluates solution objects when evaluation cache is used."""
+        values = [{"a": 1}, {"a": 2}]
+        solutions = [Mock(), Mock()]
+        population = Mock(to_values=Mock(return_value=values))
+        self.mock_problem.evaluation_cache = Mock()
+        self.mock_evolutionary_algorithm_object.problem = self.mock_problem
+        self.mock_evolutionary_algorithm_object.evaluator = Mock()
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock(from_trusted_values=Mock(side_effect=solutions))
+        with patch(f"{self.SCRIPT_LOCATION}.ArrayPopulation.get_fitness") as mock_get_fitness:
+            EvolutionaryAlgorithm._evaluate_array_population(self=self.mock_evolutionary_algorithm_object,
+                                                             population=population)
+        mock_get_fitness.assert_called_once_with(solutions)
+        self.mock_evolutionary_algorithm_object._evaluate_solutions.assert_called_once_with(solutions)
+        self.mock_evolutionary_algorithm_object.evaluator.evaluate_batch.assert_not_called()
+        assert population.fitness == mock_get_fitness.return_value
+
     # _perform_iteration
 
     @pytest.mark.parametrize("current_best", [None, - 5, 13, 2.53])
@@ -536,15 +886,20 @@ class TestEvolutionaryAlgorithm:
         :param population: Generated population.
         """
         self.mock_evolutionary_algorithm_object.logger = None
+        population = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in population]
+        if current_best is not None:
+            current_best = Mock(get_fitness=Mock(return_value=current_best))
         self.mock_evolutionary_algorithm_object._best_solution = current_best
         self.mock_evolutionary_algorithm_object._population = population
         EvolutionaryAlgorithm._perform_iteration(self=self.mock_evolutionary_algorithm_object, iteration_index=0)
         self.mock_generate_random_population.assert_called_once_with()
         self.mock_evolution_iteration.assert_not_called()
         if current_best is None:
-            assert self.mock_evolutionary_algorithm_object._best_solution == max(population)
+            assert self.mock_evolutionary_algorithm_object._best_solution \
+                == max(population, key=lambda solution: solution.get_fitness())
         else:
-            assert self.mock_evolutionary_algorithm_object._best_solution == max(*population, current_best)
+            assert self.mock_evolutionary_algorithm_object._best_solution \
+                == max(*population, current_best, key=lambda solution: solution.get_fitness())
         self.mock_log_iteration.assert_called_once_with(iteration_index=0)
 
     @pytest.mark.parametrize("iteration", [1, 323])
@@ -559,17 +914,68 @@ class TestEvolutionaryAlgorithm:
         :param iteration: Example index of iteration.
         """
         self.mock_evolutionary_algorithm_object.logger = None
+        population = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in population]
+        if current_best is not None:
+            current_best = Mock(get_fitness=Mock(return_value=current_best))
         self.mock_evolutionary_algorithm_object._best_solution = current_best
         self.mock_evolutionary_algorithm_object._population = population
         EvolutionaryAlgorithm._perform_iteration(self=self.mock_evolutionary_algorithm_object, iteration_index=iteration)
         self.mock_generate_random_population.assert_not_called()
         self.mock_evolution_iteration.assert_called_once_with()
         if current_best is None:
-            assert self.mock_evolutionary_algorithm_object._best_solution == max(population)
+            assert self.mock_evolutionary_algorithm_object._best_solution \
+                == max(population, key=lambda solution: solution.get_fitness())
         else:
-            assert self.mock_evolutionary_algorithm_object._best_solution == max(*population, current_best)
+            assert self.mock_evolutionary_algorithm_object._best_solution \
+                == max(*population, current_best, key=lambda solution: solution.get_fitness())
         self.mock_log_iteration.assert_called_once_with(iteration_index=iteration)
 
+    @pytest.mark.parametrize("iteration", [1, 323])
+    def test_perform_iteration__following_iteration_array_population(self, iteration):
+        """
+        Test '_perform_iteration' method for following iteration (non zero) when array population is used.
+
+        :param iteration: Example index of iteration.
+        """
+        self.mock_evolutionary_algorithm_object.logger = None
+        self.mock_evolutionary_algorithm_object.array_population = True
+        self.mock_evolutionary_algorithm_object._best_solution = None
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock()
+        best_solution = Mock(get_fitness=Mock(return_value=5))
+        mock_array_population = Mock(fitness=np.array([1., 5., 2.]), to_solutions=Mock(return_value=[best_solution]))
+        self.mock_evolutionary_algorithm_object._array_population = mock_array_population
+        self.mock_evolutionary_algorithm_object._population = []
+        EvolutionaryAlgorithm._perform_iteration(self=self.mock_evolutionary_algorithm_object, iteration_index=iteration)
+        self.mock_generate_random_population.assert_not_called()
+        self.mock_evolution_iteration.assert_not_called()
+        self.mock_array_evolution_iteration.assert_called_once_with()
+        mock_array_population.to_solutions.assert_called_once()
+        assert mock_array_population.to_solutions.call_args[0] == (self.mock_evolutionary_algorithm_object.SolutionClass,)
+        assert mock_array_population.to_solutions.call_args[1]["indices"].tolist() == [1]
+        assert self.mock_evolutionary_algorithm_object._best_solution == best_solution
+        self.mock_log_iteration.assert_called_once_with(iteration_index=iteration)
+
+    @pytest.mark.parametrize("current_best, expected_best_index", [(3, 0), (7, 1)])
+    def test_perform_iteration__following_iteration_array_population_current_best(self, current_best,
+                                                                                   expected_best_index):
+        """
+        Test '_perform_iteration' method keeps the better of current best solution and the best individual.
+
+        :param current_best: Fitness of currently best solution.
+        :param expected_best_index: Index of expected best solution (0 - best individual, 1 - current best).
+        """
+        self.mock_evolutionary_algorithm_object.logger = None
+        self.mock_evolutionary_algorithm_object.array_population = True
+        self.mock_evolutionary_algorithm_object.SolutionClass = Mock()
+        current_best = Mock(get_fitness=Mock(return_value=current_best))
+        best_individual = Mock(get_fitness=Mock(return_value=5))
+        self.mock_evolutionary_algorithm_object._best_solution = current_best
+        self.mock_evolutionary_algorithm_object._array_population = Mock(
+            fitness=np.array([5., 1.]), to_solutions=Mock(return_value=[best_individual]))
+        EvolutionaryAlgorithm._perform_iteration(self=self.mock_evolutionary_algorithm_object, iteration_index=1)
+        assert self.mock_evolutionary_algorithm_object._best_solution \
+            == [best_individual, current_best][expected_best_index]
+
     # get_log_data
 
     @pytest.mark.parametrize("population_size", [2, 22])
@@ -609,3 +1015,4 @@ class TestEvolutionaryAlgorithm:
         assert log_data["mutation_type"] == mutation_type
         assert log_data["mutation_params"] == mutation_params
         assert log_data["mutation_chance"] == mutation_chance
+        assert log_data["initialization_type"] == self.mock_evolutionary_algorithm_object.initialization_type
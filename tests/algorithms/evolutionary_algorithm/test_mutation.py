@@ -1,8 +1,12 @@
 import pytest
 from mock import patch, Mock, call
 
+import numpy as np
+
 from optimization.algorithms.evolutionary_algorithm.mutation import single_point_mutation, multi_point_mutation, \
-    probabilistic_mutation, check_mutation_parameters
+    probabilistic_mutation, check_mutation_parameters, single_point_mutation_mask, multi_point_mutation_mask, \
+    probabilistic_mutation_mask, gaussian_mutation, polynomial_mutation, gaussian_mutation_genes, \
+    polynomial_mutation_genes, real_valued_mutation_mask
 
 
 class TestUtilities:
@@ -17,6 +21,10 @@ class TestUtilities:
         (8, {"mutation_points_number": 2}),
         (8, {"mutation_points_number": 5}),
         (8, {"mutation_points_number": 7}),
+        (3, {"mutation_sigma": 0.1}),
+        (3, {"mutation_sigma": 1}),
+        (3, {"mutation_distribution_index": 20}),
+        (3, {"mutation_distribution_index": 1.5}),
     ])
     def test_check_mutation_parameters__valid(self, variables_number, mutation_params):
         """
@@ -31,6 +39,8 @@ class TestUtilities:
         (3, {"mutation_points_number": 2.1}),
         (8, {"mutation_points_number": "3"}),
         (8, {"mutation_points_number": None}),
+        (3, {"mutation_sigma": "0.1"}),
+        (3, {"mutation_distribution_index": None}),
     ])
     def test_check_crossover_parameters__invalid_type(self, variables_number, mutation_params):
         """
@@ -49,6 +59,10 @@ class TestUtilities:
         (8, {"mutation_points_number": 8}),
         (8, {"mutation_points_number": 0}),
         (8, {"mutation_points_number": -3}),
+        (3, {"mutation_sigma": 0}),
+        (3, {"mutation_sigma": 1.01}),
+        (3, {"mutation_distribution_index": 0.99}),
+        (3, {"mutation_distribution_index": 101}),
     ])
     def test_check_crossover_parameters__invalid_value(self, variables_number, mutation_params):
         """
@@ -74,11 +88,14 @@ class TestMutationFunctions:
         self.mock_choose_random_value = self._patcher_choose_random_value.start()
         self._patcher_choose_random_values = patch(f"{self.SCRIPT_LOCATION}.choose_random_values")
         self.mock_choose_random_values = self._patcher_choose_random_values.start()
+        self._patcher_generate_random_geometric_gap = patch(f"{self.SCRIPT_LOCATION}.generate_random_geometric_gap")
+        self.mock_generate_random_geometric_gap = self._patcher_generate_random_geometric_gap.start()
 
     def teardown(self):
         self._patcher_generate_random_float.stop()
         self._patcher_choose_random_value.stop()
         self._patcher_choose_random_values.stop()
+        self._patcher_generate_random_geometric_gap.stop()
 
     # single_point_mutation
 
@@ -178,20 +195,157 @@ class TestMutationFunctions:
     # probabilistic_mutation
 
     @pytest.mark.parametrize("mutation_chance", [0.01, 0.25, 0.5])
-    @pytest.mark.parametrize("variables_number, random_values", [
-        (3, [0.25, 0.5, 0.75]),
-        (5, [0.654, 0.4999, 0.025, 0.12345, 0.009999999]),
-        (4, [0., 0.01, 0.9999, 0.876]),
+    @pytest.mark.parametrize("variables_number, random_gaps, expected_mutation_points", [
+        (3, [3], []),
+        (5, [0, 1, 0, 5], [0, 2, 3]),
+        (4, [2, 0, 7], [2, 3]),
     ])
-    def test_probabilistic_mutation(self, variables_number, mutation_chance, random_values):
+    def test_probabilistic_mutation(self, variables_number, mutation_chance, random_gaps, expected_mutation_points):
         """
-        Test 'probabilistic_mutation'.
+        Test 'probabilistic_mutation' selects mutation points using gaps between them.
 
         :param variables_number: Example value of 'variables_number'.
         :param mutation_chance: Example value of 'mutation_chance'.
-        :param random_values: Values simulated as return from 'generate_random_float'.
+        :param random_gaps: Values simulated as return from 'generate_random_geometric_gap'.
+        :param expected_mutation_points: Expected mutation points.
         """
-        self.mock_generate_random_float.side_effect = random_values
+        self.mock_generate_random_geometric_gap.side_effect = random_gaps
         assert probabilistic_mutation(variables_number=variables_number, mutation_chance=mutation_chance) \
-            == [i for i, random_value in enumerate(random_values) if random_value <= mutation_chance]
-        self.mock_generate_random_float.assert_has_calls([call(0, 1)] * variables_number)
+            == expected_mutation_points
+        self.mock_generate_random_geometric_gap.assert_has_calls([call(mutation_chance)] * len(random_gaps))
+        self.mock_generate_random_float.assert_not_called()
+
+    @pytest.mark.parametrize("variables_number", [1, 100])
+    def test_probabilistic_mutation__no_chance(self, variables_number):
+        """
+        Test 'probabilistic_mutation' selects no points of mutation when mutation chance is 0.
+
+        :param variables_number: Example value of 'variables_number'.
+        """
+        assert probabilistic_mutation(variables_number=variables_number, mutation_chance=0) == []
+        self.mock_generate_random_geometric_gap.assert_not_called()
+
+    # gaussian_mutation, polynomial_mutation
+
+    @pytest.mark.parametrize("mutation_function, mutation_params", [
+        (gaussian_mutation, {"mutation_sigma": 0.1}),
+        (polynomial_mutation, {"mutation_distribution_index": 20}),
+    ])
+    @pytest.mark.parametrize("variables_number, mutation_chance", [(1, 0.5), (10, 0.01)])
+    @patch(f"{SCRIPT_LOCATION}.probabilistic_mutation")
+    def test_real_valued_mutation(self, mock_probabilistic_mutation, variables_number, mutation_chance,
+                                  mutation_function, mutation_params):
+        """
+        Test that real-valued mutation functions select mutation points as 'probabilistic_mutation'.
+
+        :param variables_number: Example value of 'variables_number'.
+        :param mutation_chance: Example value of 'mutation_chance'.
+        :param mutation_function: Real-valued mutation function to test.
+        :param mutation_params: Example additional parameters of the mutation.
+        """
+        assert mutation_function(variables_number=variables_number, mutation_chance=mutation_chance,
+                                 **mutation_params) == mock_probabilistic_mutation.return_value
+        mock_probabilistic_mutation.assert_called_once_with(variables_number=variables_number,
+                                                            mutation_chance=mutation_chance)
+
+
+class TestRealValuedMutationGenesFunctions:
+    """Tests for real-valued mutation functions of float genes."""
+
+    SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.mutation"
+
+    def setup(self):
+        self.lower_bounds = np.array([-1., -1., -1.])
+        self.upper_bounds = np.array([1., 1., 1.])
+        # patching
+        self._patcher_generate_random_floats_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_floats_array")
+        self.mock_generate_random_floats_array = self._patcher_generate_random_floats_array.start()
+        self._patcher_generate_random_normal_floats_array = \
+            patch(f"{self.SCRIPT_LOCATION}.generate_random_normal_floats_array")
+        self.mock_generate_random_normal_floats_array = self._patcher_generate_random_normal_floats_array.start()
+
+    def teardown(self):
+        self._patcher_generate_random_floats_array.stop()
+        self._patcher_generate_random_normal_floats_array.stop()
+
+    # gaussian_mutation_genes
+
+    def test_gaussian_mutation_genes(self):
+        """Test that 'gaussian_mutation_genes' shifts genes by scaled normal values and clips them to bounds."""
+        self.mock_generate_random_normal_floats_array.return_value = np.array([1., -2., 0.5])
+        genes = gaussian_mutation_genes(np.array([0., -0.8, 0.95]), lower_bounds=self.lower_bounds,
+                                        upper_bounds=self.upper_bounds, mutation_sigma=0.1)
+        assert np.allclose(genes, [0.2, -1., 1.])
+        self.mock_generate_random_normal_floats_array.assert_called_once_with(size=(3, ))
+
+    # polynomial_mutation_genes
+
+    def test_polynomial_mutation_genes(self):
+        """Test that 'polynomial_mutation_genes' shifts genes by polynomially distributed values."""
+        self.mock_generate_random_floats_array.return_value = np.array([0.25, 0.875, 0.5])
+        genes = polynomial_mutation_genes(np.array([0., 0.5, 0.2]), lower_bounds=self.lower_bounds,
+                                          upper_bounds=self.upper_bounds, mutation_distribution_index=1)
+        assert np.allclose(genes, [2 * (0.5 ** 0.5 - 1), 1., 0.2])
+        self.mock_generate_random_floats_array.assert_called_once_with(size=(3, ))
+
+
+class TestMutationMaskFunctions:
+    """Tests for mutation masks functions."""
+
+    SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.mutation"
+
+    def setup(self):
+        self._patcher_generate_random_ints_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_ints_array")
+        self.mock_generate_random_ints_array = self._patcher_generate_random_ints_array.start()
+        self._patcher_generate_random_floats_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_floats_array")
+        self.mock_generate_random_floats_array = self._patcher_generate_random_floats_array.start()
+        self._patcher_choose_random_successes_indices = \
+            patch(f"{self.SCRIPT_LOCATION}.choose_random_successes_indices")
+        self.mock_choose_random_successes_indices = self._patcher_choose_random_successes_indices.start()
+
+    def teardown(self):
+        self._patcher_generate_random_ints_array.stop()
+        self._patcher_generate_random_floats_array.stop()
+        self._patcher_choose_random_successes_indices.stop()
+
+    # single_point_mutation_mask
+
+    def test_single_point_mutation_mask(self):
+        """Test for 'single_point_mutation_mask' function."""
+        self.mock_generate_random_floats_array.return_value = np.array([0.1, 0.9, 0.3])
+        self.mock_generate_random_ints_array.return_value = np.array([2, 0])
+        mask = single_point_mutation_mask(individuals_number=3, variables_number=4, mutation_chance=0.1)
+        assert mask.tolist() == [[False, False, True, False], [False] * 4, [True, False, False, False]]
+        self.mock_generate_random_floats_array.assert_called_once_with(size=3)
+        self.mock_generate_random_ints_array.assert_called_once_with(0, 3, size=2)
+
+    # multi_point_mutation_mask
+
+    def test_multi_point_mutation_mask(self):
+        """Test for 'multi_point_mutation_mask' function."""
+        self.mock_generate_random_floats_array.side_effect = [np.array([0.9, 0.1]),
+                                                              np.array([[0.5, 0.1, 0.9, 0.2]])]
+        mask = multi_point_mutation_mask(individuals_number=2, variables_number=4, mutation_chance=0.1,
+                                         mutation_points_number=2)
+        assert mask.tolist() == [[False] * 4, [False, True, False, True]]
+        self.mock_generate_random_floats_array.assert_has_calls([call(size=2), call(size=(1, 4))])
+
+    # probabilistic_mutation_mask
+
+    def test_probabilistic_mutation_mask(self):
+        """Test for 'probabilistic_mutation_mask' function."""
+        self.mock_choose_random_successes_indices.return_value = np.array([0, 2, 5])
+        mask = probabilistic_mutation_mask(individuals_number=2, variables_number=3, mutation_chance=0.2)
+        assert mask.tolist() == [[True, False, True], [False, False, True]]
+        self.mock_choose_random_successes_indices.assert_called_once_with(trials_number=6, success_probability=0.2)
+        self.mock_generate_random_floats_array.assert_not_called()
+
+    # real_valued_mutation_mask
+
+    def test_real_valued_mutation_mask(self):
+        """Test that 'real_valued_mutation_mask' creates probabilistic mutation masks."""
+        self.mock_choose_random_successes_indices.return_value = np.array([1, 4])
+        mask = real_valued_mutation_mask(individuals_number=2, variables_number=3, mutation_chance=0.2,
+                                         mutation_sigma=0.1)
+        assert mask.tolist() == [[False, True, False], [False, True, False]]
+        self.mock_choose_random_successes_indices.assert_called_once_with(trials_number=6, success_probability=0.2)
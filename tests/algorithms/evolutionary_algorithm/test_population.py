@@ -0,0 +1,308 @@
+import pytest
+from mock import Mock, patch
+
+from collections import OrderedDict
+
+import numpy as np
+
+from optimization.algorithms.evolutionary_algorithm.population import GenesEncoding, ArrayPopulation, \
+    OptimizationProblem, OptimizationType, IntegerVariable, DiscreteVariable, FloatVariable, ChoiceVariable
+
+
+class TestGenesEncoding:
+    """Tests for 'GenesEncoding' class and its methods."""
+
+    SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.population"
+
+    def setup(self):
+        self.decision_variables = OrderedDict(
+            x=IntegerVariable(min_value=-5, max_value=5),
+            y=DiscreteVariable(min_value=0, max_value=1, step=0.25),
+            z=FloatVariable(min_value=-1., max_value=1.),
+            c=ChoiceVariable(possible_values=["a", "b", "c"]),
+            d=DiscreteVariable(min_value=2, max_value=10, step=2),
+        )
+        self.mock_problem = Mock(spec=OptimizationProblem, decision_variables=self.decision_variables)
+        # patching
+        self._patcher_generate_random_floats_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_floats_array")
+        self.mock_generate_random_floats_array = self._patcher_generate_random_floats_array.start()
+
+    def teardown(self):
+        self._patcher_generate_random_floats_array.stop()
+
+    # __init__
+
+    def test_init(self):
+        """Test initialization of 'GenesEncoding' class."""
+        encoding = GenesEncoding(problem=self.mock_problem)
+        assert encoding.problem == self.mock_problem
+        assert encoding.names == ["x", "y", "z", "c", "d"]
+        assert encoding.variables_number == 5
+        assert list(encoding.choices.keys()) == [3]
+        assert set(encoding.choices[3]) == {"a", "b", "c"}
+
+    def test_init__unknown_variable(self):
+        """Test that initialization of 'GenesEncoding' raises TypeError when decision variable type is unknown."""
+        self.mock_problem.decision_variables = OrderedDict(x=Mock())
+        with pytest.raises(TypeError):
+            GenesEncoding(problem=self.mock_problem)
+
+    # get_inexact_variables
+
+    def test_get_inexact_variables__none(self):
+        """Test that 'get_inexact_variables' returns empty list when all values are exactly stored as genes."""
+        assert GenesEncoding.get_inexact_variables(problem=self.mock_problem) == []
+
+    def test_get_inexact_variables(self):
+        """Test that 'get_inexact_variables' returns names of integer variables with too big absolute values."""
+        self.mock_problem.decision_variables = OrderedDict(
+            a=IntegerVariable(min_value=10 ** 18, max_value=10 ** 18 + 10),
+            b=IntegerVariable(min_value=-2 ** 53, max_value=2 ** 53),
+            c=DiscreteVariable(min_value=-2 ** 64, max_value=0, step=2),
+            d=DiscreteVariable(min_value=0., max_value=1e20, step=0.5),
+            e=FloatVariable(min_value=-1e300, max_value=1e300),
+        )
+        assert GenesEncoding.get_inexact_variables(problem=self.mock_problem) == ["a", "c"]
+
+    # encode and decode
+
+    @pytest.mark.parametrize("values", [
+        [{"x": -5, "y": 0.25, "z": 0.5, "c": "a", "d": 2}],
+        [{"x": 5, "y": 1., "z": -1., "c": "b", "d": 10}, {"x": 0, "y": 0.5, "z": 0.123, "c": "c", "d": 6}],
+    ])
+    def test_encode_decode(self, values):
+        """
+        Test that decision variables values are the same after encoding and decoding.
+
+        :param values: Example decision variables values of following individuals.
+        """
+        encoding = GenesEncoding(problem=self.mock_problem)
+        genes = encoding.encode(values)
+        assert genes.shape == (len(values), 5)
+        decoded_values = encoding.decode(genes)
+        assert decoded_values == values
+        for individual_values in decoded_values:
+            assert isinstance(individual_values, OrderedDict)
+            assert list(individual_values.keys()) == encoding.names
+            assert isinstance(individual_values["x"], int)
+            assert isinstance(individual_values["y"], float)
+            assert isinstance(individual_values["d"], int)
+
+    @pytest.mark.parametrize("values", [
+        [{"x": -5, "y": 0.25, "z": 0.5, "c": "a", "d": 2}],
+        [{"x": 5, "y": 1., "z": -1., "c": "b", "d": 10}, {"x": 0, "y": 0.5, "z": 0.123, "c": "c", "d": 6}],
+    ])
+    def test_decode_columns(self, values):
+        """
+        Test that 'decode_columns' returns values in the format accepted by batch functions.
+
+        :param values: Example decision variables values of following individuals.
+        """
+        encoding = GenesEncoding(problem=self.mock_problem)
+        batch_values = encoding.decode_columns(encoding.encode(values))
+        assert list(batch_values.keys()) == encoding.names
+        for name, column in batch_values.items():
+            assert isinstance(column, np.ndarray)
+            assert column.tolist() == [individual_values[name] for individual_values in values]
+        assert batch_values["x"].dtype.kind == "i"
+        assert batch_values["d"].dtype.kind == "i"
+        assert batch_values["y"].dtype.kind == "f"
+        assert batch_values["c"].dtype == object
+
+    def test_decode_columns__sequence_choices(self):
+        """Test that 'decode_columns' keeps sequences (possible values of choice variable) as single values."""
+        self.mock_problem.decision_variables = OrderedDict(c=ChoiceVariable(possible_values=[(1, 2), (3, 4)]))
+        encoding = GenesEncoding(problem=self.mock_problem)
+        batch_values = encoding.decode_columns(encoding.encode([{"c": (3, 4)}, {"c": (1, 2)}]))
+        assert batch_values["c"].shape == (2,)
+        assert batch_values["c"].tolist() == [(3, 4), (1, 2)]
+
+    # get_bounds
+
+    def test_get_bounds(self):
+        """Test that 'get_bounds' returns minimal and maximal values of continuous genes."""
+        self.mock_problem.decision_variables["w"] = FloatVariable(min_value=10., max_value=20.)
+        encoding = GenesEncoding(problem=self.mock_problem)
+        assert encoding.continuous.tolist() == [False, False, True, False, False, True]
+        lower_bounds, upper_bounds = encoding.get_bounds(np.array([2, 5]))
+        assert lower_bounds.tolist() == [-1., 10.]
+        assert upper_bounds.tolist() == [1., 20.]
+
+    # generate_random_genes
+
+    @pytest.mark.parametrize("random_value", [0., 0.5, 0.999999])
+    def test_generate_random_genes(self, random_value):
+        """
+        Test that 'generate_random_genes' returns values compatible with decision variables definitions.
+
+        :param random_value: Value to simulate random float.
+        """
+        encoding = GenesEncoding(problem=self.mock_problem)
+        rows = np.array([0, 0, 0, 0, 0])
+        columns = np.array([0, 1, 2, 3, 4])
+        self.mock_generate_random_floats_array.return_value = np.full(5, random_value)
+        genes = encoding.generate_random_genes(rows=rows, columns=columns)
+        self.mock_generate_random_floats_array.assert_called_once_with(size=5)
+        decoded_values = encoding.decode(genes[np.newaxis, :])[0]
+        for name, value in decoded_values.items():
+            assert self.decision_variables[name].is_proper_value(value)
+
+
+class TestArrayPopulation:
+    """Tests for 'ArrayPopulation' class and its methods."""
+
+    def setup(self):
+        self.mock_encoding = Mock(spec=GenesEncoding)
+        self.genes = np.array([[1., 2.], [3., 4.], [5., 6.]])
+        self.fitness = np.array([0.1, -2., 7.])
+        self.population = ArrayPopulation(encoding=self.mock_encoding, genes=self.genes, fitness=self.fitness)
+
+    # __init__
+
+    def test_init(self):
+        """Test initialization of 'ArrayPopulation' class."""
+        assert self.population.encoding == self.mock_encoding
+        assert self.population.genes is self.genes
+        assert self.population.fitness is self.fitness
+        assert len(self.population) == 3
+
+    # get_fitness
+
+    @pytest.mark.parametrize("values", [[1, 2.5, -3], [-1., 0]])
+    def test_get_fitness(self, values):
+        """
+        Test that 'get_fitness' returns fitness of solutions.
+
+        :param values: Example fitness of solutions.
+        """
+        solutions = [Mock(get_fitness=Mock(return_value=value)) for value in values]
+        assert ArrayPopulation.get_fitness(solutions).tolist() == values
+        for solution in solutions:
+            solution.get_fitness.assert_called_once_with()
+
+    def test_get_fitness__empty(self):
+        """Test that 'get_fitness' returns empty array if no solutions are provided."""
+        assert ArrayPopulation.get_fitness([]).size == 0
+
+    # from_solutions
+
+    def test_from_solutions(self):
+        """Test that 'from_solutions' creates population with genes and fitness of solutions."""
+        solutions = [Mock(), Mock()]
+        with patch.object(ArrayPopulation, "get_fitness") as mock_get_fitness:
+            population = ArrayPopulation.from_solutions(encoding=self.mock_encoding, solutions=solutions)
+        mock_get_fitness.assert_called_once_with(solutions)
+        self.mock_encoding.encode.assert_called_once_with([solution.decision_variables_values
+                                                           for solution in solutions])
+        assert population.genes == self.mock_encoding.encode.return_value
+        assert population.fitness == mock_get_fitness.return_value
+
+    # to_values
+
+    def test_to_values(self):
+        """Test that 'to_values' decodes genes of the population."""
+        assert self.population.to_values() == self.mock_encoding.decode.return_value
+        self.mock_encoding.decode.assert_called_once_with(self.genes)
+
+    # to_solutions
+
+    @pytest.mark.parametrize("optimization_type, expected_objective_values", [
+        (OptimizationType.Minimize, [-0.1, 2., -7.]),
+        (OptimizationType.Maximize, [0.1, -2., 7.]),
+    ])
+    @pytest.mark.parametrize("indices", [None, np.array([2, 0])])
+    def test_to_solutions(self, optimization_type, expected_objective_values, indices):
+        """
+        Test that 'to_solutions' creates evaluated solutions of selected individuals.
+
+        :param optimization_type: Optimization type of the problem.
+        :param expected_objective_values: Expected objective values (with penalty) of all individuals.
+        :param indices: Example indices of individuals.
+        """
+        self.mock_encoding.problem = Mock(optimization_type=optimization_type)
+        self.mock_encoding.decode.side_effect = lambda genes: [{"row": row} for row in genes.tolist()]
+        mock_solution_class = Mock(from_trusted_values=Mock(side_effect=lambda values: Mock(values=values)))
+        solutions = self.population.to_solutions(mock_solution_class, indices=indices)
+        selected = [0, 1, 2] if indices is None else indices.tolist()
+        assert [solution.values for solution in solutions] == [{"row": self.genes[i].tolist()} for i in selected]
+        assert [solution._fitness for solution in solutions] == [self.fitness[i] for i in selected]
+        assert [solution._objective_value_with_penalty for solution in solutions] \
+            == [expected_objective_values[i] for i in selected]
+
+    # take
+
+    @pytest.mark.parametrize("indices", [[0], [2, 2, 1], [1, 0, 2, 0]])
+    def test_take(self, indices):
+        """
+        Test that 'take' creates population with selected individuals.
+
+        :param indices: Example indices of individuals.
+        """
+        population = self.population.take(np.array(indices))
+        assert population.genes.tolist() == [self.genes[i].tolist() for i in indices]
+        assert population.fitness.tolist() == [self.fitness[i] for i in indices]
+        assert population.encoding == self.mock_encoding
+
+    # crossover
+
+    def test_crossover(self):
+        """Test that 'crossover' mixes genes of parents according to masks."""
+        children = self.population.crossover(parents_indices=np.array([[0, 2], [1, 1]]),
+                                             masks=np.array([[True, False], [False, True]]))
+        assert children.genes.tolist() == [[5., 2.], [1., 6.], [3., 4.], [3., 4.]]
+        assert children.fitness is None
+        assert children.encoding == self.mock_encoding
+
+    def test_crossover__genes_function(self):
+        """Test that 'crossover' uses real-valued crossover function for continuous genes."""
+        self.mock_encoding.continuous = np.array([False, True])
+        self.mock_encoding.get_bounds.return_value = np.array([0.]), np.array([10.])
+        mock_genes_function = Mock(return_value=(np.array([[-1.], [-2.]]), np.array([[-3.], [-4.]])))
+        children = self.population.crossover(parents_indices=np.array([[0, 2], [1, 1]]),
+                                             masks=np.array([[True, False], [False, True]]),
+                                             genes_function=mock_genes_function)
+        assert children.genes.tolist() == [[5., -1.], [1., -3.], [3., -2.], [3., -4.]]
+        assert self.mock_encoding.get_bounds.call_args[0][0].tolist() == [1]
+        call_args, call_kwargs = mock_genes_function.call_args
+        assert call_args[0].tolist() == [[2.], [4.]]
+        assert call_args[1].tolist() == [[6.], [4.]]
+        assert call_kwargs["lower_bounds"].tolist() == [0.]
+        assert call_kwargs["upper_bounds"].tolist() == [10.]
+
+    # mutate
+
+    def test_mutate(self):
+        """Test that 'mutate' replaces selected genes with random values."""
+        self.mock_encoding.generate_random_genes.return_value = np.array([-1., -2.])
+        self.population.mutate(np.array([[False, True], [False, False], [True, False]]))
+        assert self.population.genes.tolist() == [[1., -1.], [3., 4.], [-2., 6.]]
+        assert self.population.fitness is None
+        call_kwargs = self.mock_encoding.generate_random_genes.call_args[1]
+        assert call_kwargs["rows"].tolist() == [0, 2]
+        assert call_kwargs["columns"].tolist() == [1, 0]
+
+    def test_mutate__no_mutation(self):
+        """Test that 'mutate' does not change population when no gene is selected."""
+        self.population.mutate(np.zeros((3, 2), dtype=bool))
+        assert self.population.genes.tolist() == [[1., 2.], [3., 4.], [5., 6.]]
+        assert self.population.fitness is self.fitness
+        self.mock_encoding.generate_random_genes.assert_not_called()
+
+    def test_mutate__genes_function(self):
+        """Test that 'mutate' uses real-valued mutation function for continuous genes."""
+        self.mock_encoding.continuous = np.array([True, False])
+        self.mock_encoding.generate_random_genes.return_value = np.array([-1.])
+        self.mock_encoding.get_bounds.return_value = np.array([0., 0.]), np.array([10., 10.])
+        mock_genes_function = Mock(return_value=np.array([7., 8.]))
+        self.population.mutate(np.array([[True, True], [False, False], [True, False]]),
+                               genes_function=mock_genes_function)
+        assert self.population.genes.tolist() == [[7., -1.], [3., 4.], [8., 6.]]
+        assert self.population.fitness is None
+        call_kwargs = self.mock_encoding.generate_random_genes.call_args[1]
+        assert call_kwargs["rows"].tolist() == [0]
+        assert call_kwargs["columns"].tolist() == [1]
+        assert self.mock_encoding.get_bounds.call_args[0][0].tolist() == [0, 0]
+        call_args, call_kwargs = mock_genes_function.call_args
+        assert call_args[0].tolist() == [1., 5.]
+        assert call_kwargs["lower_bounds"].tolist() == [0., 0.]
+        assert call_kwargs["upper_bounds"].tolist() == [10., 10.]
@@ -2,11 +2,17 @@ import pytest
 from copy import deepcopy
 from mock import Mock, patch, call
 from types import GeneratorType
+from itertools import accumulate
+
+import numpy as np
 
 from optimization.algorithms.evolutionary_algorithm.selection import uniform_selection, tournament_selection, \
     double_tournament_selection, roulette_selection, ranking_selection, \
     get_scaled_ranking, get_scaled_objective, calculate_roulette_scaling, \
-    check_selection_parameters, \
+    check_selection_parameters, uniform_batch_selection, tournament_batch_selection, \
+    double_tournament_batch_selection, roulette_batch_selection, ranking_batch_selection, \
+    stochastic_universal_sampling_selection, stochastic_universal_sampling_batch_selection, \
+    get_roulette_weights, get_stochastic_universal_sampling_indices, \
     MIN_TOURNAMENT_GROUP_SIZE, MAX_TOURNAMENT_GROUP_SIZE, MIN_ROULETTE_BIAS, MAX_ROULETTE_BIAS, \
     MIN_RANKING_BIAS, MAX_RANKING_BIAS
 
@@ -152,8 +158,10 @@ class TestSelectionFunctions:
         # patching
         self._patcher_choose_random_values = patch(f"{self.SCRIPT_LOCATION}.choose_random_values")
         self.mock_choose_random_values = self._patcher_choose_random_values.start()
-        self._patcher_choose_random_value_with_weights = patch(f"{self.SCRIPT_LOCATION}.choose_random_value_with_weights")
-        self.mock_choose_random_value_with_weights = self._patcher_choose_random_value_with_weights.start()
+        self._patcher_choose_random_values_with_cumulative_weights = \
+            patch(f"{self.SCRIPT_LOCATION}.choose_random_values_with_cumulative_weights")
+        self.mock_choose_random_values_with_cumulative_weights = \
+            self._patcher_choose_random_values_with_cumulative_weights.start()
         self._patcher_get_scaled_ranking = patch(f"{self.SCRIPT_LOCATION}.get_scaled_ranking")
         self.mock_get_scaled_ranking = self._patcher_get_scaled_ranking.start()
         self._patcher_uniform_selection = patch(f"{self.SCRIPT_LOCATION}.uniform_selection")
@@ -162,14 +170,18 @@ class TestSelectionFunctions:
         self.mock_calculate_roulette_scaling = self._patcher_calculate_roulette_scaling.start()
         self._patcher_get_scaled_objective = patch(f"{self.SCRIPT_LOCATION}.get_scaled_objective")
         self.mock_get_scaled_objective = self._patcher_get_scaled_objective.start()
+        # numbers simulate solutions, so each of them is its own fitness
+        self._patcher_fitness_key = patch(f"{self.SCRIPT_LOCATION}.fitness_key", side_effect=lambda solution: solution)
+        self.mock_fitness_key = self._patcher_fitness_key.start()
 
     def teardown(self):
         self._patcher_choose_random_values.stop()
-        self._patcher_choose_random_value_with_weights.stop()
+        self._patcher_choose_random_values_with_cumulative_weights.stop()
         self._patcher_get_scaled_ranking.stop()
         self._patcher_uniform_selection.stop()
         self._patcher_calculate_roulette_scaling.stop()
         self._patcher_get_scaled_objective.stop()
+        self._patcher_fitness_key.stop()
 
     # uniform_selection
 
@@ -266,12 +278,16 @@ class TestSelectionFunctions:
         :param solution_values: Values that simulates all solution objects.
         :param roulette_bias: Example value of 'roulette_bias' parameter.
         """
-        self.mock_uniform_selection.return_value = [(solution_values, solution_values) for _ in range(population_size//2)]
-        output = roulette_selection(population_size=population_size, population=[solution_values]*population_size,
+        population = [solution_values] * population_size
+        self.mock_uniform_selection.return_value = [(solution_values, solution_values)] * (population_size // 2)
+        output = roulette_selection(population_size=population_size, population=population,
                                     roulette_bias=roulette_bias)
         assert isinstance(output, GeneratorType)
         output_list = list(output)
-        assert self.mock_uniform_selection.return_value == output_list
+        assert output_list == [(solution_values, solution_values)] * (population_size // 2)
+        self.mock_uniform_selection.assert_called_once_with(population_size=population_size, population=population)
+        self.mock_choose_random_values_with_cumulative_weights.assert_not_called()
+        self.mock_calculate_roulette_scaling.assert_not_called()
 
     @pytest.mark.parametrize("factor", [-1.1, 2.2])
     @pytest.mark.parametrize("offset", [0, 2.5])
@@ -291,7 +307,7 @@ class TestSelectionFunctions:
         """
         self.mock_calculate_roulette_scaling.return_value = [factor, offset]
         self.mock_get_scaled_objective.side_effect = weights
-        self.mock_choose_random_value_with_weights.side_effect = expected_output
+        self.mock_choose_random_values_with_cumulative_weights.return_value = expected_output
         output = roulette_selection(population_size=population_size, population=population, roulette_bias=roulette_bias)
         assert isinstance(output, GeneratorType)
         output_list = list(output)
@@ -299,7 +315,8 @@ class TestSelectionFunctions:
         assert all([(expected_output[2 * i], expected_output[2 * i + 1]) == pair for i, pair in enumerate(output_list)])
         self.mock_get_scaled_objective.assert_has_calls([call(solution=solution, factor=factor, offset=offset)
                                                          for solution in population])
-        self.mock_choose_random_value_with_weights.assert_has_calls([call(values_pool=population, weights=weights)] * population_size)
+        self.mock_choose_random_values_with_cumulative_weights.assert_called_once_with(
+            values_pool=population, cumulative_weights=list(accumulate(weights)), values_number=population_size)
 
     # ranking_selection
 
@@ -318,7 +335,7 @@ class TestSelectionFunctions:
         :param weights: Values to be simulated as returned by 'get_scaled_ranking' function.
         """
         self.mock_get_scaled_ranking.side_effect = weights
-        self.mock_choose_random_value_with_weights.side_effect = expected_output
+        self.mock_choose_random_values_with_cumulative_weights.return_value = expected_output
         output = ranking_selection(population_size=population_size, population=population, ranking_bias=ranking_bias)
         assert isinstance(output, GeneratorType)
         output_list = list(output)
@@ -327,5 +344,198 @@ class TestSelectionFunctions:
         self.mock_get_scaled_ranking.assert_has_calls([
             call(rank=i, population_size=population_size, ranking_bias=ranking_bias) for i in range(population_size)
         ])
-        self.mock_choose_random_value_with_weights.assert_has_calls([call(values_pool=population,
-                                                                          weights=weights)] * population_size)
+        self.mock_choose_random_values_with_cumulative_weights.assert_called_once_with(
+            values_pool=population, cumulative_weights=list(accumulate(weights)), values_number=population_size)
+
+    # stochastic_universal_sampling_selection
+
+    @pytest.mark.parametrize("population_size, population, indices", [
+        (2, ["a", "b", "c"], [0, 2]),
+        (4, [1, 2, 3, 4], [0, 0, 1, 3]),
+    ])
+    @pytest.mark.parametrize("roulette_bias", [1.5, 10])
+    def test_stochastic_universal_sampling_selection(self, population_size, population, indices, roulette_bias):
+        """
+        Test that 'stochastic_universal_sampling_selection' picks parents with stochastic universal sampling.
+
+        :param population_size: Example value of 'population_size' parameter.
+        :param population: Example value of 'population' parameter.
+        :param indices: Values to simulate indices picked by stochastic universal sampling.
+        :param roulette_bias: Example value of 'roulette_bias' parameter.
+        """
+        weights = list(range(1, len(population) + 1))
+        with patch(f"{self.SCRIPT_LOCATION}.get_roulette_weights", return_value=weights) as mock_get_roulette_weights, \
+                patch(f"{self.SCRIPT_LOCATION}.get_stochastic_universal_sampling_indices", return_value=indices) \
+                as mock_get_sus_indices, \
+                patch(f"{self.SCRIPT_LOCATION}.shuffle") as mock_shuffle:
+            output = stochastic_universal_sampling_selection(population_size=population_size, population=population,
+                                                             roulette_bias=roulette_bias)
+            assert isinstance(output, GeneratorType)
+            output_list = list(output)
+        mock_get_roulette_weights.assert_called_once_with(population=population, roulette_bias=roulette_bias)
+        mock_get_sus_indices.assert_called_once_with(cumulative_weights=list(accumulate(weights)),
+                                                     values_number=population_size)
+        mock_shuffle.assert_called_once()
+        expected_parents = [population[index] for index in indices]
+        assert output_list == [(expected_parents[i], expected_parents[i + 1]) for i in range(0, population_size, 2)]
+
+
+class TestBatchSelectionFunctions:
+    """Tests for batch selection functions."""
+
+    SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.selection"
+
+    def setup(self):
+        self._patcher_generate_random_ints_array = patch(f"{self.SCRIPT_LOCATION}.generate_random_ints_array")
+        self.mock_generate_random_ints_array = self._patcher_generate_random_ints_array.start()
+        self._patcher_choose_random_indices_groups = patch(f"{self.SCRIPT_LOCATION}.choose_random_indices_groups")
+        self.mock_choose_random_indices_groups = self._patcher_choose_random_indices_groups.start()
+        self._patcher_choose_random_indices_with_weights = \
+            patch(f"{self.SCRIPT_LOCATION}.choose_random_indices_with_weights")
+        self.mock_choose_random_indices_with_weights = self._patcher_choose_random_indices_with_weights.start()
+
+    def teardown(self):
+        self._patcher_generate_random_ints_array.stop()
+        self._patcher_choose_random_indices_groups.stop()
+        self._patcher_choose_random_indices_with_weights.stop()
+
+    # uniform_batch_selection
+
+    def test_uniform_batch_selection(self):
+        """Test that 'uniform_batch_selection' picks pairs of different parents."""
+        self.mock_generate_random_ints_array.side_effect = [np.array([0, 5, 9]), np.array([0, 5, 8])]
+        pairs = uniform_batch_selection(population_size=6, fitness=np.zeros(10))
+        assert pairs.tolist() == [[0, 1], [5, 6], [9, 8]]
+        self.mock_generate_random_ints_array.assert_has_calls([call(0, 9, size=3), call(0, 8, size=3)])
+
+    # tournament_batch_selection
+
+    def test_tournament_batch_selection(self):
+        """Test that 'tournament_batch_selection' picks the two best individuals from each group."""
+        fitness = np.array([1., 5., -2., 3., 0.])
+        self.mock_choose_random_indices_groups.return_value = np.array([[0, 1, 2], [4, 2, 3]])
+        pairs = tournament_batch_selection(population_size=4, fitness=fitness, tournament_group_size=3)
+        assert pairs.tolist() == [[1, 0], [3, 4]]
+        self.mock_choose_random_indices_groups.assert_called_once_with(pool_size=5, groups_number=2, group_size=3)
+
+    # double_tournament_batch_selection
+
+    def test_double_tournament_batch_selection(self):
+        """Test that 'double_tournament_batch_selection' picks the best individual from each group."""
+        fitness = np.array([1., 5., -2., 3., 0.])
+        self.mock_choose_random_indices_groups.return_value = np.array([[0, 1, 2], [4, 2, 3], [0, 2, 4], [4, 1, 3]])
+        pairs = double_tournament_batch_selection(population_size=4, fitness=fitness, tournament_group_size=3)
+        assert pairs.tolist() == [[1, 3], [0, 1]]
+        self.mock_choose_random_indices_groups.assert_called_once_with(pool_size=5, groups_number=4, group_size=3)
+
+    # roulette_batch_selection
+
+    @pytest.mark.parametrize("roulette_bias", [2, 10.5])
+    def test_roulette_batch_selection(self, roulette_bias):
+        """
+        Test that 'roulette_batch_selection' picks parents with scaled fitness as weights.
+
+        :param roulette_bias: Example value of 'roulette_bias'.
+        """
+        fitness = np.array([1., 5., -3.])
+        assert roulette_batch_selection(population_size=10, fitness=fitness, roulette_bias=roulette_bias) \
+            == self.mock_choose_random_indices_with_weights.return_value
+        call_kwargs = self.mock_choose_random_indices_with_weights.call_args[1]
+        assert call_kwargs["size"] == (5, 2)
+        assert call_kwargs["weights"][2] == pytest.approx(1)
+        assert call_kwargs["weights"][1] == pytest.approx(roulette_bias)
+        assert call_kwargs["weights"][0] == pytest.approx(1 + (roulette_bias - 1) / 2)
+
+    def test_roulette_batch_selection__same_fitness(self):
+        """Test that 'roulette_batch_selection' uses uniform selection when all individuals have the same fitness."""
+        with patch(f"{self.SCRIPT_LOCATION}.uniform_batch_selection") as mock_uniform_batch_selection:
+            assert roulette_batch_selection(population_size=10, fitness=np.ones(10), roulette_bias=2) \
+                == mock_uniform_batch_selection.return_value
+        self.mock_choose_random_indices_with_weights.assert_not_called()
+
+    # ranking_batch_selection
+
+    @pytest.mark.parametrize("ranking_bias", [1.5, 2.])
+    def test_ranking_batch_selection(self, ranking_bias):
+        """
+        Test that 'ranking_batch_selection' picks parents with scaled ranking as weights.
+
+        :param ranking_bias: Example value of 'ranking_bias'.
+        """
+        fitness = np.array([1., 5., -3., 2.])
+        assert ranking_batch_selection(population_size=4, fitness=fitness, ranking_bias=ranking_bias) \
+            == self.mock_choose_random_indices_with_weights.return_value
+        call_kwargs = self.mock_choose_random_indices_with_weights.call_args[1]
+        assert call_kwargs["size"] == (2, 2)
+        assert call_kwargs["weights"].tolist() == pytest.approx([get_scaled_ranking(rank, 4, ranking_bias)
+                                                                 for rank in (1, 3, 0, 2)])
+
+    # stochastic_universal_sampling_batch_selection
+
+    @pytest.mark.parametrize("fitness, roulette_bias, random_offset, expected_parents", [
+        ([1., 1., 1., 1.], 2, 0.5, [0, 1, 2, 3]),
+        ([0., 2., 1., 0.], 3, 0.1, [0, 1, 1, 2]),
+        ([0., 2., 1., 0.], 3, 0.9, [1, 1, 2, 3]),
+    ])
+    def test_stochastic_universal_sampling_batch_selection(self, fitness, roulette_bias, random_offset,
+                                                           expected_parents):
+        """
+        Test that 'stochastic_universal_sampling_batch_selection' picks parents with equally spaced pointers.
+
+        :param fitness: Example fitness of individuals.
+        :param roulette_bias: Example value of 'roulette_bias'.
+        :param random_offset: Value to simulate random offset of pointers (in steps).
+        :param expected_parents: Expected picked parents (before pairs randomization).
+        """
+        with patch(f"{self.SCRIPT_LOCATION}.generate_random_floats_array", return_value=np.array([random_offset])), \
+                patch(f"{self.SCRIPT_LOCATION}.generate_random_permutation", side_effect=np.arange) \
+                as mock_generate_random_permutation:
+            pairs = stochastic_universal_sampling_batch_selection(population_size=4, fitness=np.array(fitness),
+                                                                  roulette_bias=roulette_bias)
+        mock_generate_random_permutation.assert_called_once_with(4)
+        assert pairs.shape == (2, 2)
+        assert pairs.ravel().tolist() == expected_parents
+
+
+class TestSelectionUtilities:
+    """Tests for selection helper functions used by roulette like selections."""
+
+    SCRIPT_LOCATION = "optimization.algorithms.evolutionary_algorithm.selection"
+
+    # get_roulette_weights
+
+    def test_get_roulette_weights__all_the_same(self):
+        """Test that 'get_roulette_weights' returns equal weights when all solutions are the same."""
+        population = [Mock(get_fitness=Mock(return_value=2)) for _ in range(3)]
+        assert get_roulette_weights(population=population, roulette_bias=5) == [1, 1, 1]
+
+    def test_get_roulette_weights__different(self):
+        """Test that 'get_roulette_weights' returns scaled objective values when solutions are different."""
+        population = [Mock(get_objective_value_with_penalty=Mock(return_value=value)) for value in (1, 3, 2)]
+        with patch(f"{self.SCRIPT_LOCATION}.max", create=True, return_value=population[1]), \
+                patch(f"{self.SCRIPT_LOCATION}.min", create=True, return_value=population[0]):
+            weights = get_roulette_weights(population=population, roulette_bias=5)
+        assert weights == pytest.approx([1, 5, 3])
+
+    # get_stochastic_universal_sampling_indices
+
+    @pytest.mark.parametrize("cumulative_weights, values_number, random_offset, expected_indices", [
+        ([1, 2, 3, 4], 4, 0.5, [0, 1, 2, 3]),
+        ([1, 4, 5], 5, 0., [0, 1, 1, 1, 2]),
+        ([1, 4, 5], 5, 1., [1, 1, 1, 2, 2]),
+    ])
+    def test_get_stochastic_universal_sampling_indices(self, cumulative_weights, values_number, random_offset,
+                                                       expected_indices):
+        """
+        Test that 'get_stochastic_universal_sampling_indices' picks indices with equally spaced pointers.
+
+        :param cumulative_weights: Example cumulative weights.
+        :param values_number: Example number of indices to pick.
+        :param random_offset: Value to simulate random offset of the first pointer.
+        :param expected_indices: Expected picked indices.
+        """
+        with patch(f"{self.SCRIPT_LOCATION}.generate_random_float", return_value=random_offset) \
+                as mock_generate_random_float:
+            assert get_stochastic_universal_sampling_indices(cumulative_weights=cumulative_weights,
+                                                             values_number=values_number) == expected_indices
+        mock_generate_random_float.assert_called_once_with(0, cumulative_weights[-1] / values_number)
@@ -1,8 +1,9 @@
 import pytest
 from mock import Mock, patch, call
 
-from optimization.algorithms.abstract_algorithm import AbstractOptimizationAlgorithm, \
-    OptimizationProblem, StopConditions, AbstractLogger, AbstractSolution
+from optimization.algorithms.abstract_algorithm import AbstractOptimizationAlgorithm, IterationInterrupted, \
+    OptimizationProblem, StopConditions, AbstractLogger, AbstractSolution, AbstractEvaluator, SerialEvaluator, fitness_key, \
+    RandomSource
 
 
 class TestAbstractOptimizationAlgorithm:
@@ -18,20 +19,35 @@ class TestAbstractOptimizationAlgorithm:
         self.mock_algorithm_object = Mock(spec=AbstractOptimizationAlgorithm,
                                           _is_stop_achieved=self.mock_algorithm_object_is_stop_achieved,
                                           _perform_iteration=self.mock_algorithm_object_perform_iteration,
-                                          stop_conditions=self.mock_algorithm_object_stop_conditions)
+                                          stop_conditions=self.mock_algorithm_object_stop_conditions,
+                                          random_source=Mock(spec=RandomSource))
         self.mock_problem_object = Mock(spec=OptimizationProblem)
         self.mock_stop_conditions_object = Mock(spec=StopConditions)
         self.mock_logger_object = Mock(spec=AbstractLogger)
+        self.mock_evaluator_object = Mock(spec=AbstractEvaluator)
+        self.mock_random_source_object = Mock(spec=RandomSource)
         self.mock_datetime_now = Mock()
         # patching
         self._patcher_sorted = patch(f"{self.SCRIPT_LOCATION}.sorted")
         self.mock_sorted = self._patcher_sorted.start()
         self._patcher_datetime = patch(f"{self.SCRIPT_LOCATION}.datetime", Mock(now=self.mock_datetime_now))
         self.mock_datetime = self._patcher_datetime.start()
+        self._patcher_monotonic_ns = patch(f"{self.SCRIPT_LOCATION}.monotonic_ns")
+        self.mock_monotonic_ns = self._patcher_monotonic_ns.start()
+        self._patcher_set_random_source = patch(f"{self.SCRIPT_LOCATION}.set_random_source")
+        self.mock_set_random_source = self._patcher_set_random_source.start()
 
     def teardown(self):
         self._patcher_sorted.stop()
         self._patcher_datetime.stop()
+        self._patcher_monotonic_ns.stop()
+        self._patcher_set_random_source.stop()
+
+    def assert_random_source_activated(self):
+        """Checks that random source of the algorithm was used only during optimization process."""
+        self.mock_set_random_source.assert_has_calls([call(self.mock_algorithm_object.random_source),
+                                                      call(self.mock_set_random_source.return_value)])
+        assert self.mock_set_random_source.call_count == 2
 
     # __init__
 
@@ -73,6 +89,32 @@ class TestAbstractOptimizationAlgorithm:
                                                    stop_conditions=self.mock_stop_conditions_object,
                                                    logger=invalid_logger)
 
+    @pytest.mark.parametrize("invalid_evaluator", ["some evaluator", 1, []])
+    def test_init__invalid_evaluator_type(self, invalid_evaluator):
+        """
+        Test that TypeError is raised when initialization of 'AbstractOptimizationAlgorithm' is performed with invalid
+        evaluator type.
+
+        :param invalid_evaluator: Value that is not 'AbstractEvaluator' type.
+        """
+        with pytest.raises(TypeError):
+            AbstractOptimizationAlgorithm.__init__(self=self.mock_algorithm_object, problem=self.mock_problem_object,
+                                                   stop_conditions=self.mock_stop_conditions_object,
+                                                   evaluator=invalid_evaluator)
+
+    @pytest.mark.parametrize("invalid_random_source", [123, "some random source", Mock()])
+    def test_init__invalid_random_source_type(self, invalid_random_source):
+        """
+        Test that TypeError is raised when initialization of 'AbstractOptimizationAlgorithm' is performed with invalid
+        random source type.
+
+        :param invalid_random_source: Value that is not 'RandomSource' type.
+        """
+        with pytest.raises(TypeError):
+            AbstractOptimizationAlgorithm.__init__(self=self.mock_algorithm_object, problem=self.mock_problem_object,
+                                                   stop_conditions=self.mock_stop_conditions_object,
+                                                   random_source=invalid_random_source)
+
     def test_init__valid(self):
         """
         Tests initialization of 'AbstractOptimizationAlgorithm' with mandatory arguments.
@@ -84,7 +126,10 @@ class TestAbstractOptimizationAlgorithm:
         assert issubclass(self.mock_algorithm_object.SolutionClass, AbstractSolution)
         assert self.mock_algorithm_object.SolutionClass.optimization_problem == self.mock_problem_object
         assert self.mock_algorithm_object.logger is None
+        assert isinstance(self.mock_algorithm_object.evaluator, SerialEvaluator)
+        assert isinstance(self.mock_algorithm_object.random_source, RandomSource)
         assert self.mock_algorithm_object._start_time is None
+        assert self.mock_algorithm_object._start_time_ns is None
         assert self.mock_algorithm_object._end_time is None
         assert self.mock_algorithm_object._best_solution is None
 
@@ -94,13 +139,17 @@ class TestAbstractOptimizationAlgorithm:
         """
         AbstractOptimizationAlgorithm.__init__(self=self.mock_algorithm_object, problem=self.mock_problem_object,
                                                stop_conditions=self.mock_stop_conditions_object,
-                                               logger=self.mock_logger_object)
+                                               logger=self.mock_logger_object, evaluator=self.mock_evaluator_object,
+                                               random_source=self.mock_random_source_object)
         assert self.mock_algorithm_object.problem == self.mock_problem_object
         assert self.mock_algorithm_object.stop_conditions == self.mock_stop_conditions_object
         assert issubclass(self.mock_algorithm_object.SolutionClass, AbstractSolution)
         assert self.mock_algorithm_object.SolutionClass.optimization_problem == self.mock_problem_object
         assert self.mock_algorithm_object.logger == self.mock_logger_object
+        assert self.mock_algorithm_object.evaluator == self.mock_evaluator_object
+        assert self.mock_algorithm_object.random_source == self.mock_random_source_object
         assert self.mock_algorithm_object._start_time is None
+        assert self.mock_algorithm_object._start_time_ns is None
         assert self.mock_algorithm_object._end_time is None
         assert self.mock_algorithm_object._best_solution is None
 
@@ -118,11 +167,152 @@ class TestAbstractOptimizationAlgorithm:
         :param best_solution: Value of best_solution currently stored in optimization algorithm.
         """
         self.mock_algorithm_object_stop_conditions_is_achieved.return_value = status
-        self.mock_algorithm_object._start_time = start_time
+        self.mock_algorithm_object._start_time_ns = start_time
         self.mock_algorithm_object._best_solution = best_solution
+        self.mock_algorithm_object._iterations_number = 3
+        self.mock_algorithm_object._evaluations_number = 250
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
         assert AbstractOptimizationAlgorithm._is_stop_achieved(self=self.mock_algorithm_object) is status
         self.mock_algorithm_object_stop_conditions_is_achieved.assert_called_once_with(start_time=start_time,
-                                                                                       best_solution=best_solution)
+                                                                                       best_solution=best_solution,
+                                                                                       iterations_number=3,
+                                                                                       evaluations_number=250)
+
+    # _is_interruption_needed
+
+    @pytest.mark.parametrize("start_time", [0, "some time"])
+    @pytest.mark.parametrize("best_solution", [1, "some solution"])
+    @pytest.mark.parametrize("status", [True, False])
+    def test_is_interruption_needed(self, status, start_time, best_solution):
+        """
+        Tests '_is_interruption_needed' method return the same value as 'is_interruption_needed' method
+        of stop conditions.
+
+        :param status: Status returned by 'is_interruption_needed' method of stop_condition attribute.
+        :param start_time: Value of start time currently stored in optimization algorithm.
+        :param best_solution: Value of best_solution currently stored in optimization algorithm.
+        """
+        self.mock_algorithm_object_stop_conditions.is_interruption_needed.return_value = status
+        self.mock_algorithm_object._start_time_ns = start_time
+        self.mock_algorithm_object._best_solution = best_solution
+        self.mock_algorithm_object._evaluations_number = 100
+        assert AbstractOptimizationAlgorithm._is_interruption_needed(self=self.mock_algorithm_object) is status
+        self.mock_algorithm_object_stop_conditions.is_interruption_needed.assert_called_once_with(
+            start_time=start_time, best_solution=best_solution, evaluations_number=100)
+
+    # _evaluate_solutions
+
+    @pytest.mark.parametrize("solutions", [[], ["solution 1", "solution 2"]])
+    @pytest.mark.parametrize("evaluations_number, performed_evaluations", [(0, 0), (10, 2)])
+    def test_evaluate_solutions(self, solutions, evaluations_number, performed_evaluations):
+        """
+        Tests '_evaluate_solutions' method delegates evaluation to the evaluator and counts performed evaluations.
+
+        :param solutions: Example solutions to evaluate.
+        :param evaluations_number: Example number of evaluations performed before.
+        :param performed_evaluations: Number of evaluations performed by the evaluator.
+        """
+        self.mock_algorithm_object_stop_conditions.checkpoint_interval = None
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
+        self.mock_algorithm_object._evaluations_number = evaluations_number
+        self.mock_evaluator_object.evaluate.return_value = performed_evaluations
+        AbstractOptimizationAlgorithm._evaluate_solutions(self=self.mock_algorithm_object, solutions=solutions)
+        self.mock_evaluator_object.evaluate.assert_called_once_with(solutions)
+        assert self.mock_algorithm_object._evaluations_number == evaluations_number + performed_evaluations
+        self.mock_algorithm_object._checkpoint.assert_not_called()
+
+    @pytest.mark.parametrize("solutions_number, checkpoint_interval", [(0, 1), (5, 5), (3, 100)])
+    def test_evaluate_solutions__single_part(self, solutions_number, checkpoint_interval):
+        """
+        Tests '_evaluate_solutions' method evaluates all solutions at once if they do not exceed checkpoint interval.
+
+        :param solutions_number: Number of solutions to evaluate.
+        :param checkpoint_interval: Example value of 'checkpoint_interval' of stop conditions.
+        """
+        solutions = [f"solution {i}" for i in range(solutions_number)]
+        self.mock_algorithm_object_stop_conditions.checkpoint_interval = checkpoint_interval
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
+        self.mock_algorithm_object._evaluations_number = 0
+        self.mock_evaluator_object.evaluate.return_value = solutions_number
+        AbstractOptimizationAlgorithm._evaluate_solutions(self=self.mock_algorithm_object, solutions=solutions)
+        self.mock_evaluator_object.evaluate.assert_called_once_with(solutions)
+        assert self.mock_algorithm_object._evaluations_number == solutions_number
+        self.mock_algorithm_object._checkpoint.assert_not_called()
+
+    @pytest.mark.parametrize("solutions_number, checkpoint_interval, expected_parts", [
+        (2, 1, [(0, 1), (1, 2)]),
+        (10, 4, [(0, 4), (4, 8), (8, 10)]),
+        (9, 3, [(0, 3), (3, 6), (6, 9)]),
+    ])
+    def test_evaluate_solutions__in_parts(self, solutions_number, checkpoint_interval, expected_parts):
+        """
+        Tests '_evaluate_solutions' method evaluates solutions in parts of 'checkpoint_interval' size and makes
+        a checkpoint after each part but the last one.
+
+        :param solutions_number: Number of solutions to evaluate.
+        :param checkpoint_interval: Example value of 'checkpoint_interval' of stop conditions.
+        :param expected_parts: Expected indices (first and last) of solutions evaluated at once.
+        """
+        solutions = [f"solution {i}" for i in range(solutions_number)]
+        self.mock_algorithm_object_stop_conditions.checkpoint_interval = checkpoint_interval
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
+        self.mock_algorithm_object._evaluations_number = 0
+        self.mock_evaluator_object.evaluate.side_effect = len
+        AbstractOptimizationAlgorithm._evaluate_solutions(self=self.mock_algorithm_object, solutions=solutions)
+        self.mock_evaluator_object.evaluate.assert_has_calls([call(solutions[first:last])
+                                                              for first, last in expected_parts])
+        assert self.mock_evaluator_object.evaluate.call_count == len(expected_parts)
+        self.mock_algorithm_object._checkpoint.assert_has_calls([call(solutions[first:last])
+                                                                 for first, last in expected_parts[:-1]])
+        assert self.mock_algorithm_object._checkpoint.call_count == len(expected_parts) - 1
+        assert self.mock_algorithm_object._evaluations_number == solutions_number
+
+    def test_evaluate_solutions__interrupted(self):
+        """Tests '_evaluate_solutions' method stops evaluation when checkpoint interrupts the iteration."""
+        solutions = [f"solution {i}" for i in range(10)]
+        self.mock_algorithm_object_stop_conditions.checkpoint_interval = 3
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
+        self.mock_algorithm_object._evaluations_number = 0
+        self.mock_evaluator_object.evaluate.side_effect = len
+        self.mock_algorithm_object._checkpoint.side_effect = [None, IterationInterrupted]
+        with pytest.raises(IterationInterrupted):
+            AbstractOptimizationAlgorithm._evaluate_solutions(self=self.mock_algorithm_object, solutions=solutions)
+        assert self.mock_evaluator_object.evaluate.call_count == 2
+        assert self.mock_algorithm_object._evaluations_number == 6
+
+    # _checkpoint
+
+    @pytest.mark.parametrize("best_fitness, evaluated_fitness, expected_best_fitness", [
+        (None, [1, 5, 3], 5),
+        (4, [1, 5, 3], 5),
+        (10, [1, 5, 3], 10),
+    ])
+    def test_checkpoint__not_interrupted(self, best_fitness, evaluated_fitness, expected_best_fitness):
+        """
+        Tests '_checkpoint' method updates the best solution and does not interrupt the iteration if it is not needed.
+
+        :param best_fitness: Fitness of the best solution found before (None if there was no such solution).
+        :param evaluated_fitness: Fitness values of just evaluated solutions.
+        :param expected_best_fitness: Expected fitness of the best solution after the checkpoint.
+        """
+        self.mock_algorithm_object._best_solution = None if best_fitness is None \
+            else Mock(get_fitness=Mock(return_value=best_fitness))
+        evaluated_solutions = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in evaluated_fitness]
+        self.mock_algorithm_object._is_interruption_needed.return_value = False
+        AbstractOptimizationAlgorithm._checkpoint(self=self.mock_algorithm_object,
+                                                  evaluated_solutions=evaluated_solutions)
+        assert self.mock_algorithm_object._best_solution.get_fitness() == expected_best_fitness
+        self.mock_algorithm_object._is_interruption_needed.assert_called_once_with()
+
+    def test_checkpoint__interrupted(self):
+        """Tests '_checkpoint' method raises IterationInterrupted if optimization process has to be stopped."""
+        evaluated_solutions = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in range(3)]
+        self.mock_algorithm_object._best_solution = None
+        self.mock_algorithm_object._is_interruption_needed.return_value = True
+        with pytest.raises(IterationInterrupted):
+            AbstractOptimizationAlgorithm._checkpoint(self=self.mock_algorithm_object,
+                                                      evaluated_solutions=evaluated_solutions)
+        assert self.mock_algorithm_object._best_solution == evaluated_solutions[-1]
 
     # sorted_solutions
 
@@ -137,7 +327,7 @@ class TestAbstractOptimizationAlgorithm:
         """
         assert AbstractOptimizationAlgorithm.sorted_solutions(solutions=solutions, descending=descending) \
             == self.mock_sorted.return_value
-        self.mock_sorted.assert_called_once_with(solutions, reverse=descending)
+        self.mock_sorted.assert_called_once_with(solutions, key=fitness_key, reverse=descending)
 
     # perform_optimization
 
@@ -158,12 +348,17 @@ class TestAbstractOptimizationAlgorithm:
         self.mock_datetime_now.side_effect = [start_time, end_time]
         self.mock_algorithm_object_is_stop_achieved.side_effect = [False] * last_iteration + [True]
         self.mock_algorithm_object._best_solution = best_solution
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
         assert AbstractOptimizationAlgorithm.perform_optimization(self=self.mock_algorithm_object) == best_solution
         assert self.mock_algorithm_object._start_time == start_time
+        assert self.mock_algorithm_object._start_time_ns == self.mock_monotonic_ns.return_value
         assert self.mock_algorithm_object._end_time == end_time
         self.mock_datetime_now.assert_called()
         self.mock_algorithm_object_perform_iteration.assert_has_calls([call(iteration_index=i)
                                                                        for i in range(last_iteration+1)])
+        assert self.mock_algorithm_object._iterations_number == last_iteration + 1
+        self.mock_evaluator_object.close.assert_called_once_with()
+        self.assert_random_source_activated()
 
     @pytest.mark.parametrize("problem", [987, "some problem"])
     @pytest.mark.parametrize("best_solution", [1, "some solution"])
@@ -184,18 +379,68 @@ class TestAbstractOptimizationAlgorithm:
         self.mock_datetime_now.side_effect = [start_time, end_time]
         self.mock_algorithm_object_is_stop_achieved.side_effect = [False] * last_iteration + [True]
         self.mock_algorithm_object._best_solution = best_solution
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
         self.mock_algorithm_object.problem = problem
         assert AbstractOptimizationAlgorithm.perform_optimization(self=self.mock_algorithm_object) == best_solution
         assert self.mock_algorithm_object._start_time == start_time
+        assert self.mock_algorithm_object._start_time_ns == self.mock_monotonic_ns.return_value
         assert self.mock_algorithm_object._end_time == end_time
         self.mock_datetime_now.assert_called()
         self.mock_algorithm_object_perform_iteration.assert_has_calls([call(iteration_index=i)
                                                                        for i in range(last_iteration+1)])
+        self.mock_evaluator_object.close.assert_called_once_with()
+        self.assert_random_source_activated()
         mock_logger.log_at_start.assert_called_once_with(algorithm=self.mock_algorithm_object,
                                                          stop_conditions=self.mock_algorithm_object.stop_conditions,
                                                          problem=problem)
         mock_logger.log_at_end.assert_called_once_with(best_solution=best_solution,
                                                        optimization_time=end_time-start_time)
+        mock_logger.close.assert_called_once_with()
+        assert mock_logger.method_calls[-2:] == [call.log_at_end(best_solution=best_solution,
+                                                                 optimization_time=end_time-start_time),
+                                                 call.close()]
+
+    @pytest.mark.parametrize("last_iteration", [0, 3])
+    def test_perform_optimization__interrupted(self, last_iteration):
+        """
+        Test 'perform_optimization' finishes optimization process when an iteration is interrupted.
+
+        :param last_iteration: Index of the interrupted iteration.
+        """
+        self.mock_algorithm_object.logger = None
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
+        self.mock_algorithm_object_is_stop_achieved.return_value = False
+        self.mock_algorithm_object_perform_iteration.side_effect = [None] * last_iteration + [IterationInterrupted]
+        self.mock_algorithm_object._best_solution = "best solution"
+        assert AbstractOptimizationAlgorithm.perform_optimization(self=self.mock_algorithm_object) == "best solution"
+        assert self.mock_algorithm_object_perform_iteration.call_count == last_iteration + 1
+        assert self.mock_algorithm_object._iterations_number == last_iteration
+        assert self.mock_algorithm_object._start_time_ns == self.mock_monotonic_ns.return_value
+        self.mock_evaluator_object.close.assert_called_once_with()
+        self.assert_random_source_activated()
+
+    def test_perform_optimization__evaluator_closed_on_error(self):
+        """Test 'perform_optimization' releases evaluator resources even if optimization process fails."""
+        self.mock_algorithm_object.logger = None
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
+        self.mock_algorithm_object_perform_iteration.side_effect = RuntimeError
+        with pytest.raises(RuntimeError):
+            AbstractOptimizationAlgorithm.perform_optimization(self=self.mock_algorithm_object)
+        self.mock_evaluator_object.close.assert_called_once_with()
+        self.assert_random_source_activated()
+
+    def test_perform_optimization__logger_closed_on_error(self):
+        """Test 'perform_optimization' closes logger (so logged records are saved) if optimization process fails."""
+        mock_logger = Mock()
+        self.mock_algorithm_object.logger = mock_logger
+        self.mock_algorithm_object.evaluator = self.mock_evaluator_object
+        self.mock_algorithm_object.problem = Mock()
+        self.mock_algorithm_object_perform_iteration.side_effect = RuntimeError
+        with pytest.raises(RuntimeError):
+            AbstractOptimizationAlgorithm.perform_optimization(self=self.mock_algorithm_object)
+        mock_logger.close.assert_called_once_with()
+        mock_logger.log_at_end.assert_not_called()
+        self.mock_evaluator_object.close.assert_called_once_with()
 
     # get_log_data
 
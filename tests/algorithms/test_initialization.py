@@ -0,0 +1,119 @@
+import pytest
+from collections import OrderedDict
+
+import numpy as np
+
+from optimization.algorithms.initialization import InitializationType, INITIALIZATION_FUNCTIONS, get_primes, \
+    get_random_permutations, uniform_initialization, latin_hypercube_initialization, halton_initialization, \
+    generate_initial_values
+from optimization.problem import IntegerVariable, DiscreteVariable, FloatVariable, ChoiceVariable
+
+
+class TestUtilities:
+    """Tests for initialization utilities functions."""
+
+    @pytest.mark.parametrize("primes_number, expected_primes", [
+        (0, []),
+        (1, [2]),
+        (10, [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]),
+    ])
+    def test_get_primes(self, primes_number, expected_primes):
+        """
+        Check that 'get_primes' returns following prime numbers.
+
+        :param primes_number: Example value of 'primes_number'.
+        :param expected_primes: Expected output.
+        """
+        assert get_primes(primes_number) == expected_primes
+
+    @pytest.mark.parametrize("permutations_number, size", [(1, 1), (5, 10), (3, 100)])
+    def test_get_random_permutations(self, permutations_number, size):
+        """
+        Check that 'get_random_permutations' returns array with permutation in each row.
+
+        :param permutations_number: Example value of 'permutations_number'.
+        :param size: Example value of 'size'.
+        """
+        permutations = get_random_permutations(permutations_number=permutations_number, size=size)
+        assert permutations.shape == (permutations_number, size)
+        assert all(sorted(permutation) == list(range(size)) for permutation in permutations.tolist())
+
+
+class TestInitializationFunctions:
+    """Tests for initialization functions."""
+
+    @pytest.mark.parametrize("initialization_function", [uniform_initialization, latin_hypercube_initialization,
+                                                         halton_initialization])
+    @pytest.mark.parametrize("samples_number, dimensions_number", [(1, 1), (10, 3), (257, 12)])
+    def test_samples_in_unit_hypercube(self, initialization_function, samples_number, dimensions_number):
+        """
+        Check that initialization functions return samples from unit hypercube.
+
+        :param initialization_function: Initialization function to test.
+        :param samples_number: Example value of 'samples_number'.
+        :param dimensions_number: Example value of 'dimensions_number'.
+        """
+        samples = initialization_function(samples_number=samples_number, dimensions_number=dimensions_number)
+        assert samples.shape == (samples_number, dimensions_number)
+        assert ((samples >= 0) & (samples < 1)).all()
+
+    @pytest.mark.parametrize("samples_number, dimensions_number", [(1, 1), (10, 3), (100, 7)])
+    def test_latin_hypercube_initialization__one_sample_per_interval(self, samples_number, dimensions_number):
+        """
+        Check that 'latin_hypercube_initialization' places exactly one sample in each interval of each dimension.
+
+        :param samples_number: Example value of 'samples_number'.
+        :param dimensions_number: Example value of 'dimensions_number'.
+        """
+        samples = latin_hypercube_initialization(samples_number=samples_number, dimensions_number=dimensions_number)
+        intervals = np.floor(samples * samples_number).astype(int)
+        for dimension in range(dimensions_number):
+            assert sorted(intervals[:, dimension].tolist()) == list(range(samples_number))
+
+    @pytest.mark.parametrize("base_index, base", [(0, 2), (1, 3), (2, 5)])
+    def test_halton_initialization__one_sample_per_interval(self, base_index, base):
+        """
+        Check that 'halton_initialization' places exactly one sample in each of 'base^k' intervals if there are
+        'base^k' samples.
+
+        :param base_index: Index of the dimension.
+        :param base: Prime base used for the dimension.
+        """
+        samples_number = base ** 3
+        samples = halton_initialization(samples_number=samples_number, dimensions_number=base_index + 1)
+        intervals = np.floor(samples[:, base_index] * samples_number + 1e-9).astype(int)
+        assert len(set(intervals.tolist())) == samples_number
+
+
+class TestGenerateInitialValues:
+    """Tests for 'generate_initial_values' function."""
+
+    DECISION_VARIABLES = OrderedDict(x=IntegerVariable(-10, 10), y=DiscreteVariable(0, 1, 0.25),
+                                     z=FloatVariable(-1.5, 2.5), w=ChoiceVariable("abc"))
+
+    @pytest.mark.parametrize("initialization_type", list(InitializationType) + [item.value
+                                                                                 for item in InitializationType])
+    @pytest.mark.parametrize("values_number", [1, 50])
+    def test_generate_initial_values(self, initialization_type, values_number):
+        """
+        Check that 'generate_initial_values' creates proper values for all decision variables.
+
+        :param initialization_type: Example value of 'initialization_type'.
+        :param values_number: Example value of 'values_number'.
+        """
+        initial_values = generate_initial_values(decision_variables=self.DECISION_VARIABLES,
+                                                 values_number=values_number,
+                                                 initialization_type=initialization_type)
+        assert isinstance(initial_values, list) and len(initial_values) == values_number
+        for values in initial_values:
+            assert isinstance(values, OrderedDict)
+            assert list(values.keys()) == list(self.DECISION_VARIABLES.keys())
+            assert all(self.DECISION_VARIABLES[name].is_proper_value(value) for name, value in values.items())
+
+
+class TestInitializationType:
+    """Tests for 'InitializationType' enum."""
+
+    def test_initialization_functions(self):
+        """Check that there is initialization function defined for each initialization type."""
+        assert set(INITIALIZATION_FUNCTIONS.keys()) == {item.value for item in InitializationType}
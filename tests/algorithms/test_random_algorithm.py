@@ -1,7 +1,7 @@
 import pytest
 from mock import Mock, patch
 
-from optimization.algorithms.random_algorithm import RandomAlgorithm
+from optimization.algorithms.random_algorithm import RandomAlgorithm, InitializationType
 
 
 class TestRandomAlgorithm:
@@ -13,16 +13,23 @@ class TestRandomAlgorithm:
         self.mock_solution_class = Mock()
         self.mock_logger = Mock()
         self.mock_random_algorithm_object = Mock(spec=RandomAlgorithm, SolutionClass=self.mock_solution_class,
-                                                 logger=self.mock_logger)
+                                                 logger=self.mock_logger, problem=Mock(),
+                                                 initialization_type=InitializationType.Uniform.value,
+                                                 chunk_size=None, best_solutions_number=1)
         # patching
         self._patcher_abstract_algorithm_init = patch(f"{self.SCRIPT_LOCATION}.AbstractOptimizationAlgorithm.__init__")
         self.mock_abstract_algorithm_class_init = self._patcher_abstract_algorithm_init.start()
         self._patcher_abstract_algorithm_get_log_data = patch(f"{self.SCRIPT_LOCATION}.AbstractOptimizationAlgorithm.get_log_data")
         self.mock_abstract_algorithm_class_get_log_data = self._patcher_abstract_algorithm_get_log_data.start()
+        self._patcher_generate_initial_values = patch(f"{self.SCRIPT_LOCATION}.generate_initial_values",
+                                                      side_effect=lambda values_number, **_: [Mock() for _ in
+                                                                                              range(values_number)])
+        self.mock_generate_initial_values = self._patcher_generate_initial_values.start()
 
     def teardown(self):
         self._patcher_abstract_algorithm_init.stop()
         self._patcher_abstract_algorithm_get_log_data.stop()
+        self._patcher_generate_initial_values.stop()
 
     # __init__
 
@@ -36,11 +43,30 @@ class TestRandomAlgorithm:
         problem = Mock()
         stop_conditions = Mock()
         logger = Mock()
+        evaluator = Mock()
+        random_source = Mock()
         RandomAlgorithm.__init__(self=self.mock_random_algorithm_object, stop_conditions=stop_conditions,
-                                 problem=problem, logger=logger, population_size=population_size)
+                                 problem=problem, logger=logger, evaluator=evaluator, population_size=population_size,
+                                 random_source=random_source)
         assert self.mock_random_algorithm_object.population_size == population_size
+        assert self.mock_random_algorithm_object.initialization_type == InitializationType.Uniform.value
+        assert self.mock_random_algorithm_object.chunk_size is None
+        assert self.mock_random_algorithm_object.best_solutions_number == 1
         self.mock_abstract_algorithm_class_init.assert_called_once_with(problem=problem,
-                                                                        stop_conditions=stop_conditions, logger=logger)
+                                                                        stop_conditions=stop_conditions, logger=logger,
+                                                                        evaluator=evaluator,
+                                                                        random_source=random_source)
+
+    @pytest.mark.parametrize("initialization_type", [InitializationType.Halton, "LatinHypercube"])
+    def test_init__initialization_type(self, initialization_type):
+        """
+        Test initialization of Random Algorithm class with 'initialization_type' parameter.
+
+        :param initialization_type: Example value of 'initialization_type'.
+        """
+        RandomAlgorithm.__init__(self=self.mock_random_algorithm_object, stop_conditions=Mock(), problem=Mock(),
+                                 initialization_type=initialization_type)
+        assert self.mock_random_algorithm_object.initialization_type == InitializationType(initialization_type).value
 
     @pytest.mark.parametrize("invalid_population_size", ["some population", None, 3.])
     def test_init__invalid_population_size_type(self, invalid_population_size):
@@ -64,39 +90,134 @@ class TestRandomAlgorithm:
             RandomAlgorithm.__init__(self=self.mock_random_algorithm_object, stop_conditions=Mock(),
                                      problem=Mock(), logger=Mock(), population_size=invalid_population_size)
 
+    @pytest.mark.parametrize("chunk_size, best_solutions_number", [(1, 1), (1000, 10)])
+    def test_init__streaming(self, chunk_size, best_solutions_number):
+        """
+        Test initialization of Random Algorithm class with streaming mode parameters.
+
+        :param chunk_size: Example value of 'chunk_size'.
+        :param best_solutions_number: Example value of 'best_solutions_number'.
+        """
+        RandomAlgorithm.__init__(self=self.mock_random_algorithm_object, stop_conditions=Mock(), problem=Mock(),
+                                 chunk_size=chunk_size, best_solutions_number=best_solutions_number)
+        assert self.mock_random_algorithm_object.chunk_size == chunk_size
+        assert self.mock_random_algorithm_object.best_solutions_number == best_solutions_number
+
+    @pytest.mark.parametrize("params", [{"chunk_size": 1.}, {"chunk_size": "1"},
+                                        {"best_solutions_number": None}, {"best_solutions_number": 2.}])
+    def test_init__streaming_invalid_type(self, params):
+        """
+        Test initialization of Random Algorithm class when invalid type of streaming mode parameter is passed.
+
+        :param params: Streaming mode parameters with value of invalid type.
+        """
+        with pytest.raises(TypeError):
+            RandomAlgorithm.__init__(self=self.mock_random_algorithm_object, stop_conditions=Mock(), problem=Mock(),
+                                     **params)
+
+    @pytest.mark.parametrize("params", [{"chunk_size": 0}, {"chunk_size": -10},
+                                        {"best_solutions_number": 0}, {"best_solutions_number": -1}])
+    def test_init__streaming_invalid_value(self, params):
+        """
+        Test initialization of Random Algorithm class when invalid value of streaming mode parameter is passed.
+
+        :param params: Streaming mode parameters with invalid value.
+        """
+        with pytest.raises(ValueError):
+            RandomAlgorithm.__init__(self=self.mock_random_algorithm_object, stop_conditions=Mock(), problem=Mock(),
+                                     **params)
+
     # _perform_iteration
 
     @pytest.mark.parametrize("iteration", [0, 1, 45])
     @pytest.mark.parametrize("best_solution", [None, -100, 100])
     @pytest.mark.parametrize("population_size", [1, 5])
     def test_perform_iteration__without_logger(self, iteration, best_solution, population_size):
-        solutions = list(range(population_size))
-        self.mock_solution_class.side_effect = solutions
+        solutions = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in range(population_size)]
+        self.mock_solution_class.from_trusted_values.side_effect = solutions
         self.mock_random_algorithm_object.logger = None
         self.mock_random_algorithm_object.population_size = population_size
-        self.mock_random_algorithm_object._best_solution = best_solution
+        self.mock_random_algorithm_object._best_solution = best_solution if best_solution is None \
+            else Mock(get_fitness=Mock(return_value=best_solution))
         RandomAlgorithm._perform_iteration(self=self.mock_random_algorithm_object, iteration_index=iteration)
-        if best_solution is None:
+        if best_solution is None or best_solution < population_size - 1:
             assert self.mock_random_algorithm_object._best_solution == solutions[-1]
         else:
-            assert self.mock_random_algorithm_object._best_solution == max(solutions[-1], best_solution)
+            assert self.mock_random_algorithm_object._best_solution.get_fitness() == best_solution
 
     @pytest.mark.parametrize("iteration", [0, 1, 45])
     @pytest.mark.parametrize("best_solution", [None, -100, 100])
     @pytest.mark.parametrize("population_size", [1, 5])
     def test_perform_iteration__with_logger(self, iteration, best_solution, population_size):
-        solutions = list(range(population_size+10, 10, -1))
-        self.mock_solution_class.side_effect = solutions
+        solutions = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in range(population_size+10, 10, -1)]
+        self.mock_solution_class.from_trusted_values.side_effect = solutions
         self.mock_random_algorithm_object.logger = self.mock_logger
         self.mock_random_algorithm_object.population_size = population_size
-        self.mock_random_algorithm_object._best_solution = best_solution
+        self.mock_random_algorithm_object._best_solution = best_solution if best_solution is None \
+            else Mock(get_fitness=Mock(return_value=best_solution))
         RandomAlgorithm._perform_iteration(self=self.mock_random_algorithm_object, iteration_index=iteration)
-        if best_solution is None:
+        self.mock_generate_initial_values.assert_called_once_with(
+            decision_variables=self.mock_random_algorithm_object.problem.decision_variables,
+            values_number=population_size, initialization_type=InitializationType.Uniform.value)
+        self.mock_solution_class.assert_not_called()
+        self.mock_random_algorithm_object._evaluate_solutions.assert_called_once_with(solutions)
+        if best_solution is None or best_solution < population_size + 10:
             assert self.mock_random_algorithm_object._best_solution == solutions[0]
         else:
-            assert self.mock_random_algorithm_object._best_solution == max(solutions[0], best_solution)
+            assert self.mock_random_algorithm_object._best_solution.get_fitness() == best_solution
         self.mock_logger.log_iteration.assert_called_once_with(iteration=iteration, solutions=solutions)
 
+    @pytest.mark.parametrize("iteration", [0, 7])
+    @pytest.mark.parametrize("chunk_size", [1, 5])
+    def test_perform_iteration__streaming_mode(self, iteration, chunk_size):
+        self.mock_random_algorithm_object.chunk_size = chunk_size
+        RandomAlgorithm._perform_iteration(self=self.mock_random_algorithm_object, iteration_index=iteration)
+        self.mock_random_algorithm_object._perform_streaming_iteration.assert_called_once_with(
+            iteration_index=iteration)
+        self.mock_random_algorithm_object._evaluate_solutions.assert_not_called()
+
+    # _perform_streaming_iteration
+
+    @pytest.mark.parametrize("iteration", [0, 3])
+    @pytest.mark.parametrize("population_size, chunk_size, expected_chunks", [
+        (10, 3, [3, 3, 3, 1]),
+        (10, 5, [5, 5]),
+        (4, 10, [4]),
+    ])
+    @pytest.mark.parametrize("best_solutions_number", [1, 3])
+    def test_perform_streaming_iteration(self, iteration, population_size, chunk_size, expected_chunks,
+                                         best_solutions_number):
+        solutions = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in range(population_size)]
+        self.mock_solution_class.from_trusted_values.side_effect = solutions
+        self.mock_random_algorithm_object._is_interruption_needed.return_value = False
+        self.mock_random_algorithm_object._best_solution = None
+        self.mock_random_algorithm_object.population_size = population_size
+        self.mock_random_algorithm_object.chunk_size = chunk_size
+        self.mock_random_algorithm_object.best_solutions_number = best_solutions_number
+        RandomAlgorithm._perform_streaming_iteration(self=self.mock_random_algorithm_object, iteration_index=iteration)
+        assert [call_args[1]["values_number"] for call_args in self.mock_generate_initial_values.call_args_list] \
+            == expected_chunks
+        assert self.mock_random_algorithm_object._evaluate_solutions.call_count == len(expected_chunks)
+        assert self.mock_random_algorithm_object._is_interruption_needed.call_count == len(expected_chunks) - 1
+        assert self.mock_random_algorithm_object._best_solution == solutions[-1]
+        self.mock_logger.log_iteration.assert_called_once_with(iteration=iteration,
+                                                               solutions=solutions[:-best_solutions_number-1:-1])
+
+    @pytest.mark.parametrize("population_size, chunk_size", [(10, 3), (100, 1)])
+    def test_perform_streaming_iteration__interrupted(self, population_size, chunk_size):
+        solutions = [Mock(get_fitness=Mock(return_value=fitness)) for fitness in range(population_size)]
+        self.mock_solution_class.from_trusted_values.side_effect = solutions
+        self.mock_random_algorithm_object._is_interruption_needed.return_value = True
+        self.mock_random_algorithm_object._best_solution = Mock(get_fitness=Mock(return_value=population_size))
+        self.mock_random_algorithm_object.population_size = population_size
+        self.mock_random_algorithm_object.chunk_size = chunk_size
+        self.mock_random_algorithm_object.best_solutions_number = 1
+        RandomAlgorithm._perform_streaming_iteration(self=self.mock_random_algorithm_object, iteration_index=0)
+        self.mock_generate_initial_values.assert_called_once()
+        self.mock_random_algorithm_object._evaluate_solutions.assert_called_once_with(solutions[:chunk_size])
+        assert self.mock_random_algorithm_object._best_solution.get_fitness() == population_size
+        self.mock_logger.log_iteration.assert_called_once_with(iteration=0, solutions=[solutions[chunk_size-1]])
+
     # get_log_data
 
     @pytest.mark.parametrize("population_size", [1, 5])
@@ -107,6 +228,9 @@ class TestRandomAlgorithm:
         log_data = RandomAlgorithm.get_log_data(self=self.mock_random_algorithm_object)
         assert isinstance(log_data, dict)
         assert log_data["population_size"] == population_size
+        assert log_data["initialization_type"] == self.mock_random_algorithm_object.initialization_type
+        assert log_data["chunk_size"] == self.mock_random_algorithm_object.chunk_size
+        assert log_data["best_solutions_number"] == self.mock_random_algorithm_object.best_solutions_number
         assert all([log_data[key] == value for key, value in parent_data.items()])
         self.mock_abstract_algorithm_class_get_log_data.assert_called_once()
 
@@ -0,0 +1,241 @@
+import pytest
+from mock import Mock
+from collections import OrderedDict
+from datetime import timedelta
+from os import listdir, path
+import json
+
+import numpy as np
+
+from optimization.logging.logger import AbstractLogger
+from optimization.logging.async_logger import AsyncLogger
+from optimization.logging.archive import ArchiveLogger, SolutionsArchive
+from optimization.problem import OptimizationProblem, OptimizationType, IntegerVariable, FloatVariable, \
+    ChoiceVariable, AbstractSolution
+
+
+def penalty_function(**constraints):
+    return constraints["limit"]
+
+
+EXAMPLE_PROBLEM = OptimizationProblem(decision_variables=OrderedDict(a=IntegerVariable(0, 10),
+                                                                     b=FloatVariable(-1., 1.),
+                                                                     c=ChoiceVariable(["x", "y", "z"])),
+                                      constraints={"limit": lambda a, b, c: max(0, a - 5)},
+                                      penalty_function=penalty_function,
+                                      objective_function=lambda a, b, c: a + b,
+                                      optimization_type=OptimizationType.Minimize)
+
+
+class ExampleSolution(AbstractSolution):
+    __slots__ = ()
+    optimization_problem = EXAMPLE_PROBLEM
+
+
+EXAMPLE_SOLUTIONS = [ExampleSolution(a=1, b=0.5, c="x"), ExampleSolution(a=7, b=-1., c="z"),
+                     ExampleSolution(a=1, b=0.5, c="y")]
+
+
+def create_logger(tmp_path, **params):
+    logger = ArchiveLogger(logs_dir=str(tmp_path), **params)
+    logger.log_at_start(algorithm=Mock(), stop_conditions=Mock(), problem=EXAMPLE_PROBLEM)
+    return logger
+
+
+class TestArchiveLogger:
+    """Tests for 'ArchiveLogger' class and their methods."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 1000])
+    def test_init__valid(self, tmp_path, chunk_size):
+        logs_dir = str(tmp_path / "logs")
+        logger = ArchiveLogger(logs_dir=logs_dir, chunk_size=chunk_size)
+        assert isinstance(logger, AbstractLogger)
+        assert logger.main_dir == logs_dir
+        assert logger.chunk_size == chunk_size
+        assert logger.optimization_process_dir is None
+        assert path.isdir(logs_dir)
+
+    @pytest.mark.parametrize("params", [{"logs_dir": 1}, {"chunk_size": 1.}, {"chunk_size": None}])
+    def test_init__invalid_type(self, tmp_path, params):
+        params.setdefault("logs_dir", str(tmp_path))
+        with pytest.raises(TypeError):
+            ArchiveLogger(**params)
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_init__invalid_value(self, tmp_path, chunk_size):
+        with pytest.raises(ValueError):
+            ArchiveLogger(logs_dir=str(tmp_path), chunk_size=chunk_size)
+
+    def test_log_at_start(self, tmp_path):
+        logger = ArchiveLogger(logs_dir=str(tmp_path))
+        logger.close = Mock()
+        logger.log_at_start(algorithm=Mock(), stop_conditions=Mock(), problem=EXAMPLE_PROBLEM)
+        logger.close.assert_called_once_with()
+        assert path.dirname(logger.optimization_process_dir) == str(tmp_path)
+        assert listdir(logger.optimization_process_dir) == []
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 100])
+    def test_log_iteration(self, tmp_path, chunk_size):
+        logger = create_logger(tmp_path, chunk_size=chunk_size)
+        logger.log_iteration(iteration=0, solutions=EXAMPLE_SOLUTIONS)
+        logger.log_iteration(iteration=1, solutions=iter(EXAMPLE_SOLUTIONS[:2]))
+        logger.close()
+        archive = SolutionsArchive(path.join(logger.optimization_process_dir, ArchiveLogger.SOLUTIONS_DIR_NAME))
+        assert len(archive) == 5
+        assert list(archive["iteration"]) == [0, 0, 0, 1, 1]
+        assert list(archive["individual"]) == [0, 1, 2, 0, 1]
+        assert list(archive.get_decision_variable_values("a")) == [1, 7, 1, 1, 7]
+        assert archive.get_decision_variable_column("a").dtype == np.int64
+        assert list(archive.get_decision_variable_values("b")) == [0.5, -1., 0.5, 0.5, -1.]
+        assert list(archive.get_decision_variable_values("c")) == ["x", "z", "y", "x", "z"]
+        assert list(archive["objective_value_with_penalty"]) == [1.5, 8., 1.5, 1.5, 8.]
+        assert list(archive["fitness"]) == [-1.5, -8., -1.5, -1.5, -8.]
+        assert list(archive["penalty_value"]) == [0, 2, 0, 0, 2]
+        assert archive.metadata["optimization_type"] == "Minimize"
+        assert archive.metadata["index_columns"] == ["iteration"]
+
+    def test_log_iteration__variables_named_as_columns(self, tmp_path):
+        problem = OptimizationProblem(decision_variables=OrderedDict(fitness=IntegerVariable(100, 200),
+                                                                     iteration=FloatVariable(-1., 1.)),
+                                      constraints={}, penalty_function=lambda **_: 0,
+                                      objective_function=lambda fitness, iteration: fitness + iteration,
+                                      optimization_type=OptimizationType.Maximize)
+
+        class ClashingSolution(AbstractSolution):
+            __slots__ = ()
+            optimization_problem = problem
+
+        logger = create_logger(tmp_path)
+        logger.log_iteration(iteration=3, solutions=[ClashingSolution(fitness=100, iteration=0.5),
+                                                     ClashingSolution(fitness=150, iteration=-0.5)])
+        logger.close()
+        archive = SolutionsArchive(path.join(logger.optimization_process_dir, ArchiveLogger.SOLUTIONS_DIR_NAME))
+        assert len(archive) == 2
+        assert list(archive["iteration"]) == [3, 3]
+        assert archive["iteration"].dtype == np.int64
+        assert list(archive["fitness"]) == [100.5, 149.5]
+        assert list(archive.get_decision_variable_values("fitness")) == [100, 150]
+        assert list(archive.get_decision_variable_values("iteration")) == [0.5, -0.5]
+
+    def test_log_iteration__unknown_penalty(self, tmp_path):
+        logger = create_logger(tmp_path)
+        solution = ExampleSolution(a=2, b=0., c="y")
+        solution._objective_value_with_penalty = 3
+        logger.log_iteration(iteration=0, solutions=[solution])
+        logger.close()
+        archive = SolutionsArchive(path.join(logger.optimization_process_dir, ArchiveLogger.SOLUTIONS_DIR_NAME))
+        assert list(archive["objective_value_with_penalty"]) == [3.]
+        assert np.isnan(archive["penalty_value"][0])
+
+    def test_log_iteration__no_solutions(self, tmp_path):
+        logger = create_logger(tmp_path)
+        logger.log_iteration(iteration=0, solutions=[])
+        logger.close()
+        assert listdir(logger.optimization_process_dir) == []
+
+    def test_log_lower_level_iteration(self, tmp_path):
+        logger = create_logger(tmp_path)
+        logger.log_lower_level_iteration(upper_iteration=0, lower_algorithm_index=1, lower_iteration=0,
+                                         solutions=EXAMPLE_SOLUTIONS[:1])
+        logger.log_lower_level_iteration(upper_iteration=0, lower_algorithm_index=1, lower_iteration=1,
+                                         solutions=EXAMPLE_SOLUTIONS[1:])
+        logger.log_lower_level_iteration(upper_iteration=2, lower_algorithm_index=0, lower_iteration=0,
+                                         solutions=EXAMPLE_SOLUTIONS)
+        logger.log_lower_level_at_end(upper_iteration=2, lower_algorithm_index=0, best_solution=EXAMPLE_SOLUTIONS[0],
+                                      optimization_time=timedelta(seconds=1))
+        logger.close()
+        assert listdir(logger.optimization_process_dir) == [ArchiveLogger.LOWER_LEVEL_SOLUTIONS_DIR_NAME]
+        archive = SolutionsArchive(path.join(logger.optimization_process_dir,
+                                             ArchiveLogger.LOWER_LEVEL_SOLUTIONS_DIR_NAME))
+        assert len(archive) == 6
+        assert list(archive["upper_iteration"]) == [0, 0, 0, 2, 2, 2]
+        assert list(archive["lower_algorithm_index"]) == [1, 1, 1, 0, 0, 0]
+        assert list(archive["lower_iteration"]) == [0, 1, 1, 0, 0, 0]
+        assert list(archive["individual"]) == [0, 0, 1, 0, 1, 2]
+        assert "iteration" not in archive.columns_names
+
+    def test_log_at_end(self, tmp_path):
+        logger = create_logger(tmp_path)
+        logger.log_at_end(best_solution=EXAMPLE_SOLUTIONS[0], optimization_time=timedelta(seconds=2))
+        with open(path.join(logger.optimization_process_dir, "best_solution.json")) as json_file:
+            data = json.load(json_file)
+        assert data == {"optimization_duration": "0:00:02",
+                        "best_solution": {"decision_variables_values": {"a": 1, "b": 0.5, "c": "x"},
+                                          "objective_value_with_penalty": 1.5}}
+
+    def test_close(self, tmp_path):
+        logger = create_logger(tmp_path, chunk_size=100)
+        logger.log_iteration(iteration=0, solutions=EXAMPLE_SOLUTIONS)
+        archive = SolutionsArchive(path.join(logger.optimization_process_dir, ArchiveLogger.SOLUTIONS_DIR_NAME))
+        assert len(archive) == 0
+        logger.close()
+        logger.close()
+        assert len(SolutionsArchive(archive.archive_dir)) == 3
+
+    def test_async(self, tmp_path):
+        logger = AsyncLogger(logger=ArchiveLogger(logs_dir=str(tmp_path)), queue_size=1)
+        logger.log_at_start(algorithm=Mock(), stop_conditions=Mock(), problem=EXAMPLE_PROBLEM)
+        for iteration in range(10):
+            logger.log_iteration(iteration=iteration, solutions=EXAMPLE_SOLUTIONS)
+        logger.close()
+        archive = SolutionsArchive(path.join(logger.logger.optimization_process_dir,
+                                             ArchiveLogger.SOLUTIONS_DIR_NAME))
+        assert len(archive) == 30
+        assert list(archive["fitness"][:3]) == [-1.5, -8., -1.5]
+
+    def test_get_log_data(self, tmp_path):
+        assert ArchiveLogger(logs_dir=str(tmp_path), chunk_size=5).get_log_data() == {"type": "ArchiveLogger",
+                                                                                       "chunk_size": 5}
+
+
+class TestSolutionsArchive:
+    """Tests for 'SolutionsArchive' class and their methods."""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        logger = create_logger(tmp_path)
+        logger.log_iteration(iteration=0, solutions=EXAMPLE_SOLUTIONS)
+        logger.close()
+        return SolutionsArchive(path.join(logger.optimization_process_dir, ArchiveLogger.SOLUTIONS_DIR_NAME))
+
+    def test_init__invalid_type(self):
+        with pytest.raises(TypeError):
+            SolutionsArchive(archive_dir=1)
+
+    def test_init__invalid_value(self, tmp_path):
+        with pytest.raises(ValueError):
+            SolutionsArchive(archive_dir=str(tmp_path))
+
+    def test_columns_names(self, archive):
+        assert archive.columns_names == ["iteration", "individual", "objective_value_with_penalty", "fitness",
+                                         "penalty_value"]
+        assert archive.decision_variables_names == ["a", "b", "c"]
+
+    def test_getitem(self, archive):
+        column = archive["fitness"]
+        assert isinstance(column, np.memmap)
+        assert not column.flags.writeable
+        assert archive["fitness"] is column
+
+    @pytest.mark.parametrize("column_name", ["unknown", "a"])
+    def test_getitem__unknown_column(self, archive, column_name):
+        with pytest.raises(KeyError):
+            archive[column_name]
+
+    def test_get_decision_variable_column(self, archive):
+        column = archive.get_decision_variable_column("b")
+        assert isinstance(column, np.memmap)
+        assert list(column) == [0.5, -1., 0.5]
+        assert archive.get_decision_variable_column("b") is column
+
+    def test_get_decision_variable_values(self, archive):
+        assert list(archive.get_decision_variable_values("a")) == [1, 7, 1]
+        assert list(archive.get_decision_variable_values("c")) == ["x", "z", "y"]
+        possible_values = archive.metadata["decision_variables"][2]["possible_values"]
+        assert [possible_values[code] for code in archive.get_decision_variable_column("c")] == ["x", "z", "y"]
+
+    def test_get_decision_variable_values__unknown_variable(self, archive):
+        with pytest.raises(KeyError):
+            archive.get_decision_variable_values("fitness")
+        with pytest.raises(KeyError):
+            archive.get_decision_variable_column("fitness")
@@ -0,0 +1,259 @@
+import pytest
+from mock import Mock, call
+from threading import Event, Thread
+from collections import OrderedDict
+from datetime import timedelta
+
+from optimization.logging.logger import AbstractLogger
+from optimization.logging.async_logger import AsyncLogger, BackpressurePolicy, take_snapshot, _SolutionSnapshot, \
+    _LogDataSnapshot
+from optimization.problem import OptimizationProblem, OptimizationType, IntegerVariable, AbstractSolution
+
+
+EXAMPLE_PROBLEM = OptimizationProblem(decision_variables=OrderedDict(a=IntegerVariable(0, 10),
+                                                                     b=IntegerVariable(-5, 5)),
+                                      constraints={}, penalty_function=lambda **_: 0,
+                                      objective_function=lambda a, b: a + b,
+                                      optimization_type=OptimizationType.Maximize)
+
+
+class ExampleSolution(AbstractSolution):
+    __slots__ = ()
+    optimization_problem = EXAMPLE_PROBLEM
+
+
+def get_logged_data(mock_method):
+    return [(params["iteration"], [solution.get_log_data() for solution in params["solutions"]])
+            for _, params in mock_method.call_args_list]
+
+
+class TestTakeSnapshot:
+    """Tests for 'take_snapshot' function."""
+
+    @pytest.mark.parametrize("a, b", [(0, 0), (10, -5), (3, 2)])
+    def test_solution(self, a, b):
+        solution = ExampleSolution(a=a, b=b)
+        snapshot = take_snapshot(solution)
+        assert isinstance(snapshot, _SolutionSnapshot)
+        assert snapshot.values == (a, b)
+        assert snapshot.optimization_problem is EXAMPLE_PROBLEM
+        assert snapshot.get_objective_value_with_penalty() == snapshot.get_fitness() == a + b
+        assert snapshot.penalty_value == 0
+        assert snapshot.log_data is None
+        assert snapshot.get_log_data() == solution.get_log_data()
+
+    def test_solution__own_log_data(self):
+        class SolutionWithLogData(ExampleSolution):
+            __slots__ = ("data",)
+
+            def get_log_data(self):
+                return {"data": self.data}
+
+        solution = SolutionWithLogData(a=1, b=1)
+        solution.data = 1
+        snapshot = take_snapshot(solution)
+        solution.data = 2
+        assert isinstance(snapshot, _SolutionSnapshot)
+        assert snapshot.values == (1, 1)
+        assert snapshot.get_log_data() == {"data": 1}
+
+    def test_other(self):
+        mock_object = Mock(get_log_data=Mock(return_value={"a": 1}))
+        snapshot = take_snapshot(mock_object)
+        assert isinstance(snapshot, _LogDataSnapshot)
+        mock_object.get_log_data.assert_called_once_with()
+        mock_object.get_log_data.return_value = {"a": 2}
+        assert snapshot.get_log_data() == {"a": 1}
+
+
+class TestAsyncLogger:
+    """Tests for 'AsyncLogger' class and their methods."""
+
+    def setup(self):
+        self.mock_logger = Mock(spec=AbstractLogger)
+
+    # __init__
+
+    @pytest.mark.parametrize("queue_size", [1, 100])
+    @pytest.mark.parametrize("backpressure_policy, expected_policy", [
+        (BackpressurePolicy.Block, BackpressurePolicy.Block),
+        ("DropOldest", BackpressurePolicy.DropOldest),
+        ("Sample", BackpressurePolicy.Sample),
+    ])
+    @pytest.mark.parametrize("sampling_step", [1, 5])
+    def test_init__valid(self, queue_size, backpressure_policy, expected_policy, sampling_step):
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=queue_size,
+                                   backpressure_policy=backpressure_policy, sampling_step=sampling_step)
+        assert isinstance(async_logger, AbstractLogger)
+        assert async_logger.logger == self.mock_logger
+        assert async_logger.queue_size == queue_size
+        assert async_logger.backpressure_policy == expected_policy
+        assert async_logger.sampling_step == sampling_step
+        assert async_logger.dropped_records_number == 0
+        assert async_logger.get_queued_records_number() == 0
+
+    @pytest.mark.parametrize("params", [{"logger": Mock()}, {"queue_size": 1.}, {"queue_size": None},
+                                        {"backpressure_policy": 1}, {"sampling_step": "10"}])
+    def test_init__invalid_type(self, params):
+        params.setdefault("logger", self.mock_logger)
+        with pytest.raises(TypeError):
+            AsyncLogger(**params)
+
+    @pytest.mark.parametrize("params", [{"queue_size": 0}, {"queue_size": -1}, {"sampling_step": 0}])
+    def test_init__invalid_value(self, params):
+        with pytest.raises(ValueError):
+            AsyncLogger(logger=self.mock_logger, **params)
+
+    # logging
+
+    @pytest.mark.parametrize("iterations", [1, 20])
+    def test_log_iteration(self, iterations):
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=3)
+        solutions = [ExampleSolution(a=1, b=2), ExampleSolution(a=5, b=-5)]
+        for iteration in range(iterations):
+            async_logger.log_iteration(iteration=iteration, solutions=solutions)
+        async_logger.close()
+        expected_data = [solution.get_log_data() for solution in solutions]
+        assert get_logged_data(self.mock_logger.log_iteration) == [(iteration, expected_data)
+                                                                   for iteration in range(iterations)]
+        self.mock_logger.close.assert_called_once_with()
+
+    def test_log_iteration__snapshot(self):
+        mock_lower_algorithm = Mock(get_log_data=Mock(return_value={"fitness": 1}))
+        started, release = Event(), Event()
+        self.mock_logger.log_iteration.side_effect = lambda **_: started.set() or release.wait()
+        async_logger = AsyncLogger(logger=self.mock_logger)
+        async_logger.log_iteration(iteration=0, solutions=[])
+        started.wait()
+        async_logger.log_iteration(iteration=1, solutions=[mock_lower_algorithm])
+        mock_lower_algorithm.get_log_data.return_value = {"fitness": 2}
+        release.set()
+        async_logger.close()
+        assert get_logged_data(self.mock_logger.log_iteration) == [(0, []), (1, [{"fitness": 1}])]
+
+    def test_log_lower_level(self):
+        async_logger = AsyncLogger(logger=self.mock_logger)
+        solution = ExampleSolution(a=3, b=4)
+        async_logger.log_lower_level_iteration(upper_iteration=1, lower_algorithm_index=2, lower_iteration=3,
+                                               solutions=[solution])
+        async_logger.log_lower_level_at_end(upper_iteration=1, lower_algorithm_index=2, best_solution=solution,
+                                            optimization_time=timedelta(seconds=1))
+        async_logger.close()
+        (_, params), = self.mock_logger.log_lower_level_iteration.call_args_list
+        assert params["upper_iteration"] == 1 and params["lower_algorithm_index"] == 2
+        assert params["lower_iteration"] == 3
+        assert [snapshot.get_log_data() for snapshot in params["solutions"]] == [solution.get_log_data()]
+        (_, params), = self.mock_logger.log_lower_level_at_end.call_args_list
+        assert params["best_solution"].get_log_data() == solution.get_log_data()
+        assert params["optimization_time"] == timedelta(seconds=1)
+
+    def test_log_at_start__waits_for_queued_records(self):
+        async_logger = AsyncLogger(logger=self.mock_logger)
+        async_logger.log_iteration(iteration=0, solutions=[])
+        async_logger.log_at_end(best_solution=ExampleSolution(a=0, b=0), optimization_time=timedelta())
+        async_logger.log_at_start(algorithm="algorithm", stop_conditions="stop_conditions", problem="problem")
+        method_names = [name for name, _, _ in self.mock_logger.mock_calls]
+        assert method_names == ["log_iteration", "log_at_end", "log_at_start"]
+        self.mock_logger.log_at_start.assert_called_once_with(algorithm="algorithm",
+                                                              stop_conditions="stop_conditions", problem="problem")
+        async_logger.close()
+
+    def test_log_at_start__resets_counters(self):
+        async_logger = AsyncLogger(logger=self.mock_logger, backpressure_policy=BackpressurePolicy.Sample)
+        async_logger.dropped_records_number = 95
+        async_logger._full_queue_records_number = 7
+        async_logger.log_at_start(algorithm="algorithm", stop_conditions="stop_conditions", problem="problem")
+        assert async_logger.dropped_records_number == 0
+        assert async_logger._full_queue_records_number == 0
+        async_logger.close()
+
+    def test_close__reusable(self):
+        async_logger = AsyncLogger(logger=self.mock_logger)
+        async_logger.close()
+        async_logger.log_iteration(iteration=0, solutions=[])
+        async_logger.close()
+        async_logger.log_iteration(iteration=1, solutions=[])
+        async_logger.close()
+        assert [params["iteration"] for _, params in self.mock_logger.log_iteration.call_args_list] == [0, 1]
+        assert self.mock_logger.close.call_args_list == [call(), call(), call()]
+
+    def test_close__error(self):
+        self.mock_logger.log_iteration.side_effect = OSError("disk full")
+        async_logger = AsyncLogger(logger=self.mock_logger)
+        async_logger.log_iteration(iteration=0, solutions=[])
+        with pytest.raises(OSError):
+            async_logger.close()
+        self.mock_logger.close.assert_called_once_with()
+        async_logger.close()
+
+    # backpressure
+
+    def _fill_queue(self, async_logger, release):
+        started = Event()
+        self.mock_logger.log_iteration.side_effect = lambda **_: started.set() or release.wait()
+        async_logger.log_iteration(iteration=0, solutions=[])
+        started.wait()
+        for iteration in range(1, async_logger.queue_size + 1):
+            async_logger.log_iteration(iteration=iteration, solutions=[])
+        assert async_logger.get_queued_records_number() == async_logger.queue_size
+
+    def test_backpressure__block(self):
+        release = Event()
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=2, backpressure_policy=BackpressurePolicy.Block)
+        self._fill_queue(async_logger, release)
+        thread = Thread(target=async_logger.log_iteration, kwargs={"iteration": 3, "solutions": []})
+        thread.start()
+        thread.join(timeout=0.1)
+        assert thread.is_alive()
+        release.set()
+        thread.join()
+        async_logger.close()
+        assert [params["iteration"] for _, params in self.mock_logger.log_iteration.call_args_list] == [0, 1, 2, 3]
+        assert async_logger.dropped_records_number == 0
+
+    def test_backpressure__drop_oldest(self):
+        release = Event()
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=2,
+                                   backpressure_policy=BackpressurePolicy.DropOldest)
+        self._fill_queue(async_logger, release)
+        async_logger.log_iteration(iteration=3, solutions=[])
+        async_logger.log_iteration(iteration=4, solutions=[])
+        assert async_logger.dropped_records_number == 2
+        release.set()
+        async_logger.close()
+        assert [params["iteration"] for _, params in self.mock_logger.log_iteration.call_args_list] == [0, 3, 4]
+
+    @pytest.mark.parametrize("policy", [BackpressurePolicy.DropOldest, BackpressurePolicy.Sample])
+    def test_backpressure__end_records_not_dropped(self, policy):
+        release = Event()
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=2, backpressure_policy=policy)
+        self._fill_queue(async_logger, release)
+        thread = Thread(target=async_logger.log_at_end, kwargs={"best_solution": ExampleSolution(a=0, b=0),
+                                                                "optimization_time": timedelta()})
+        thread.start()
+        release.set()
+        thread.join()
+        async_logger.close()
+        assert [params["iteration"] for _, params in self.mock_logger.log_iteration.call_args_list] == [0, 1, 2]
+        self.mock_logger.log_at_end.assert_called_once()
+
+    @pytest.mark.parametrize("sampling_step", [1, 3])
+    def test_is_dropped__sample(self, sampling_step):
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=1,
+                                   backpressure_policy=BackpressurePolicy.Sample, sampling_step=sampling_step)
+        assert async_logger._is_dropped() is False
+        async_logger._records.append((True, "log_iteration", {}))
+        decisions = [async_logger._is_dropped() for _ in range(2 * sampling_step)]
+        assert decisions == 2 * ([True] * (sampling_step - 1) + [False])
+
+    @pytest.mark.parametrize("policy", [BackpressurePolicy.Block, BackpressurePolicy.DropOldest])
+    def test_is_dropped__not_sample(self, policy):
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=1, backpressure_policy=policy)
+        async_logger._records.append((True, "log_iteration", {}))
+        assert async_logger._is_dropped() is False
+
+    def test_get_log_data(self):
+        async_logger = AsyncLogger(logger=self.mock_logger, queue_size=5,
+                                   backpressure_policy=BackpressurePolicy.Sample, sampling_step=2)
+        assert async_logger.get_log_data() == {"type": "AsyncLogger", "queue_size": 5,
+                                               "backpressure_policy": "Sample", "sampling_step": 2}
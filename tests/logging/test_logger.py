@@ -1,6 +1,8 @@
 import pytest
-from mock import Mock, patch
+from mock import Mock, patch, call
 from operator import eq, ne, lt, le, ge, gt
+from datetime import timedelta
+import json
 
 from optimization.logging.logger import LoggingVerbosity, Logger, LoggingFormat
 
@@ -88,6 +90,7 @@ class TestLogger:
 
     def setup(self):
         self.mock_logger_object = Mock(spec=Logger)
+        self.mock_logger_object.compress_lower_level = False
         self.mock_path_isdir = Mock()
         # patching
         self._patcher_path = patch(f"{self.SCRIPT_LOCATION}.path", Mock(isdir=self.mock_path_isdir))
@@ -113,7 +116,14 @@ class TestLogger:
         assert self.mock_logger_object.main_dir == logs_dir
         assert self.mock_logger_object.verbosity == LoggingVerbosity.BestSolution
         assert self.mock_logger_object.log_format == LoggingFormat.YAML
+        assert self.mock_logger_object.buffer_size == 1024 * 1024
+        assert self.mock_logger_object.flush_interval is None
+        assert self.mock_logger_object.compress_lower_level is False
+        assert self.mock_logger_object.max_lower_level_file_size is None
         assert self.mock_logger_object.optimization_process_dir is None
+        assert self.mock_logger_object._solutions_writer is None
+        assert self.mock_logger_object._lower_level_writer is None
+        assert self.mock_logger_object._lower_level_stream is None
 
     @pytest.mark.parametrize("logs_dir", EXAMPLE_LOGS_DIR)
     @pytest.mark.parametrize("verbosity", list(LoggingVerbosity) + [item.name for item in list(LoggingVerbosity)])
@@ -178,3 +188,342 @@ class TestLogger:
         self.mock_path_isdir.return_value = False
         Logger.__init__(self=self.mock_logger_object, logs_dir=logs_dir)
         self.mock_makedirs.assert_called_once_with(logs_dir)
+
+    @pytest.mark.parametrize("buffer_size, flush_interval", [(0, None), (100, timedelta(seconds=5))])
+    def test_init__valid_buffering(self, buffer_size, flush_interval):
+        """
+        Tests that 'Logger' class can be initialized with proper values of buffering parameters.
+
+        :param buffer_size: Example value of 'buffer_size' parameter.
+        :param flush_interval: Example value of 'flush_interval' parameter.
+        """
+        Logger.__init__(self=self.mock_logger_object, logs_dir="logs", buffer_size=buffer_size,
+                        flush_interval=flush_interval)
+        assert self.mock_logger_object.buffer_size == buffer_size
+        assert self.mock_logger_object.flush_interval == flush_interval
+
+    @pytest.mark.parametrize("params", [{"buffer_size": 1.}, {"buffer_size": None}, {"flush_interval": 5},
+                                        {"flush_interval": "1s"}])
+    def test_init__invalid_buffering_type(self, params):
+        """
+        Tests that during init of 'Logger' class TypeError will be raise if buffering parameter has invalid type.
+
+        :param params: Example values of buffering parameters.
+        """
+        with pytest.raises(TypeError):
+            Logger.__init__(self=self.mock_logger_object, logs_dir="logs", **params)
+
+    @pytest.mark.parametrize("params", [{"buffer_size": -1}, {"flush_interval": timedelta()},
+                                        {"flush_interval": timedelta(seconds=-1)}])
+    def test_init__invalid_buffering_value(self, params):
+        """
+        Tests that during init of 'Logger' class ValueError will be raise if buffering parameter has invalid value.
+
+        :param params: Example values of buffering parameters.
+        """
+        with pytest.raises(ValueError):
+            Logger.__init__(self=self.mock_logger_object, logs_dir="logs", **params)
+
+    @pytest.mark.parametrize("compress_lower_level, max_lower_level_file_size", [(True, None), (False, 1024)])
+    def test_init__valid_compression(self, compress_lower_level, max_lower_level_file_size):
+        """
+        Tests that 'Logger' class can be initialized with proper values of lower level compression parameters.
+
+        :param compress_lower_level: Example value of 'compress_lower_level' parameter.
+        :param max_lower_level_file_size: Example value of 'max_lower_level_file_size' parameter.
+        """
+        Logger.__init__(self=self.mock_logger_object, logs_dir="logs", compress_lower_level=compress_lower_level,
+                        max_lower_level_file_size=max_lower_level_file_size)
+        assert self.mock_logger_object.compress_lower_level is compress_lower_level
+        assert self.mock_logger_object.max_lower_level_file_size == max_lower_level_file_size
+
+    @pytest.mark.parametrize("params", [{"compress_lower_level": 1}, {"compress_lower_level": None},
+                                        {"max_lower_level_file_size": 1.5}, {"max_lower_level_file_size": "1MB"}])
+    def test_init__invalid_compression_type(self, params):
+        """
+        Tests that during init of 'Logger' class TypeError will be raise if compression parameter has invalid type.
+
+        :param params: Example values of compression parameters.
+        """
+        with pytest.raises(TypeError):
+            Logger.__init__(self=self.mock_logger_object, logs_dir="logs", **params)
+
+    @pytest.mark.parametrize("max_lower_level_file_size", [0, -1])
+    def test_init__invalid_compression_value(self, max_lower_level_file_size):
+        """
+        Tests that during init of 'Logger' class ValueError will be raise if 'max_lower_level_file_size' is not
+        positive.
+
+        :param max_lower_level_file_size: Example invalid value of 'max_lower_level_file_size' parameter.
+        """
+        with pytest.raises(ValueError):
+            Logger.__init__(self=self.mock_logger_object, logs_dir="logs",
+                            max_lower_level_file_size=max_lower_level_file_size)
+
+    # _serialize_record
+
+    @pytest.mark.parametrize("data_to_log", [{"a": 1}, {"Iteration 0": [{"x": 1.5}, {"x": -2}]}])
+    def test_serialize_record__json(self, data_to_log):
+        """
+        Tests that '_serialize_record' returns JSON documents for JSON and JSONL formats.
+
+        :param data_to_log: Example data to be logged.
+        """
+        self.mock_logger_object.log_format = LoggingFormat.JSON
+        assert json.loads(Logger._serialize_record(self=self.mock_logger_object, data_to_log=data_to_log)) \
+            == data_to_log
+        self.mock_logger_object.log_format = LoggingFormat.JSONL
+        record = Logger._serialize_record(self=self.mock_logger_object, data_to_log=data_to_log)
+        assert record.endswith("\n") and record.count("\n") == 1
+        assert json.loads(record) == data_to_log
+
+    # log_iteration
+
+    @pytest.mark.parametrize("verbosity", [LoggingVerbosity.BestSolution, LoggingVerbosity.OptimizationTime])
+    def test_log_iteration__low_verbosity(self, verbosity):
+        """
+        Tests that 'log_iteration' does not log solutions for verbosity lower than AllSolutions.
+
+        :param verbosity: Example verbosity.
+        """
+        self.mock_logger_object.verbosity = verbosity
+        Logger.log_iteration(self=self.mock_logger_object, iteration=0, solutions=[Mock()])
+        self.mock_logger_object._open_writer.assert_not_called()
+
+    @pytest.mark.parametrize("log_format, extension, expected_data", [
+        (LoggingFormat.YAML, "yaml", {"Iteration 3": ["data 1", "data 2"]}),
+        (LoggingFormat.JSON, "json", {"Iteration 3": ["data 1", "data 2"]}),
+        (LoggingFormat.JSONL, "jsonl", {"iteration": 3, "solutions": ["data 1", "data 2"]}),
+    ])
+    def test_log_iteration(self, log_format, extension, expected_data):
+        """
+        Tests that 'log_iteration' opens solutions file only once and writes serialized records to it.
+
+        :param log_format: Example log format.
+        :param extension: Expected extension of solutions file.
+        :param expected_data: Expected data to be logged.
+        """
+        solutions = [Mock(get_log_data=Mock(return_value="data 1")), Mock(get_log_data=Mock(return_value="data 2"))]
+        self.mock_logger_object.verbosity = LoggingVerbosity.AllSolutions
+        self.mock_logger_object.log_format = log_format
+        self.mock_logger_object._solutions_file_extension = extension
+        self.mock_logger_object._solutions_writer = None
+        Logger.log_iteration(self=self.mock_logger_object, iteration=3, solutions=solutions)
+        Logger.log_iteration(self=self.mock_logger_object, iteration=3, solutions=solutions)
+        self.mock_logger_object._open_writer.assert_called_once_with(f"solutions.{extension}")
+        assert self.mock_logger_object._solutions_writer == self.mock_logger_object._open_writer.return_value
+        self.mock_logger_object._serialize_record.assert_has_calls([call(expected_data), call(expected_data)])
+        self.mock_logger_object._open_writer.return_value.write.assert_has_calls(
+            [call(self.mock_logger_object._serialize_record.return_value)] * 2)
+
+    # log_lower_level_iteration
+
+    @pytest.mark.parametrize("log_format, extension", [(LoggingFormat.YAML, "yaml"), (LoggingFormat.JSON, "json")])
+    def test_log_lower_level_iteration__file_per_algorithm(self, log_format, extension):
+        """
+        Tests that 'log_lower_level_iteration' keeps file of the currently logged lower algorithm open.
+
+        :param log_format: Example log format.
+        :param extension: Expected extension of solutions files.
+        """
+        writers = {}
+
+        def _open_writer(file_name):
+            writers[file_name] = Mock(file_path=f"dir/{file_name}")
+            return writers[file_name]
+
+        self.mock_path.basename.side_effect = lambda file_path: file_path.split("/")[-1]
+        self.mock_logger_object.verbosity = LoggingVerbosity.AllSolutions
+        self.mock_logger_object.log_format = log_format
+        self.mock_logger_object._lower_level_writer = None
+        self.mock_logger_object._open_writer.side_effect = _open_writer
+        self.mock_logger_object._get_lower_level_file_name.side_effect = \
+            lambda **kwargs: Logger._get_lower_level_file_name(self.mock_logger_object, **kwargs)
+        self.mock_logger_object._solutions_file_extension = extension
+        for upper_iteration, lower_algorithm_index, lower_iteration in [(0, 0, 0), (0, 0, 1), (0, 1, 0), (1, 0, 0)]:
+            Logger.log_lower_level_iteration(self=self.mock_logger_object, upper_iteration=upper_iteration,
+                                             lower_algorithm_index=lower_algorithm_index,
+                                             lower_iteration=lower_iteration, solutions=[])
+        assert list(writers.keys()) == [f"iter_0_alg_0_solutions.{extension}", f"iter_0_alg_1_solutions.{extension}",
+                                        f"iter_1_alg_0_solutions.{extension}"]
+        self.mock_logger_object._serialize_record.assert_has_calls([call({"Iteration 0": []}),
+                                                                    call({"Iteration 1": []})])
+        assert writers[f"iter_0_alg_0_solutions.{extension}"].write.call_count == 2
+        writers[f"iter_0_alg_0_solutions.{extension}"].close.assert_called_once_with()
+        writers[f"iter_0_alg_1_solutions.{extension}"].close.assert_called_once_with()
+        writers[f"iter_1_alg_0_solutions.{extension}"].close.assert_not_called()
+        assert self.mock_logger_object._lower_level_writer == writers[f"iter_1_alg_0_solutions.{extension}"]
+
+    def test_log_lower_level_iteration__jsonl(self):
+        """Tests that 'log_lower_level_iteration' logs all lower algorithms to a single JSONL file."""
+        writer = Mock(file_path="dir/lower_level_solutions.jsonl")
+        self.mock_path.basename.side_effect = lambda file_path: file_path.split("/")[-1]
+        self.mock_logger_object.verbosity = LoggingVerbosity.AllSolutions
+        self.mock_logger_object.log_format = LoggingFormat.JSONL
+        self.mock_logger_object._lower_level_writer = None
+        self.mock_logger_object._open_writer.return_value = writer
+        self.mock_logger_object._get_lower_level_file_name.return_value = "lower_level_solutions.jsonl"
+        solutions = [Mock(get_log_data=Mock(return_value="data"))]
+        for upper_iteration, lower_algorithm_index, lower_iteration in [(0, 0, 0), (0, 1, 0), (2, 3, 4)]:
+            Logger.log_lower_level_iteration(self=self.mock_logger_object, upper_iteration=upper_iteration,
+                                             lower_algorithm_index=lower_algorithm_index,
+                                             lower_iteration=lower_iteration, solutions=solutions)
+        self.mock_logger_object._open_writer.assert_called_once_with("lower_level_solutions.jsonl")
+        assert writer.write.call_count == 3
+        writer.close.assert_not_called()
+        assert self.mock_logger_object._serialize_record.call_args_list[-1] == call(
+            {"upper_iteration": 2, "lower_algorithm_index": 3, "lower_iteration": 4, "solutions": ["data"]})
+
+    @pytest.mark.parametrize("log_format", list(LoggingFormat))
+    def test_log_lower_level_iteration__compressed(self, log_format):
+        """
+        Tests that 'log_lower_level_iteration' writes records to compressed lower level stream if it is set.
+
+        :param log_format: Example log format.
+        """
+        self.mock_logger_object.verbosity = LoggingVerbosity.AllSolutions
+        self.mock_logger_object.log_format = log_format
+        self.mock_logger_object.compress_lower_level = True
+        solutions = [Mock(get_log_data=Mock(return_value="data"))]
+        Logger.log_lower_level_iteration(self=self.mock_logger_object, upper_iteration=2, lower_algorithm_index=3,
+                                         lower_iteration=4, solutions=solutions)
+        self.mock_logger_object._write_lower_level_stream_record.assert_called_once_with(
+            upper_iteration=2, lower_algorithm_index=3, data_to_log={"lower_iteration": 4, "solutions": ["data"]})
+        self.mock_logger_object._open_writer.assert_not_called()
+        self.mock_logger_object._serialize_record.assert_not_called()
+
+    @pytest.mark.parametrize("verbosity", [LoggingVerbosity.BestSolution, LoggingVerbosity.AllSolutions])
+    def test_log_lower_level_at_end__compressed(self, verbosity):
+        """
+        Tests that 'log_lower_level_at_end' writes data to compressed lower level stream if it is set.
+
+        :param verbosity: Example verbosity.
+        """
+        self.mock_logger_object.verbosity = verbosity
+        self.mock_logger_object.compress_lower_level = True
+        Logger.log_lower_level_at_end(self=self.mock_logger_object, upper_iteration=1, lower_algorithm_index=0,
+                                      best_solution=Mock(get_log_data=Mock(return_value="best")),
+                                      optimization_time=timedelta(seconds=3))
+        expected_data = {"best_solution": "best"}
+        if verbosity >= LoggingVerbosity.OptimizationTime:
+            expected_data["optimization_duration"] = "0:00:03"
+        self.mock_logger_object._write_lower_level_stream_record.assert_called_once_with(
+            upper_iteration=1, lower_algorithm_index=0, data_to_log=expected_data)
+
+    @pytest.mark.parametrize("log_format, expected_file_name", [
+        (LoggingFormat.YAML, "iter_3_alg_7_solutions.yaml"),
+        (LoggingFormat.JSON, "iter_3_alg_7_solutions.json"),
+        (LoggingFormat.JSONL, "lower_level_solutions.jsonl"),
+    ])
+    def test_get_lower_level_file_name(self, log_format, expected_file_name):
+        """
+        Tests that '_get_lower_level_file_name' returns name of file according to log format.
+
+        :param log_format: Example log format.
+        :param expected_file_name: Expected name of the file.
+        """
+        self.mock_logger_object.log_format = log_format
+        self.mock_logger_object._solutions_file_extension = log_format.value.lower()
+        assert Logger._get_lower_level_file_name(self=self.mock_logger_object, upper_iteration=3,
+                                                 lower_algorithm_index=7) == expected_file_name
+
+    # close
+
+    @pytest.mark.parametrize("solutions_writer, lower_level_writer, lower_level_stream", [
+        (None, None, None), (Mock(), None, None), (Mock(), Mock(), None), (Mock(), None, Mock())])
+    def test_close(self, solutions_writer, lower_level_writer, lower_level_stream):
+        """
+        Tests that 'close' closes all opened writers.
+
+        :param solutions_writer: Example value of '_solutions_writer' attribute.
+        :param lower_level_writer: Example value of '_lower_level_writer' attribute.
+        :param lower_level_stream: Example value of '_lower_level_stream' attribute.
+        """
+        self.mock_logger_object._solutions_writer = solutions_writer
+        self.mock_logger_object._lower_level_writer = lower_level_writer
+        self.mock_logger_object._lower_level_stream = lower_level_stream
+        Logger.close(self=self.mock_logger_object)
+        for writer in (solutions_writer, lower_level_writer, lower_level_stream):
+            if writer is not None:
+                writer.close.assert_called_once_with()
+        assert self.mock_logger_object._solutions_writer is None
+        assert self.mock_logger_object._lower_level_writer is None
+        assert self.mock_logger_object._lower_level_stream is None
+
+
+class TestLoggerFiles:
+    """Tests of files created by 'Logger'."""
+
+    @staticmethod
+    def run_logger(logger):
+        mock_algorithm = Mock(get_log_data=Mock(return_value={"type": "algorithm"}))
+        mock_algorithm.__class__.__name__ = "SomeAlgorithm"
+        logger.log_at_start(algorithm=mock_algorithm, stop_conditions=Mock(get_log_data=Mock(return_value={})),
+                            problem=Mock(get_log_data=Mock(return_value={})))
+        for iteration in range(3):
+            logger.log_iteration(iteration=iteration,
+                                 solutions=[Mock(get_log_data=Mock(return_value={"x": iteration, "i": i}))
+                                            for i in range(2)])
+        for upper_iteration in range(2):
+            for lower_iteration in range(2):
+                logger.log_lower_level_iteration(upper_iteration=upper_iteration, lower_algorithm_index=1,
+                                                 lower_iteration=lower_iteration,
+                                                 solutions=[Mock(get_log_data=Mock(return_value={"y": 1}))])
+            logger.log_lower_level_at_end(upper_iteration=upper_iteration, lower_algorithm_index=1,
+                                          best_solution=Mock(get_log_data=Mock(return_value={"y": 1})),
+                                          optimization_time=timedelta(seconds=1))
+        logger.log_at_end(best_solution=Mock(get_log_data=Mock(return_value={"x": 0})),
+                          optimization_time=timedelta(seconds=1))
+        logger.close()
+
+    def test_jsonl(self, tmp_path):
+        """Tests that JSONL solutions files contain one valid JSON object in each line."""
+        logger = Logger(logs_dir=str(tmp_path), verbosity=LoggingVerbosity.AllSolutions,
+                        log_format=LoggingFormat.JSONL, buffer_size=10)
+        self.run_logger(logger)
+        process_dir = tmp_path / next(tmp_path.iterdir()).name
+        with open(process_dir / "solutions.jsonl", encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert [record["iteration"] for record in records] == [0, 1, 2]
+        assert records[2]["solutions"] == [{"x": 2, "i": 0}, {"x": 2, "i": 1}]
+        with open(process_dir / "lower_level_solutions.jsonl", encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert [(record["upper_iteration"], record["lower_algorithm_index"], record["lower_iteration"])
+                for record in records] == [(0, 1, 0), (0, 1, 1), (1, 1, 0), (1, 1, 1)]
+        with open(process_dir / "best_solution.json", encoding="utf-8") as file:
+            assert json.load(file)["best_solution"] == {"x": 0}
+
+    def test_yaml(self, tmp_path):
+        """Tests that YAML solutions files contain solutions of all iterations."""
+        from yaml import safe_load
+        logger = Logger(logs_dir=str(tmp_path), verbosity=LoggingVerbosity.AllSolutions,
+                        log_format=LoggingFormat.YAML)
+        self.run_logger(logger)
+        process_dir = tmp_path / next(tmp_path.iterdir()).name
+        with open(process_dir / "solutions.yaml", encoding="utf-8") as file:
+            assert list(safe_load(file).keys()) == ["Iteration 0", "Iteration 1", "Iteration 2"]
+        with open(process_dir / "iter_1_alg_1_solutions.yaml", encoding="utf-8") as file:
+            assert safe_load(file) == {"Iteration 0": [{"y": 1}], "Iteration 1": [{"y": 1}]}
+
+    @pytest.mark.parametrize("log_format", [LoggingFormat.YAML, LoggingFormat.JSONL])
+    @pytest.mark.parametrize("max_lower_level_file_size", [None, 1])
+    def test_compressed_lower_level(self, tmp_path, log_format, max_lower_level_file_size):
+        """Tests that lower level data is written to compressed stream from which a single lower run is extracted."""
+        logger = Logger(logs_dir=str(tmp_path), verbosity=LoggingVerbosity.AllSolutions, log_format=log_format,
+                        compress_lower_level=True, max_lower_level_file_size=max_lower_level_file_size)
+        self.run_logger(logger)
+        process_dir = tmp_path / next(tmp_path.iterdir()).name
+        file_names = sorted(file.name for file in process_dir.iterdir())
+        assert not any(file_name.startswith("iter_") or file_name.startswith("lower_level_solutions")
+                       for file_name in file_names)
+        stream_files = [file_name for file_name in file_names if file_name.endswith(".jsonl.gz")]
+        assert len(stream_files) == (1 if max_lower_level_file_size is None else 2)
+        records = Logger.read_lower_level_records(optimization_process_dir=str(process_dir), upper_iteration=1,
+                                                  lower_algorithm_index=1)
+        assert records == [
+            {"upper_iteration": 1, "lower_algorithm_index": 1, "lower_iteration": 0, "solutions": [{"y": 1}]},
+            {"upper_iteration": 1, "lower_algorithm_index": 1, "lower_iteration": 1, "solutions": [{"y": 1}]},
+            {"upper_iteration": 1, "lower_algorithm_index": 1, "optimization_duration": "0:00:01",
+             "best_solution": {"y": 1}}]
+        assert Logger.read_lower_level_records(optimization_process_dir=str(process_dir), upper_iteration=5,
+                                               lower_algorithm_index=1) == []
@@ -0,0 +1,225 @@
+import pytest
+from mock import patch
+from datetime import timedelta
+import gzip
+import json
+
+import numpy as np
+
+from optimization.logging.writers import BufferedRecordWriter, NpyColumnWriter, CompressedRecordWriter, \
+    read_compressed_records
+
+
+class TestBufferedRecordWriter:
+    """Tests for 'BufferedRecordWriter' class and their methods."""
+
+    SCRIPT_LOCATION = "optimization.logging.writers"
+
+    @staticmethod
+    def read(file_path):
+        with open(file_path, encoding="utf-8") as file:
+            return file.read()
+
+    def test_init(self, tmp_path):
+        """Test that initialization of 'BufferedRecordWriter' opens the file in append mode."""
+        file_path = tmp_path / "records.txt"
+        file_path.write_text("old\n", encoding="utf-8")
+        writer = BufferedRecordWriter(file_path=str(file_path), buffer_size=10)
+        assert writer.file_path == str(file_path)
+        assert writer.buffer_size == 10
+        assert writer.flush_interval is None
+        assert writer.closed is False
+        writer.write("new\n")
+        writer.close()
+        assert self.read(file_path) == "old\nnew\n"
+
+    @pytest.mark.parametrize("records", [["a\n"], ["abc\n", "de\n", "f\n"]])
+    def test_write__buffered(self, tmp_path, records):
+        """
+        Test that records are kept in the buffer until its size is reached.
+
+        :param records: Example records which total size is lower than buffer size.
+        """
+        file_path = tmp_path / "records.txt"
+        writer = BufferedRecordWriter(file_path=str(file_path), buffer_size=100)
+        for record in records:
+            writer.write(record)
+        assert self.read(file_path) == ""
+        writer.flush()
+        assert self.read(file_path) == "".join(records)
+        writer.close()
+
+    def test_write__buffer_size_reached(self, tmp_path):
+        """Test that buffered records are written to the file when buffer size is reached."""
+        file_path = tmp_path / "records.txt"
+        writer = BufferedRecordWriter(file_path=str(file_path), buffer_size=6)
+        writer.write("abc\n")
+        assert self.read(file_path) == ""
+        writer.write("de\n")
+        assert self.read(file_path) == "abc\nde\n"
+        writer.write("f\n")
+        assert self.read(file_path) == "abc\nde\n"
+        writer.close()
+        assert self.read(file_path) == "abc\nde\nf\n"
+
+    def test_write__no_buffer(self, tmp_path):
+        """Test that records are written to the file immediately when buffer size is 0."""
+        file_path = tmp_path / "records.txt"
+        writer = BufferedRecordWriter(file_path=str(file_path), buffer_size=0)
+        writer.write("abc\n")
+        assert self.read(file_path) == "abc\n"
+        writer.close()
+
+    def test_write__flush_interval(self, tmp_path):
+        """Test that buffered records are written to the file when flush interval has passed."""
+        file_path = tmp_path / "records.txt"
+        with patch(f"{self.SCRIPT_LOCATION}.monotonic_ns") as mock_monotonic_ns:
+            mock_monotonic_ns.return_value = 0
+            writer = BufferedRecordWriter(file_path=str(file_path), flush_interval=timedelta(seconds=1))
+            mock_monotonic_ns.return_value = 999_999_999
+            writer.write("abc\n")
+            assert self.read(file_path) == ""
+            mock_monotonic_ns.return_value = 1_000_000_000
+            writer.write("de\n")
+            assert self.read(file_path) == "abc\nde\n"
+            mock_monotonic_ns.return_value = 1_500_000_000
+            writer.write("f\n")
+            assert self.read(file_path) == "abc\nde\n"
+        writer.close()
+
+    def test_close(self, tmp_path):
+        """Test that 'close' writes buffered records and might be called many times."""
+        file_path = tmp_path / "records.txt"
+        writer = BufferedRecordWriter(file_path=str(file_path))
+        writer.write("abc\n")
+        writer.close()
+        assert writer.closed is True
+        assert self.read(file_path) == "abc\n"
+        writer.close()
+        assert self.read(file_path) == "abc\n"
+
+
+class TestNpyColumnWriter:
+    """Tests for 'NpyColumnWriter' class and their methods."""
+
+    @pytest.mark.parametrize("dtype", [np.int64, np.float64])
+    def test_init(self, tmp_path, dtype):
+        """Test that initialization of 'NpyColumnWriter' creates valid '.npy' file with empty column."""
+        file_path = tmp_path / "column.npy"
+        writer = NpyColumnWriter(file_path=str(file_path), dtype=dtype, chunk_size=10)
+        assert writer.file_path == str(file_path)
+        assert writer.dtype == np.dtype(dtype)
+        assert writer.chunk_size == 10
+        assert writer.length == 0
+        assert writer.closed is False
+        loaded = np.load(file_path)
+        assert loaded.dtype == np.dtype(dtype) and loaded.shape == (0,)
+        writer.close()
+
+    @pytest.mark.parametrize("chunks", [[[1, 2, 3]], [[1], [2, 3], [], [4, 5, 6, 7, 8, 9, 10, 11]], [list(range(25))]])
+    def test_write(self, tmp_path, chunks):
+        """Test that values are appended to the column through the buffer."""
+        file_path = tmp_path / "column.npy"
+        writer = NpyColumnWriter(file_path=str(file_path), dtype=np.int64, chunk_size=4)
+        expected_values = []
+        for chunk in chunks:
+            writer.write(chunk)
+            expected_values.extend(chunk)
+            assert writer.length <= len(expected_values)
+            assert list(np.load(file_path)) == expected_values[:writer.length]
+        writer.flush()
+        assert writer.length == len(expected_values)
+        assert list(np.load(file_path, mmap_mode="r")) == expected_values
+        writer.close()
+
+    def test_write__buffered(self, tmp_path):
+        """Test that values are kept in the buffer until chunk size is reached."""
+        file_path = tmp_path / "column.npy"
+        writer = NpyColumnWriter(file_path=str(file_path), dtype=np.float64, chunk_size=3)
+        writer.write([0.5, 1.5])
+        assert writer.length == 0
+        writer.write([2.5, 3.5])
+        assert list(np.load(file_path)) == [0.5, 1.5]
+        writer.close()
+        assert list(np.load(file_path)) == [0.5, 1.5, 2.5, 3.5]
+
+    def test_close(self, tmp_path):
+        """Test that 'close' writes buffered values and might be called many times."""
+        file_path = tmp_path / "column.npy"
+        writer = NpyColumnWriter(file_path=str(file_path), dtype=np.int64)
+        writer.write([7])
+        writer.close()
+        assert writer.closed is True
+        writer.close()
+        assert list(np.load(file_path)) == [7]
+
+
+class TestCompressedRecordWriter:
+    """Tests for 'CompressedRecordWriter' class and 'read_compressed_records' function."""
+
+    PATTERN = "records_{}.jsonl.gz"
+    INDEX = "index.jsonl"
+
+    def create_writer(self, tmp_path, **params):
+        return CompressedRecordWriter(dir_path=str(tmp_path), file_name_pattern=self.PATTERN,
+                                      index_file_name=self.INDEX, **params)
+
+    def read_index(self, tmp_path):
+        with open(tmp_path / self.INDEX, encoding="utf-8") as index_file:
+            return [json.loads(line) for line in index_file]
+
+    def test_init(self, tmp_path):
+        """Test that initialization of 'CompressedRecordWriter' opens the first file and the index file."""
+        writer = self.create_writer(tmp_path, buffer_size=10, max_file_size=100)
+        assert writer.dir_path == str(tmp_path)
+        assert writer.buffer_size == 10
+        assert writer.max_file_size == 100
+        assert writer.compression_level == CompressedRecordWriter.DEFAULT_COMPRESSION_LEVEL
+        assert writer.file_name == "records_0.jsonl.gz"
+        assert writer.closed is False
+        writer.close()
+        assert writer.closed is True
+        assert sorted(file.name for file in tmp_path.iterdir()) == [self.INDEX, "records_0.jsonl.gz"]
+
+    def test_write(self, tmp_path):
+        """Test that records of following keys are compressed as separate members of a valid gzip file."""
+        writer = self.create_writer(tmp_path)
+        records = [((0, 0), "a\n"), ((0, 0), "b\n"), ((0, 1), "c\n"), ((0, 0), "d\n")]
+        for key, record in records:
+            writer.write(key=key, record=record)
+        writer.close()
+        with gzip.open(tmp_path / "records_0.jsonl.gz", "rt", encoding="utf-8") as compressed_file:
+            assert compressed_file.read() == "a\nb\nc\nd\n"
+        index = self.read_index(tmp_path)
+        assert [(member["key"], member["records"]) for member in index] == [([0, 0], 2), ([0, 1], 1), ([0, 0], 1)]
+        assert [member["offset"] for member in index] == [0, index[0]["size"], index[0]["size"] + index[1]["size"]]
+
+    def test_write__buffer_size_reached(self, tmp_path):
+        """Test that buffered records are compressed and written when buffer size is reached."""
+        writer = self.create_writer(tmp_path, buffer_size=4)
+        writer.write(key=("x",), record="ab\n")
+        assert (tmp_path / "records_0.jsonl.gz").stat().st_size == 0
+        writer.write(key=("x",), record="cd\n")
+        writer.write(key=("x",), record="e\n")
+        writer.close()
+        assert [member["records"] for member in self.read_index(tmp_path)] == [2, 1]
+
+    def test_write__rotation(self, tmp_path):
+        """Test that the stream is rotated when the file would exceed maximal size."""
+        writer = self.create_writer(tmp_path, max_file_size=1)
+        for index in range(3):
+            writer.write(key=(index,), record=f"{index}\n")
+        writer.close()
+        assert [(member["file"], member["offset"]) for member in self.read_index(tmp_path)] == [
+            ("records_0.jsonl.gz", 0), ("records_1.jsonl.gz", 0), ("records_2.jsonl.gz", 0)]
+
+    @pytest.mark.parametrize("max_file_size", [None, 50])
+    def test_read_compressed_records(self, tmp_path, max_file_size):
+        """Test that records of a single key are read in order in which they were written."""
+        writer = self.create_writer(tmp_path, buffer_size=5, max_file_size=max_file_size)
+        for index in range(20):
+            writer.write(key=(index // 3 % 2, 1), record=f"record {index}\n")
+        writer.close()
+        assert read_compressed_records(dir_path=str(tmp_path), index_file_name=self.INDEX, key=(1, 1)) == \
+            [f"record {index}\n" for index in range(20) if index // 3 % 2 == 1]
+        assert read_compressed_records(dir_path=str(tmp_path), index_file_name=self.INDEX, key=(2, 1)) == []
@@ -0,0 +1,373 @@
+import pickle
+import sqlite3
+
+import pytest
+from mock import Mock
+import numpy
+from collections import OrderedDict
+
+from optimization.problem.cache import EvaluationCache, PersistentEvaluationCache, CachePolicy
+
+
+class TestEvaluationCache:
+    """Tests for 'EvaluationCache' class and their methods."""
+
+    def setup(self):
+        self.mock_evaluation_cache_object = Mock(spec=EvaluationCache)
+
+    # __init__
+
+    @pytest.mark.parametrize("max_size", [1, 1000])
+    @pytest.mark.parametrize("policy, expected_policy", [
+        (CachePolicy.LRU, CachePolicy.LRU),
+        ("LFU", CachePolicy.LFU),
+    ])
+    def test_init__valid(self, max_size, policy, expected_policy):
+        """
+        Test valid initialization of 'EvaluationCache' class.
+
+        :param max_size: Example value of 'max_size' parameter.
+        :param policy: Example value of 'policy' parameter.
+        :param expected_policy: Policy expected to be set.
+        """
+        EvaluationCache.__init__(self=self.mock_evaluation_cache_object, max_size=max_size, policy=policy)
+        assert self.mock_evaluation_cache_object.max_size == max_size
+        assert self.mock_evaluation_cache_object.policy == expected_policy
+        assert self.mock_evaluation_cache_object.hits == 0
+        assert self.mock_evaluation_cache_object.misses == 0
+
+    @pytest.mark.parametrize("max_size, policy", [("10", CachePolicy.LRU), (10., "LRU"), (10, None), (10, 1)])
+    def test_init__invalid_type(self, max_size, policy):
+        """
+        Test that TypeError is raised when some parameter has invalid type.
+
+        :param max_size: Example value of 'max_size' parameter.
+        :param policy: Example value of 'policy' parameter.
+        """
+        with pytest.raises(TypeError):
+            EvaluationCache.__init__(self=self.mock_evaluation_cache_object, max_size=max_size, policy=policy)
+
+    @pytest.mark.parametrize("max_size", [0, -1])
+    def test_init__invalid_max_size_value(self, max_size):
+        """
+        Test that ValueError is raised when 'max_size' parameter has invalid value.
+
+        :param max_size: Value that is not positive.
+        """
+        with pytest.raises(ValueError):
+            EvaluationCache.__init__(self=self.mock_evaluation_cache_object, max_size=max_size)
+
+    # make_key
+
+    @pytest.mark.parametrize("values, expected_key", [
+        (OrderedDict(), ()),
+        (OrderedDict(x=1, y="a", z=2.5), (1, "a", 2.5)),
+    ])
+    def test_make_key(self, values, expected_key):
+        """
+        Test 'make_key' method creates hashable key from decision variables values.
+
+        :param values: Example decision variables values.
+        :param expected_key: Expected key.
+        """
+        key = EvaluationCache.make_key(values)
+        assert key == expected_key
+        hash(key)
+
+    # get, set
+
+    @pytest.mark.parametrize("policy", list(CachePolicy))
+    def test_get_set(self, policy):
+        """
+        Test that stored values are returned and hit/miss counters are updated.
+
+        :param policy: Eviction policy of the cache.
+        """
+        cache = EvaluationCache(max_size=10, policy=policy)
+        assert cache.get((1,)) is None
+        cache.set((1,), 5.5)
+        assert cache.get((1,)) == 5.5
+        assert (1,) in cache and len(cache) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_ratio == 0.5
+
+    @pytest.mark.parametrize("policy", list(CachePolicy))
+    def test_set__existing_key(self, policy):
+        """
+        Test that value of already stored key is overwritten.
+
+        :param policy: Eviction policy of the cache.
+        """
+        cache = EvaluationCache(max_size=2, policy=policy)
+        cache.set((1,), 1.)
+        cache.set((1,), 2.)
+        assert len(cache) == 1
+        assert cache.get((1,)) == 2.
+
+    def test_eviction__lru(self):
+        """Test that the least recently used entry is removed when the cache is full (LRU policy)."""
+        cache = EvaluationCache(max_size=3, policy=CachePolicy.LRU)
+        for key in range(3):
+            cache.set(key, key)
+        cache.get(0)
+        cache.set(3, 3)
+        assert 1 not in cache
+        assert all(key in cache for key in (0, 2, 3))
+
+    def test_eviction__lfu(self):
+        """Test that the least frequently used entry is removed when the cache is full (LFU policy)."""
+        cache = EvaluationCache(max_size=3, policy=CachePolicy.LFU)
+        for key in range(3):
+            cache.set(key, key)
+        cache.get(0)
+        cache.get(0)
+        cache.get(1)
+        cache.set(3, 3)
+        assert 2 not in cache
+        cache.set(4, 4)
+        assert 3 not in cache
+        assert all(key in cache for key in (0, 1, 4))
+
+    def test_eviction__lfu_ties(self):
+        """Test that the least recently used entry is removed if many entries are used the same number of times."""
+        cache = EvaluationCache(max_size=2, policy=CachePolicy.LFU)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("b")
+        cache.get("a")
+        cache.set("c", 3)
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+
+    @pytest.mark.parametrize("policy", list(CachePolicy))
+    def test_max_size(self, policy):
+        """
+        Test that number of entries never exceeds maximal size.
+
+        :param policy: Eviction policy of the cache.
+        """
+        cache = EvaluationCache(max_size=5, policy=policy)
+        for key in range(100):
+            cache.set(key, key)
+            cache.get(key % 7)
+            assert len(cache) <= 5
+
+    # clear
+
+    @pytest.mark.parametrize("policy", list(CachePolicy))
+    def test_clear(self, policy):
+        """
+        Test that 'clear' method removes all entries and resets counters.
+
+        :param policy: Eviction policy of the cache.
+        """
+        cache = EvaluationCache(max_size=5, policy=policy)
+        cache.set(1, 1)
+        cache.get(1)
+        cache.get(2)
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+        assert cache.hit_ratio == 0.
+        cache.set(1, 1)
+        assert cache.get(1) == 1
+
+    # get_log_data
+
+    def test_get_log_data(self):
+        """Test that 'get_log_data' return dictionary with cache configuration and statistics."""
+        cache = EvaluationCache(max_size=5, policy="LFU")
+        cache.get(1)
+        log_data = cache.get_log_data()
+        assert log_data["policy"] == "LFU"
+        assert log_data["max_size"] == 5
+        assert log_data["misses"] == 1
+
+
+class TestPersistentEvaluationCache:
+    """Tests for 'PersistentEvaluationCache' class and their methods."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = str(tmp_path / "cache.sqlite")
+        self.mock_persistent_evaluation_cache_object = Mock(spec=PersistentEvaluationCache)
+
+    # __init__
+
+    @pytest.mark.parametrize("problem_fingerprint", [None, "abc"])
+    def test_init__valid(self, problem_fingerprint):
+        """
+        Test valid initialization of 'PersistentEvaluationCache' class.
+
+        :param problem_fingerprint: Example value of 'problem_fingerprint' parameter.
+        """
+        cache = PersistentEvaluationCache(path=self.path, problem_fingerprint=problem_fingerprint)
+        assert cache.path == self.path
+        assert cache.problem_fingerprint == problem_fingerprint
+        assert cache._connection is None
+
+    @pytest.mark.parametrize("params", [
+        {"path": None},
+        {"path": "cache.sqlite", "problem_fingerprint": 1},
+        {"path": "cache.sqlite", "timeout": "1"},
+    ])
+    def test_init__invalid_type(self, params):
+        """
+        Test that TypeError is raised when some parameter has invalid type.
+
+        :param params: Parameters with invalid type.
+        """
+        with pytest.raises(TypeError):
+            PersistentEvaluationCache.__init__(self=self.mock_persistent_evaluation_cache_object, **params)
+
+    def test_init__invalid_timeout_value(self):
+        """Test that ValueError is raised when 'timeout' parameter has negative value."""
+        with pytest.raises(ValueError):
+            PersistentEvaluationCache.__init__(self=self.mock_persistent_evaluation_cache_object, path=self.path,
+                                               timeout=-1)
+
+    # bind_problem
+
+    @pytest.mark.parametrize("problem_fingerprint", [None, "abc"])
+    def test_bind_problem(self, problem_fingerprint):
+        """
+        Test that 'bind_problem' method calculates problem fingerprint only if it was not provided.
+
+        :param problem_fingerprint: Example value of 'problem_fingerprint' parameter.
+        """
+        mock_problem = Mock()
+        cache = PersistentEvaluationCache(path=self.path, problem_fingerprint=problem_fingerprint)
+        cache.bind_problem(mock_problem)
+        if problem_fingerprint is None:
+            assert cache.problem_fingerprint == mock_problem.get_fingerprint.return_value
+        else:
+            assert cache.problem_fingerprint == problem_fingerprint
+            mock_problem.get_fingerprint.assert_not_called()
+
+    # get, set
+
+    def test_set__unknown_fingerprint(self):
+        """Test that ValueError is raised when value is stored before problem fingerprint is known."""
+        cache = PersistentEvaluationCache(path=self.path)
+        with pytest.raises(ValueError):
+            cache.set((1,), 1.)
+
+    def test_values_persisted(self):
+        """Test that values stored by one cache object are available for other ones using the same file."""
+        cache_1 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem 1")
+        cache_1.set((1, "a"), 2.5)
+        cache_2 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem 1", max_size=1)
+        assert cache_2.get((1, "a")) == 2.5
+        assert (1, "a") in cache_2
+        assert cache_2.get((2, "a")) is None
+        assert (cache_2.hits, cache_2.misses) == (1, 1)
+        cache_1.close()
+        cache_2.close()
+
+    def test_evaluation_results_persisted(self):
+        """Test that values of objective, penalty and constraints are stored in the database file."""
+        cache_1 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem 1")
+        cache_1.set((1, "a"), 2.5, objective_value=3.5, penalty_value=1, constraints_values={"c0": 1, "c1": 0})
+        cache_1.set((2, "b"), -1.)
+        cache_2 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem 1")
+        assert cache_2.get_evaluation_results((1, "a")) == {"objective_value_with_penalty": 2.5,
+                                                             "objective_value": 3.5,
+                                                             "penalty_value": 1,
+                                                             "constraints_values": {"c0": 1, "c1": 0}}
+        assert cache_2.get_evaluation_results((2, "b")) == {"objective_value_with_penalty": -1.,
+                                                             "objective_value": None,
+                                                             "penalty_value": None,
+                                                             "constraints_values": None}
+        assert cache_2.get_evaluation_results((3, "c")) is None
+        assert (cache_2.hits, cache_2.misses) == (0, 0)
+        cache_1.close()
+        cache_2.close()
+
+    def test_get_evaluation_results__unknown_fingerprint(self):
+        """Test that 'get_evaluation_results' returns None if problem fingerprint is unknown."""
+        cache = PersistentEvaluationCache(path=self.path)
+        assert cache.get_evaluation_results((1,)) is None
+
+    def test_old_database_file(self):
+        """Test that database file that stores objective values (with penalty) only is extended with new columns."""
+        connection = sqlite3.connect(self.path)
+        connection.execute("CREATE TABLE evaluations (problem TEXT NOT NULL, genome TEXT NOT NULL, "
+                           "objective_value_with_penalty REAL NOT NULL, PRIMARY KEY (problem, genome))")
+        connection.execute("INSERT INTO evaluations VALUES (?, ?, ?)",
+                           ("problem", PersistentEvaluationCache.hash_key((1,)), 2.5))
+        connection.commit()
+        connection.close()
+        cache = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem")
+        assert cache.get((1,)) == 2.5
+        cache.set((2,), 1.5, objective_value=1.5, penalty_value=0, constraints_values={})
+        assert cache.get_evaluation_results((2,))["objective_value"] == 1.5
+        assert cache.get_evaluation_results((1,))["objective_value"] is None
+        cache.close()
+
+    @pytest.mark.parametrize("key, equal_key", [
+        ((1, 2.5, "a"), (numpy.int64(1), numpy.float64(2.5), numpy.str_("a"))),
+        ((True, (1, 2)), (numpy.bool_(True), (numpy.int32(1), numpy.int64(2)))),
+        ((10 ** 20, -3), (10 ** 20, numpy.int8(-3))),
+    ])
+    def test_hash_key__numpy_values(self, key, equal_key):
+        """
+        Test that 'hash_key' creates the same hash for values of NumPy and Python types.
+
+        :param key: Example key with values of Python types.
+        :param equal_key: The same key with (some) values of NumPy types.
+        """
+        assert PersistentEvaluationCache.hash_key(key) == PersistentEvaluationCache.hash_key(equal_key)
+
+    @pytest.mark.parametrize("key, other_key", [
+        ((1, 2), (2, 1)),
+        ((1,), (1.5,)),
+        (("1",), (1,)),
+        ((frozenset({1}),), (frozenset({2}),)),
+    ])
+    def test_hash_key__different_values(self, key, other_key):
+        """
+        Test that 'hash_key' creates different hashes for different values.
+
+        :param key: Example key.
+        :param other_key: Other key.
+        """
+        assert PersistentEvaluationCache.hash_key(key) != PersistentEvaluationCache.hash_key(other_key)
+
+    def test_get__numpy_values(self):
+        """Test that value stored for Python values is found for the same values of NumPy types."""
+        cache_1 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem")
+        cache_1.set((1, 0.5), 2.5)
+        cache_2 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem")
+        assert cache_2.get((numpy.int64(1), numpy.float64(0.5))) == 2.5
+        cache_1.close()
+        cache_2.close()
+
+    def test_values_separated_by_problem(self):
+        """Test that values stored for one problem are not available for other problems."""
+        cache_1 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem 1")
+        cache_1.set((1,), 2.5)
+        cache_2 = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem 2")
+        assert cache_2.get((1,)) is None
+        cache_1.close()
+        cache_2.close()
+
+    def test_pickle(self):
+        """Test that the cache can be transferred to other processes (without database connection)."""
+        cache = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem")
+        cache.set((1,), 2.5)
+        copied_cache = pickle.loads(pickle.dumps(cache))
+        assert copied_cache._connection is None
+        assert copied_cache.get((1,)) == 2.5
+        cache.close()
+        copied_cache.close()
+
+    # close
+
+    def test_close(self):
+        """Test that 'close' method closes database connection."""
+        cache = PersistentEvaluationCache(path=self.path, problem_fingerprint="problem")
+        cache.set((1,), 2.5)
+        cache.close()
+        assert cache._connection is None
+        assert cache.get((1,)) == 2.5
+        cache.close()
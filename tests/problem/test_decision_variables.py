@@ -1,9 +1,13 @@
 import pytest
 
+import numpy as np
 from mock import Mock, patch
 from optimization.problem.decision_variables import IntegerVariable, DiscreteVariable, FloatVariable, ChoiceVariable
 
 
+EXAMPLE_UNIT_VALUES = np.array([0., 0.2499, 0.5, 0.99999999])
+
+
 class TestIntegerVariable:
     """
     Tests for 'IntegerVariable' class and their methods.
@@ -109,6 +113,19 @@ class TestIntegerVariable:
         self.mock_decision_variable_object.max_value = max_value
         assert IntegerVariable.is_proper_value(self.mock_decision_variable_object, value=not_int) is False
 
+    @pytest.mark.parametrize("min_value, max_value", EXAMPLE_INT_VARIABLE_LIMITS)
+    def test_scale_unit_values(self, min_value, max_value):
+        """
+        Check that 'scale_unit_values' maps floats from range [0, 1) onto ints in range [min_value, max_value].
+
+        :param min_value: Some int value.
+        :param max_value: Int value that is greater than 'min_value'.
+        """
+        values = IntegerVariable(min_value=min_value, max_value=max_value).scale_unit_values(EXAMPLE_UNIT_VALUES).tolist()
+        assert values[0] == min_value
+        assert values == sorted(values)
+        assert all(isinstance(value, int) and min_value <= value <= max_value for value in values)
+
     @pytest.mark.parametrize("min_value, max_value", EXAMPLE_INT_VARIABLE_LIMITS)
     def test_get_log_data(self, min_value, max_value):
         self.mock_decision_variable_object.min_value = min_value
@@ -273,6 +290,21 @@ class TestDiscreteVariable:
         self.mock_decision_variable_object.step = step
         assert DiscreteVariable.is_proper_value(self.mock_decision_variable_object, value=not_int_float) is False
 
+    @pytest.mark.parametrize("min_value, max_value, step", EXAMPLE_LIMITS_AND_STEP)
+    def test_scale_unit_values(self, min_value, max_value, step):
+        """
+        Check that 'scale_unit_values' maps floats from range [0, 1) onto possible values of 'DiscreteVariable'.
+
+        :param min_value: Some int or float value.
+        :param max_value: Int or float value that is greater than 'min_value'.
+        :param step: Some int or float value that is greater than 0.
+        """
+        variable = DiscreteVariable(min_value=min_value, max_value=max_value, step=step)
+        values = variable.scale_unit_values(EXAMPLE_UNIT_VALUES).tolist()
+        assert values[0] == min_value
+        assert values == sorted(values)
+        assert all(variable.is_proper_value(value) for value in values)
+
     @pytest.mark.parametrize("min_value, max_value, step", EXAMPLE_LIMITS_AND_STEP)
     def test_get_log_data(self, min_value, max_value, step):
         self.mock_decision_variable_object.min_value = min_value
@@ -391,6 +423,19 @@ class TestFloatVariable:
         self.mock_decision_variable_object.max_value = max_value
         assert FloatVariable.is_proper_value(self.mock_decision_variable_object, value=not_float) is False
 
+    @pytest.mark.parametrize("min_value, max_value", EXAMPLE_FLOAT_VARIABLE_LIMITS)
+    def test_scale_unit_values(self, min_value, max_value):
+        """
+        Check that 'scale_unit_values' maps floats from range [0, 1) onto floats in range [min_value, max_value].
+
+        :param min_value: Some float value.
+        :param max_value: Float value that is greater than 'min_value'.
+        """
+        values = FloatVariable(min_value=min_value, max_value=max_value).scale_unit_values(EXAMPLE_UNIT_VALUES).tolist()
+        assert values[0] == min_value
+        assert values == sorted(values)
+        assert all(isinstance(value, float) and min_value <= value <= max_value for value in values)
+
     @pytest.mark.parametrize("min_value, max_value", EXAMPLE_FLOAT_VARIABLE_LIMITS)
     def test_get_log_data(self, min_value, max_value):
         self.mock_decision_variable_object.min_value = min_value
@@ -465,6 +510,17 @@ class TestChoiceVariable:
         self.mock_decision_variable_object.possible_values = set(values_pool)
         assert ChoiceVariable.is_proper_value(self=self.mock_decision_variable_object, value=not_in_pool) is False
 
+    @pytest.mark.parametrize("values_pool", EXAMPLE_VALUES_POOLS)
+    def test_scale_unit_values(self, values_pool):
+        """
+        Check that 'scale_unit_values' maps floats from range [0, 1) onto possible values of 'ChoiceVariable'.
+
+        :param values_pool: Some iterable with possible values to pick.
+        """
+        values = ChoiceVariable(possible_values=values_pool).scale_unit_values(np.linspace(0., 0.999, 100)).tolist()
+        assert len(values) == 100
+        assert set(values) == set(values_pool)
+
     @pytest.mark.parametrize("values_pool", EXAMPLE_VALUES_POOLS)
     def test_get_log_data(self, values_pool):
         self.mock_decision_variable_object.possible_values = set(values_pool)
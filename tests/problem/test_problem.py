@@ -1,7 +1,9 @@
 import pytest
 from mock import Mock, patch
 
-from optimization.problem.problem import OptimizationType, OptimizationProblem
+import numpy
+
+from optimization.problem.problem import OptimizationType, OptimizationProblem, EvaluationCache, ChoiceVariable
 
 
 class TestOptimizationProblem:
@@ -246,6 +248,227 @@ class TestOptimizationProblem:
                                          objective_function=example_objective_function,
                                          optimization_type=optimization_type)
 
+    @pytest.mark.parametrize("optimization_type", [OptimizationType.Maximize, OptimizationType.Minimize.value])
+    def test_init__valid_batch_functions(self, example_decision_variables, example_constraints,
+                                         example_penalty_function, example_objective_function, optimization_type):
+        """
+        Test for initialization of 'OptimizationProblem' with batch (vectorized) functions provided.
+
+        :param example_decision_variables: Example value of 'decision_variables' param.
+        :param example_constraints: Example value of 'constraints' param.
+        :param example_penalty_function: Example value of 'penalty_function' param.
+        :param example_objective_function: Example value of 'objective_function' param.
+        :param optimization_type: Example value of 'optimization_type' param.
+        """
+        batch_objective_function = Mock()
+        batch_constraints = {name: Mock() for name in example_constraints.keys()}
+        batch_penalty_function = Mock()
+        OptimizationProblem.__init__(self=self.mock_optimization_problem_object,
+                                     decision_variables=example_decision_variables, constraints=example_constraints,
+                                     penalty_function=example_penalty_function,
+                                     objective_function=example_objective_function, optimization_type=optimization_type,
+                                     batch_objective_function=batch_objective_function,
+                                     batch_constraints=batch_constraints,
+                                     batch_penalty_function=batch_penalty_function)
+        assert self.mock_optimization_problem_object.batch_objective_function == batch_objective_function
+        assert self.mock_optimization_problem_object.batch_constraints == batch_constraints
+        assert self.mock_optimization_problem_object.batch_penalty_function == batch_penalty_function
+
+    def test_init__valid_evaluation_cache(self, example_decision_variables, example_constraints,
+                                          example_penalty_function, example_objective_function):
+        """
+        Test for initialization of 'OptimizationProblem' with evaluation cache provided.
+
+        :param example_decision_variables: Example value of 'decision_variables' param.
+        :param example_constraints: Example value of 'constraints' param.
+        :param example_penalty_function: Example value of 'penalty_function' param.
+        :param example_objective_function: Example value of 'objective_function' param.
+        """
+        evaluation_cache = Mock(spec=EvaluationCache)
+        OptimizationProblem.__init__(self=self.mock_optimization_problem_object,
+                                     decision_variables=example_decision_variables, constraints=example_constraints,
+                                     penalty_function=example_penalty_function,
+                                     objective_function=example_objective_function,
+                                     optimization_type=OptimizationType.Minimize, evaluation_cache=evaluation_cache)
+        assert self.mock_optimization_problem_object.evaluation_cache == evaluation_cache
+        evaluation_cache.bind_problem.assert_called_once_with(self.mock_optimization_problem_object)
+
+    @pytest.mark.parametrize("invalid_evaluation_cache", [{}, "cache", 100])
+    def test_init__invalid_evaluation_cache_type(self, example_decision_variables, example_constraints,
+                                                 example_penalty_function, example_objective_function,
+                                                 invalid_evaluation_cache):
+        """
+        Test that during initialization of 'OptimizationProblem' will be raised TypeError if evaluation cache
+        has invalid type.
+
+        :param example_decision_variables: Example value of 'decision_variables' param.
+        :param example_constraints: Example value of 'constraints' param.
+        :param example_penalty_function: Example value of 'penalty_function' param.
+        :param example_objective_function: Example value of 'objective_function' param.
+        :param invalid_evaluation_cache: Value of 'evaluation_cache' param of invalid type.
+        """
+        with pytest.raises(TypeError):
+            OptimizationProblem.__init__(self=self.mock_optimization_problem_object,
+                                         decision_variables=example_decision_variables,
+                                         constraints=example_constraints, penalty_function=example_penalty_function,
+                                         objective_function=example_objective_function,
+                                         optimization_type=OptimizationType.Maximize,
+                                         evaluation_cache=invalid_evaluation_cache)
+
+    @pytest.mark.parametrize("batch_params", [
+        {"batch_objective_function": 1},
+        {"batch_constraints": [Mock()]},
+        {"batch_penalty_function": "penalty"},
+    ])
+    def test_init__invalid_batch_functions_type(self, example_decision_variables, example_constraints,
+                                                example_penalty_function, example_objective_function, batch_params):
+        """
+        Test that during initialization of 'OptimizationProblem' will be raised TypeError if batch function
+        has invalid type.
+
+        :param example_decision_variables: Example value of 'decision_variables' param.
+        :param example_constraints: Example value of 'constraints' param.
+        :param example_penalty_function: Example value of 'penalty_function' param.
+        :param example_objective_function: Example value of 'objective_function' param.
+        :param batch_params: Batch functions params with invalid type.
+        """
+        with pytest.raises(TypeError):
+            OptimizationProblem.__init__(self=self.mock_optimization_problem_object,
+                                         decision_variables=example_decision_variables,
+                                         constraints=example_constraints, penalty_function=example_penalty_function,
+                                         objective_function=example_objective_function,
+                                         optimization_type=OptimizationType.Maximize, **batch_params)
+
+    def test_init__invalid_batch_constraints_keys(self, example_decision_variables, example_constraints,
+                                                  example_penalty_function, example_objective_function):
+        """
+        Test that during initialization of 'OptimizationProblem' will be raised ValueError if 'batch_constraints'
+        does not contain the same constraints as 'constraints'.
+
+        :param example_decision_variables: Example value of 'decision_variables' param.
+        :param example_constraints: Example value of 'constraints' param.
+        :param example_penalty_function: Example value of 'penalty_function' param.
+        :param example_objective_function: Example value of 'objective_function' param.
+        """
+        batch_constraints = {name: Mock() for name in list(example_constraints.keys())[1:]}
+        with pytest.raises(ValueError):
+            OptimizationProblem.__init__(self=self.mock_optimization_problem_object,
+                                         decision_variables=example_decision_variables,
+                                         constraints=example_constraints, penalty_function=example_penalty_function,
+                                         objective_function=example_objective_function,
+                                         optimization_type=OptimizationType.Maximize,
+                                         batch_constraints=batch_constraints)
+
+    # get_batch_values
+
+    @pytest.mark.parametrize("solutions_values", [
+        [(1, 2.5), (3, -1.)],
+        [(0, 0.)],
+        [],
+    ])
+    def test_get_batch_values(self, solutions_values):
+        """
+        Test 'get_batch_values' converts values of solutions to arrays (one per decision variable).
+
+        :param solutions_values: Example decision variables values of solutions.
+        """
+        self.mock_optimization_problem_object.decision_variables = {"x0": Mock(), "x1": Mock()}
+        self.mock_optimization_problem_object.variables_number = 2
+        batch_values = OptimizationProblem.get_batch_values(self=self.mock_optimization_problem_object,
+                                                            solutions_values=solutions_values)
+        assert list(batch_values.keys()) == ["x0", "x1"]
+        for index, values in enumerate(batch_values.values()):
+            assert isinstance(values, numpy.ndarray)
+            assert values.tolist() == [solution_values[index] for solution_values in solutions_values]
+
+    def test_get_batch_values__choice_variable(self):
+        """Test 'get_batch_values' keeps values of choice variables (e.g. tuples) as objects."""
+        self.mock_optimization_problem_object.decision_variables = {"x": Mock(spec=ChoiceVariable)}
+        self.mock_optimization_problem_object.variables_number = 1
+        batch_values = OptimizationProblem.get_batch_values(self=self.mock_optimization_problem_object,
+                                                            solutions_values=[((1, 2),), ((3, 4),)])
+        assert batch_values["x"].dtype == object
+        assert batch_values["x"].tolist() == [(1, 2), (3, 4)]
+
+    # evaluate_batch
+
+    def test_evaluate_batch(self):
+        """Test 'evaluate_batch' returns objective values (with penalty) of batch evaluation results."""
+        batch_values = {"x": numpy.array([1, 2])}
+        objective_values = numpy.array([5., 6.])
+        self.mock_optimization_problem_object.evaluate_batch_components.return_value = {
+            "objective_value_with_penalty": objective_values, "objective_value": numpy.array([4., 6.])}
+        assert OptimizationProblem.evaluate_batch(self=self.mock_optimization_problem_object,
+                                                  batch_values=batch_values) is objective_values
+        self.mock_optimization_problem_object.evaluate_batch_components.assert_called_once_with(batch_values)
+
+    # evaluate_batch_components
+
+    @pytest.mark.parametrize("optimization_type", [OptimizationType.Maximize, OptimizationType.Minimize])
+    @pytest.mark.parametrize("use_batch_objective", [True, False])
+    @pytest.mark.parametrize("use_batch_constraints", [True, False])
+    @pytest.mark.parametrize("use_batch_penalty", [True, False])
+    def test_evaluate_batch_components(self, optimization_type, use_batch_objective, use_batch_constraints,
+                                       use_batch_penalty):
+        """
+        Test 'evaluate_batch_components' calculates the same values for any combination of batch and not batch
+        functions.
+
+        :param optimization_type: Example value of 'optimization_type'.
+        :param use_batch_objective: Flag whether batch objective function is defined.
+        :param use_batch_constraints: Flag whether batch constraints are defined.
+        :param use_batch_penalty: Flag whether batch penalty function is defined.
+        """
+        batch_values = {"x0": numpy.array([1., -2., 3.]), "x1": numpy.array([0., 5., -1.])}
+        self.mock_optimization_problem_object.optimization_type = optimization_type
+        self.mock_optimization_problem_object.objective_function = lambda x0, x1: x0 + x1
+        self.mock_optimization_problem_object.constraints = {"c0": lambda x0, x1: x0 - x1}
+        self.mock_optimization_problem_object.penalty_function = lambda c0: 10 * c0
+        self.mock_optimization_problem_object.batch_objective_function = \
+            (lambda x0, x1: x0 + x1) if use_batch_objective else None
+        self.mock_optimization_problem_object.batch_constraints = \
+            {"c0": lambda x0, x1: x0 - x1} if use_batch_constraints else None
+        self.mock_optimization_problem_object.batch_penalty_function = \
+            (lambda c0: 10 * c0) if use_batch_penalty else None
+        evaluation_results = OptimizationProblem.evaluate_batch_components(
+            self=self.mock_optimization_problem_object, batch_values=batch_values)
+        if optimization_type == OptimizationType.Minimize:
+            assert evaluation_results["objective_value_with_penalty"].tolist() == [11., 73., 42.]
+        else:
+            assert evaluation_results["objective_value_with_penalty"].tolist() == [-9., -67., -38.]
+        assert evaluation_results["objective_value"].tolist() == [1., 3., 2.]
+        assert evaluation_results["penalty_value"].tolist() == [10., 70., 40.]
+        assert list(evaluation_results["constraints_values"].keys()) == ["c0"]
+        assert evaluation_results["constraints_values"]["c0"].tolist() == [1., 7., 4.]
+
+    # get_fingerprint
+
+    @pytest.mark.parametrize("log_data", [{}, {"a": 1, "b": ["x", "y"]}])
+    def test_get_fingerprint(self, log_data):
+        """
+        Test that 'get_fingerprint' method returns the same hash for the same problem definition.
+
+        :param log_data: Simulated log data of the problem.
+        """
+        self.mock_optimization_problem_object.get_log_data.return_value = log_data
+        fingerprint = OptimizationProblem.get_fingerprint(self=self.mock_optimization_problem_object)
+        assert isinstance(fingerprint, str) and len(fingerprint) == 64
+        self.mock_optimization_problem_object.get_log_data.return_value = dict(reversed(list(log_data.items())))
+        assert OptimizationProblem.get_fingerprint(self=self.mock_optimization_problem_object) == fingerprint
+        self.mock_optimization_problem_object.get_log_data.return_value = {**log_data, "other": None}
+        assert OptimizationProblem.get_fingerprint(self=self.mock_optimization_problem_object) != fingerprint
+
+    @pytest.mark.parametrize("error", [OSError, TypeError])
+    def test_get_fingerprint__code_not_available(self, error):
+        """
+        Test that 'get_fingerprint' method raises ValueError if code of some function cannot be extracted.
+
+        :param error: Error raised when extracting function code.
+        """
+        self.mock_optimization_problem_object.get_log_data.side_effect = error
+        with pytest.raises(ValueError):
+            OptimizationProblem.get_fingerprint(self=self.mock_optimization_problem_object)
+
     # get_log_data
 
     def test_get_log_data(self):
@@ -2,7 +2,9 @@ import pytest
 from mock import Mock, patch
 from collections import OrderedDict
 
-from optimization.problem.solution import AbstractSolution, OptimizationType
+import numpy
+
+from optimization.problem.solution import AbstractSolution, OptimizationType, fitness_key
 
 
 class TestSolution:
@@ -19,7 +21,8 @@ class TestSolution:
         self.mock_decision_variables_items = Mock(return_value=[])
         self.mock_decision_variables = Mock(items=self.mock_decision_variables_items)
         self.mock_optimization_problem_object = Mock(decision_variables=self.mock_decision_variables,
-                                                     constraints=dict(c0=self.mock_constraint, c1=self.mock_constraint))
+                                                     constraints=dict(c0=self.mock_constraint, c1=self.mock_constraint),
+                                                     evaluation_cache=None)
         self.mock_solution_object_calculate_constraints = Mock()
         self.mock_solution_object_calculate_objective = Mock()
         self.mock_solution_object_calculate_penalty = Mock()
@@ -46,12 +49,13 @@ class TestSolution:
         self.mock_decision_variables_items.return_value = [(name, self.mock_decision_variable)
                                                            for name in decision_variables_names]
         AbstractSolution.__init__(self_solution=self.mock_solution_object)
-        assert isinstance(self.mock_solution_object.decision_variables_values, OrderedDict)
-        assert set(self.mock_solution_object.decision_variables_values.keys()) == set(decision_variables_names)
-        assert all([self.mock_solution_object.decision_variables_values[
-                        var_name] == self.mock_decision_variable_generate_random_value.return_value
-                    for var_name in decision_variables_names])
+        assert self.mock_solution_object.values \
+            == len(decision_variables_names) * (self.mock_decision_variable_generate_random_value.return_value, )
         assert self.mock_solution_object._objective_value_with_penalty is None
+        assert self.mock_solution_object._fitness is None
+        assert self.mock_solution_object._objective_value is None
+        assert self.mock_solution_object._penalty_value is None
+        assert self.mock_solution_object._constraints_values is None
 
     @pytest.mark.parametrize("decision_variables_values", EXAMPLE_DECISION_VARIABLES_VALUES)
     def test_init__valid_input_with_all_variables(self, decision_variables_values):
@@ -63,11 +67,12 @@ class TestSolution:
         self.mock_decision_variables_items.return_value = [(name, self.mock_decision_variable)
                                                            for name in decision_variables_values.keys()]
         AbstractSolution.__init__(self_solution=self.mock_solution_object, **decision_variables_values)
-        assert isinstance(self.mock_solution_object.decision_variables_values, OrderedDict)
-        assert set(self.mock_solution_object.decision_variables_values.keys()) == set(decision_variables_values.keys())
-        assert all([self.mock_solution_object.decision_variables_values[var_name] == var_value
-                    for var_name, var_value in decision_variables_values.items()])
+        assert self.mock_solution_object.values == tuple(decision_variables_values.values())
         assert self.mock_solution_object._objective_value_with_penalty is None
+        assert self.mock_solution_object._fitness is None
+        assert self.mock_solution_object._objective_value is None
+        assert self.mock_solution_object._penalty_value is None
+        assert self.mock_solution_object._constraints_values is None
 
     @pytest.mark.parametrize("decision_variables_values", EXAMPLE_DECISION_VARIABLES_VALUES)
     def test_init__invalid_variable_value(self, decision_variables_values):
@@ -94,6 +99,124 @@ class TestSolution:
         with pytest.raises(ValueError):
             AbstractSolution.__init__(self_solution=self.mock_solution_object, **decision_variables_values)
 
+    # from_trusted_values
+
+    @pytest.mark.parametrize("decision_variables_values", EXAMPLE_DECISION_VARIABLES_VALUES)
+    def test_from_trusted_values(self, decision_variables_values):
+        """
+        Test 'from_trusted_values' method creates solution without validation of decision variables values.
+
+        :param decision_variables_values: Examples values of decision variables to be set in solution object.
+        """
+        mock_decision_variable = Mock()
+        mock_problem = Mock(decision_variables=OrderedDict((name, mock_decision_variable)
+                                                           for name in decision_variables_values))
+
+        class Solution(AbstractSolution):
+            __slots__ = ()
+            optimization_problem = mock_problem
+
+        solution = Solution.from_trusted_values(OrderedDict(decision_variables_values))
+        assert isinstance(solution, Solution)
+        assert solution.values == tuple(decision_variables_values.values())
+        assert solution.decision_variables_values == decision_variables_values
+        assert solution._objective_value_with_penalty is None
+        assert solution._fitness is None
+        assert solution.constraints_values is None
+        mock_decision_variable.is_proper_value.assert_not_called()
+
+    @pytest.mark.parametrize("decision_variables_values", EXAMPLE_DECISION_VARIABLES_VALUES)
+    def test_from_trusted_values__validation(self, decision_variables_values):
+        """
+        Test 'from_trusted_values' method validates decision variables values when 'validate_trusted_values'
+        debug flag is set.
+
+        :param decision_variables_values: Examples values of decision variables to be set in solution object.
+        """
+        mock_solution_class = Mock(validate_trusted_values=True)
+        assert AbstractSolution.from_trusted_values.__func__(mock_solution_class, decision_variables_values) \
+            == mock_solution_class.return_value
+        mock_solution_class.assert_called_once_with(**decision_variables_values)
+
+    def test_from_trusted_values__invalid_value(self):
+        """
+        Test 'from_trusted_values' method raises ValueError for incorrect value when 'validate_trusted_values'
+        debug flag is set.
+        """
+        mock_problem = Mock(decision_variables=OrderedDict(x=Mock(is_proper_value=Mock(return_value=False))))
+
+        class Solution(AbstractSolution):
+            __slots__ = ()
+            optimization_problem = mock_problem
+            validate_trusted_values = True
+
+        with pytest.raises(ValueError):
+            Solution.from_trusted_values(OrderedDict(x=1))
+
+    # decision_variables_values
+
+    @pytest.mark.parametrize("decision_variables_values", EXAMPLE_DECISION_VARIABLES_VALUES)
+    def test_decision_variables_values(self, decision_variables_values):
+        """
+        Test 'decision_variables_values' property creates dictionary with decision variables values.
+
+        :param decision_variables_values: Examples values of decision variables stored in solution object.
+        """
+        self.mock_optimization_problem_object.decision_variables = dict.fromkeys(decision_variables_values)
+        self.mock_solution_object.values = tuple(decision_variables_values.values())
+        values = AbstractSolution.decision_variables_values.fget(self.mock_solution_object)
+        assert isinstance(values, OrderedDict)
+        assert list(values.items()) == list(decision_variables_values.items())
+
+    # constraints_values
+
+    def test_constraints_values__not_calculated(self):
+        """Test 'constraints_values' property returns None if constraints were not calculated."""
+        self.mock_solution_object._constraints_values = None
+        assert AbstractSolution.constraints_values.fget(self.mock_solution_object) is None
+
+    @pytest.mark.parametrize("constraints_values", [(0, 1.5), (2.34, 0)])
+    def test_constraints_values(self, constraints_values):
+        """
+        Test 'constraints_values' property creates dictionary with calculated constraints values.
+
+        :param constraints_values: Example constraints values stored in solution object.
+        """
+        self.mock_solution_object._constraints_values = constraints_values
+        assert AbstractSolution.constraints_values.fget(self.mock_solution_object) \
+            == dict(zip(("c0", "c1"), constraints_values))
+
+    # objective_value, penalty_value
+
+    @pytest.mark.parametrize("objective_value, penalty_value", [(None, None), (2.5, 0), (-3, 1.25)])
+    def test_objective_and_penalty_values(self, objective_value, penalty_value):
+        """
+        Test 'objective_value' and 'penalty_value' properties return values calculated during evaluation.
+
+        :param objective_value: Example objective value stored in solution object.
+        :param penalty_value: Example penalty value stored in solution object.
+        """
+        self.mock_solution_object._objective_value = objective_value
+        self.mock_solution_object._penalty_value = penalty_value
+        assert AbstractSolution.objective_value.fget(self.mock_solution_object) == objective_value
+        assert AbstractSolution.penalty_value.fget(self.mock_solution_object) == penalty_value
+
+    # __slots__
+
+    def test_slots(self):
+        """Test that solutions of classes with empty '__slots__' do not have '__dict__'."""
+        mock_problem = Mock(decision_variables=OrderedDict(x=Mock(is_proper_value=Mock(return_value=True))))
+
+        class Solution(AbstractSolution):
+            __slots__ = ()
+            optimization_problem = mock_problem
+
+        solution = Solution(x=5)
+        assert not hasattr(solution, "__dict__")
+        assert solution.values == (5, )
+        assert solution.decision_variables_values == OrderedDict(x=5)
+        assert solution.constraints_values is None
+
     # _calculate_objective
 
     @pytest.mark.parametrize("decision_variables_values", EXAMPLE_DECISION_VARIABLES_VALUES)
@@ -102,13 +225,11 @@ class TestSolution:
         Test '_calculate_objective' method of AbstractSolution class calculates objective using
         optimization_problem model.
 
-        :param decision_variables_values: Examples values of decision variables to be stored in solution object.
+        :param decision_variables_values: Examples values of decision variables of the solution.
         """
-        self.mock_solution_object.decision_variables_values = decision_variables_values
-        assert AbstractSolution._calculate_objective(
-            self.mock_solution_object) == self.mock_optimization_problem_object.objective_function.return_value
-        self.mock_optimization_problem_object.objective_function.assert_called_once_with(
-            **self.mock_solution_object.decision_variables_values)
+        assert AbstractSolution._calculate_objective(self.mock_solution_object, decision_variables_values) \
+            == self.mock_optimization_problem_object.objective_function.return_value
+        self.mock_optimization_problem_object.objective_function.assert_called_once_with(**decision_variables_values)
 
     # _calculate_constraints
 
@@ -119,12 +240,12 @@ class TestSolution:
         Test '_calculate_constraints' method of AbstractSolution class calculates constraints values using
         optimization_problem model.
 
-        :param decision_variables_values: Examples values of decision variables to be stored in solution object.
+        :param decision_variables_values: Examples values of decision variables of the solution.
         :param constraint_value: Value to be returned by constraint function.
         """
         self.mock_constraint.return_value = constraint_value
-        self.mock_solution_object.decision_variables_values = decision_variables_values
-        constraints_values = AbstractSolution._calculate_constraints(self.mock_solution_object)
+        constraints_values = AbstractSolution._calculate_constraints(self.mock_solution_object,
+                                                                     decision_variables_values)
         assert isinstance(constraints_values, dict)
         assert set(constraints_values.keys()) == set(self.mock_optimization_problem_object.constraints.keys())
         assert all([value == abs(self.mock_constraint.return_value) for value in constraints_values.values()])
@@ -140,9 +261,41 @@ class TestSolution:
         :param constraints_values: Values to be simulated as constraint values.
         """
         self.mock_solution_object_calculate_constraints.return_value = constraints_values
-        assert AbstractSolution._calculate_penalty(
-            self.mock_solution_object) == self.mock_optimization_problem_object.penalty_function.return_value
+        decision_variables_values = {"x": 1}
+        assert AbstractSolution._calculate_penalty(self.mock_solution_object, decision_variables_values) \
+            == self.mock_optimization_problem_object.penalty_function.return_value
+        self.mock_solution_object_calculate_constraints.assert_called_once_with(decision_variables_values)
         self.mock_optimization_problem_object.penalty_function.assert_called_once_with(**constraints_values)
+        assert self.mock_solution_object._constraints_values == tuple(constraints_values.values())
+
+    # _calculate_objective_value_with_penalty
+
+    @pytest.mark.parametrize("objective_value", [1, 2.34])
+    @pytest.mark.parametrize("penalty_value", [954, 534.132])
+    @pytest.mark.parametrize("optimization_type", [OptimizationType.Minimize, OptimizationType.Maximize])
+    def test_calculate_objective_value_with_penalty(self, objective_value, penalty_value, optimization_type):
+        """
+        Test '_calculate_objective_value_with_penalty' method returns objective value with penalty according to
+        optimization type.
+
+        :param objective_value: Simulated value of objective.
+        :param penalty_value: Simulated value of penalty.
+        :param optimization_type: Simulated optimization type of optimization problem.
+        """
+        self.mock_optimization_problem_object.optimization_type = optimization_type
+        self.mock_solution_object_calculate_penalty.return_value = penalty_value
+        self.mock_solution_object_calculate_objective.return_value = objective_value
+        if optimization_type == OptimizationType.Maximize:
+            expected_objective_with_penalty = objective_value - penalty_value
+        else:
+            expected_objective_with_penalty = objective_value + penalty_value
+        assert AbstractSolution._calculate_objective_value_with_penalty(self.mock_solution_object) \
+               == expected_objective_with_penalty
+        decision_variables_values = self.mock_solution_object.decision_variables_values
+        self.mock_solution_object_calculate_objective.assert_called_once_with(decision_variables_values)
+        assert self.mock_solution_object._objective_value == objective_value
+        assert self.mock_solution_object._penalty_value == penalty_value
+        self.mock_solution_object_calculate_penalty.assert_called_once_with(decision_variables_values)
 
     # get_objective_value_with_penalty
 
@@ -157,31 +310,257 @@ class TestSolution:
         self.mock_solution_object._objective_value_with_penalty = objective_value_with_penalty
         assert AbstractSolution.get_objective_value_with_penalty(
             self.mock_solution_object) == objective_value_with_penalty
-        self.mock_solution_object_calculate_objective.assert_not_called()
-        self.mock_solution_object_calculate_penalty.assert_not_called()
+        self.mock_solution_object._calculate_objective_value_with_penalty.assert_not_called()
 
-    @pytest.mark.parametrize("objective_value", [1, 2.34])
-    @pytest.mark.parametrize("penalty_value", [954, 534.132])
-    @pytest.mark.parametrize("optimization_type", [OptimizationType.Minimize, OptimizationType.Maximize])
-    def test_get_objective_value_with_penalty__not_calculated(self, objective_value, penalty_value, optimization_type):
+    @pytest.mark.parametrize("objective_value_with_penalty", [-5, 2.34])
+    def test_get_objective_value_with_penalty__not_calculated(self, objective_value_with_penalty):
         """
         Test 'get_objective_value_with_penalty' method returns and stores calculated value  of objective (with penalty)
         if it has never been calculated before in this object.
 
-        :param objective_value: Simulated value of objective.
-        :param penalty_value: Simulated value of penalty.
-        :param optimization_type: Simulated optimization type of optimization problem.
+        :param objective_value_with_penalty: Simulated value of objective with penalty.
         """
-        self.mock_optimization_problem_object.optimization_type = optimization_type
         self.mock_solution_object._objective_value_with_penalty = None
-        self.mock_solution_object_calculate_penalty.return_value = penalty_value
-        self.mock_solution_object_calculate_objective.return_value = objective_value
-        if optimization_type == OptimizationType.Maximize:
-            expected_objective_with_penalty = objective_value - penalty_value
-        else:
-            expected_objective_with_penalty = objective_value + penalty_value
+        self.mock_solution_object._calculate_objective_value_with_penalty.return_value = objective_value_with_penalty
+        assert AbstractSolution.get_objective_value_with_penalty(self.mock_solution_object) \
+               == objective_value_with_penalty == self.mock_solution_object._objective_value_with_penalty
+
+    @pytest.mark.parametrize("cached_value", [-5, 2.34])
+    def test_get_objective_value_with_penalty__cache_hit(self, cached_value):
+        """
+        Test 'get_objective_value_with_penalty' method uses value found in evaluation cache.
+
+        :param cached_value: Simulated value of objective with penalty stored in the cache.
+        """
+        mock_cache = Mock()
+        mock_cache.get.return_value = cached_value
+        self.mock_optimization_problem_object.evaluation_cache = mock_cache
+        self.mock_solution_object.values = (1, 2)
+        self.mock_solution_object._objective_value_with_penalty = None
         assert AbstractSolution.get_objective_value_with_penalty(self.mock_solution_object) \
-               == expected_objective_with_penalty == self.mock_solution_object._objective_value_with_penalty
+               == cached_value == self.mock_solution_object._objective_value_with_penalty
+        mock_cache.get.assert_called_once_with((1, 2))
+        self.mock_solution_object._calculate_objective_value_with_penalty.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @pytest.mark.parametrize("objective_value_with_penalty", [-5, 2.34])
+    def test_get_objective_value_with_penalty__cache_miss(self, objective_value_with_penalty):
+        """
+        Test 'get_objective_value_with_penalty' method calculates value not found in evaluation cache
+        and stores it in the cache.
+
+        :param objective_value_with_penalty: Simulated value of objective with penalty.
+        """
+        mock_cache = Mock()
+        mock_cache.get.return_value = None
+        self.mock_optimization_problem_object.evaluation_cache = mock_cache
+        self.mock_solution_object.values = (1, 2)
+        self.mock_solution_object._objective_value_with_penalty = None
+        self.mock_solution_object._calculate_objective_value_with_penalty.return_value = objective_value_with_penalty
+        assert AbstractSolution.get_objective_value_with_penalty(self.mock_solution_object) \
+               == objective_value_with_penalty == self.mock_solution_object._objective_value_with_penalty
+        self.mock_solution_object._store_in_cache.assert_called_once_with(mock_cache)
+
+    # get_fitness
+
+    @pytest.mark.parametrize("fitness", [-5, 2.34])
+    def test_get_fitness__already_calculated(self, fitness):
+        """
+        Test 'get_fitness' method returns stored value of fitness if already calculated.
+
+        :param fitness: Simulated value of fitness.
+        """
+        self.mock_solution_object._fitness = fitness
+        assert AbstractSolution.get_fitness(self.mock_solution_object) == fitness
+        self.mock_solution_object_get_objective_value_with_penalty.assert_not_called()
+
+    @pytest.mark.parametrize("optimization_type, objective_value_with_penalty, expected_fitness", [
+        (OptimizationType.Maximize, -5, -5),
+        (OptimizationType.Maximize, 2.34, 2.34),
+        (OptimizationType.Minimize, -5, 5),
+        (OptimizationType.Minimize, 2.34, -2.34),
+    ])
+    def test_get_fitness__not_calculated(self, optimization_type, objective_value_with_penalty, expected_fitness):
+        """
+        Test 'get_fitness' method calculates and stores fitness (objective value with penalty normalized
+        by optimization type) if it has never been calculated before in this object.
+
+        :param optimization_type: Simulated type of optimization.
+        :param objective_value_with_penalty: Simulated value of objective with penalty.
+        :param expected_fitness: Expected value of fitness.
+        """
+        self.mock_optimization_problem_object.optimization_type = optimization_type
+        self.mock_solution_object._fitness = None
+        self.mock_solution_object_get_objective_value_with_penalty.return_value = objective_value_with_penalty
+        assert AbstractSolution.get_fitness(self.mock_solution_object) \
+               == expected_fitness == self.mock_solution_object._fitness
+        self.mock_solution_object_get_objective_value_with_penalty.assert_called_once_with()
+
+    # fitness_key
+
+    def test_fitness_key(self):
+        """Test 'fitness_key' function returns fitness of the solution."""
+        assert fitness_key(self.mock_solution_object) == self.mock_solution_object.get_fitness.return_value
+        self.mock_solution_object.get_fitness.assert_called_once_with()
+
+    # group_not_evaluated
+
+    @pytest.mark.parametrize("solutions_number", [0, 1, 5])
+    def test_group_not_evaluated__no_cache(self, solutions_number):
+        """
+        Test 'group_not_evaluated' method creates separate group for each not evaluated solution if evaluation cache
+        is not defined.
+
+        :param solutions_number: Number of solutions that were not evaluated.
+        """
+        mock_solution_class = Mock(optimization_problem=Mock(evaluation_cache=None))
+        solutions = [Mock(is_evaluated=False) for _ in range(solutions_number)]
+        assert AbstractSolution.group_not_evaluated.__func__(mock_solution_class, solutions + [Mock(is_evaluated=True)]) \
+            == [[solution] for solution in solutions]
+
+    def test_group_not_evaluated__with_cache(self):
+        """Test 'group_not_evaluated' method assigns cached values and groups solutions with the same values."""
+        mock_cache = Mock(hits=0, make_key=lambda values: tuple(values.values()),
+                          get=Mock(side_effect=lambda key: {(1,): 10.}.get(key)))
+        mock_solution_class = Mock(optimization_problem=Mock(evaluation_cache=mock_cache))
+        cached = Mock(is_evaluated=False, values=(1, ), _objective_value_with_penalty=None)
+        first = Mock(is_evaluated=False, values=(2, ), _objective_value_with_penalty=None)
+        duplicate = Mock(is_evaluated=False, values=(2, ), _objective_value_with_penalty=None)
+        other = Mock(is_evaluated=False, values=(3, ), _objective_value_with_penalty=None)
+        groups = AbstractSolution.group_not_evaluated.__func__(mock_solution_class,
+                                                               [cached, first, other, duplicate])
+        assert groups == [[first, duplicate], [other]]
+        assert cached._objective_value_with_penalty == 10.
+        assert mock_cache.hits == 1
+
+    # calculate_objective_values
+
+    @pytest.mark.parametrize("solutions_number", [1, 5])
+    def test_calculate_objective_values__not_batch(self, solutions_number):
+        """
+        Test 'calculate_objective_values' method evaluates each solution separately when batch functions are not
+        defined.
+
+        :param solutions_number: Number of solutions to evaluate.
+        """
+        mock_solution_class = Mock(optimization_problem=Mock(supports_batch_evaluation=False))
+        solutions = [Mock(_objective_value_with_penalty=None) for _ in range(solutions_number)]
+        AbstractSolution.calculate_objective_values.__func__(mock_solution_class, solutions)
+        for solution in solutions:
+            solution._calculate_objective_value_with_penalty.assert_called_once_with()
+            assert solution._objective_value_with_penalty \
+                == solution._calculate_objective_value_with_penalty.return_value
+        mock_solution_class.optimization_problem.evaluate_batch.assert_not_called()
+
+    @pytest.mark.parametrize("objective_values", [[1.5], [2, -3.4, 0.]])
+    def test_calculate_objective_values__batch(self, objective_values):
+        """
+        Test 'calculate_objective_values' method evaluates all solutions at once when batch functions are defined.
+
+        :param objective_values: Simulated objective values (with penalty) calculated by batch functions.
+        """
+        mock_problem = Mock(supports_batch_evaluation=True)
+        mock_solution_class = Mock(optimization_problem=mock_problem)
+        solutions = [Mock(_objective_value_with_penalty=None) for _ in objective_values]
+        AbstractSolution.calculate_objective_values.__func__(mock_solution_class, solutions)
+        mock_problem.get_batch_values.assert_called_once_with([solution.values for solution in solutions])
+        mock_problem.evaluate_batch_components.assert_called_once_with(mock_problem.get_batch_values.return_value)
+        mock_solution_class.assign_evaluation_results.assert_called_once_with(
+            solutions, mock_problem.evaluate_batch_components.return_value)
+
+    def test_calculate_objective_values__no_solutions(self):
+        """Test 'calculate_objective_values' method does nothing if no solutions are provided."""
+        mock_problem = Mock(supports_batch_evaluation=True)
+        AbstractSolution.calculate_objective_values.__func__(Mock(optimization_problem=mock_problem), [])
+        mock_problem.evaluate_batch.assert_not_called()
+
+    # assign_evaluation_results
+
+    @pytest.mark.parametrize("constraints", [{}, {"c0": Mock(), "c1": Mock()}])
+    def test_assign_evaluation_results(self, constraints):
+        """
+        Test 'assign_evaluation_results' method assigns objective value (with penalty) and its components.
+
+        :param constraints: Example constraints of the optimization problem.
+        """
+        mock_solution_class = Mock(optimization_problem=Mock(constraints=constraints))
+        solutions = [Mock(), Mock()]
+        evaluation_results = {
+            "objective_value_with_penalty": numpy.array([3., -1.]),
+            "objective_value": numpy.array([1., -2.]),
+            "penalty_value": numpy.array([2., 1.]),
+            "constraints_values": {name: numpy.array([index, 10 + index])
+                                   for index, name in reversed(list(enumerate(constraints)))},
+        }
+        AbstractSolution.assign_evaluation_results.__func__(mock_solution_class, solutions, evaluation_results)
+        assert [solution._objective_value_with_penalty for solution in solutions] == [3., -1.]
+        assert [solution._objective_value for solution in solutions] == [1., -2.]
+        assert [solution._penalty_value for solution in solutions] == [2., 1.]
+        if constraints:
+            assert [solution._constraints_values for solution in solutions] == [(0, 1), (10, 11)]
+        else:
+            assert [solution._constraints_values for solution in solutions] == [(), ()]
+
+    # store_evaluation_results
+
+    @pytest.mark.parametrize("with_cache", [True, False])
+    def test_store_evaluation_results(self, with_cache):
+        """
+        Test 'store_evaluation_results' method propagates values to other solutions in groups and stores them
+        in evaluation cache.
+
+        :param with_cache: Whether evaluation cache is defined.
+        """
+        mock_cache = Mock(make_key=lambda values: tuple(values.values())) if with_cache else None
+        mock_solution_class = Mock(optimization_problem=Mock(evaluation_cache=mock_cache))
+        groups = [[Mock(_objective_value_with_penalty=1., values=(1, )), Mock(), Mock()],
+                  [Mock(_objective_value_with_penalty=-2., values=(2, ))]]
+        AbstractSolution.store_evaluation_results.__func__(mock_solution_class, groups)
+        assert [solution._objective_value_with_penalty for solution in groups[0]] == [1., 1., 1.]
+        for evaluated_solution, *other_solutions in groups:
+            if with_cache:
+                evaluated_solution._store_in_cache.assert_called_once_with(mock_cache)
+            else:
+                evaluated_solution._store_in_cache.assert_not_called()
+            for solution in other_solutions:
+                solution._store_in_cache.assert_not_called()
+
+    # _store_in_cache
+
+    @pytest.mark.parametrize("objective_value, penalty_value, constraints_values", [
+        (None, None, None),
+        (5.5, 1.5, (1.5, 0)),
+    ])
+    def test_store_in_cache(self, objective_value, penalty_value, constraints_values):
+        """
+        Test '_store_in_cache' method stores objective value (with penalty) and other evaluation results in the cache.
+
+        :param objective_value: Example value of objective.
+        :param penalty_value: Example value of penalty.
+        :param constraints_values: Example values of constraints.
+        """
+        mock_cache = Mock()
+        self.mock_solution_object.values = (1, 2)
+        self.mock_solution_object._objective_value_with_penalty = 4
+        self.mock_solution_object._objective_value = objective_value
+        self.mock_solution_object._penalty_value = penalty_value
+        self.mock_solution_object.constraints_values = constraints_values
+        AbstractSolution._store_in_cache(self.mock_solution_object, mock_cache)
+        mock_cache.set.assert_called_once_with((1, 2), 4, objective_value=objective_value, penalty_value=penalty_value,
+                                               constraints_values=constraints_values)
+
+    # evaluate_solutions
+
+    def test_evaluate_solutions(self):
+        """Test 'evaluate_solutions' method evaluates only the first solution of each group."""
+        mock_solution_class = Mock()
+        groups = [[Mock(), Mock()], [Mock()]]
+        mock_solution_class.group_not_evaluated.return_value = groups
+        solutions = Mock()
+        assert AbstractSolution.evaluate_solutions.__func__(mock_solution_class, solutions) == len(groups)
+        mock_solution_class.group_not_evaluated.assert_called_once_with(solutions)
+        mock_solution_class.calculate_objective_values.assert_called_once_with([groups[0][0], groups[1][0]])
+        mock_solution_class.store_evaluation_results.assert_called_once_with(groups)
 
     # get_log_data
 
@@ -0,0 +1,622 @@
+import asyncio
+
+import pytest
+from mock import Mock, patch, call
+import numpy
+
+from optimization.evaluators import AbstractEvaluator, SerialEvaluator, ProcessPoolEvaluator, ThreadPoolEvaluator, \
+    AsyncEvaluator, OptimizationType, _initialize_worker, _evaluate_chunk, _evaluate_batch_chunk, _split_batch_values
+import optimization.evaluators as evaluators_module
+
+
+class TestSerialEvaluator:
+    """Tests for 'SerialEvaluator' class and their methods."""
+
+    def setup(self):
+        self.mock_serial_evaluator_object = Mock(spec=SerialEvaluator)
+
+    def test_evaluate__no_solutions(self):
+        """Test 'evaluate' method does nothing if no solutions were provided."""
+        assert SerialEvaluator.evaluate(self=self.mock_serial_evaluator_object, solutions=[]) == 0
+
+    @pytest.mark.parametrize("solutions_number", [1, 5])
+    def test_evaluate(self, solutions_number):
+        """
+        Test 'evaluate' method delegates evaluation to the solution class.
+
+        :param solutions_number: Number of solutions to evaluate.
+        """
+        solutions = [Mock() for _ in range(solutions_number)]
+        assert SerialEvaluator.evaluate(self=self.mock_serial_evaluator_object, solutions=solutions) \
+            == solutions[0].evaluate_solutions.return_value
+        solutions[0].evaluate_solutions.assert_called_once_with(solutions)
+
+    def test_evaluate_batch(self):
+        """Test 'evaluate_batch' method delegates evaluation to the optimization problem."""
+        mock_problem = Mock()
+        batch_values = {"x": numpy.array([1, 2])}
+        assert AbstractEvaluator.evaluate_batch(self=self.mock_serial_evaluator_object, problem=mock_problem,
+                                                batch_values=batch_values) == mock_problem.evaluate_batch.return_value
+        mock_problem.evaluate_batch.assert_called_once_with(batch_values)
+
+    def test_get_log_data(self):
+        """Test that 'get_log_data' return dictionary with certain keys."""
+        log_data = AbstractEvaluator.get_log_data(self=self.mock_serial_evaluator_object)
+        assert isinstance(log_data, dict)
+        assert "type" in log_data
+
+
+class TestProcessPoolEvaluator:
+    """Tests for 'ProcessPoolEvaluator' class and their methods."""
+
+    SCRIPT_LOCATION = "optimization.evaluators"
+
+    def setup(self):
+        self.mock_executor = Mock()
+        self.mock_process_pool_evaluator_object = Mock(spec=ProcessPoolEvaluator, workers=None, chunk_size=1)
+        self.mock_process_pool_evaluator_object._get_executor.return_value = self.mock_executor
+        # patching
+        self._patcher_process_pool_executor = patch(f"{self.SCRIPT_LOCATION}.ProcessPoolExecutor")
+        self.mock_process_pool_executor = self._patcher_process_pool_executor.start()
+
+    def teardown(self):
+        self._patcher_process_pool_executor.stop()
+
+    # __init__
+
+    @pytest.mark.parametrize("workers", [None, 1, 8])
+    @pytest.mark.parametrize("chunk_size", [1, 50])
+    def test_init__valid(self, workers, chunk_size):
+        """
+        Test valid initialization of 'ProcessPoolEvaluator' class.
+
+        :param workers: Example value of 'workers' parameter.
+        :param chunk_size: Example value of 'chunk_size' parameter.
+        """
+        ProcessPoolEvaluator.__init__(self=self.mock_process_pool_evaluator_object, workers=workers,
+                                      chunk_size=chunk_size)
+        assert self.mock_process_pool_evaluator_object.workers == workers
+        assert self.mock_process_pool_evaluator_object.chunk_size == chunk_size
+        assert self.mock_process_pool_evaluator_object._executor is None
+        self.mock_process_pool_executor.assert_not_called()
+
+    @pytest.mark.parametrize("workers", ["1", 2.])
+    def test_init__invalid_workers_type(self, workers):
+        """
+        Test that TypeError is raised when 'workers' parameter has invalid type.
+
+        :param workers: Value that is not int nor None type.
+        """
+        with pytest.raises(TypeError):
+            ProcessPoolEvaluator.__init__(self=self.mock_process_pool_evaluator_object, workers=workers)
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_init__invalid_workers_value(self, workers):
+        """
+        Test that ValueError is raised when 'workers' parameter has invalid value.
+
+        :param workers: Value that is not positive.
+        """
+        with pytest.raises(ValueError):
+            ProcessPoolEvaluator.__init__(self=self.mock_process_pool_evaluator_object, workers=workers)
+
+    @pytest.mark.parametrize("chunk_size", [None, "1", 2.])
+    def test_init__invalid_chunk_size_type(self, chunk_size):
+        """
+        Test that TypeError is raised when 'chunk_size' parameter has invalid type.
+
+        :param chunk_size: Value that is not int type.
+        """
+        with pytest.raises(TypeError):
+            ProcessPoolEvaluator.__init__(self=self.mock_process_pool_evaluator_object, chunk_size=chunk_size)
+
+    @pytest.mark.parametrize("chunk_size", [0, -10])
+    def test_init__invalid_chunk_size_value(self, chunk_size):
+        """
+        Test that ValueError is raised when 'chunk_size' parameter has invalid value.
+
+        :param chunk_size: Value that is not positive.
+        """
+        with pytest.raises(ValueError):
+            ProcessPoolEvaluator.__init__(self=self.mock_process_pool_evaluator_object, chunk_size=chunk_size)
+
+    # _get_executor
+
+    @pytest.mark.parametrize("workers", [None, 4])
+    def test_get_executor__new(self, workers):
+        """
+        Test '_get_executor' method starts worker processes if they were not started yet.
+
+        :param workers: Number of workers configured.
+        """
+        mock_problem = Mock()
+        self.mock_process_pool_evaluator_object._executor = None
+        self.mock_process_pool_evaluator_object.workers = workers
+        assert ProcessPoolEvaluator._get_executor(self=self.mock_process_pool_evaluator_object, problem=mock_problem) \
+            == self.mock_process_pool_executor.return_value
+        self.mock_process_pool_executor.assert_called_once_with(max_workers=workers, initializer=_initialize_worker,
+                                                                initargs=(mock_problem,))
+        assert self.mock_process_pool_evaluator_object._problem == mock_problem
+
+    def test_get_executor__reused(self):
+        """Test '_get_executor' method reuses worker processes for the same optimization problem."""
+        mock_problem = Mock()
+        self.mock_process_pool_evaluator_object._executor = self.mock_executor
+        self.mock_process_pool_evaluator_object._problem = mock_problem
+        assert ProcessPoolEvaluator._get_executor(self=self.mock_process_pool_evaluator_object,
+                                                  problem=mock_problem) == self.mock_executor
+        self.mock_process_pool_executor.assert_not_called()
+        self.mock_process_pool_evaluator_object.close.assert_not_called()
+
+    def test_get_executor__other_problem(self):
+        """Test '_get_executor' method restarts worker processes when optimization problem changes."""
+        mock_problem = Mock()
+        self.mock_process_pool_evaluator_object._executor = self.mock_executor
+        self.mock_process_pool_evaluator_object._problem = Mock()
+        assert ProcessPoolEvaluator._get_executor(self=self.mock_process_pool_evaluator_object, problem=mock_problem) \
+            == self.mock_process_pool_executor.return_value
+        self.mock_process_pool_evaluator_object.close.assert_called_once_with()
+
+    # evaluate
+
+    def test_evaluate__all_evaluated(self):
+        """Test 'evaluate' method does not start worker processes if all solutions are already evaluated."""
+        solutions = [Mock(is_evaluated=True) for _ in range(3)]
+        solutions[0].group_not_evaluated.return_value = []
+        assert ProcessPoolEvaluator.evaluate(self=self.mock_process_pool_evaluator_object, solutions=solutions) == 0
+        self.mock_process_pool_evaluator_object._get_executor.assert_not_called()
+
+    @pytest.mark.parametrize("chunk_size, expected_chunks", [
+        (1, [[(0,)], [(1,)], [(2,)]]),
+        (2, [[(0,), (1,)], [(2,)]]),
+        (10, [[(0,), (1,), (2,)]]),
+    ])
+    def test_evaluate(self, chunk_size, expected_chunks):
+        """
+        Test 'evaluate' method splits solutions (one for each group of not evaluated solutions) into chunks
+        and assigns calculated objective values.
+
+        :param chunk_size: Number of solutions in a chunk.
+        :param expected_chunks: Chunks of decision variables values expected to be sent to worker processes.
+        """
+        self.mock_process_pool_evaluator_object.chunk_size = chunk_size
+        solutions = [Mock(is_evaluated=False, values=(i,), _objective_value_with_penalty=None) for i in range(3)]
+        groups = [[solution, Mock()] for solution in solutions]
+        evaluated_solution = Mock(is_evaluated=True, _objective_value_with_penalty=-1)
+        evaluated_solution.group_not_evaluated.return_value = groups
+        chunks_results = [Mock() for _ in expected_chunks]
+        self.mock_executor.map.return_value = chunks_results
+        assert ProcessPoolEvaluator.evaluate(self=self.mock_process_pool_evaluator_object,
+                                             solutions=[evaluated_solution] + solutions) == len(groups)
+        evaluated_solution.group_not_evaluated.assert_called_once_with([evaluated_solution] + solutions)
+        self.mock_process_pool_evaluator_object._get_executor.assert_called_once_with(
+            evaluated_solution.optimization_problem)
+        self.mock_executor.map.assert_called_once_with(_evaluate_chunk, expected_chunks)
+        evaluated_solutions_chunks = [[solutions[values[0]] for values in chunk] for chunk in expected_chunks]
+        assert evaluated_solution.assign_evaluation_results.call_args_list \
+            == [call(solutions_chunk, chunk_results)
+                for solutions_chunk, chunk_results in zip(evaluated_solutions_chunks, chunks_results)]
+        evaluated_solution.store_evaluation_results.assert_called_once_with(groups)
+
+    # evaluate_batch
+
+    def test_evaluate_batch__empty(self):
+        """Test 'evaluate_batch' method does not start worker processes if no individuals are provided."""
+        assert ProcessPoolEvaluator.evaluate_batch(self=self.mock_process_pool_evaluator_object, problem=Mock(),
+                                                   batch_values={"x": numpy.array([])}).size == 0
+        self.mock_process_pool_evaluator_object._get_executor.assert_not_called()
+
+    @pytest.mark.parametrize("chunk_size, expected_chunks", [
+        (1, [[0], [1], [2]]),
+        (2, [[0, 1], [2]]),
+        (10, [[0, 1, 2]]),
+    ])
+    def test_evaluate_batch(self, chunk_size, expected_chunks):
+        """
+        Test 'evaluate_batch' method splits individuals into chunks evaluated by worker processes.
+
+        :param chunk_size: Number of individuals in a chunk.
+        :param expected_chunks: Values of decision variable 'x' in following chunks.
+        """
+        mock_problem = Mock()
+        self.mock_process_pool_evaluator_object.chunk_size = chunk_size
+        self.mock_executor.map.side_effect = lambda function, chunks: [10 * chunk["x"] for chunk in chunks]
+        objective_values = ProcessPoolEvaluator.evaluate_batch(self=self.mock_process_pool_evaluator_object,
+                                                               problem=mock_problem,
+                                                               batch_values={"x": numpy.array([0, 1, 2])})
+        assert objective_values.tolist() == [0, 10, 20]
+        self.mock_process_pool_evaluator_object._get_executor.assert_called_once_with(mock_problem)
+        function, chunks = self.mock_executor.map.call_args[0]
+        assert function is _evaluate_batch_chunk
+        assert [chunk["x"].tolist() for chunk in chunks] == expected_chunks
+
+    # close
+
+    def test_close__not_started(self):
+        """Test 'close' method does nothing if worker processes were not started."""
+        self.mock_process_pool_evaluator_object._executor = None
+        ProcessPoolEvaluator.close(self=self.mock_process_pool_evaluator_object)
+        assert self.mock_process_pool_evaluator_object._executor is None
+
+    def test_close__started(self):
+        """Test 'close' method shuts down worker processes."""
+        self.mock_process_pool_evaluator_object._executor = self.mock_executor
+        ProcessPoolEvaluator.close(self=self.mock_process_pool_evaluator_object)
+        self.mock_executor.shutdown.assert_called_once_with(wait=True)
+        assert self.mock_process_pool_evaluator_object._executor is None
+        assert self.mock_process_pool_evaluator_object._problem is None
+
+    # get_log_data
+
+    @pytest.mark.parametrize("workers, chunk_size", [(None, 1), (4, 25)])
+    def test_get_log_data(self, workers, chunk_size):
+        """
+        Test that 'get_log_data' return dictionary with evaluator configuration.
+
+        :param workers: Number of workers configured.
+        :param chunk_size: Chunk size configured.
+        """
+        self.mock_process_pool_evaluator_object.workers = workers
+        self.mock_process_pool_evaluator_object.chunk_size = chunk_size
+        log_data = ProcessPoolEvaluator.get_log_data(self=self.mock_process_pool_evaluator_object)
+        assert log_data["workers"] == workers
+        assert log_data["chunk_size"] == chunk_size
+
+
+class TestThreadPoolEvaluator:
+    """Tests for 'ThreadPoolEvaluator' class and their methods."""
+
+    SCRIPT_LOCATION = "optimization.evaluators"
+
+    def setup(self):
+        self.mock_executor = Mock()
+        self.mock_executor.map.return_value = []
+        self.mock_thread_pool_evaluator_object = Mock(spec=ThreadPoolEvaluator, workers=None, chunk_size=1,
+                                                      _executor=None)
+        # patching
+        self._patcher_thread_pool_executor = patch(f"{self.SCRIPT_LOCATION}.ThreadPoolExecutor",
+                                                   Mock(return_value=self.mock_executor))
+        self.mock_thread_pool_executor = self._patcher_thread_pool_executor.start()
+
+    def teardown(self):
+        self._patcher_thread_pool_executor.stop()
+
+    # __init__
+
+    @pytest.mark.parametrize("workers", [None, 1, 64])
+    @pytest.mark.parametrize("chunk_size", [1, 10])
+    def test_init__valid(self, workers, chunk_size):
+        """
+        Test valid initialization of 'ThreadPoolEvaluator' class.
+
+        :param workers: Example value of 'workers' parameter.
+        :param chunk_size: Example value of 'chunk_size' parameter.
+        """
+        ThreadPoolEvaluator.__init__(self=self.mock_thread_pool_evaluator_object, workers=workers,
+                                     chunk_size=chunk_size)
+        assert self.mock_thread_pool_evaluator_object.workers == workers
+        assert self.mock_thread_pool_evaluator_object.chunk_size == chunk_size
+        assert self.mock_thread_pool_evaluator_object._executor is None
+
+    @pytest.mark.parametrize("workers, chunk_size", [("1", 1), (2., 1), (1, None), (1, "5")])
+    def test_init__invalid_type(self, workers, chunk_size):
+        """
+        Test that TypeError is raised when some parameter has invalid type.
+
+        :param workers: Example value of 'workers' parameter.
+        :param chunk_size: Example value of 'chunk_size' parameter.
+        """
+        with pytest.raises(TypeError):
+            ThreadPoolEvaluator.__init__(self=self.mock_thread_pool_evaluator_object, workers=workers,
+                                         chunk_size=chunk_size)
+
+    @pytest.mark.parametrize("workers, chunk_size", [(0, 1), (-1, 1), (1, 0), (None, -5)])
+    def test_init__invalid_value(self, workers, chunk_size):
+        """
+        Test that ValueError is raised when some parameter has invalid value.
+
+        :param workers: Example value of 'workers' parameter.
+        :param chunk_size: Example value of 'chunk_size' parameter.
+        """
+        with pytest.raises(ValueError):
+            ThreadPoolEvaluator.__init__(self=self.mock_thread_pool_evaluator_object, workers=workers,
+                                         chunk_size=chunk_size)
+
+    # evaluate
+
+    def test_evaluate__all_evaluated(self):
+        """Test 'evaluate' method does not start worker threads if all solutions are already evaluated."""
+        solutions = [Mock(is_evaluated=True) for _ in range(3)]
+        solutions[0].group_not_evaluated.return_value = []
+        assert ThreadPoolEvaluator.evaluate(self=self.mock_thread_pool_evaluator_object, solutions=solutions) == 0
+        self.mock_thread_pool_executor.assert_not_called()
+
+    @pytest.mark.parametrize("chunk_size, expected_chunks", [(1, [[0], [1], [2]]), (2, [[0, 1], [2]]), (5, [[0, 1, 2]])])
+    def test_evaluate(self, chunk_size, expected_chunks):
+        """
+        Test 'evaluate' method splits solutions (one for each group of not evaluated solutions) into chunks
+        evaluated by worker threads.
+
+        :param chunk_size: Number of solutions in a chunk.
+        :param expected_chunks: Indexes of solutions in following chunks.
+        """
+        self.mock_thread_pool_evaluator_object.chunk_size = chunk_size
+        solutions = [Mock(is_evaluated=False) for _ in range(3)]
+        groups = [[solution, Mock()] for solution in solutions]
+        solutions[0].group_not_evaluated.return_value = groups
+        assert ThreadPoolEvaluator.evaluate(self=self.mock_thread_pool_evaluator_object,
+                                            solutions=solutions + [Mock(is_evaluated=True)]) == len(groups)
+        self.mock_thread_pool_executor.assert_called_once_with(max_workers=None)
+        self.mock_executor.map.assert_called_once_with(
+            solutions[0].calculate_objective_values, [[solutions[i] for i in chunk] for chunk in expected_chunks])
+        solutions[0].store_evaluation_results.assert_called_once_with(groups)
+
+    def test_evaluate__executor_reused(self):
+        """Test 'evaluate' method reuses already started worker threads."""
+        self.mock_thread_pool_evaluator_object._executor = self.mock_executor
+        solution = Mock(is_evaluated=False)
+        solution.group_not_evaluated.return_value = [[solution]]
+        ThreadPoolEvaluator.evaluate(self=self.mock_thread_pool_evaluator_object, solutions=[solution])
+        self.mock_thread_pool_executor.assert_not_called()
+        self.mock_executor.map.assert_called_once()
+
+    # evaluate_batch
+
+    def test_evaluate_batch__empty(self):
+        """Test 'evaluate_batch' method does not start worker threads if no individuals are provided."""
+        assert ThreadPoolEvaluator.evaluate_batch(self=self.mock_thread_pool_evaluator_object, problem=Mock(),
+                                                  batch_values={"x": numpy.array([])}).size == 0
+        self.mock_thread_pool_executor.assert_not_called()
+
+    @pytest.mark.parametrize("chunk_size, expected_chunks", [(1, [[0], [1], [2]]), (2, [[0, 1], [2]]), (5, [[0, 1, 2]])])
+    def test_evaluate_batch(self, chunk_size, expected_chunks):
+        """
+        Test 'evaluate_batch' method splits individuals into chunks evaluated by worker threads.
+
+        :param chunk_size: Number of individuals in a chunk.
+        :param expected_chunks: Values of decision variable 'x' in following chunks.
+        """
+        mock_problem = Mock()
+        self.mock_thread_pool_evaluator_object.chunk_size = chunk_size
+        self.mock_executor.map.side_effect = lambda function, chunks: [-chunk["x"] for chunk in chunks]
+        objective_values = ThreadPoolEvaluator.evaluate_batch(self=self.mock_thread_pool_evaluator_object,
+                                                              problem=mock_problem,
+                                                              batch_values={"x": numpy.array([0, 1, 2])})
+        assert objective_values.tolist() == [0, -1, -2]
+        self.mock_thread_pool_executor.assert_called_once_with(max_workers=None)
+        function, chunks = self.mock_executor.map.call_args[0]
+        assert function == mock_problem.evaluate_batch
+        assert [chunk["x"].tolist() for chunk in chunks] == expected_chunks
+
+    # close
+
+    def test_close(self):
+        """Test 'close' method shuts down worker threads."""
+        self.mock_thread_pool_evaluator_object._executor = self.mock_executor
+        ThreadPoolEvaluator.close(self=self.mock_thread_pool_evaluator_object)
+        self.mock_executor.shutdown.assert_called_once_with(wait=True)
+        assert self.mock_thread_pool_evaluator_object._executor is None
+
+
+class TestAsyncEvaluator:
+    """Tests for 'AsyncEvaluator' class and their methods."""
+
+    def setup(self):
+        self.mock_async_evaluator_object = Mock(spec=AsyncEvaluator)
+
+    @staticmethod
+    def _create_solution(optimization_type, objective_function, constraints, penalty_function, **values):
+        mock_problem = Mock(optimization_type=optimization_type, objective_function=objective_function,
+                            constraints=constraints, penalty_function=penalty_function)
+        solution = Mock(optimization_problem=mock_problem, decision_variables_values=values, is_evaluated=False,
+                        _objective_value_with_penalty=None)
+        solution.group_not_evaluated.side_effect = lambda solutions: [[solution] for solution in solutions]
+        return solution
+
+    # __init__
+
+    @pytest.mark.parametrize("max_concurrency", [1, 500])
+    def test_init__valid(self, max_concurrency):
+        """
+        Test valid initialization of 'AsyncEvaluator' class.
+
+        :param max_concurrency: Example value of 'max_concurrency' parameter.
+        """
+        AsyncEvaluator.__init__(self=self.mock_async_evaluator_object, max_concurrency=max_concurrency)
+        assert self.mock_async_evaluator_object.max_concurrency == max_concurrency
+
+    @pytest.mark.parametrize("max_concurrency", [None, 1., "10"])
+    def test_init__invalid_type(self, max_concurrency):
+        """
+        Test that TypeError is raised when 'max_concurrency' parameter has invalid type.
+
+        :param max_concurrency: Value that is not int type.
+        """
+        with pytest.raises(TypeError):
+            AsyncEvaluator.__init__(self=self.mock_async_evaluator_object, max_concurrency=max_concurrency)
+
+    @pytest.mark.parametrize("max_concurrency", [0, -3])
+    def test_init__invalid_value(self, max_concurrency):
+        """
+        Test that ValueError is raised when 'max_concurrency' parameter has invalid value.
+
+        :param max_concurrency: Value that is not positive.
+        """
+        with pytest.raises(ValueError):
+            AsyncEvaluator.__init__(self=self.mock_async_evaluator_object, max_concurrency=max_concurrency)
+
+    # evaluate
+
+    def test_evaluate__all_evaluated(self):
+        """Test 'evaluate' method does nothing if all solutions are already evaluated."""
+        solutions = [Mock(is_evaluated=True) for _ in range(3)]
+        solutions[0].group_not_evaluated.return_value = []
+        assert AsyncEvaluator.evaluate(self=self.mock_async_evaluator_object, solutions=solutions) == 0
+        self.mock_async_evaluator_object._evaluate_all.assert_not_called()
+        solutions[0].store_evaluation_results.assert_not_called()
+
+    @pytest.mark.parametrize("optimization_type, expected_values", [
+        (OptimizationType.Minimize, [0, 24]),
+        (OptimizationType.Maximize, [0, -16]),
+    ])
+    def test_evaluate__async_functions(self, optimization_type, expected_values):
+        """
+        Test 'evaluate' method awaits objective, constraints and penalty functions defined with 'async def'.
+
+        :param optimization_type: Optimization type of the problem.
+        :param expected_values: Expected objective values (with penalty) of following solutions.
+        """
+        async def objective_function(x):
+            return x ** 2
+
+        async def constraint_function(x):
+            return -x
+
+        async def penalty_function(c):
+            return 10 * c
+
+        solutions = [self._create_solution(optimization_type, objective_function, {"c": constraint_function},
+                                           penalty_function, x=x) for x in (0, 2)]
+        evaluator = AsyncEvaluator(max_concurrency=1)
+        evaluator.evaluate(solutions)
+        assert [solution._objective_value_with_penalty for solution in solutions] == expected_values
+        assert [solution._objective_value for solution in solutions] == [0, 4]
+        assert [solution._penalty_value for solution in solutions] == [0, 20]
+        assert [solution._constraints_values for solution in solutions] == [(0,), (2,)]
+
+    def test_evaluate__sync_functions(self):
+        """Test 'evaluate' method accepts regular (not 'async def') functions as well."""
+        solution = self._create_solution(OptimizationType.Minimize, lambda x: x + 1, {}, lambda: 0.5, x=3)
+        AsyncEvaluator(max_concurrency=10).evaluate([solution])
+        assert solution._objective_value_with_penalty == 4.5
+
+    @pytest.mark.parametrize("max_concurrency", [1, 3])
+    def test_evaluate__concurrency_limit(self, max_concurrency):
+        """
+        Test 'evaluate' method never exceeds configured number of concurrent evaluations.
+
+        :param max_concurrency: Maximal number of concurrent evaluations.
+        """
+        state = {"running": 0, "max_running": 0}
+
+        async def objective_function(x):
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+            await asyncio.sleep(0.001)
+            state["running"] -= 1
+            return x
+
+        solutions = [self._create_solution(OptimizationType.Minimize, objective_function, {}, lambda: 0, x=x)
+                     for x in range(10)]
+        AsyncEvaluator(max_concurrency=max_concurrency).evaluate(solutions)
+        assert state["max_running"] == max_concurrency
+        assert [solution._objective_value_with_penalty for solution in solutions] == list(range(10))
+
+    # evaluate_batch
+
+    @pytest.mark.parametrize("optimization_type, expected_values", [
+        (OptimizationType.Minimize, [0, 24, 39]),
+        (OptimizationType.Maximize, [0, -16, -21]),
+    ])
+    def test_evaluate_batch(self, optimization_type, expected_values):
+        """
+        Test 'evaluate_batch' method evaluates individuals given as batch values using async functions.
+
+        :param optimization_type: Optimization type of the problem.
+        :param expected_values: Expected objective values (with penalty) of following individuals.
+        """
+        async def objective_function(x):
+            return x ** 2
+
+        async def constraint_function(x):
+            return -x
+
+        async def penalty_function(c):
+            return 10 * c
+
+        mock_problem = Mock(optimization_type=optimization_type, objective_function=objective_function,
+                            constraints={"c": constraint_function}, penalty_function=penalty_function)
+        objective_values = AsyncEvaluator(max_concurrency=2).evaluate_batch(
+            problem=mock_problem, batch_values={"x": numpy.array([0, 2, 3])})
+        assert objective_values.tolist() == expected_values
+
+    def test_evaluate_batch__empty(self):
+        """Test 'evaluate_batch' method returns empty array if no individuals are provided."""
+        mock_problem = Mock(optimization_type=OptimizationType.Minimize)
+        assert AsyncEvaluator().evaluate_batch(problem=mock_problem, batch_values={"x": numpy.array([])}).size == 0
+
+    # get_log_data
+
+    @pytest.mark.parametrize("max_concurrency", [1, 50])
+    def test_get_log_data(self, max_concurrency):
+        """
+        Test that 'get_log_data' return dictionary with evaluator configuration.
+
+        :param max_concurrency: Maximal number of concurrent evaluations.
+        """
+        self.mock_async_evaluator_object.max_concurrency = max_concurrency
+        log_data = AsyncEvaluator.get_log_data(self=self.mock_async_evaluator_object)
+        assert log_data["max_concurrency"] == max_concurrency
+
+
+class TestWorkerFunctions:
+    """Tests for functions executed by worker processes."""
+
+    def teardown(self):
+        evaluators_module._worker_problem = None
+
+    def test_initialize_worker(self):
+        """Test '_initialize_worker' sets optimization problem for the worker process."""
+        mock_problem = Mock()
+        _initialize_worker(mock_problem)
+        assert evaluators_module._worker_problem == mock_problem
+
+    @pytest.mark.parametrize("values", [[(1,)], [(1, 2), (3, 4)]])
+    def test_evaluate_chunk(self, values):
+        """
+        Test '_evaluate_chunk' evaluates decision variables values using the worker optimization problem.
+
+        :param values: Example decision variables values.
+        """
+        mock_problem = Mock()
+        _initialize_worker(mock_problem)
+        assert _evaluate_chunk(values) == mock_problem.evaluate_batch_components.return_value
+        mock_problem.get_batch_values.assert_called_once_with(values)
+        mock_problem.evaluate_batch_components.assert_called_once_with(mock_problem.get_batch_values.return_value)
+
+    def test_evaluate_batch_chunk(self):
+        """Test '_evaluate_batch_chunk' evaluates batch values using the worker optimization problem."""
+        mock_problem = Mock()
+        batch_values = {"x": numpy.array([1, 2])}
+        _initialize_worker(mock_problem)
+        assert _evaluate_batch_chunk(batch_values) == mock_problem.evaluate_batch.return_value
+        mock_problem.evaluate_batch.assert_called_once_with(batch_values)
+
+
+class TestSplitBatchValues:
+    """Tests for '_split_batch_values' function."""
+
+    @pytest.mark.parametrize("chunk_size, expected_chunks", [
+        (1, [([1], [4.]), ([2], [5.]), ([3], [6.])]),
+        (2, [([1, 2], [4., 5.]), ([3], [6.])]),
+        (3, [([1, 2, 3], [4., 5., 6.])]),
+    ])
+    def test_split_batch_values(self, chunk_size, expected_chunks):
+        """
+        Test '_split_batch_values' splits values of all decision variables into chunks.
+
+        :param chunk_size: Maximal number of individuals in a chunk.
+        :param expected_chunks: Expected values of decision variables 'x' and 'y' in following chunks.
+        """
+        batch_values = {"x": numpy.array([1, 2, 3]), "y": numpy.array([4., 5., 6.])}
+        chunks = _split_batch_values(batch_values, chunk_size)
+        assert [(chunk["x"].tolist(), chunk["y"].tolist()) for chunk in chunks] == expected_chunks
+
+    @pytest.mark.parametrize("batch_values", [{}, {"x": numpy.array([])}])
+    def test_split_batch_values__empty(self, batch_values):
+        """
+        Test '_split_batch_values' returns no chunks if there are no individuals.
+
+        :param batch_values: Example batch values without individuals.
+        """
+        assert _split_batch_values(batch_values, 2) == []
@@ -1,6 +1,6 @@
 import pytest
 from mock import Mock, patch
-from datetime import timedelta
+from datetime import timedelta, datetime
 
 from optimization.stop_conditions import StopConditions, OptimizationType
 
@@ -16,21 +16,24 @@ class TestStopConditions:
         self.mock_is_iter_without_progress_exceeded = Mock()
         self.mock_is_time_without_progress_exceeded = Mock()
         self.mock_is_limit_without_progress_exceeded = Mock()
+        self.mock_is_iterations_limit_exceeded = Mock(return_value=False)
+        self.mock_is_evaluations_limit_exceeded = Mock(return_value=False)
         self.mock_stop_condition_object = Mock(spec=StopConditions,
                                                _is_time_exceeded=self.mock_is_time_exceeded,
+                                               _is_iterations_limit_exceeded=self.mock_is_iterations_limit_exceeded,
+                                               _is_evaluations_limit_exceeded=self.mock_is_evaluations_limit_exceeded,
                                                _is_satisfying_solution_found=self.mock_is_satisfying_solution_found,
                                                _is_iter_without_progress_exceeded=self.mock_is_iter_without_progress_exceeded,
                                                _is_time_without_progress_exceeded=self.mock_is_time_without_progress_exceeded,
                                                _is_limit_without_progress_exceeded=self.mock_is_limit_without_progress_exceeded)
         self.mock_get_objective_value_with_penalty = Mock()
         self.mock_solution_object = Mock(get_objective_value_with_penalty=self.mock_get_objective_value_with_penalty)
-        self.mock_datetime_now = Mock()
         # patching
-        self._patcher_datetime = patch(f"{self.SCRIPT_LOCATION}.datetime", Mock(now=self.mock_datetime_now))
-        self.mock_datetime = self._patcher_datetime.start()
+        self._patcher_monotonic_ns = patch(f"{self.SCRIPT_LOCATION}.monotonic_ns")
+        self.mock_monotonic_ns = self._patcher_monotonic_ns.start()
 
     def teardown(self):
-        self._patcher_datetime.stop()
+        self._patcher_monotonic_ns.stop()
 
     # __init__
 
@@ -42,10 +45,70 @@ class TestStopConditions:
         assert self.mock_stop_condition_object.satisfying_objective_value is None
         assert self.mock_stop_condition_object.max_iter_without_progress is None
         assert self.mock_stop_condition_object.max_time_without_progress is None
+        assert self.mock_stop_condition_object.max_iterations is None
+        assert self.mock_stop_condition_object.max_evaluations is None
         assert self.mock_stop_condition_object._best_objective_found is None
-        assert self.mock_stop_condition_object._last_objective_progress_datetime is None
+        assert self.mock_stop_condition_object._last_objective_progress_time is None
         assert self.mock_stop_condition_object._iter_without_progress is None
 
+    @pytest.mark.parametrize("max_iterations, max_evaluations", [(1, None), (None, 1000), (50, 10000)])
+    def test_init__valid_without_time_limit(self, max_iterations, max_evaluations):
+        """
+        Test 'StopCondition' initialization without 'time_limit' parameter, but with other hard limit.
+
+        :param max_iterations: Example value of 'max_iterations'.
+        :param max_evaluations: Example value of 'max_evaluations'.
+        """
+        StopConditions.__init__(self=self.mock_stop_condition_object, max_iterations=max_iterations,
+                                max_evaluations=max_evaluations)
+        assert self.mock_stop_condition_object.time_limit is None
+        assert self.mock_stop_condition_object.max_iterations == max_iterations
+        assert self.mock_stop_condition_object.max_evaluations == max_evaluations
+
+    @pytest.mark.parametrize("params", [{}, {"satisfying_objective_value": 10, "max_iter_without_progress": 5}])
+    def test_init__no_hard_limit(self, params):
+        """
+        Test 'StopCondition' initialization without any hard limit ('time_limit', 'max_iterations',
+        'max_evaluations') raises ValueError.
+
+        :param params: Example values of other parameters.
+        """
+        with pytest.raises(ValueError):
+            StopConditions.__init__(self=self.mock_stop_condition_object, **params)
+
+    @pytest.mark.parametrize("param_name", ["max_iterations", "max_evaluations", "checkpoint_interval"])
+    @pytest.mark.parametrize("invalid_value", ["some value", 1.5, (1,)])
+    def test_init__hard_limit_incorrect_type(self, param_name, invalid_value):
+        """
+        Test 'StopCondition' initialization with invalid type of 'max_iterations', 'max_evaluations'
+        or 'checkpoint_interval' parameter.
+        """
+        with pytest.raises(TypeError):
+            StopConditions.__init__(self=self.mock_stop_condition_object, time_limit=timedelta(seconds=1),
+                                    **{param_name: invalid_value})
+
+    @pytest.mark.parametrize("param_name", ["max_iterations", "max_evaluations", "checkpoint_interval"])
+    @pytest.mark.parametrize("invalid_value", [0, -1, -100])
+    def test_init__hard_limit_incorrect_value(self, param_name, invalid_value):
+        """
+        Test 'StopCondition' initialization with invalid value of 'max_iterations', 'max_evaluations'
+        or 'checkpoint_interval' parameter.
+        """
+        with pytest.raises(ValueError):
+            StopConditions.__init__(self=self.mock_stop_condition_object, time_limit=timedelta(seconds=1),
+                                    **{param_name: invalid_value})
+
+    @pytest.mark.parametrize("checkpoint_interval", [None, 1, 250])
+    def test_init__checkpoint_interval(self, checkpoint_interval):
+        """
+        Test 'StopCondition' initialization with valid value of 'checkpoint_interval' parameter.
+
+        :param checkpoint_interval: Example value of 'checkpoint_interval'.
+        """
+        StopConditions.__init__(self=self.mock_stop_condition_object, max_evaluations=1000,
+                                checkpoint_interval=checkpoint_interval)
+        assert self.mock_stop_condition_object.checkpoint_interval == checkpoint_interval
+
     @pytest.mark.parametrize("satisfying_objective_value", [None, 123.456, -10])
     @pytest.mark.parametrize("max_iter_without_progress", [None, 2])
     @pytest.mark.parametrize("max_time_without_progress", [None, Mock(spec=timedelta, __le__=Mock(return_value=True))])
@@ -67,7 +130,7 @@ class TestStopConditions:
         assert self.mock_stop_condition_object.max_iter_without_progress == max_iter_without_progress
         assert self.mock_stop_condition_object.max_time_without_progress == max_time_without_progress
         assert self.mock_stop_condition_object._best_objective_found is None
-        assert self.mock_stop_condition_object._last_objective_progress_datetime is None
+        assert self.mock_stop_condition_object._last_objective_progress_time is None
         assert self.mock_stop_condition_object._iter_without_progress is None
 
     def test_init__time_limit_less_or_equal_zero(self):
@@ -120,27 +183,107 @@ class TestStopConditions:
     # _is_time_exceeded
 
     @pytest.mark.parametrize("now, start_time, time_limit, expected_result", [
-        (1, 0, 1.00001, False),
-        (1, 0, 1, True),
-        (1, 0, 0.99999, True),
-        (987.654, 123.456, 864.199, False),
-        (987.654, 123.456, 864.198, True),
-        (987.654, 123.456, 864.197, True),
+        (10 ** 9, 0, timedelta(seconds=1, microseconds=1), False),
+        (10 ** 9, 0, timedelta(seconds=1), True),
+        (10 ** 9, 0, timedelta(microseconds=999999), True),
+        (987654000000, 123456000000, timedelta(seconds=864.199), False),
+        (987654000000, 123456000000, timedelta(seconds=864.198), True),
+        (987654000000, 123456000000, timedelta(seconds=864.197), True),
     ])
     def test_is_time_exceeded(self, now, start_time, time_limit, expected_result):
         """
         Test '_is_time_exceeded' method return True if time_limit exceeded ([now] - [start_time] >= [time_limit]),
         False otherwise.
 
-        :param now: Value that represents time now.
-        :param start_time: Value that represents start time.
+        :param now: Value of monotonic clock (in nanoseconds) that represents time now.
+        :param start_time: Value of monotonic clock (in nanoseconds) that represents start time.
         :param time_limit: Value that represents time limit.
         :param expected_result: Expected return from '_is_time_exceeded' method.
         """
-        self.mock_datetime_now.return_value = now
+        self.mock_monotonic_ns.return_value = now
         self.mock_stop_condition_object.time_limit = time_limit
         assert StopConditions._is_time_exceeded(self.mock_stop_condition_object, start_time) is expected_result
-        self.mock_datetime_now.assert_called_once()
+        self.mock_monotonic_ns.assert_called_once()
+
+    @pytest.mark.parametrize("time_since_start, time_limit, expected_result", [
+        (timedelta(hours=1), timedelta(minutes=59), True),
+        (timedelta(minutes=1), timedelta(hours=1), False),
+    ])
+    def test_is_time_exceeded__datetime(self, time_since_start, time_limit, expected_result):
+        """
+        Test '_is_time_exceeded' method uses wall clock if start time is provided as datetime.
+
+        :param time_since_start: Time that passed since the start.
+        :param time_limit: Value that represents time limit.
+        :param expected_result: Expected return from '_is_time_exceeded' method.
+        """
+        self.mock_stop_condition_object.time_limit = time_limit
+        assert StopConditions._is_time_exceeded(self.mock_stop_condition_object,
+                                                datetime.now() - time_since_start) is expected_result
+        self.mock_monotonic_ns.assert_not_called()
+
+    @pytest.mark.parametrize("time_limit", [timedelta(seconds=1), timedelta(hours=2)])
+    def test_is_time_exceeded__time_limit_changed(self, time_limit):
+        """
+        Test '_is_time_exceeded' method uses current value of 'time_limit' attribute.
+
+        :param time_limit: Value of time limit set after initialization.
+        """
+        stop_conditions = StopConditions(time_limit=timedelta(minutes=1))
+        stop_conditions.time_limit = time_limit
+        self.mock_monotonic_ns.return_value = 10 ** 9 * 60 * 30
+        assert stop_conditions._is_time_exceeded(start_time=0) is (time_limit < timedelta(minutes=30))
+
+    def test_is_time_exceeded__no_time_limit(self):
+        """Test '_is_time_exceeded' method return False if there is no time limit."""
+        self.mock_stop_condition_object.time_limit = None
+        assert StopConditions._is_time_exceeded(self.mock_stop_condition_object, Mock()) is False
+
+    # _is_iterations_limit_exceeded
+
+    @pytest.mark.parametrize("max_iterations, iterations_number, expected_result", [
+        (None, 0, False),
+        (None, 10 ** 9, False),
+        (1, 0, False),
+        (1, 1, True),
+        (100, 99, False),
+        (100, 100, True),
+        (100, 101, True),
+    ])
+    def test_is_iterations_limit_exceeded(self, max_iterations, iterations_number, expected_result):
+        """
+        Test '_is_iterations_limit_exceeded' method return True if at least 'max_iterations' were performed.
+
+        :param max_iterations: Value of 'max_iterations' attribute.
+        :param iterations_number: Number of performed iterations.
+        :param expected_result: Expected return from '_is_iterations_limit_exceeded' method.
+        """
+        self.mock_stop_condition_object.max_iterations = max_iterations
+        assert StopConditions._is_iterations_limit_exceeded(self.mock_stop_condition_object,
+                                                            iterations_number=iterations_number) is expected_result
+
+    # _is_evaluations_limit_exceeded
+
+    @pytest.mark.parametrize("max_evaluations, evaluations_number, expected_result", [
+        (None, 0, False),
+        (None, 10 ** 9, False),
+        (1, 0, False),
+        (1, 1, True),
+        (1000, 999, False),
+        (1000, 1000, True),
+        (1000, 1050, True),
+    ])
+    def test_is_evaluations_limit_exceeded(self, max_evaluations, evaluations_number, expected_result):
+        """
+        Test '_is_evaluations_limit_exceeded' method return True if at least 'max_evaluations' were performed.
+
+        :param max_evaluations: Value of 'max_evaluations' attribute.
+        :param evaluations_number: Number of performed evaluations.
+        :param expected_result: Expected return from '_is_evaluations_limit_exceeded' method.
+        """
+        self.mock_stop_condition_object.max_evaluations = max_evaluations
+        assert StopConditions._is_evaluations_limit_exceeded(self.mock_stop_condition_object,
+                                                             evaluations_number=evaluations_number) is expected_result
 
     # _is_satisfying_solution_found
 
@@ -252,9 +395,9 @@ class TestStopConditions:
     # _is_time_without_progress_exceeded
 
     @pytest.mark.parametrize("max_time_without_progress, current_time, last_progress_time", [
-        (1, 1.000001, 0),
-        (9876.5432, 9920.4133, 43.87),
-        (10, 20, 1)
+        (timedelta(seconds=1), 1000001000, 0),
+        (timedelta(seconds=9876.5432), 9920413300000, 43870000000),
+        (timedelta(seconds=10), 20 * 10 ** 9, 10 ** 9)
     ])
     def test_is_time_without_progress_exceeded__true(self, max_time_without_progress, current_time, last_progress_time):
         """
@@ -262,19 +405,19 @@ class TestStopConditions:
         if max_time_without_progress < current_time - last_progress_time.
 
         :param max_time_without_progress: Maximal time without finding a better solution.
-        :param current_time: Time returned by datetime.now()
+        :param current_time: Time returned by monotonic_ns()
         :param last_progress_time: Last time when progress in solution took place.
         """
-        self.mock_datetime_now.return_value = current_time
+        self.mock_monotonic_ns.return_value = current_time
         self.mock_stop_condition_object.max_time_without_progress = max_time_without_progress
-        self.mock_stop_condition_object._last_objective_progress_datetime = last_progress_time
+        self.mock_stop_condition_object._last_objective_progress_time = last_progress_time
         assert StopConditions._is_time_without_progress_exceeded(self=self.mock_stop_condition_object) is True
 
     @pytest.mark.parametrize("max_time_without_progress, current_time, last_progress_time", [
-        (None, 1, 0),
-        (1, 1, 0),
-        (9876.5432, 9920.4132, 43.87),
-        (10, 20, 15)
+        (None, 10 ** 9, 0),
+        (timedelta(seconds=1), 10 ** 9, 0),
+        (timedelta(seconds=9876.5432), 9920413200000, 43870000000),
+        (timedelta(seconds=10), 20 * 10 ** 9, 15 * 10 ** 9)
     ])
     def test_is_time_without_progress_exceeded__false(self, max_time_without_progress, current_time, last_progress_time):
         """
@@ -282,12 +425,12 @@ class TestStopConditions:
         if max_time_without_progress >= current_time - last_progress_time.
 
         :param max_time_without_progress: Maximal time without finding a better solution.
-        :param current_time: Time returned by datetime.now()
+        :param current_time: Time returned by monotonic_ns()
         :param last_progress_time: Last time when progress in solution took place.
         """
-        self.mock_datetime_now.return_value = current_time
+        self.mock_monotonic_ns.return_value = current_time
         self.mock_stop_condition_object.max_time_without_progress = max_time_without_progress
-        self.mock_stop_condition_object._last_objective_progress_datetime = last_progress_time
+        self.mock_stop_condition_object._last_objective_progress_time = last_progress_time
         assert StopConditions._is_time_without_progress_exceeded(self=self.mock_stop_condition_object) is False
 
     # _is_limit_without_progress_exceeded
@@ -334,7 +477,7 @@ class TestStopConditions:
         assert StopConditions._is_limit_without_progress_exceeded(self=self.mock_stop_condition_object,
                                                                   best_solution=self.mock_solution_object) is expected_result
         assert self.mock_stop_condition_object._iter_without_progress == 0
-        assert self.mock_stop_condition_object._last_objective_progress_datetime == self.mock_datetime_now.return_value
+        assert self.mock_stop_condition_object._last_objective_progress_time == self.mock_monotonic_ns.return_value
         assert self.mock_stop_condition_object._best_objective_found == self.mock_get_objective_value_with_penalty.return_value
 
     @pytest.mark.parametrize("max_iter_without_progress, max_time_without_progress", [(2, None), (None, 2), (10, 10)])
@@ -359,7 +502,7 @@ class TestStopConditions:
         :param max_iter_without_progress: Example value of 'max_iter_without_progress'.
         :param max_time_without_progress: Example value of 'max_time_without_progress'.
         :param iter_without_progress: Example value of '_iter_without_progress'.
-        :param last_progress_time: Example value of '_last_objective_progress_datetime'.
+        :param last_progress_time: Example value of '_last_objective_progress_time'.
         :param best_objective_found: Example value of currently best solution.
         :param new_objective: Value of newly found best solution.
         :param is_iter_exceeded: Value to be returned by '_is_iter_without_progress_exceeded' method.
@@ -369,7 +512,7 @@ class TestStopConditions:
         self.mock_stop_condition_object.max_iter_without_progress = max_iter_without_progress
         self.mock_stop_condition_object.max_time_without_progress = max_time_without_progress
         self.mock_stop_condition_object._iter_without_progress = iter_without_progress
-        self.mock_stop_condition_object._last_objective_progress_datetime = last_progress_time
+        self.mock_stop_condition_object._last_objective_progress_time = last_progress_time
         self.mock_stop_condition_object._best_objective_found = best_objective_found
         self.mock_get_objective_value_with_penalty.return_value = new_objective
         self.mock_is_iter_without_progress_exceeded.return_value = is_iter_exceeded
@@ -378,7 +521,7 @@ class TestStopConditions:
                                                                   best_solution=self.mock_solution_object) is expected_result
         assert self.mock_stop_condition_object._iter_without_progress == iter_without_progress + 1
         assert self.mock_stop_condition_object._best_objective_found == best_objective_found
-        assert self.mock_stop_condition_object._last_objective_progress_datetime == last_progress_time
+        assert self.mock_stop_condition_object._last_objective_progress_time == last_progress_time
 
     # is_achieved
 
@@ -408,16 +551,102 @@ class TestStopConditions:
         assert StopConditions.is_achieved(self=self.mock_stop_condition_object, start_time=mock_start_time,
                                           best_solution=self.mock_solution_object) is expected_result
 
-    @pytest.mark.parametrize("time_limit", [timedelta(days=1), timedelta(hours=5)])
+    @pytest.mark.parametrize("is_iterations_limit_exceeded, is_evaluations_limit_exceeded", [
+        (True, False),
+        (False, True),
+        (True, True),
+    ])
+    @pytest.mark.parametrize("iterations_number, evaluations_number", [(0, 0), (15, 1500)])
+    def test_is_achieved__hard_limits(self, is_iterations_limit_exceeded, is_evaluations_limit_exceeded,
+                                      iterations_number, evaluations_number):
+        """
+        Test 'is_achieved' method returns True if iterations or evaluations limit is exceeded.
+
+        :param is_iterations_limit_exceeded: Simulated return value of '_is_iterations_limit_exceeded' method.
+        :param is_evaluations_limit_exceeded: Simulated return value of '_is_evaluations_limit_exceeded' method.
+        :param iterations_number: Example number of performed iterations.
+        :param evaluations_number: Example number of performed evaluations.
+        """
+        self.mock_is_time_exceeded.return_value = False
+        self.mock_is_satisfying_solution_found.return_value = False
+        self.mock_is_limit_without_progress_exceeded.return_value = False
+        self.mock_is_iterations_limit_exceeded.return_value = is_iterations_limit_exceeded
+        self.mock_is_evaluations_limit_exceeded.return_value = is_evaluations_limit_exceeded
+        assert StopConditions.is_achieved(self=self.mock_stop_condition_object, start_time=Mock(),
+                                          best_solution=self.mock_solution_object,
+                                          iterations_number=iterations_number,
+                                          evaluations_number=evaluations_number) is True
+        self.mock_is_iterations_limit_exceeded.assert_called_once_with(iterations_number=iterations_number)
+        if is_iterations_limit_exceeded:
+            self.mock_is_evaluations_limit_exceeded.assert_not_called()
+        else:
+            self.mock_is_evaluations_limit_exceeded.assert_called_once_with(evaluations_number=evaluations_number)
+        self.mock_is_limit_without_progress_exceeded.assert_not_called()
+
+    def test_is_achieved__progress_checked_last(self):
+        """
+        Test 'is_achieved' method does not check (and update) progress related conditions if any other condition
+        was achieved.
+        """
+        self.mock_is_time_exceeded.return_value = True
+        self.mock_is_satisfying_solution_found.return_value = False
+        assert StopConditions.is_achieved(self=self.mock_stop_condition_object, start_time=Mock(),
+                                          best_solution=self.mock_solution_object) is True
+        self.mock_is_limit_without_progress_exceeded.assert_not_called()
+
+    # is_interruption_needed
+
+    @pytest.mark.parametrize("is_time_exceeded, is_satisfying_solution_found, expected_result", [
+        (True, True, True),
+        (True, False, True),
+        (False, True, True),
+        (False, False, False),
+    ])
+    def test_is_interruption_needed(self, is_time_exceeded, is_satisfying_solution_found, expected_result):
+        """
+        Test 'is_interruption_needed' method returns outcome of '_is_time_exceeded' and '_is_satisfying_solution_found'
+        methods and does not update progress related state.
+
+        :param is_time_exceeded: Simulated return value of '_is_time_exceeded' method.
+        :param is_satisfying_solution_found: Simulated return value of '_is_satisfying_solution_found' method.
+        :param expected_result: Expected return value of 'is_interruption_needed' method.
+        """
+        self.mock_is_time_exceeded.return_value = is_time_exceeded
+        self.mock_is_satisfying_solution_found.return_value = is_satisfying_solution_found
+        assert StopConditions.is_interruption_needed(self=self.mock_stop_condition_object, start_time=Mock(),
+                                                     best_solution=self.mock_solution_object) is expected_result
+        self.mock_is_limit_without_progress_exceeded.assert_not_called()
+        self.mock_is_iterations_limit_exceeded.assert_not_called()
+
+    @pytest.mark.parametrize("evaluations_number", [0, 1234])
+    def test_is_interruption_needed__evaluations_limit(self, evaluations_number):
+        """
+        Test 'is_interruption_needed' method returns True if evaluations limit is exceeded.
+
+        :param evaluations_number: Example number of performed evaluations.
+        """
+        self.mock_is_time_exceeded.return_value = False
+        self.mock_is_satisfying_solution_found.return_value = False
+        self.mock_is_evaluations_limit_exceeded.return_value = True
+        assert StopConditions.is_interruption_needed(self=self.mock_stop_condition_object, start_time=Mock(),
+                                                     best_solution=self.mock_solution_object,
+                                                     evaluations_number=evaluations_number) is True
+        self.mock_is_evaluations_limit_exceeded.assert_called_once_with(evaluations_number=evaluations_number)
+
+    @pytest.mark.parametrize("time_limit", [None, timedelta(days=1), timedelta(hours=5)])
     @pytest.mark.parametrize("satisfying_objective_value", [None, 0, 2.321, -453])
     @pytest.mark.parametrize("max_iter_without_progress", [None, 1, 54])
     @pytest.mark.parametrize("max_time_without_progress", [None, timedelta(seconds=5), timedelta(hours=1)])
+    @pytest.mark.parametrize("max_iterations, max_evaluations", [(None, None), (10, 5000)])
     def test_get_log_data(self, time_limit, satisfying_objective_value, max_iter_without_progress,
-                          max_time_without_progress):
+                          max_time_without_progress, max_iterations, max_evaluations):
         """
         Test 'log_data' return dictionary with proper data.
         """
+        self.mock_stop_condition_object.max_iterations = max_iterations
+        self.mock_stop_condition_object.max_evaluations = max_evaluations
         self.mock_stop_condition_object.time_limit = time_limit
+        self.mock_stop_condition_object.checkpoint_interval = 100
         self.mock_stop_condition_object.satisfying_objective_value = satisfying_objective_value
         self.mock_stop_condition_object.max_iter_without_progress = max_iter_without_progress
         self.mock_stop_condition_object.max_time_without_progress = max_time_without_progress
@@ -427,3 +656,6 @@ class TestStopConditions:
         assert "satisfying_objective_value" in log_data
         assert "max_iter_without_progress" in log_data
         assert "max_time_without_progress" in log_data
+        assert log_data["max_iterations"] == max_iterations
+        assert log_data["max_evaluations"] == max_evaluations
+        assert log_data["checkpoint_interval"] == 100
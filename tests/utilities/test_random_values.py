@@ -2,8 +2,14 @@ import pytest
 from copy import deepcopy
 from string import printable
 
+import numpy as np
+
 from optimization.utilities.random_values import generate_random_int, generate_random_float, choose_random_value, \
-    choose_random_values, shuffle, shuffled, choose_random_value_with_weights
+    choose_random_values, shuffle, shuffled, choose_random_value_with_weights, generate_random_ints_array, \
+    generate_random_floats_array, choose_random_indices_groups, choose_random_indices_with_weights, \
+    choose_random_values_with_cumulative_weights, generate_random_permutation, generate_random_geometric_gap, \
+    choose_random_successes_indices, generate_random_normal_floats_array, RandomSource, get_random_source, \
+    set_random_source, set_random_seed
 
 
 class TestRandomFunctions:
@@ -117,3 +123,275 @@ class TestRandomFunctions:
         assert copy_input_values == values, "Input were unchanged"
         assert set(values) == set(output_values) and isinstance(output_values, list) \
             and any([output_values[i] != values[i] for i in range(len(values))])
+
+    @pytest.mark.parametrize("min_value, max_value, size", [(1, 10, 100), (-100, 100, (20, 30))])
+    def test_generate_random_ints_array__values_in_range(self, min_value, max_value, size):
+        """
+        Check that 'generate_random_ints_array' function returns array of integers in given range.
+
+        :param min_value: Minimal possible random value.
+        :param max_value: Maximal possible random value.
+        :param size: Shape of the array.
+        """
+        values = generate_random_ints_array(min_value, max_value, size=size)
+        assert values.shape == ((size, ) if isinstance(size, int) else size)
+        assert values.dtype.kind == "i" and values.min() >= min_value and values.max() <= max_value
+
+    @pytest.mark.parametrize("size", [100, (20, 30)])
+    def test_generate_random_floats_array__values_in_range(self, size):
+        """
+        Check that 'generate_random_floats_array' function returns array of floats in range [0, 1).
+
+        :param size: Shape of the array.
+        """
+        values = generate_random_floats_array(size=size)
+        assert values.shape == ((size, ) if isinstance(size, int) else size)
+        assert values.dtype.kind == "f" and values.min() >= 0 and values.max() < 1
+
+    @pytest.mark.parametrize("size", [1000, (40, 50)])
+    def test_generate_random_normal_floats_array(self, size):
+        """
+        Check that 'generate_random_normal_floats_array' function returns array of floats around 0.
+
+        :param size: Shape of the array.
+        """
+        values = generate_random_normal_floats_array(size=size)
+        assert values.shape == ((size, ) if isinstance(size, int) else size)
+        assert values.dtype.kind == "f" and values.min() < 0 < values.max()
+
+    @pytest.mark.parametrize("pool_size, groups_number, group_size", [(10, 100, 3), (8, 50, 8), (1000, 500, 2)])
+    def test_choose_random_indices_groups__unique_values_in_range(self, pool_size, groups_number, group_size):
+        """
+        Check that 'choose_random_indices_groups' function returns groups of unique indices in given range.
+
+        :param pool_size: Number of indices to pick from.
+        :param groups_number: Number of groups to pick.
+        :param group_size: Number of indices in each group.
+        """
+        groups = choose_random_indices_groups(pool_size=pool_size, groups_number=groups_number, group_size=group_size)
+        assert groups.shape == (groups_number, group_size)
+        assert groups.min() >= 0 and groups.max() < pool_size
+        assert all(len(set(group)) == group_size for group in groups.tolist())
+
+    @pytest.mark.parametrize("weights, size", [([0., 1., 0., 2.], 100), ([5., 0.], (10, 2))])
+    def test_choose_random_indices_with_weights__values(self, weights, size):
+        """
+        Check that 'choose_random_indices_with_weights' function never returns indices with weight equal 0.
+
+        :param weights: Example weights values.
+        :param size: Shape of the output array.
+        """
+        indices = choose_random_indices_with_weights(weights=np.array(weights), size=size)
+        assert indices.shape == ((size, ) if isinstance(size, int) else size)
+        assert all(weights[index] > 0 for index in indices.ravel().tolist())
+
+    @pytest.mark.parametrize("values_pool, cumulative_weights, values_number", [
+        (["a", "b", "c", "d"], [0, 1, 1, 3], 100),
+        (range(-10, 11), list(range(1, 22)), 20),
+    ])
+    def test_choose_random_values_with_cumulative_weights__values_in_pool(self, values_pool, cumulative_weights,
+                                                                         values_number):
+        """
+        Check that 'choose_random_values_with_cumulative_weights' function returns values with non-zero weights.
+
+        :param values_pool: Example values pool.
+        :param cumulative_weights: Example cumulative weights values.
+        :param values_number: Number of values to be picked.
+        """
+        values = choose_random_values_with_cumulative_weights(values_pool=values_pool,
+                                                              cumulative_weights=cumulative_weights,
+                                                              values_number=values_number)
+        assert isinstance(values, list) and len(values) == values_number
+        weights = [cumulative_weights[0]] + [cumulative_weights[i] - cumulative_weights[i - 1]
+                                             for i in range(1, len(cumulative_weights))]
+        assert all(weights[list(values_pool).index(value)] > 0 for value in values)
+
+    @pytest.mark.parametrize("size", [1, 10, 1000])
+    def test_generate_random_permutation(self, size):
+        """
+        Check that 'generate_random_permutation' function returns permutation of indices.
+
+        :param size: Number of indices to permute.
+        """
+        assert sorted(generate_random_permutation(size).tolist()) == list(range(size))
+
+    @pytest.mark.parametrize("success_probability", [0.001, 0.3, 0.99])
+    def test_generate_random_geometric_gap(self, success_probability):
+        """
+        Check that 'generate_random_geometric_gap' function returns non-negative integers.
+
+        :param success_probability: Example probability of success.
+        """
+        for _ in range(100):
+            gap = generate_random_geometric_gap(success_probability)
+            assert isinstance(gap, int) and gap >= 0
+
+    def test_generate_random_geometric_gap__certain_success(self):
+        """Check that 'generate_random_geometric_gap' function returns 0 when success is certain."""
+        assert generate_random_geometric_gap(1) == 0
+
+    @pytest.mark.parametrize("trials_number, success_probability", [(1, 0.5), (100, 0.01), (100000, 0.001),
+                                                                    (5000, 0.2)])
+    def test_choose_random_successes_indices(self, trials_number, success_probability):
+        """
+        Check that 'choose_random_successes_indices' function returns sorted unique indices of trials.
+
+        :param trials_number: Example number of trials.
+        :param success_probability: Example probability of success.
+        """
+        indices = choose_random_successes_indices(trials_number=trials_number, success_probability=success_probability)
+        assert indices.ndim == 1
+        assert (np.diff(indices) > 0).all()
+        assert indices.size == 0 or 0 <= indices[0] <= indices[-1] < trials_number
+
+    @pytest.mark.parametrize("trials_number, success_probability, expected_indices", [
+        (0, 0.5, []),
+        (10, 0, []),
+        (4, 1, [0, 1, 2, 3]),
+    ])
+    def test_choose_random_successes_indices__edge_cases(self, trials_number, success_probability, expected_indices):
+        """
+        Check that 'choose_random_successes_indices' function handles edge cases.
+
+        :param trials_number: Example number of trials.
+        :param success_probability: Example probability of success.
+        :param expected_indices: Expected indices of successful trials.
+        """
+        assert choose_random_successes_indices(trials_number=trials_number,
+                                               success_probability=success_probability).tolist() == expected_indices
+
+    @pytest.mark.random
+    def test_choose_random_successes_indices__distribution(self):
+        """Check that 'choose_random_successes_indices' function picks expected number of indices."""
+        indices = choose_random_successes_indices(trials_number=1000000, success_probability=0.01)
+        assert 9500 <= indices.size <= 10500
+
+
+class TestRandomSource:
+    """Tests for 'RandomSource' class and functions that manage the current random source."""
+
+    def setup(self):
+        self.previous_random_source = get_random_source()
+
+    def teardown(self):
+        set_random_source(self.previous_random_source)
+
+    @staticmethod
+    def draw_values(random_source):
+        """
+        Draws example values (both single values and arrays) from random source.
+
+        :param random_source: Random source to use.
+
+        :return: List with drawn values.
+        """
+        return [random_source.ints(0, 100), random_source.floats(), random_source.ints(-5, 5, size=10).tolist(),
+                random_source.floats(size=(2, 3)).tolist(), random_source.normal_floats(size=4).tolist(),
+                random_source.choices(10, size=5).tolist(), random_source.permutation(20, k=5).tolist(),
+                random_source.geometric(0.1, size=3).tolist()]
+
+    # __init__
+
+    @pytest.mark.parametrize("invalid_seed", ["123", 1.5, True, [1, 2]])
+    def test_init__invalid_seed_type(self, invalid_seed):
+        """
+        Check that TypeError is raised when seed of incorrect type is provided.
+
+        :param invalid_seed: Value that is not int, SeedSequence nor None.
+        """
+        with pytest.raises(TypeError):
+            RandomSource(seed=invalid_seed)
+
+    def test_init__invalid_seed_value(self):
+        """Check that ValueError is raised when negative seed is provided."""
+        with pytest.raises(ValueError):
+            RandomSource(seed=-1)
+
+    @pytest.mark.parametrize("seed", [0, 12345, 2 ** 100])
+    def test_init__reproducible(self, seed):
+        """
+        Check that random sources created with the same seed return the same values.
+
+        :param seed: Example seed.
+        """
+        assert self.draw_values(RandomSource(seed=seed)) == self.draw_values(RandomSource(seed=seed))
+        assert self.draw_values(RandomSource(seed=seed)) != self.draw_values(RandomSource(seed=seed + 1))
+
+    # spawn
+
+    @pytest.mark.parametrize("sources_number", [1, 4])
+    def test_spawn(self, sources_number):
+        """
+        Check that spawned random sources are reproducible and independent.
+
+        :param sources_number: Example number of sources to spawn.
+        """
+        sources = RandomSource(seed=7).spawn(sources_number)
+        other_sources = RandomSource(seed=7).spawn(sources_number)
+        assert len(sources) == sources_number and all(isinstance(source, RandomSource) for source in sources)
+        values = [self.draw_values(source) for source in sources]
+        assert values == [self.draw_values(source) for source in other_sources]
+        assert all(values[0] != other_values for other_values in values[1:])
+        assert values[0] != self.draw_values(RandomSource(seed=7))
+
+    # ints, floats, permutation
+
+    @pytest.mark.parametrize("min_value, max_value", [(0, 1), (-3, 3)])
+    def test_ints__inclusive_range(self, min_value, max_value):
+        """
+        Check that 'ints' method returns values in range including both limits.
+
+        :param min_value: Minimal possible value.
+        :param max_value: Maximal possible value.
+        """
+        values = RandomSource().ints(min_value, max_value, size=1000)
+        assert set(values.tolist()) == set(range(min_value, max_value + 1))
+
+    def test_floats(self):
+        """Check that 'floats' method returns values in range [0, 1)."""
+        random_source = RandomSource()
+        assert isinstance(random_source.floats(), float)
+        values = random_source.floats(size=1000)
+        assert values.min() >= 0 and values.max() < 1
+
+    @pytest.mark.parametrize("size, k", [(10, None), (10, 10), (1000, 3)])
+    def test_permutation(self, size, k):
+        """
+        Check that 'permutation' method returns unique indices.
+
+        :param size: Example number of indices to permute.
+        :param k: Example number of indices to return.
+        """
+        values = RandomSource().permutation(size, k=k).tolist()
+        assert len(values) == (size if k is None else k) == len(set(values))
+        assert all(0 <= value < size for value in values)
+
+    # get_random_source, set_random_source, set_random_seed
+
+    def test_set_random_source(self):
+        """Check that 'set_random_source' replaces the current random source and returns the previous one."""
+        random_source = RandomSource()
+        assert set_random_source(random_source) is self.previous_random_source
+        assert get_random_source() is random_source
+
+    @pytest.mark.parametrize("invalid_random_source", [None, 1, np.random.default_rng()])
+    def test_set_random_source__invalid_type(self, invalid_random_source):
+        """
+        Check that 'set_random_source' raises TypeError when value of incorrect type is provided.
+
+        :param invalid_random_source: Value that is not RandomSource type.
+        """
+        with pytest.raises(TypeError):
+            set_random_source(invalid_random_source)
+        assert get_random_source() is self.previous_random_source
+
+    def test_set_random_seed(self):
+        """Check that module functions return the same values after setting the same seed."""
+        values = []
+        for _ in range(2):
+            set_random_seed(2024)
+            values.append([generate_random_int(0, 1000), generate_random_float(0, 1),
+                           choose_random_value({"a", "b", "c"}), shuffled(range(10)),
+                           generate_random_floats_array(size=3).tolist(),
+                           choose_random_successes_indices(trials_number=100, success_probability=0.1).tolist()])
+        assert values[0] == values[1]